@@ -32,6 +32,7 @@ logger = logging.getLogger(__name__)
 # Import news_bot modules
 from news_bot.config import config
 from news_bot.aggregator import NewsAggregator
+from news_bot.http_cache import HttpCache
 from news_bot.summarizer import AISummarizer
 from news_bot.writer import MarkdownWriter
 from news_bot.orchestrator import run_news_research, NewsOrchestrationResult
@@ -52,13 +53,15 @@ class NewsBot:
 
             # Initialize components
             category_map = getattr(self.config, 'CATEGORY_MAP', {})
-            if category_map:
-                self.news_aggregator = NewsAggregator(
-                    self.config.NEWS_SOURCES,
-                    category_map=category_map
-                )
-            else:
-                self.news_aggregator = NewsAggregator(self.config.NEWS_SOURCES)
+            http_cache = HttpCache(
+                self.config.NEWS_CACHE_PATH,
+                article_ttl=self.config.NEWS_ARTICLE_CACHE_TTL_HOURS * 3600,
+            )
+            self.news_aggregator = NewsAggregator(
+                self.config.NEWS_SOURCES,
+                category_map=category_map or None,
+                cache=http_cache,
+            )
 
             self.ai_summarizer = AISummarizer(
                 api_key=self.config.GEMINI_API_KEY,
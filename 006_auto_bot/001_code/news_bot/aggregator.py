@@ -1,40 +1,96 @@
 import ssl
+import re
 import certifi
 import feedparser
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Dict
+from typing import List, Dict, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 from bs4 import BeautifulSoup
 import logging
-import time
 from newspaper import Article
 
+from .host_limiter import HostLimiter
+from .http_cache import HttpCache
+
 # Fix SSL certificate verification issues on macOS
 ssl._create_default_https_context = ssl._create_unverified_context
 
 logger = logging.getLogger(__name__)
 
+# Sites with strong paywalls or bot protection: keep the RSS summary only
+SKIP_FETCH_DOMAINS = ['bloomberg.com', 'marketwatch.com', 'ft.com', 'wsj.com']
+
+# Politeness delay per host (seconds between request starts); others use DEFAULT_HOST_DELAY
+HOST_DELAYS = {'hankyung.com': 2.0, 'mk.co.kr': 2.0}
+DEFAULT_HOST_DELAY = 1.0
+
+# Query parameters that only track the referrer and never change the article
+TRACKING_PARAMS = ('utm_', 'fbclid', 'gclid', 'cmpid', 'ref')
+
+
+def canonical_url(url: str) -> str:
+    """Normalize an article URL for dedup (scheme/host case, www, fragment, tracking params)"""
+    parts = urlsplit(url.strip())
+    host = (parts.hostname or '').lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+             if not k.lower().startswith(TRACKING_PARAMS)]
+    path = parts.path.rstrip('/') or '/'
+    return urlunsplit(('https' if parts.scheme in ('http', 'https') else parts.scheme,
+                       host, path, urlencode(query), ''))
+
+
+def normalize_title(title: str) -> str:
+    """Lower-case, punctuation-free, whitespace-collapsed title for dedup"""
+    return re.sub(r'\s+', ' ', re.sub(r'[^\w\s]', ' ', title.lower())).strip()
+
 
 class NewsAggregator:
     """Aggregates news from multiple RSS feeds"""
 
-    def __init__(self, rss_feeds: List[str], category_map: Dict[str, str] = None):
+    def __init__(
+        self,
+        rss_feeds: List[str],
+        category_map: Dict[str, str] = None,
+        max_workers: int = 8,
+        limiter: Optional[HostLimiter] = None,
+        entries_per_feed: int = 10,
+        timeout: float = 10,
+        cache: Optional[HttpCache] = None,
+    ):
         """
         Initialize NewsAggregator with RSS feed URLs
 
         Args:
             rss_feeds: List of RSS feed URLs
             category_map: Dict mapping feed URL to category name
+            max_workers: Concurrent feed/article downloads across all hosts
+            limiter: Per-host concurrency/politeness limiter (default: 2 per host,
+                HOST_DELAYS / DEFAULT_HOST_DELAY spacing)
+            entries_per_feed: Newest entries considered per feed
+            timeout: HTTP timeout in seconds
+            cache: Persistent feed validators / article text cache shared across
+                runs (None: always download)
         """
         self.rss_feeds = rss_feeds
         self.category_map = category_map or {}
         self.news_items = []
+        self.max_workers = max_workers
+        self.limiter = limiter or HostLimiter(
+            max_per_host=2, default_delay=DEFAULT_HOST_DELAY, host_delays=HOST_DELAYS
+        )
+        self.entries_per_feed = entries_per_feed
+        self.timeout = timeout
+        self.cache = cache
 
         # Configure newspaper3k globally with browser-like headers
         from newspaper import Config
         self.newspaper_config = Config()
         self.newspaper_config.browser_user_agent = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        self.newspaper_config.request_timeout = 10
+        self.newspaper_config.request_timeout = timeout
         self.newspaper_config.memoize_articles = False
 
         # Prepare headers for requests fallback
@@ -42,7 +98,7 @@ class NewsAggregator:
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.9,ko;q=0.8',
-            'Accept-Encoding': 'gzip, deflate, br',
+            'Accept-Encoding': 'gzip, deflate',
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
             'Cache-Control': 'max-age=0',
@@ -52,10 +108,19 @@ class NewsAggregator:
             'Sec-Fetch-Dest': 'document'
         }
 
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=32, pool_maxsize=max_workers)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
     def fetch_news(self, hours_limit: int = 24, hours_by_category: Dict[str, int] = None) -> List[Dict]:
         """
         Fetch news from all RSS feeds.
 
+        Feeds are downloaded concurrently; entries are filtered by the category
+        cutoff and deduplicated by canonical URL / title before any article is
+        fetched; articles are then fetched concurrently under the per-host limiter.
+
         Args:
             hours_limit: Default hours window for any category not listed in hours_by_category.
             hours_by_category: Optional per-category override (e.g. {'정치': 6, '문화': 24}).
@@ -67,36 +132,108 @@ class NewsAggregator:
         hours_by_category = hours_by_category or {}
         now = datetime.now()
 
-        for feed_url in self.rss_feeds:
-            try:
-                logger.info(f"Fetching news from: {feed_url}")
-                feed = feedparser.parse(feed_url)
-
-                category = self.category_map.get(feed_url, '기타')
-                effective_limit = hours_by_category.get(category, hours_limit)
-                cutoff_time = now - timedelta(hours=effective_limit)
-
-                for entry in feed.entries[:10]:
-                    news_item = self._parse_entry(entry, feed_url)
-                    if news_item:
-                        pub_date = news_item.get('published_date')
-                        if pub_date and pub_date >= cutoff_time:
-                            self.news_items.append(news_item)
-                            logger.debug(f"Added news: {news_item['title'][:50]}... (cat={category}, limit={effective_limit}h)")
-                        else:
-                            logger.debug(f"Skipped old news: {news_item['title'][:50]}... (cat={category}, limit={effective_limit}h)")
-
-            except Exception as e:
-                logger.error(f"Error fetching from {feed_url}: {str(e)}")
-                continue
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            feeds = dict(zip(self.rss_feeds, pool.map(self._fetch_feed, self.rss_feeds)))
+
+            candidates = self._select_candidates(feeds, now, hours_limit, hours_by_category)
 
-        logger.info(f"Total news items fetched: {len(self.news_items)} (per-category limits applied)")
+            to_fetch = [item for item in candidates if self._should_fetch(item['link'])]
+            contents = pool.map(lambda item: self._fetch_full_article(item['link']), to_fetch)
+            for item, full_content in zip(to_fetch, contents):
+                if full_content:
+                    item['full_content'] = full_content
+                    item['description'] = full_content
+
+        self.news_items = candidates
+        logger.info(f"Total news items fetched: {len(self.news_items)} "
+                    f"({len(to_fetch)} article fetches, per-category limits applied)")
         return self.news_items
 
+    def _fetch_feed(self, feed_url: str):
+        """Download and parse one RSS feed; None on failure"""
+        logger.info(f"Fetching news from: {feed_url}")
+        headers = self.headers
+        if self.cache:
+            headers = {**self.headers, **self.cache.conditional_headers(feed_url)}
+        try:
+            with self.limiter.acquire(feed_url):
+                response = self.session.get(feed_url, headers=headers, timeout=self.timeout)
+            if response.status_code == 304 and self.cache:
+                body = self.cache.feed_body(feed_url)
+                if body is not None:
+                    logger.info(f"Feed not modified, using cached copy: {feed_url}")
+                    self.cache.touch_feed(feed_url)
+                    return feedparser.parse(body)
+                # Validators without a body (should not happen): refetch unconditionally
+                response = self.session.get(feed_url, headers=self.headers, timeout=self.timeout)
+            response.raise_for_status()
+            if self.cache:
+                self.cache.store_feed(
+                    feed_url, response.content,
+                    response.headers.get('ETag'), response.headers.get('Last-Modified'),
+                )
+            return feedparser.parse(response.content)
+        except Exception as e:
+            logger.error(f"Error fetching from {feed_url}: {str(e)}")
+            return None
+
+    def _select_candidates(
+        self,
+        feeds: Dict[str, object],
+        now: datetime,
+        hours_limit: int,
+        hours_by_category: Dict[str, int],
+    ) -> List[Dict]:
+        """Entries within their category cutoff, first occurrence per URL/title (feed order)"""
+        candidates = []
+        seen_urls, seen_titles = set(), set()
+        for feed_url in self.rss_feeds:
+            feed = feeds.get(feed_url)
+            if feed is None:
+                continue
+            category = self.category_map.get(feed_url, '기타')
+            effective_limit = hours_by_category.get(category, hours_limit)
+            cutoff_time = now - timedelta(hours=effective_limit)
+
+            for entry in feed.entries[:self.entries_per_feed]:
+                news_item = self._parse_entry(entry, feed_url)
+                if not news_item:
+                    continue
+                pub_date = news_item.get('published_date')
+                if not pub_date or pub_date < cutoff_time:
+                    logger.debug(f"Skipped old news: {news_item['title'][:50]}... (cat={category}, limit={effective_limit}h)")
+                    continue
+
+                url_key = canonical_url(news_item['link']) if news_item['link'] else None
+                title_key = normalize_title(news_item['title'])
+                if (url_key and url_key in seen_urls) or (title_key and title_key in seen_titles):
+                    logger.debug(f"Skipped duplicate: {news_item['title'][:50]}...")
+                    continue
+                if url_key:
+                    seen_urls.add(url_key)
+                if title_key:
+                    seen_titles.add(title_key)
+
+                candidates.append(news_item)
+                logger.debug(f"Added news: {news_item['title'][:50]}... (cat={category}, limit={effective_limit}h)")
+        return candidates
+
+    @staticmethod
+    def _should_fetch(article_link: str) -> bool:
+        if not article_link:
+            return False
+        if any(domain in article_link for domain in SKIP_FETCH_DOMAINS):
+            logger.debug(f"Skipping full article fetch for paywall site: {article_link[:60]}...")
+            return False
+        return True
+
     def _fetch_full_article(self, url: str) -> str:
         """
-        Fetch full article content from URL using web scraping
-        Try newspaper3k first, fallback to requests if it fails
+        Fetch full article content from URL using web scraping.
+        Text cached by canonical URL within the TTL is returned without a
+        request. Otherwise the page is downloaded once (under the per-host
+        limiter); newspaper3k extracts from it first, BeautifulSoup selectors
+        are the fallback.
 
         Args:
             url: Article URL
@@ -104,28 +241,46 @@ class NewsAggregator:
         Returns:
             Full article text, or empty string if failed
         """
+        url_key = canonical_url(url)
+        if self.cache:
+            cached = self.cache.get_article(url_key)
+            if cached:
+                logger.debug(f"Article cache hit: {url[:60]}...")
+                return cached
+
         logger.info(f"Fetching full article from: {url[:60]}...")
 
-        # Method 1: Try newspaper3k with configured headers
+        try:
+            with self.limiter.acquire(url):
+                response = self.session.get(url, headers=self.headers, timeout=self.timeout)
+            response.raise_for_status()
+        except Exception as e:
+            logger.error(f"All methods failed for {url[:60]}...: {str(e)}")
+            return ""
+
+        text = self._extract_article_text(url, response.text, response.content)
+        if text and self.cache:
+            self.cache.store_article(url_key, text)
+        return text
+
+    def _extract_article_text(self, url: str, html: str, raw: bytes = None) -> str:
+        # Method 1: newspaper3k on the downloaded page
         try:
             article = Article(url, config=self.newspaper_config)
-            article.download()
+            article.download(input_html=html)
             article.parse()
 
             if article.text and len(article.text) > 100:  # Ensure meaningful content
                 logger.info(f"Successfully extracted article ({len(article.text)} chars) via newspaper3k")
                 return article.text
             else:
-                logger.debug(f"newspaper3k extracted insufficient content, trying requests...")
+                logger.debug(f"newspaper3k extracted insufficient content, trying selectors...")
         except Exception as e:
-            logger.debug(f"newspaper3k failed for {url[:60]}...: {str(e)}, trying requests fallback...")
+            logger.debug(f"newspaper3k failed for {url[:60]}...: {str(e)}, trying selectors...")
 
-        # Method 2: Fallback to requests + BeautifulSoup
+        # Method 2: BeautifulSoup with common article selectors
         try:
-            response = requests.get(url, headers=self.headers, timeout=10)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(raw if raw is not None else html, 'html.parser')
 
             # Remove script and style elements
             for script in soup(['script', 'style', 'nav', 'header', 'footer', 'aside']):
@@ -158,7 +313,7 @@ class NewsAggregator:
                         break
 
             if text and len(text) > 100:
-                logger.info(f"Successfully extracted article ({len(text)} chars) via requests")
+                logger.info(f"Successfully extracted article ({len(text)} chars) via selectors")
                 return text
             else:
                 logger.warning(f"Could not extract meaningful content from {url[:60]}...")
@@ -170,7 +325,8 @@ class NewsAggregator:
 
     def _parse_entry(self, entry, source_url: str) -> Dict:
         """
-        Parse a single RSS entry and fetch full article content
+        Parse a single RSS entry (metadata only; the full article is fetched
+        later, and only for entries that survive the cutoff and dedup)
 
         Args:
             entry: RSS entry object
@@ -197,27 +353,6 @@ class NewsAggregator:
             # Get article link
             article_link = entry.link if hasattr(entry, 'link') else ''
 
-            # Determine if we should try to fetch full article
-            # Skip sites with strong paywalls or bot protection
-            skip_fetch_domains = ['bloomberg.com', 'marketwatch.com', 'ft.com', 'wsj.com']
-            should_fetch = not any(domain in article_link for domain in skip_fetch_domains)
-
-            # Fetch full article content (unless skipped)
-            full_content = ''
-            if article_link and should_fetch:
-                full_content = self._fetch_full_article(article_link)
-                # Add delay to be respectful to servers and avoid rate limiting
-                # Longer delay for sites with strict anti-bot measures
-                if 'hankyung.com' in article_link or 'mk.co.kr' in article_link:
-                    time.sleep(2)  # 2 seconds for Korean economy sites
-                else:
-                    time.sleep(1)  # 1 second for others
-            elif article_link and not should_fetch:
-                logger.debug(f"Skipping full article fetch for paywall site: {article_link[:60]}...")
-
-            # Use full content if available, otherwise fall back to RSS description
-            description = full_content if full_content else rss_description
-
             # Get source name from feed
             source_name = self._extract_source_name(source_url)
 
@@ -227,9 +362,9 @@ class NewsAggregator:
             return {
                 'title': entry.title if hasattr(entry, 'title') else 'No Title',
                 'link': article_link,
-                'description': description,
+                'description': rss_description,  # Replaced by full content once fetched
                 'rss_summary': rss_description,  # Keep RSS summary for reference
-                'full_content': full_content,  # Store full content separately
+                'full_content': '',  # Store full content separately
                 'published_date': published_date,
                 'source': source_name,
                 'source_url': source_url,
@@ -19,6 +19,13 @@ class Config:
     # News Fetching Settings
     NEWS_HOURS_LIMIT = int(os.getenv('NEWS_HOURS_LIMIT', '24'))  # Default: 24 hours
 
+    # Persistent HTTP cache (feed ETag/Last-Modified + extracted article text)
+    NEWS_CACHE_PATH = os.getenv(
+        'NEWS_CACHE_PATH',
+        os.path.join(os.path.dirname(__file__), '..', 'data', 'news', 'http_cache.db'),
+    )
+    NEWS_ARTICLE_CACHE_TTL_HOURS = int(os.getenv('NEWS_ARTICLE_CACHE_TTL_HOURS', '72'))
+
     # Per-category freshness limits (hours). Falls back to NEWS_HOURS_LIMIT if not listed.
     HOURS_LIMIT_BY_CATEGORY = {
         '정치': int(os.getenv('NEWS_HOURS_정치', '6')),
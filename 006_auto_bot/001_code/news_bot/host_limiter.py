@@ -0,0 +1,72 @@
+"""
+Per-host concurrency + politeness limiter for feed/article fetching.
+
+Each host gets its own slot semaphore and its own minimum spacing between
+request starts, so slow or strict sites no longer hold up everyone else.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Optional
+from urllib.parse import urlsplit
+
+
+def host_of(url: str) -> str:
+    """Lower-cased host of a URL without a leading 'www.'"""
+    host = (urlsplit(url).hostname or '').lower()
+    return host[4:] if host.startswith('www.') else host
+
+
+class HostLimiter:
+    """Bounded concurrency and minimum start interval, tracked per host"""
+
+    def __init__(
+        self,
+        max_per_host: int = 2,
+        default_delay: float = 1.0,
+        host_delays: Optional[Dict[str, float]] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Args:
+            max_per_host: Max in-flight requests per host
+            default_delay: Min seconds between request starts on the same host
+            host_delays: Per-domain overrides, matched as a suffix of the host
+                (e.g. {'hankyung.com': 2.0})
+            clock: Monotonic time source (injectable for tests)
+            sleep: Sleep function (injectable for tests)
+        """
+        self.max_per_host = max_per_host
+        self.default_delay = default_delay
+        self.host_delays = host_delays or {}
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._next_start: Dict[str, float] = {}
+
+    def delay_for(self, host: str) -> float:
+        for domain, delay in self.host_delays.items():
+            if host == domain or host.endswith('.' + domain):
+                return delay
+        return self.default_delay
+
+    @contextmanager
+    def acquire(self, url: str):
+        """Hold one of the host's slots, starting no earlier than its politeness window"""
+        host = host_of(url)
+        with self._lock:
+            slot = self._slots.setdefault(host, threading.BoundedSemaphore(self.max_per_host))
+        slot.acquire()
+        try:
+            with self._lock:
+                now = self._clock()
+                start = max(now, self._next_start.get(host, now))
+                self._next_start[host] = start + self.delay_for(host)
+            if start > now:
+                self._sleep(start - now)
+            yield
+        finally:
+            slot.release()
@@ -0,0 +1,119 @@
+"""
+Persistent HTTP cache for the news bot (SQLite).
+
+- feeds: last body + ETag/Last-Modified per feed URL, for conditional GETs
+  (a 304 reuses the stored body instead of downloading the feed again)
+- articles: extracted article text keyed by canonical URL, valid for a TTL
+
+Shared by the daily/weekly/monthly runs so a run a few hours after the
+previous one only downloads what actually changed.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+
+class HttpCache:
+    """Thread-safe conditional-GET validators and article text store"""
+
+    def __init__(self, db_path: str, article_ttl: float = 72 * 3600):
+        """
+        Args:
+            db_path: SQLite file path (parent directory is created)
+            article_ttl: Seconds an extracted article stays valid
+        """
+        self.db_path = db_path
+        self.article_ttl = article_ttl
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.executescript(
+            """
+            PRAGMA journal_mode=WAL;
+            CREATE TABLE IF NOT EXISTS feeds (
+              url TEXT PRIMARY KEY,
+              etag TEXT, last_modified TEXT,
+              body BLOB, fetched_at REAL
+            );
+            CREATE TABLE IF NOT EXISTS articles (
+              url_key TEXT PRIMARY KEY,
+              text TEXT, fetched_at REAL
+            );
+            """
+        )
+        self.prune()
+
+    # === Feeds ===
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """If-None-Match / If-Modified-Since for a feed seen before (empty otherwise)"""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT etag, last_modified FROM feeds WHERE url = ?", (url,)
+            ).fetchone()
+        if not row:
+            return {}
+        headers = {}
+        if row[0]:
+            headers['If-None-Match'] = row[0]
+        if row[1]:
+            headers['If-Modified-Since'] = row[1]
+        return headers
+
+    def feed_body(self, url: str) -> Optional[bytes]:
+        """Stored feed body (served on 304 Not Modified)"""
+        with self._lock:
+            row = self.conn.execute("SELECT body FROM feeds WHERE url = ?", (url,)).fetchone()
+        return row[0] if row else None
+
+    def touch_feed(self, url: str):
+        """Record a 304 so a feed that never changes isn't pruned as unused"""
+        with self._lock, self.conn:
+            self.conn.execute("UPDATE feeds SET fetched_at = ? WHERE url = ?", (time.time(), url))
+
+    def store_feed(self, url: str, body: bytes, etag: Optional[str], last_modified: Optional[str]):
+        with self._lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO feeds (url, etag, last_modified, body, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (url, etag, last_modified, body, time.time()),
+            )
+
+    # === Articles ===
+
+    def get_article(self, url_key: str) -> Optional[str]:
+        """Cached article text if younger than the TTL"""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT text FROM articles WHERE url_key = ? AND fetched_at >= ?",
+                (url_key, time.time() - self.article_ttl),
+            ).fetchone()
+        return row[0] if row else None
+
+    def store_article(self, url_key: str, text: str):
+        with self._lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO articles (url_key, text, fetched_at) VALUES (?, ?, ?)",
+                (url_key, text, time.time()),
+            )
+
+    # === Maintenance ===
+
+    def prune(self) -> Tuple[int, int]:
+        """Drop expired articles and feeds not fetched for 30 days; returns (articles, feeds)"""
+        now = time.time()
+        with self._lock, self.conn:
+            articles = self.conn.execute(
+                "DELETE FROM articles WHERE fetched_at < ?", (now - self.article_ttl,)
+            ).rowcount
+            feeds = self.conn.execute(
+                "DELETE FROM feeds WHERE fetched_at < ?", (now - 30 * 86400,)
+            ).rowcount
+        return articles, feeds
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
@@ -4,10 +4,18 @@ property_type('apartment'|'officetel')로 매물 유형을 구분한다. 기존
 기본값 'apartment'라 아파트 동작이 불변이고, 오피스텔은 property_type만 바꿔
 같은 코드로 적재·집계한다. record_key는 아파트만 기존 포맷(prefix 無)을 유지해
 기존 94만 행 마이그레이션·중복을 피하고, 그 외 유형만 prefix로 네임스페이스 분리.
+
+집계(baseline·밴드 중앙값·거래량)는 구 하나씩 조회하지 않고 전 지역·여러 월을
+윈도우 함수 쿼리 한 번으로 계산한다(*_by_region). 구 단위 메서드는 그 얇은 래퍼.
+월 필터는 적재 시 채우는 year_month('YYYYMM') 컬럼 + 커버링 인덱스로 처리.
+
+적재(insert_new*)는 임시 스테이징 테이블에 executemany로 넣고, 한 문장
+(INSERT … ON CONFLICT DO NOTHING RETURNING)으로 신규 행만 돌려받는다. WAL 모드.
+여러 호출을 한 트랜잭션으로 묶으려면 `with store.batch():`.
 """
 import os
 import sqlite3
-import statistics
+from contextlib import contextmanager
 from datetime import date as _date
 
 from realestate_bot import config
@@ -37,12 +45,58 @@ def _area_band(area_sqm) -> int:
     return int(round(float(area_sqm)))
 
 
+def _year_month(trade_date: str) -> str:
+    """'2026-05-10' → '202605'"""
+    return str(trade_date).replace("-", "")[:6]
+
+
+def _in_clause(column: str, values) -> tuple:
+    """values가 주어지면 'AND column IN (?,...)' 조각과 파라미터, 아니면 빈 조각."""
+    if values is None:
+        return "", ()
+    values = list(values)
+    return f" AND {column} IN ({','.join('?' * len(values))})", tuple(values)
+
+
+_TXN_COLUMNS = ("record_key", "property_type", "region_code", "apt_name", "dong", "area_sqm",
+                "area_band", "floor", "price_10k", "trade_date", "build_year", "deal_type",
+                "first_seen_date", "year_month")
+_RENT_COLUMNS = ("record_key", "property_type", "region_code", "apt_name", "dong", "area_sqm",
+                 "area_band", "floor", "deposit_10k", "monthly_rent_10k", "contract_type",
+                 "trade_date", "build_year", "first_seen_date", "year_month")
+
+# RETURNING은 SQLite 3.35+. 그 이전 버전은 anti-join으로 신규 키를 먼저 구한다.
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+
+# (region_code, year_month, area_band) 그룹별 중앙값.
+# 짝수 건수는 가운데 두 값 평균 — statistics.median과 동일(호출 측에서 int 절삭).
+_GROUPED_MEDIAN_SQL = """
+    WITH ranked AS (
+      SELECT region_code, year_month, area_band, {value} AS v,
+             ROW_NUMBER() OVER (PARTITION BY region_code, year_month, area_band
+                                ORDER BY {value}) AS rn,
+             COUNT(*) OVER (PARTITION BY region_code, year_month, area_band) AS cnt
+      FROM {table}
+      WHERE property_type=? {where}
+    )
+    SELECT region_code, year_month, area_band, AVG(v) AS median, MAX(cnt) AS cnt
+    FROM ranked
+    WHERE rn IN ((cnt + 1) / 2, (cnt + 2) / 2)
+    GROUP BY region_code, year_month, area_band
+"""
+
+
 class RealEstateStore:
     def __init__(self, db_path: str = None):
         self.db_path = db_path or config.DB_PATH
         os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
         self.conn = sqlite3.connect(self.db_path)
         self.conn.row_factory = sqlite3.Row
+        # WAL: 적재 커밋이 가볍고, 읽기(주간 리포트)와 쓰기(백필)가 서로 안 막힌다
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self._batch_depth = 0
         self._init_schema()
 
     def _init_schema(self):
@@ -56,7 +110,7 @@ class RealEstateStore:
               area_sqm REAL, area_band INTEGER,
               floor INTEGER, price_10k INTEGER,
               trade_date TEXT, build_year INTEGER, deal_type TEXT,
-              first_seen_date TEXT
+              first_seen_date TEXT, year_month TEXT
             );
             CREATE TABLE IF NOT EXISTS rents (
               record_key TEXT PRIMARY KEY,
@@ -64,12 +118,14 @@ class RealEstateStore:
               region_code TEXT, apt_name TEXT, dong TEXT,
               area_sqm REAL, area_band INTEGER, floor INTEGER,
               deposit_10k INTEGER, monthly_rent_10k INTEGER, contract_type TEXT,
-              trade_date TEXT, build_year INTEGER, first_seen_date TEXT
+              trade_date TEXT, build_year INTEGER, first_seen_date TEXT,
+              year_month TEXT
             );
             """
         )
-        # 2) 구 DB에 property_type 컬럼 추가 (인덱스가 이 컬럼을 참조하므로 인덱스 생성 전에)
+        # 2) 구 DB에 property_type·year_month 컬럼 추가 (인덱스가 참조하므로 인덱스 생성 전에)
         self._migrate_property_type()
+        self._migrate_year_month()
         # 3) property_type 인덱스 (컬럼 존재 보장 후)
         self.conn.executescript(
             """
@@ -81,6 +137,16 @@ class RealEstateStore:
               ON rents(region_code, property_type, area_band, monthly_rent_10k, trade_date);
             CREATE INDEX IF NOT EXISTS idx_rent_vol2
               ON rents(region_code, property_type, trade_date);
+            -- 월·밴드 집계용 커버링 인덱스 (중앙값·거래량이 테이블을 읽지 않음)
+            CREATE INDEX IF NOT EXISTS idx_txn_ym
+              ON transactions(region_code, property_type, year_month, area_band, price_10k);
+            CREATE INDEX IF NOT EXISTS idx_rent_ym
+              ON rents(region_code, property_type, year_month, area_band,
+                       monthly_rent_10k, deposit_10k);
+            -- baseline(전 지역 × 36개월) 커버링 인덱스
+            CREATE INDEX IF NOT EXISTS idx_txn_base
+              ON transactions(property_type, trade_date, region_code, apt_name, area_band,
+                              price_10k);
             """
         )
         self.conn.commit()
@@ -93,33 +159,76 @@ class RealEstateStore:
                 self.conn.execute(
                     f"ALTER TABLE {tbl} ADD COLUMN property_type TEXT DEFAULT 'apartment'")
 
-    # ── 매매(transactions) ─────────────────────────────────────────
-    def insert_new(self, records: list, property_type: str = "apartment") -> list:
-        """INSERT OR IGNORE 후 실제 삽입된(신규) 레코드만 반환."""
-        today = _date.today().isoformat()
+    def _migrate_year_month(self):
+        """year_month 컬럼이 없던 DB: 컬럼 추가 후 trade_date로 1회 채움."""
+        for tbl in ("transactions", "rents"):
+            cols = [row[1] for row in self.conn.execute(f"PRAGMA table_info({tbl})")]
+            if cols and "year_month" not in cols:
+                self.conn.execute(f"ALTER TABLE {tbl} ADD COLUMN year_month TEXT")
+                self.conn.execute(
+                    f"UPDATE {tbl} SET year_month = substr(replace(trade_date,'-',''),1,6)")
+
+    @contextmanager
+    def batch(self):
+        """블록 안의 insert_new*를 한 트랜잭션으로 커밋(중첩 가능). 예외 시에도 적재분은 커밋."""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.conn.commit()
+
+    def _bulk_insert(self, table: str, columns: tuple, records: list, rows: list) -> list:
+        """rows(records와 같은 순서)를 스테이징 → 신규 record_key만 삽입 → 신규 records 반환.
+        배치 안에서 같은 키가 반복되면 첫 레코드만 신규로 본다(행 단위 INSERT OR IGNORE와 동일)."""
+        if not rows:
+            return []
+        stage = f"_stage_{table}"
+        cols = ", ".join(columns)
+        self.conn.execute(
+            f"CREATE TEMP TABLE IF NOT EXISTS {stage} AS SELECT {cols} FROM {table} WHERE 0")
+        self.conn.execute(f"DELETE FROM {stage}")
+        self.conn.executemany(
+            f"INSERT INTO {stage} ({cols}) VALUES ({','.join('?' * len(columns))})", rows)
+        if _HAS_RETURNING:
+            # WHERE true: INSERT … SELECT 뒤 ON CONFLICT 파싱 모호성 회피
+            new_keys = {row[0] for row in self.conn.execute(
+                f"""INSERT INTO {table} ({cols}) SELECT {cols} FROM {stage} WHERE true
+                    ORDER BY rowid ON CONFLICT(record_key) DO NOTHING RETURNING record_key""")}
+        else:
+            new_keys = {row[0] for row in self.conn.execute(
+                f"""SELECT s.record_key FROM {stage} s
+                    WHERE NOT EXISTS (SELECT 1 FROM {table} t WHERE t.record_key = s.record_key)""")}
+            self.conn.execute(
+                f"INSERT OR IGNORE INTO {table} ({cols}) SELECT {cols} FROM {stage} ORDER BY rowid")
+        if self._batch_depth == 0:
+            self.conn.commit()
+
         new_records = []
-        cur = self.conn.cursor()
-        for r in records:
-            key = _record_key(r, property_type)
-            band = _area_band(r["area_sqm"])
-            cur.execute(
-                """INSERT OR IGNORE INTO transactions
-                   (record_key, property_type, region_code, apt_name, dong, area_sqm,
-                    area_band, floor, price_10k, trade_date, build_year, deal_type,
-                    first_seen_date)
-                   VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?)""",
-                (key, property_type, r["region_code"], r.get("apt_name", ""),
-                 r.get("dong", ""), float(r["area_sqm"]), band, int(r["floor"]),
-                 int(r["price_10k"]), r["trade_date"], r.get("build_year"),
-                 r.get("deal_type"), today),
-            )
-            if cur.rowcount == 1:
+        for r, row in zip(records, rows):
+            key = row[0]
+            if key in new_keys:
+                new_keys.discard(key)
                 out = dict(r)
-                out["area_band"] = band
+                out["area_band"] = row[6]
                 new_records.append(out)
-        self.conn.commit()
         return new_records
 
+    # ── 매매(transactions) ─────────────────────────────────────────
+    def insert_new(self, records: list, property_type: str = "apartment") -> list:
+        """일괄 적재 후 실제 삽입된(신규) 레코드만 반환."""
+        today = _date.today().isoformat()
+        rows = [
+            (_record_key(r, property_type), property_type, r["region_code"],
+             r.get("apt_name", ""), r.get("dong", ""), float(r["area_sqm"]),
+             _area_band(r["area_sqm"]), int(r["floor"]), int(r["price_10k"]),
+             r["trade_date"], r.get("build_year"), r.get("deal_type"), today,
+             _year_month(r["trade_date"]))
+            for r in records
+        ]
+        return self._bulk_insert("transactions", _TXN_COLUMNS, records, rows)
+
     def _cutoff(self, as_of: str) -> str:
         if as_of == "now":
             ref = _date.today()
@@ -133,104 +242,104 @@ class RealEstateStore:
 
     def baseline_snapshot(self, region_code: str, as_of: str = "now",
                           property_type: str = "apartment") -> dict:
+        return self.baseline_snapshots([region_code], as_of, property_type).get(region_code, {})
+
+    def baseline_snapshots(self, region_codes=None, as_of: str = "now",
+                           property_type: str = "apartment") -> dict:
+        """전 지역 baseline을 쿼리 한 번으로. region_codes=None이면 적재된 모든 지역.
+        반환 {region_code: {(apt_name, area_band): {max, max_date, min, min_date, count}}}.
+        max_date/min_date는 최고·최저가가 여러 번이면 가장 최근 거래일."""
         cutoff = self._cutoff(as_of)
+        where, params = _in_clause("region_code", region_codes)
         rows = self.conn.execute(
-            """SELECT apt_name, area_band,
-                      MAX(price_10k) AS mx, MIN(price_10k) AS mn, COUNT(*) AS cnt
-               FROM transactions
-               WHERE region_code=? AND property_type=? AND trade_date>=?
-               GROUP BY apt_name, area_band""",
-            (region_code, property_type, cutoff),
+            f"""WITH w AS (
+                  SELECT region_code, apt_name, area_band, price_10k, trade_date,
+                         MAX(price_10k) OVER g AS mx, MIN(price_10k) OVER g AS mn
+                  FROM transactions
+                  WHERE property_type=? AND trade_date>=? {where}
+                  WINDOW g AS (PARTITION BY region_code, apt_name, area_band)
+                )
+                SELECT region_code, apt_name, area_band, mx, mn, COUNT(*) AS cnt,
+                       MAX(CASE WHEN price_10k=mx THEN trade_date END) AS mx_date,
+                       MAX(CASE WHEN price_10k=mn THEN trade_date END) AS mn_date
+                FROM w GROUP BY region_code, apt_name, area_band""",
+            (property_type, cutoff) + params,
         ).fetchall()
-        snap = {}
+        snaps = {}
         for row in rows:
-            key = (row["apt_name"], row["area_band"])
-            mx_date = self.conn.execute(
-                """SELECT trade_date FROM transactions
-                   WHERE region_code=? AND property_type=? AND apt_name=? AND area_band=?
-                         AND price_10k=?
-                   ORDER BY trade_date DESC LIMIT 1""",
-                (region_code, property_type, row["apt_name"], row["area_band"], row["mx"]),
-            ).fetchone()["trade_date"]
-            mn_date = self.conn.execute(
-                """SELECT trade_date FROM transactions
-                   WHERE region_code=? AND property_type=? AND apt_name=? AND area_band=?
-                         AND price_10k=?
-                   ORDER BY trade_date DESC LIMIT 1""",
-                (region_code, property_type, row["apt_name"], row["area_band"], row["mn"]),
-            ).fetchone()["trade_date"]
-            snap[key] = {"max": row["mx"], "max_date": mx_date,
-                         "min": row["mn"], "min_date": mn_date, "count": row["cnt"]}
-        return snap
+            snaps.setdefault(row["region_code"], {})[(row["apt_name"], row["area_band"])] = {
+                "max": row["mx"], "max_date": row["mx_date"],
+                "min": row["mn"], "min_date": row["mn_date"], "count": row["cnt"]}
+        return snaps
 
     def monthly_volume(self, region_code: str, months: int = 12,
                        property_type: str = "apartment") -> list:
         rows = self.conn.execute(
-            """SELECT substr(replace(trade_date,'-',''),1,6) AS ym, COUNT(*) AS cnt
+            """SELECT year_month AS ym, COUNT(*) AS cnt
                FROM transactions WHERE region_code=? AND property_type=?
                GROUP BY ym ORDER BY ym DESC LIMIT ?""",
             (region_code, property_type, months),
         ).fetchall()
         return [(row["ym"], row["cnt"]) for row in reversed(rows)]
 
-    def band_medians(self, region_code: str, year_month: str,
-                     property_type: str = "apartment") -> dict:
-        like = f"{year_month[:4]}-{year_month[4:6]}-%"
+    def _grouped_medians(self, table: str, value: str, year_months, property_type: str,
+                         region_codes=None, extra: str = "") -> dict:
+        """{(region_code, year_month): {band: (median, count)}} — 한 번의 윈도우 쿼리."""
+        ym_where, ym_params = _in_clause("year_month", year_months)
+        rg_where, rg_params = _in_clause("region_code", region_codes)
         rows = self.conn.execute(
-            """SELECT area_band, price_10k FROM transactions
-               WHERE region_code=? AND property_type=? AND trade_date LIKE ?""",
-            (region_code, property_type, like),
+            _GROUPED_MEDIAN_SQL.format(table=table, value=value,
+                                       where=ym_where + rg_where + extra),
+            (property_type,) + ym_params + rg_params,
         ).fetchall()
-        by_band = {}
+        out = {}
         for row in rows:
-            by_band.setdefault(row["area_band"], []).append(row["price_10k"])
-        return {b: {"median": int(statistics.median(p)), "count": len(p)}
-                for b, p in by_band.items()}
+            out.setdefault((row["region_code"], row["year_month"]), {})[row["area_band"]] = (
+                int(row["median"]), row["cnt"])
+        return out
+
+    def band_medians(self, region_code: str, year_month: str,
+                     property_type: str = "apartment") -> dict:
+        return self.band_medians_by_region([year_month], property_type,
+                                           [region_code]).get((region_code, year_month), {})
+
+    def band_medians_by_region(self, year_months, property_type: str = "apartment",
+                               region_codes=None) -> dict:
+        """{(region_code, year_month): {band: {median, count}}} — 매매가 중앙값."""
+        grouped = self._grouped_medians("transactions", "price_10k", year_months,
+                                        property_type, region_codes)
+        return {k: {b: {"median": m, "count": c} for b, (m, c) in bands.items()}
+                for k, bands in grouped.items()}
 
     def has_records_for_month(self, region_code: str, year_month: str,
                               property_type: str = "apartment") -> bool:
         """해당 (구, 월, 유형)에 적재된 레코드가 1건이라도 있으면 True (백필 skip 판정)."""
-        like = f"{year_month[:4]}-{year_month[4:6]}-%"
         row = self.conn.execute(
             """SELECT 1 FROM transactions
-               WHERE region_code=? AND property_type=? AND trade_date LIKE ? LIMIT 1""",
-            (region_code, property_type, like),
+               WHERE region_code=? AND property_type=? AND year_month=? LIMIT 1""",
+            (region_code, property_type, year_month),
         ).fetchone()
         return row is not None
 
     # ── 전월세(rents) ──────────────────────────────────────────────
     def insert_new_rents(self, records: list, property_type: str = "apartment") -> list:
         today = _date.today().isoformat()
-        new_records = []
-        cur = self.conn.cursor()
-        for r in records:
-            key = _rent_record_key(r, property_type)
-            band = _area_band(r["area_sqm"])
-            cur.execute(
-                """INSERT OR IGNORE INTO rents
-                   (record_key, property_type, region_code, apt_name, dong, area_sqm,
-                    area_band, floor, deposit_10k, monthly_rent_10k, contract_type,
-                    trade_date, build_year, first_seen_date)
-                   VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?)""",
-                (key, property_type, r["region_code"], r.get("apt_name", ""),
-                 r.get("dong", ""), float(r["area_sqm"]), band, int(r["floor"]),
-                 int(r["deposit_10k"]), int(r.get("monthly_rent_10k", 0)),
-                 r.get("contract_type"), r["trade_date"], r.get("build_year"), today),
-            )
-            if cur.rowcount == 1:
-                out = dict(r)
-                out["area_band"] = band
-                new_records.append(out)
-        self.conn.commit()
-        return new_records
+        rows = [
+            (_rent_record_key(r, property_type), property_type, r["region_code"],
+             r.get("apt_name", ""), r.get("dong", ""), float(r["area_sqm"]),
+             _area_band(r["area_sqm"]), int(r["floor"]), int(r["deposit_10k"]),
+             int(r.get("monthly_rent_10k", 0)), r.get("contract_type"), r["trade_date"],
+             r.get("build_year"), today, _year_month(r["trade_date"]))
+            for r in records
+        ]
+        return self._bulk_insert("rents", _RENT_COLUMNS, records, rows)
 
     def has_rent_records_for_month(self, region_code: str, year_month: str,
                                    property_type: str = "apartment") -> bool:
-        like = f"{year_month[:4]}-{year_month[4:6]}-%"
         row = self.conn.execute(
             """SELECT 1 FROM rents
-               WHERE region_code=? AND property_type=? AND trade_date LIKE ? LIMIT 1""",
-            (region_code, property_type, like),
+               WHERE region_code=? AND property_type=? AND year_month=? LIMIT 1""",
+            (region_code, property_type, year_month),
         ).fetchone()
         return row is not None
 
@@ -238,29 +347,37 @@ class RealEstateStore:
                           property_type: str = "apartment") -> dict:
         """평형 밴드별 전세(월세=0) 보증금 중앙값 → 전세가율 산출용.
         반환 {band: {median_deposit_10k, count}}."""
-        like = f"{year_month[:4]}-{year_month[4:6]}-%"
-        rows = self.conn.execute(
-            """SELECT area_band, deposit_10k FROM rents
-               WHERE region_code=? AND property_type=? AND trade_date LIKE ?
-                     AND monthly_rent_10k=0""",
-            (region_code, property_type, like),
-        ).fetchall()
-        by_band = {}
-        for row in rows:
-            by_band.setdefault(row["area_band"], []).append(row["deposit_10k"])
-        return {b: {"median_deposit_10k": int(statistics.median(d)), "count": len(d)}
-                for b, d in by_band.items()}
+        return self.rent_band_medians_by_region([year_month], property_type,
+                                                [region_code]).get((region_code, year_month), {})
+
+    def rent_band_medians_by_region(self, year_months, property_type: str = "apartment",
+                                    region_codes=None) -> dict:
+        """{(region_code, year_month): {band: {median_deposit_10k, count}}} — 전세만."""
+        grouped = self._grouped_medians("rents", "deposit_10k", year_months, property_type,
+                                        region_codes, extra=" AND monthly_rent_10k=0")
+        return {k: {b: {"median_deposit_10k": m, "count": c} for b, (m, c) in bands.items()}
+                for k, bands in grouped.items()}
 
     def rent_volume(self, region_code: str, year_month: str,
                     property_type: str = "apartment") -> dict:
         """해당 (구, 월, 유형) 전월세 거래 건수 — 전세(월세=0)/월세 구성.
         반환 {total, jeonse, wolse}. (오피스텔 임대시장은 매매보다 활발해 별도 노출)."""
-        like = f"{year_month[:4]}-{year_month[4:6]}-%"
+        return self.rent_volume_by_region([year_month], property_type, [region_code]).get(
+            (region_code, year_month), {"total": 0, "jeonse": 0, "wolse": 0})
+
+    def rent_volume_by_region(self, year_months, property_type: str = "apartment",
+                              region_codes=None) -> dict:
+        """{(region_code, year_month): {total, jeonse, wolse}} — 거래 없는 조합은 키 없음."""
+        ym_where, ym_params = _in_clause("year_month", year_months)
+        rg_where, rg_params = _in_clause("region_code", region_codes)
         rows = self.conn.execute(
-            """SELECT monthly_rent_10k FROM rents
-               WHERE region_code=? AND property_type=? AND trade_date LIKE ?""",
-            (region_code, property_type, like),
+            f"""SELECT region_code, year_month, COUNT(*) AS total,
+                       SUM(COALESCE(monthly_rent_10k, 0) = 0) AS jeonse
+                FROM rents WHERE property_type=? {ym_where}{rg_where}
+                GROUP BY region_code, year_month""",
+            (property_type,) + ym_params + rg_params,
         ).fetchall()
-        total = len(rows)
-        jeonse = sum(1 for r in rows if (r["monthly_rent_10k"] or 0) == 0)
-        return {"total": total, "jeonse": jeonse, "wolse": total - jeonse}
+        return {(row["region_code"], row["year_month"]):
+                {"total": row["total"], "jeonse": row["jeonse"],
+                 "wolse": row["total"] - row["jeonse"]}
+                for row in rows}
@@ -149,3 +149,114 @@ def test_rent_volume_splits_jeonse_wolse(store):
     # 다른 월·유형엔 안 잡힘
     assert store.rent_volume("11440", "202604", "officetel") == {"total": 0, "jeonse": 0, "wolse": 0}
     assert store.rent_volume("11440", "202605", "apartment") == {"total": 0, "jeonse": 0, "wolse": 0}
+
+
+def test_band_medians_by_region_single_query(store):
+    store.insert_new([
+        _rec(region="11440", price=100000, floor=1, date="2026-05-01"),
+        _rec(region="11440", price=130000, floor=2, date="2026-05-02"),
+        _rec(region="11440", price=90000, floor=3, date="2026-04-02"),
+        _rec(region="11680", price=200000, floor=1, date="2026-05-01"),
+        _rec(region="11680", price=220000, floor=2, date="2026-05-02"),
+        _rec(region="11680", price=240000, floor=3, date="2026-05-03"),
+    ])
+    bm = store.band_medians_by_region(["202605", "202604"])
+    assert bm[("11440", "202605")][85] == {"median": 115000, "count": 2}   # 짝수 → 가운데 평균
+    assert bm[("11440", "202604")][85] == {"median": 90000, "count": 1}
+    assert bm[("11680", "202605")][85] == {"median": 220000, "count": 3}
+    assert ("11680", "202604") not in bm
+    # region_codes 필터, 구 단위 래퍼와 동일 결과
+    only = store.band_medians_by_region(["202605"], region_codes=["11680"])
+    assert list(only) == [("11680", "202605")]
+    assert store.band_medians("11440", "202605") == bm[("11440", "202605")]
+
+
+def test_baseline_snapshots_all_regions(store):
+    store.insert_new([
+        _rec(region="11440", price=100000, floor=1, date="2026-01-05"),
+        _rec(region="11440", price=100000, floor=2, date="2026-03-05"),   # 최고가 동률 → 최근일
+        _rec(region="11680", apt="B아파트", price=300000, floor=1, date="2026-02-05"),
+    ])
+    snaps = store.baseline_snapshots(as_of="2026-06-01")
+    assert snaps["11440"][("A아파트", 85)]["max_date"] == "2026-03-05"
+    assert snaps["11440"][("A아파트", 85)]["count"] == 2
+    assert snaps["11680"][("B아파트", 85)]["max"] == 300000
+    assert store.baseline_snapshots(["11680"], as_of="2026-06-01").keys() == {"11680"}
+    assert store.baseline_snapshot("11110") == {}
+
+
+def test_rent_bulk_queries(store):
+    store.insert_new_rents([
+        _rent(region="11440", deposit=50000, monthly=0, floor=1),
+        _rent(region="11440", deposit=10000, monthly=50, floor=2),
+        _rent(region="11680", deposit=70000, monthly=0, floor=1),
+    ], "officetel")
+    rv = store.rent_volume_by_region(["202605"], "officetel")
+    assert rv[("11440", "202605")] == {"total": 2, "jeonse": 1, "wolse": 1}
+    assert rv[("11680", "202605")] == {"total": 1, "jeonse": 1, "wolse": 0}
+    rb = store.rent_band_medians_by_region(["202605"], "officetel")
+    assert rb[("11440", "202605")][85] == {"median_deposit_10k": 50000, "count": 1}
+
+
+def test_year_month_backfilled_for_old_db(tmp_path):
+    import sqlite3
+    path = str(tmp_path / "old.db")
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+        CREATE TABLE transactions (
+          record_key TEXT PRIMARY KEY, region_code TEXT, apt_name TEXT, dong TEXT,
+          area_sqm REAL, area_band INTEGER, floor INTEGER, price_10k INTEGER,
+          trade_date TEXT, build_year INTEGER, deal_type TEXT, first_seen_date TEXT);
+        INSERT INTO transactions VALUES
+          ('k1', '11440', 'A아파트', '합정동', 84.9, 85, 1, 100000, '2026-05-10', 2015, '', '');
+    """)
+    conn.commit()
+    conn.close()
+
+    store = RealEstateStore(path)
+    assert store.has_records_for_month("11440", "202605") is True
+    assert store.band_medians("11440", "202605")[85]["median"] == 100000
+
+
+def test_synthesize_query_count_independent_of_regions(store):
+    import importlib
+    bot = importlib.import_module("weekly_realestate_bot")
+    regions = {f"구{i}": f"11{i:03d}" for i in range(30)}
+    store.insert_new([_rec(region=code, floor=i) for i, code in enumerate(regions.values())])
+    queries = []
+    store.conn.set_trace_callback(queries.append)
+    syn = bot.synthesize(store, regions, "202605")
+    store.conn.set_trace_callback(None)
+    assert len(queries) == 4                     # 매매·전세 중앙값, 오피스텔 매매·전월세
+    assert set(syn["jeonse"]) == set(regions)
+
+
+def test_insert_new_dedups_within_batch(store):
+    # 같은 배치 안 중복 키 → 첫 레코드만 신규 (행 단위 INSERT OR IGNORE와 동일)
+    new = store.insert_new([_rec(price=100000, apt="첫번째"), _rec(price=100000, apt="첫번째"),
+                            _rec(price=110000, floor=11)])
+    assert [r["price_10k"] for r in new] == [100000, 110000]
+    assert all("area_band" in r for r in new)
+    assert store.insert_new([]) == []
+
+
+def test_insert_new_anti_join_fallback(store, monkeypatch):
+    # SQLite < 3.35 (RETURNING 미지원) 경로
+    from realestate_bot import store as store_mod
+    monkeypatch.setattr(store_mod, "_HAS_RETURNING", False)
+    assert len(store.insert_new([_rec(price=100000), _rec(price=100000)])) == 1
+    assert store.insert_new([_rec(price=100000), _rec(price=120000, floor=12)]) == [
+        {**_rec(price=120000, floor=12), "area_band": 85}]
+    assert len(store.insert_new_rents([_rent(), _rent(floor=11)])) == 2
+
+
+def test_batch_commits_once_on_exit(store, tmp_path):
+    with store.batch():
+        store.insert_new([_rec(date="2026-04-10")])
+        with store.batch():                                      # 중첩
+            store.insert_new_rents([_rent()])
+        assert store.conn.in_transaction                        # 아직 미커밋
+    assert not store.conn.in_transaction
+    reopened = RealEstateStore(str(tmp_path / "t.db"))
+    assert reopened.has_records_for_month("11440", "202604")
+    assert reopened.has_rent_records_for_month("11440", "202605")
@@ -0,0 +1,283 @@
+"""Tests for the concurrent, cutoff-aware news_bot.aggregator pipeline.
+
+Covers:
+  - news_bot.host_limiter.HostLimiter (per-host concurrency + start spacing)
+  - NewsAggregator.fetch_news          (cutoff/dedup before any article fetch,
+                                        concurrent feeds, paywall skip)
+  - news_bot.http_cache.HttpCache      (conditional feed GETs, article TTL)
+
+Feeds and articles are served by a local HTTP server; no live network access.
+"""
+
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+from email.utils import format_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from news_bot.aggregator import NewsAggregator, canonical_url, normalize_title
+from news_bot.host_limiter import HostLimiter
+from news_bot.http_cache import HttpCache
+
+ARTICLE_BODY = "본문 " * 80
+
+
+def _rss(items):
+    entries = "".join(
+        f"<item><title>{title}</title><link>{link}</link>"
+        f"<description>요약</description><pubDate>{format_datetime(when)}</pubDate></item>"
+        for title, link, when in items
+    )
+    return f'<?xml version="1.0"?><rss version="2.0"><channel><title>t</title>{entries}</channel></rss>'
+
+
+class _Server:
+    """Serves registered paths; counts hits and tracks in-flight article requests."""
+
+    def __init__(self, delay=0.0):
+        self.routes = {}
+        self.etags = {}
+        self.hits = Counter()
+        self.not_modified = Counter()
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                path = self.path.split("?")[0]
+                with server._lock:
+                    server.hits[path] += 1
+                    server.in_flight += 1
+                    server.max_in_flight = max(server.max_in_flight, server.in_flight)
+                try:
+                    time.sleep(server.delay)
+                    etag = server.etags.get(path)
+                    if etag and self.headers.get("If-None-Match") == etag:
+                        with server._lock:
+                            server.not_modified[path] += 1
+                        self.send_response(304)
+                        self.end_headers()
+                        return
+                    body = server.routes.get(path)
+                    self.send_response(200 if body is not None else 404)
+                    self.send_header("Content-Type", "text/html; charset=utf-8")
+                    if etag:
+                        self.send_header("ETag", etag)
+                    self.end_headers()
+                    self.wfile.write((body or "").encode("utf-8"))
+                finally:
+                    with server._lock:
+                        server.in_flight -= 1
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.base = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def article(self, path):
+        self.routes[path] = f"<html><body><article><p>{ARTICLE_BODY}</p></article></body></html>"
+        return self.base + path
+
+
+@pytest.fixture
+def server():
+    srv = _Server()
+    yield srv
+    srv.httpd.shutdown()
+    srv.httpd.server_close()
+
+
+def _aggregator(feeds, category_map=None, max_per_host=4, cache=None):
+    limiter = HostLimiter(max_per_host=max_per_host, default_delay=0.0)
+    return NewsAggregator(feeds, category_map=category_map, limiter=limiter, cache=cache)
+
+
+# --------------------------- helpers ---------------------------
+
+def test_canonical_url_drops_tracking_and_fragment():
+    assert canonical_url("http://WWW.Example.com/a/?utm_source=x&id=3#top") == \
+        canonical_url("https://example.com/a?id=3")
+    assert canonical_url("https://example.com/a?id=3") != canonical_url("https://example.com/a?id=4")
+
+
+def test_normalize_title_ignores_case_and_punctuation():
+    assert normalize_title("Fed Holds Rates!") == normalize_title("fed  holds rates")
+
+
+# --------------------------- fetch_news ---------------------------
+
+def test_old_entries_are_never_fetched(server):
+    now = datetime.now()
+    fresh = server.article("/fresh")
+    old = server.article("/old")
+    server.routes["/feed"] = _rss([
+        ("Fresh story", fresh, now - timedelta(hours=1)),
+        ("Old story", old, now - timedelta(hours=30)),
+    ])
+
+    items = _aggregator([server.base + "/feed"]).fetch_news(hours_limit=24)
+
+    assert [i["title"] for i in items] == ["Fresh story"]
+    assert items[0]["full_content"].startswith("본문")
+    assert server.hits["/fresh"] == 1
+    assert server.hits["/old"] == 0
+
+
+def test_per_category_cutoff_applies_before_fetch(server):
+    now = datetime.now()
+    server.routes["/politics"] = _rss([("Politics 8h", server.article("/p"), now - timedelta(hours=8))])
+    server.routes["/culture"] = _rss([("Culture 8h", server.article("/c"), now - timedelta(hours=8))])
+    feeds = [server.base + "/politics", server.base + "/culture"]
+    cmap = {feeds[0]: "정치", feeds[1]: "문화"}
+
+    items = _aggregator(feeds, cmap).fetch_news(hours_limit=24, hours_by_category={"정치": 6})
+
+    assert [i["category"] for i in items] == ["문화"]
+    assert server.hits["/p"] == 0
+
+
+def test_duplicates_across_feeds_are_fetched_once(server):
+    now = datetime.now()
+    link = server.article("/shared")
+    server.routes["/a"] = _rss([("Same Story", link + "?utm_source=a", now)])
+    server.routes["/b"] = _rss([
+        ("Same story!", server.article("/mirror"), now),     # same title, other URL
+        ("Other", link + "#comments", now),                  # same URL, other title
+    ])
+
+    items = _aggregator([server.base + "/a", server.base + "/b"]).fetch_news()
+
+    assert len(items) == 1
+    assert items[0]["source_url"] == server.base + "/a"  # first feed wins
+    assert server.hits["/shared"] == 1
+    assert server.hits["/mirror"] == 0
+
+
+def test_paywall_domains_keep_rss_summary(server, monkeypatch):
+    monkeypatch.setattr("news_bot.aggregator.SKIP_FETCH_DOMAINS", ["127.0.0.1"])
+    server.routes["/feed"] = _rss([("Paywalled", server.article("/pw"), datetime.now())])
+
+    items = _aggregator([server.base + "/feed"]).fetch_news()
+
+    assert items[0]["description"] == "요약"
+    assert server.hits["/pw"] == 0
+
+
+def test_feeds_are_fetched_concurrently():
+    srv = _Server(delay=0.3)
+    try:
+        feeds = []
+        for n in range(4):
+            srv.routes[f"/feed{n}"] = _rss([])
+            feeds.append(srv.base + f"/feed{n}")
+        started = time.monotonic()
+        _aggregator(feeds).fetch_news()
+        assert time.monotonic() - started < 0.9  # serial would take >= 1.2s
+        assert srv.max_in_flight > 1
+    finally:
+        srv.httpd.shutdown()
+        srv.httpd.server_close()
+
+
+def test_article_fetches_respect_per_host_limit():
+    srv = _Server(delay=0.05)
+    try:
+        now = datetime.now()
+        srv.routes["/feed"] = _rss([(f"Story {n}", srv.article(f"/s{n}"), now) for n in range(8)])
+        _aggregator([srv.base + "/feed"], max_per_host=2).fetch_news()
+        assert sum(srv.hits[f"/s{n}"] for n in range(8)) == 8
+        assert srv.max_in_flight <= 2
+    finally:
+        srv.httpd.shutdown()
+        srv.httpd.server_close()
+
+
+# --------------------------- HostLimiter ---------------------------
+
+def test_host_limiter_spaces_request_starts_per_host():
+    clock = [0.0]
+    slept = []
+
+    def fake_sleep(sec):
+        slept.append(sec)
+        clock[0] += sec
+
+    limiter = HostLimiter(default_delay=1.0, host_delays={"hankyung.com": 2.0},
+                          clock=lambda: clock[0], sleep=fake_sleep)
+
+    for _ in range(3):
+        with limiter.acquire("https://www.hankyung.com/article/1"):
+            pass
+    with limiter.acquire("https://other.example/a"):
+        pass
+
+    assert slept == [2.0, 2.0]  # other host is not held back by hankyung
+    assert limiter.delay_for("news.mk.co.kr") == 1.0
+    assert limiter.delay_for("magazine.hankyung.com") == 2.0
+
+
+# --------------------------- HttpCache ---------------------------
+
+def test_repeat_run_uses_conditional_get_and_cached_articles(server, tmp_path):
+    server.routes["/feed"] = _rss([("Story", server.article("/s") + "?utm_source=rss", datetime.now())])
+    server.etags["/feed"] = '"v1"'
+    cache = HttpCache(str(tmp_path / "cache.db"))
+
+    first = _aggregator([server.base + "/feed"], cache=cache).fetch_news()
+    second = _aggregator([server.base + "/feed"], cache=cache).fetch_news()
+
+    assert server.not_modified["/feed"] == 1          # second feed request answered 304
+    assert server.hits["/s"] == 1                     # article served from cache
+    assert second[0]["full_content"] == first[0]["full_content"]
+    assert second[0]["title"] == "Story"
+
+
+def test_changed_feed_is_downloaded_again(server, tmp_path):
+    now = datetime.now()
+    server.routes["/feed"] = _rss([("One", server.article("/1"), now)])
+    server.etags["/feed"] = '"v1"'
+    cache = HttpCache(str(tmp_path / "cache.db"))
+    _aggregator([server.base + "/feed"], cache=cache).fetch_news()
+
+    server.routes["/feed"] = _rss([("One", server.article("/1"), now), ("Two", server.article("/2"), now)])
+    server.etags["/feed"] = '"v2"'
+    items = _aggregator([server.base + "/feed"], cache=cache).fetch_news()
+
+    assert [i["title"] for i in items] == ["One", "Two"]
+    assert server.not_modified["/feed"] == 0
+    assert (server.hits["/1"], server.hits["/2"]) == (1, 1)
+
+
+def test_expired_articles_are_refetched(server, tmp_path):
+    server.routes["/feed"] = _rss([("Story", server.article("/s"), datetime.now())])
+    cache = HttpCache(str(tmp_path / "cache.db"), article_ttl=-1)
+
+    _aggregator([server.base + "/feed"], cache=cache).fetch_news()
+    _aggregator([server.base + "/feed"], cache=cache).fetch_news()
+
+    assert server.hits["/s"] == 2
+    assert cache.prune()[0] == 1
+
+
+def test_cache_persists_across_instances(tmp_path):
+    path = str(tmp_path / "cache.db")
+    cache = HttpCache(path)
+    cache.store_feed("https://f.example/rss", b"<rss/>", '"e"', "Mon, 01 Jan 2026 00:00:00 GMT")
+    cache.store_article("https://example.com/a", "본문")
+    cache.close()
+
+    reopened = HttpCache(path)
+    assert reopened.conditional_headers("https://f.example/rss") == {
+        "If-None-Match": '"e"', "If-Modified-Since": "Mon, 01 Jan 2026 00:00:00 GMT",
+    }
+    assert reopened.feed_body("https://f.example/rss") == b"<rss/>"
+    assert reopened.get_article("https://example.com/a") == "본문"
+    assert reopened.conditional_headers("https://other.example/rss") == {}
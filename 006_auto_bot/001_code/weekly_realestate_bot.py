@@ -67,10 +67,13 @@ def build_report(store: RealEstateStore, regions: dict, months: list, as_of: str
     per_gu = {}
     highlights = []
     seoul = {"new_total": 0, "high_total": 0, "low_total": 0}
+    latest_ym = months[0]
+    prev_ym = months[1] if len(months) > 1 else None
 
+    # 1) 전 지역 baseline 스냅샷(삽입 전, 쿼리 1회). 구 적재는 다른 구 baseline에 영향 無
+    baselines = store.baseline_snapshots(list(regions.values()), as_of=as_of)
     for gu, code in regions.items():
-        # 1) baseline 스냅샷(삽입 전)
-        baseline = store.baseline_snapshot(code, as_of=as_of)
+        baseline = baselines.get(code, {})
         # 2) fetch + 적재(diff)
         fetched = []
         for ym in months:
@@ -90,23 +93,26 @@ def build_report(store: RealEstateStore, regions: dict, months: list, as_of: str
                                    "area_band": r["area_band"], "price_10k": r["price_10k"],
                                    "pct": v.pct, "kind": v.kind,
                                    "ref_price": v.ref_price, "ref_date": v.ref_date})
-        # 4) 지표
+        # 4) 지표(중앙값 변화 제외 — 전 지역 적재 후 한 번에)
         b = indicators.breadth(verdicts)
-        latest_ym = months[0]
-        prev_ym = months[1] if len(months) > 1 else None
-        cur_bm = store.band_medians(code, latest_ym)
-        prev_bm = store.band_medians(code, prev_ym) if prev_ym else {}
-        mix = indicators.mix_adjusted_change(
-            {k: v["median"] for k, v in cur_bm.items()},
-            {k: v["median"] for k, v in prev_bm.items()},
-            {k: v["count"] for k, v in cur_bm.items()})
         seg = indicators.segment_flags(new_records, current_year=cur_year)
         per_gu[gu] = {"new_count": len(new_records), "breadth": b,
-                      "mix_change": mix, "segment": seg}
+                      "mix_change": None, "segment": seg}
         seoul["new_total"] += len(new_records)
         seoul["high_total"] += b["high"]
         seoul["low_total"] += b["low"]
 
+    # 5) 밴드 중앙값(전 지역 × 당월·전월, 쿼리 1회) → 믹스 보정 변화율
+    medians = store.band_medians_by_region([ym for ym in (latest_ym, prev_ym) if ym],
+                                           region_codes=list(regions.values()))
+    for gu, code in regions.items():
+        cur_bm = medians.get((code, latest_ym), {})
+        prev_bm = medians.get((code, prev_ym), {}) if prev_ym else {}
+        per_gu[gu]["mix_change"] = indicators.mix_adjusted_change(
+            {k: v["median"] for k, v in cur_bm.items()},
+            {k: v["median"] for k, v in prev_bm.items()},
+            {k: v["count"] for k, v in cur_bm.items()})
+
     seoul["high_pct"] = (seoul["high_total"] / seoul["new_total"] * 100
                          if seoul["new_total"] else 0.0)
     highlights.sort(key=lambda h: abs(h["pct"] or 0), reverse=True)
@@ -129,16 +135,23 @@ def synthesize(store: RealEstateStore, regions: dict, year_month: str) -> dict:
     jeonse, officetel, officetel_rent = {}, {}, {}
     officetel_rent_breakdown = {}
     o_rent_jeonse = o_rent_wolse = 0
+    codes = list(regions.values())
+    # 유형·지표별 전 지역 쿼리 1회씩
+    trade_bm = store.band_medians_by_region([year_month], "apartment", codes)
+    rent_bm = store.rent_band_medians_by_region([year_month], "apartment", codes)
+    oftl_bm = store.band_medians_by_region([year_month], "officetel", codes)
+    oftl_rv = store.rent_volume_by_region([year_month], "officetel", codes)
     for gu, code in regions.items():
-        tb = store.band_medians(code, year_month, "apartment")
-        rb = store.rent_band_medians(code, year_month, "apartment")
+        key = (code, year_month)
+        tb = trade_bm.get(key, {})
+        rb = rent_bm.get(key, {})
         jeonse[gu] = indicators.jeonse_ratio(
             {b: v["median"] for b, v in tb.items()},
             {b: v["median_deposit_10k"] for b, v in rb.items()},
             {b: v["count"] for b, v in rb.items()})
-        ob = store.band_medians(code, year_month, "officetel")
+        ob = oftl_bm.get(key, {})
         officetel[gu] = sum(v["count"] for v in ob.values())
-        rv = store.rent_volume(code, year_month, "officetel")
+        rv = oftl_rv.get(key, {"total": 0, "jeonse": 0, "wolse": 0})
         officetel_rent[gu] = rv["total"]
         officetel_rent_breakdown[gu] = {"jeonse": rv["jeonse"], "wolse": rv["wolse"]}
         o_rent_jeonse += rv["jeonse"]
@@ -326,12 +339,13 @@ class RealEstateBot:
             if grp != "세종":   # 세종 오피스텔은 표본 적어 제외(스펙 §5)
                 specs += [(client.fetch_officetel_trades, self.store.insert_new, "officetel"),
                           (client.fetch_officetel_rent, self.store.insert_new_rents, "officetel")]
-            for ym in months:
-                for fetch, insert, ptype in specs:
-                    try:
-                        insert(fetch(code, ym), ptype)
-                    except Exception as e:  # noqa: BLE001
-                        logger.warning("extra collect skip %s %s %s: %s", ptype, gu, ym, e)
+            with self.store.batch():
+                for ym in months:
+                    for fetch, insert, ptype in specs:
+                        try:
+                            insert(fetch(code, ym), ptype)
+                        except Exception as e:  # noqa: BLE001
+                            logger.warning("extra collect skip %s %s %s: %s", ptype, gu, ym, e)
 
     def backfill(self, months: int, skip_existing: bool = True,
                  max_consecutive_fails: int = None, fetch_region=None):
@@ -395,24 +409,26 @@ class RealEstateBot:
                        insert_fn, has_fn, tag=""):
         consecutive_fails = 0
         for gu, code in config.ALL_REGIONS.items():  # 서울+경기+광역시+세종 전체
-            for ym in all_months:
-                if skip_existing and has_fn(code, ym):
-                    logger.info("backfill%s cached %s %s (already loaded, skip fetch)", tag, gu, ym)
-                    continue
-                try:
-                    recs = fetch_fn(code, ym)
-                    n = len(insert_fn(recs))
-                    logger.info("backfill%s %s %s: +%s", tag, gu, ym, n)
-                    consecutive_fails = 0
-                except Exception as e:  # noqa: BLE001
-                    consecutive_fails += 1
-                    logger.warning("backfill%s skip %s %s: %s", tag, gu, ym, e)
-                    if consecutive_fails >= max_fails:
-                        logger.error(
-                            "backfill%s ABORTED: %s consecutive failures (한도/API 오류 추정). "
-                            "적재분은 보존됨 — 회복 후 같은 명령으로 재개.",
-                            tag, consecutive_fails)
-                        return
+            with self.store.batch():  # 구 단위 1 트랜잭션 (중단돼도 그 구 적재분은 커밋)
+                for ym in all_months:
+                    if skip_existing and has_fn(code, ym):
+                        logger.info("backfill%s cached %s %s (already loaded, skip fetch)",
+                                    tag, gu, ym)
+                        continue
+                    try:
+                        recs = fetch_fn(code, ym)
+                        n = len(insert_fn(recs))
+                        logger.info("backfill%s %s %s: +%s", tag, gu, ym, n)
+                        consecutive_fails = 0
+                    except Exception as e:  # noqa: BLE001
+                        consecutive_fails += 1
+                        logger.warning("backfill%s skip %s %s: %s", tag, gu, ym, e)
+                        if consecutive_fails >= max_fails:
+                            logger.error(
+                                "backfill%s ABORTED: %s consecutive failures (한도/API 오류 추정). "
+                                "적재분은 보존됨 — 회복 후 같은 명령으로 재개.",
+                                tag, consecutive_fails)
+                            return
 
     def run_scheduled(self):
         getattr(schedule.every(), config.SCHEDULE_DAY).at(config.SCHEDULE_TIME).do(self.run)
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+부동산 store 적재 벤치마크 — 행 단위 INSERT vs 일괄 적재(스테이징 + RETURNING)
+
+합성 다년 데이터(지역 × 월 × 건수)를 백필과 같은 (구, 월) 단위 호출로 적재한다.
+  - row:  이전 방식 재현 (rollback journal, 행마다 INSERT OR IGNORE + rowcount, 호출마다 commit)
+  - bulk: RealEstateStore.insert_new (WAL, executemany + INSERT … RETURNING, 구 단위 batch)
+두 번째 패스는 같은 데이터를 다시 넣는다(재개/주간 중복 수집 — 신규 0건).
+
+  python 003_test_code/bench_realestate_ingest.py --regions 40 --months 36 --per-month 150
+"""
+
+import argparse
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '001_code'))
+
+from realestate_bot.store import RealEstateStore, _record_key, _area_band, _year_month
+
+
+def synthetic(regions: int, months: int, per_month: int, seed: int = 7) -> dict:
+    """{(region_code, 'YYYYMM'): [record, ...]}"""
+    rnd = random.Random(seed)
+    data = {}
+    for g in range(regions):
+        code = f"{11000 + g * 10}"
+        for m in range(months):
+            y, mm = 2023 + m // 12, m % 12 + 1
+            ym = f"{y:04d}{mm:02d}"
+            data[(code, ym)] = [
+                {"region_code": code, "apt_name": f"단지{rnd.randrange(300)}",
+                 "dong": f"동{rnd.randrange(20)}",
+                 "area_sqm": rnd.choice((59.9, 74.8, 84.9, 114.7)),
+                 "floor": rnd.randrange(1, 30),
+                 "price_10k": rnd.randrange(30000, 300000, 100),
+                 "trade_date": f"{y:04d}-{mm:02d}-{rnd.randrange(1, 29):02d}",
+                 "build_year": rnd.randrange(1985, 2025), "deal_type": "중개거래"}
+                for _ in range(per_month)
+            ]
+    return data
+
+
+def row_at_a_time(conn, records: list) -> int:
+    """이전 insert_new 방식 (행마다 1문장)."""
+    cur = conn.cursor()
+    new = 0
+    for r in records:
+        cur.execute(
+            """INSERT OR IGNORE INTO transactions
+               (record_key, property_type, region_code, apt_name, dong, area_sqm,
+                area_band, floor, price_10k, trade_date, build_year, deal_type,
+                first_seen_date, year_month)
+               VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?)""",
+            (_record_key(r), "apartment", r["region_code"], r.get("apt_name", ""),
+             r.get("dong", ""), float(r["area_sqm"]), _area_band(r["area_sqm"]),
+             int(r["floor"]), int(r["price_10k"]), r["trade_date"], r.get("build_year"),
+             r.get("deal_type"), "2026-01-01", _year_month(r["trade_date"])),
+        )
+        new += cur.rowcount == 1
+    conn.commit()
+    return new
+
+
+def run_row(path: str, data: dict) -> tuple:
+    store = RealEstateStore(path)                 # 스키마/인덱스 동일하게 생성
+    store.conn.execute("PRAGMA journal_mode=DELETE")
+    store.conn.execute("PRAGMA synchronous=FULL")
+    timings = []
+    for _ in range(2):
+        started = time.perf_counter()
+        n = sum(row_at_a_time(store.conn, recs) for recs in data.values())
+        timings.append((time.perf_counter() - started, n))
+    return timings
+
+
+def run_bulk(path: str, data: dict) -> tuple:
+    store = RealEstateStore(path)
+    by_region = {}
+    for (code, ym), recs in data.items():
+        by_region.setdefault(code, []).append(recs)
+    timings = []
+    for _ in range(2):
+        started = time.perf_counter()
+        n = 0
+        for batches in by_region.values():
+            with store.batch():
+                n += sum(len(store.insert_new(recs)) for recs in batches)
+        timings.append((time.perf_counter() - started, n))
+    return timings
+
+
+def main():
+    p = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    p.add_argument("--regions", type=int, default=40)
+    p.add_argument("--months", type=int, default=36)
+    p.add_argument("--per-month", type=int, default=150, dest="per_month")
+    args = p.parse_args()
+
+    data = synthetic(args.regions, args.months, args.per_month)
+    total = sum(len(v) for v in data.values())
+    print(f"sqlite {sqlite3.sqlite_version} · {args.regions} regions × {args.months} months "
+          f"× {args.per_month} = {total:,} records ({len(data):,} calls)")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        results = {"row": run_row(os.path.join(tmp, "row.db"), data),
+                   "bulk": run_bulk(os.path.join(tmp, "bulk.db"), data)}
+
+    print(f"{'':6}{'first load':>22}{'re-ingest (dups)':>22}")
+    for name, ((t1, n1), (t2, n2)) in results.items():
+        print(f"{name:6}{t1:>10.2f}s {total / t1:>9,.0f}/s{t2:>10.2f}s {total / t2:>9,.0f}/s"
+              f"   new={n1:,}/{n2:,}")
+    speedup = [r / b for (r, _), (b, _) in zip(results["row"], results["bulk"])]
+    print(f"speedup: first load ×{speedup[0]:.1f}, re-ingest ×{speedup[1]:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Item #46: 리밸런싱 주문 파이프라인 - 매도 배치 → 체결 확인 → 매수 배치 (실주문 mock)"""
+import sys
+import threading
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import MagicMock
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.api.kis_client import OrderResult
+from src.quant_modules import order_executor as oe_module
+from src.quant_modules.order_executor import OrderExecutor
+from src.quant_modules.state_manager import PendingOrder
+from src.strategy.quant import Position, PortfolioManager, StopLossManager
+
+
+class FakeClient:
+    """주문/시세 API 대체 - 호출 순서 기록"""
+
+    def __init__(self):
+        self.calls = []
+        self.orders = {}
+        self._lock = threading.Lock()
+        self._seq = 0
+
+    def get_stock_price(self, code):
+        with self._lock:
+            self.calls.append(("price", code))
+        if code == "000001":
+            raise Exception("조회 불가 종목")
+        return MagicMock(price=10000)
+
+    def _order(self, side, code, qty):
+        with self._lock:
+            self._seq += 1
+            order_no = f"{self._seq:010d}"
+            self.calls.append((side, code))
+            self.orders[order_no] = qty
+        return OrderResult(success=True, order_no=order_no, message="")
+
+    def buy_stock(self, code, qty, price=0, order_type="01"):
+        return self._order("buy", code, qty)
+
+    def sell_stock(self, code, qty, price=0, order_type="01"):
+        return self._order("sell", code, qty)
+
+    def get_order_history(self):
+        with self._lock:
+            self.calls.append(("history", ""))
+            # 주문번호 앞자리 0 제거 형태로 반환 (정규화 검증)
+            return [
+                {"order_no": no.lstrip("0"), "filled_qty": qty}
+                for no, qty in self.orders.items()
+            ]
+
+
+def main():
+    # 테스트 속도: 체결 폴링 간격 단축
+    oe_module.FILL_POLL_INTERVAL = 0.01
+
+    portfolio = PortfolioManager(total_capital=100_000_000)
+    for code in ("111111", "222222"):
+        portfolio.positions[code] = Position(
+            code=code, name=code, entry_price=9000, current_price=9000, quantity=10,
+            entry_date=datetime.now(), stop_loss=8000, take_profit_1=12000, take_profit_2=14000,
+        )
+
+    cfg = type("Cfg", (), {"dry_run": False, "target_stock_count": 5, "stop_loss_pct": 0.07})()
+    client = FakeClient()
+    oe = OrderExecutor(client=client, portfolio=portfolio, notifier=MagicMock(), config=cfg, is_virtual=False)
+
+    pending = [
+        PendingOrder(code="111111", name="A", order_type="SELL", quantity=10, price=0, reason="t"),
+        PendingOrder(code="222222", name="B", order_type="SELL", quantity=10, price=0, reason="t"),
+        PendingOrder(code="333333", name="C", order_type="BUY", quantity=5, price=0, reason="t", stop_loss=9000),
+        PendingOrder(code="444444", name="D", order_type="BUY", quantity=5, price=0, reason="t", stop_loss=9000),
+        PendingOrder(code="000001", name="E", order_type="BUY", quantity=5, price=0, reason="t", stop_loss=9000),
+    ]
+    failed = []
+    daily_trades = []
+
+    oe.execute_pending_orders(
+        pending_orders=pending,
+        failed_orders=failed,
+        daily_trades=daily_trades,
+        order_lock=threading.Lock(),
+        position_class=Position,
+        stop_loss_manager=StopLossManager,
+        take_profit_manager=MagicMock(),
+        save_state_callback=lambda: None,
+    )
+
+    sides = [c[0] for c in client.calls if c[0] in ("sell", "buy", "history")]
+    last_sell = max(i for i, s in enumerate(sides) if s == "sell")
+    first_buy = min(i for i, s in enumerate(sides) if s == "buy")
+    first_history = sides.index("history")
+    assert last_sell < first_history < first_buy, f"매도 → 체결 조회 → 매수 순서 기대: {sides}"
+
+    assert set(portfolio.positions) == {"333333", "444444"}, f"보유 종목 불일치: {set(portfolio.positions)}"
+    assert [t["type"] for t in daily_trades] == ["SELL", "SELL", "BUY", "BUY"], daily_trades
+    assert [o.code for o in failed] == ["000001"], f"가격 조회 실패 종목만 실패 기대: {failed}"
+    assert pending == [], f"대기 주문 비어야 함: {pending}"
+
+    print("PASS: 매도 배치 → 체결 확인 → 매수 배치, 실패 주문 이관")
+
+
+if __name__ == "__main__":
+    main()
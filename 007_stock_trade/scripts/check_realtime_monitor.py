@@ -0,0 +1,111 @@
+"""Item #45: 실시간 체결가 틱 → 손절 트리거 / 보유 종목 구독 동기화 (WebSocket mock)"""
+import sys
+import time
+import threading
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import MagicMock
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.api.kis_websocket import RealtimePrice
+from src.quant_modules.position_monitor import PositionMonitor
+from src.quant_modules.realtime_monitor import RealtimePositionMonitor
+from src.strategy.quant import Position
+
+
+class FakeWebSocket:
+    """KISWebSocket 대체 (네트워크 없음)"""
+
+    def __init__(self):
+        self.is_connected = False
+        self.ws_thread = None
+        self.on_price = None
+        self.subscribed = set()
+
+    def connect(self, on_price=None, on_error=None, **kwargs):
+        self.on_price = on_price
+        self.is_connected = True
+
+    def disconnect(self):
+        self.is_connected = False
+
+    def subscribe_price(self, code):
+        self.subscribed.add(code)
+
+    def unsubscribe_price(self, code):
+        self.subscribed.discard(code)
+
+
+def _tick(code, price):
+    return RealtimePrice(
+        code=code, time="100000", price=price, change=0, change_rate=0.0,
+        volume=1, cum_volume=1
+    )
+
+
+def main():
+    pos = Position(
+        code="005930",
+        name="삼성전자",
+        entry_price=50000,
+        current_price=50000,
+        quantity=10,
+        entry_date=datetime.now(),
+        stop_loss=46500,
+        take_profit_1=62250,
+        take_profit_2=71000,
+        highest_price=50000,
+    )
+    portfolio = MagicMock()
+    portfolio.positions = {pos.code: pos}
+
+    cfg = type("Cfg", (), {"trailing_stop": False, "stop_loss_pct": 0.07})()
+    pm = PositionMonitor(MagicMock(), portfolio, MagicMock(), cfg, is_virtual=True, order_executor=MagicMock())
+
+    # 손절 트리거 spy: 매도 성공으로 간주하고 포지션 제거
+    triggered = {"n": 0}
+    def spy(position, daily_trades):
+        triggered["n"] += 1
+        portfolio.positions.pop(position.code, None)
+    pm._trigger_stop_loss = spy
+
+    fake_ws = FakeWebSocket()
+    rt = RealtimePositionMonitor(pm, portfolio, is_virtual=True, ws_factory=lambda: fake_ws)
+
+    saved = {"n": 0}
+    def save_state():
+        saved["n"] += 1
+
+    lock = threading.Lock()
+    daily_trades = []
+    rt.start(lock, lambda: daily_trades, save_state)
+    try:
+        # 보유 종목 구독
+        rt.sync_subscriptions()
+        assert fake_ws.subscribed == {"005930"}, f"구독 목록 불일치: {fake_ws.subscribed}"
+        assert rt.is_streaming, "스트리밍 상태 기대"
+
+        # 손절가 위 틱 → 현재가만 갱신
+        fake_ws.on_price(_tick("005930", 48000))
+        # 손절가 아래 틱 → 손절 트리거
+        fake_ws.on_price(_tick("005930", 45000))
+
+        deadline = time.time() + 5
+        while triggered["n"] == 0 and time.time() < deadline:
+            time.sleep(0.05)
+        assert triggered["n"] == 1, f"손절 트리거 1회 기대, 실제 {triggered['n']}"
+
+        # 청산 종목 구독 해제
+        rt.sync_subscriptions()
+        assert fake_ws.subscribed == set(), f"청산 종목 구독 해제 기대: {fake_ws.subscribed}"
+    finally:
+        rt.stop()
+
+    assert saved["n"] >= 1, "청산 후 상태 저장 기대"
+    assert not rt.is_streaming, "정지 후 스트리밍 해제 기대"
+    print("PASS: 실시간 틱 손절 트리거 + 구독 동기화")
+
+
+if __name__ == "__main__":
+    main()
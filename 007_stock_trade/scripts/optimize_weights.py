@@ -18,17 +18,28 @@ from itertools import product
 import warnings
 warnings.filterwarnings('ignore')
 
-from src.strategy.quant.backtest import Backtester, BacktestConfig
+from src.strategy.quant.backtest import Backtester
+from src.strategy.quant.walk_forward import (
+    DEFAULT_PARAM_GRID, FactorPanel, evaluate_weights, optimizer_backtest_config
+)
 
 
 class WeightOptimizer:
     """팩터 가중치 최적화기"""
 
-    def __init__(self, price_data: dict, start_date: datetime, end_date: datetime):
+    def __init__(
+        self,
+        price_data: dict,
+        start_date: datetime,
+        end_date: datetime,
+        panel: FactorPanel = None
+    ):
         self.price_data = price_data
         self.start_date = start_date
         self.end_date = end_date
         self.results = []
+        # 사전 계산 팩터 패널 (있으면 조합별 신호 생성을 패널에서 수행)
+        self.panel = panel
 
     def generate_signals(
         self,
@@ -126,16 +137,19 @@ class WeightOptimizer:
     ) -> dict:
         """단일 가중치 조합으로 백테스트 실행"""
 
-        config = BacktestConfig(
-            initial_capital=100_000_000,
-            commission_rate=0.00015,
-            slippage_rate=0.001,
-            target_position_count=target_count,
-            max_position_size=0.10,
-            rebalance_frequency="M",
-            stop_loss_pct=0.07,
-            take_profit_pct=0.15
-        )
+        if self.panel is not None:
+            params = {
+                'momentum_weight': momentum_weight,
+                'short_mom_weight': short_mom_weight,
+                'volatility_weight': volatility_weight,
+                'volume_weight': volume_weight,
+                'target_count': target_count,
+            }
+            return evaluate_weights(
+                self.panel, self.price_data, params, self.start_date, self.end_date
+            )
+
+        config = optimizer_backtest_config(target_count)
 
         # 신호 생성
         sample_df = list(self.price_data.values())[0]
@@ -181,12 +195,12 @@ class WeightOptimizer:
     def grid_search(self, verbose: bool = True) -> pd.DataFrame:
         """그리드 서치로 최적 가중치 탐색"""
 
-        # 가중치 범위 정의
-        momentum_range = [0.2, 0.3, 0.4, 0.5, 0.6]
-        short_mom_range = [0.1, 0.2, 0.3, 0.4]
-        volatility_range = [0.1, 0.2, 0.3, 0.4, 0.5]
-        volume_range = [0.0, 0.1, 0.2]
-        target_count_range = [10, 15, 20]
+        # 가중치 범위 정의 (워크포워드 검증과 동일 그리드)
+        momentum_range = DEFAULT_PARAM_GRID['momentum_weight']
+        short_mom_range = DEFAULT_PARAM_GRID['short_mom_weight']
+        volatility_range = DEFAULT_PARAM_GRID['volatility_weight']
+        volume_range = DEFAULT_PARAM_GRID['volume_weight']
+        target_count_range = DEFAULT_PARAM_GRID['target_count']
 
         total = (len(momentum_range) * len(short_mom_range) *
                  len(volatility_range) * len(volume_range) * len(target_count_range))
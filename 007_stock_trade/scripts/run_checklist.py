@@ -38,10 +38,10 @@ INLINE_CHECKS = [
      "import json; [json.load(open(f)) for f in ['config/system_config.json','config/optimal_weights.json']]"),
     (35, "engine_state schema",
      "import json; d=json.load(open('data/quant/engine_state.json')); assert 'positions' in d and 'last_rebalance_month' in d and 'updated_at' in d"),
-    (36, "daily_history schema",
-     "import json; d=json.load(open('data/quant/daily_history.json')); assert isinstance(d.get('snapshots'),list) and 'initial_capital' in d"),
-    (37, "transaction_journal schema",
-     "import json; d=json.load(open('data/quant/transaction_journal.json')); assert isinstance(d.get('transactions'),list)"),
+    (36, "daily_tracker snapshots schema",
+     "import sqlite3; c=sqlite3.connect('file:data/quant/daily_tracker.db?mode=ro',uri=True); c.execute('SELECT date,payload FROM snapshots LIMIT 1'); assert c.execute(\"SELECT value FROM meta WHERE key='initial_capital'\").fetchone()"),
+    (37, "daily_tracker transactions schema",
+     "import sqlite3,json; c=sqlite3.connect('file:data/quant/daily_tracker.db?mode=ro',uri=True); [json.loads(p)[k] for (p,) in c.execute('SELECT payload FROM transactions LIMIT 3') for k in ['type','code','date']]"),
 ]
 
 PYTEST_CHECKS = [
@@ -73,6 +73,8 @@ SCRIPT_CHECKS = [
     (41, "watchdog syntax", "scripts/check_watchdog_syntax.py"),
     (42, "reentry cooldown", "scripts/check_reentry_cooldown.py"),
     (43, "sector limit", "scripts/check_sector_limit.py"),
+    (45, "realtime monitor", "scripts/check_realtime_monitor.py"),
+    (46, "order batch pipeline", "scripts/check_order_batch_pipeline.py"),
 ]
 
 ENTRY_COMPILE = (32, "main.py compile", "python -m py_compile main.py")
@@ -211,6 +211,7 @@ class QuantDaemon:
             momentum_weight=self.factor_weights.get('momentum_weight', 0.30),
             quality_weight=self.factor_weights.get('quality_weight', 0.30),
             volume_weight=self.factor_weights.get('volume_weight', 0.0),
+            realtime_monitoring=sys_config.realtime_monitoring,
         )
 
         logger.info(
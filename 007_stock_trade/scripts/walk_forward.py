@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+워크포워드 가중치 검증 스크립트
+- 수년치 가격 데이터 로컬 캐시 (data/quant/price_cache)
+- 학습/검증 구간 롤링 그리드 서치 (프로세스 풀)
+- 표본외 샤프비율 / 턴오버 / 가중치 안정성 리포트
+- 가중치 파일(optimal_weights.json)은 수정하지 않음
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import json
+import argparse
+import pandas as pd
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List
+import warnings
+warnings.filterwarnings('ignore')
+
+from src.strategy.quant.walk_forward import WalkForwardConfig, WalkForwardOptimizer
+
+PRICE_CACHE_DIR = Path("data/quant/price_cache")
+REPORT_FILE = Path("data/quant/walk_forward_report.json")
+
+
+def get_kospi200_tickers(end_date: datetime, limit: int = 50) -> List[str]:
+    """KOSPI200 구성종목 조회 (휴일 대비 최근 7일 탐색)"""
+    from pykrx import stock
+
+    tickers = []
+    for i in range(7):
+        check_date = (end_date - timedelta(days=i)).strftime("%Y%m%d")
+        tickers = stock.get_index_portfolio_deposit_file("1028", check_date)
+        if tickers is not None and len(tickers) > 0:
+            break
+
+    return list(tickers)[:limit]
+
+
+def load_price_history(
+    tickers: List[str],
+    start_date: datetime,
+    end_date: datetime,
+    cache_dir: Path = PRICE_CACHE_DIR,
+    min_rows: int = 60
+) -> Dict[str, pd.DataFrame]:
+    """종목별 가격 데이터 로드 (캐시 우선, 부족한 구간만 조회)"""
+    from scripts.optimize_weights import get_price_data
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    price_data = {}
+
+    for ticker in tickers:
+        cache_file = cache_dir / f"{ticker}.csv"
+        cached = None
+        if cache_file.exists():
+            try:
+                cached = pd.read_csv(cache_file, parse_dates=['date'])
+            except Exception:
+                cached = None
+
+        if cached is None or cached.empty or cached['date'].min() > start_date + timedelta(days=7):
+            # 캐시 없음 또는 시작 구간 부족 → 전체 조회
+            df = get_price_data(ticker, start_date.strftime("%Y%m%d"), end_date.strftime("%Y%m%d"))
+        elif cached['date'].max() < end_date - timedelta(days=1):
+            # 최근 구간만 추가 조회
+            fetch_start = cached['date'].max() + timedelta(days=1)
+            new_rows = get_price_data(ticker, fetch_start.strftime("%Y%m%d"), end_date.strftime("%Y%m%d"))
+            df = cached if new_rows is None else pd.concat([cached, new_rows], ignore_index=True)
+        else:
+            df = cached
+
+        if df is None or df.empty:
+            continue
+
+        df = df.drop_duplicates('date').sort_values('date').reset_index(drop=True)
+        if df is not cached:
+            df.to_csv(cache_file, index=False)
+
+        df = df[(df['date'] >= start_date) & (df['date'] <= end_date)].reset_index(drop=True)
+        if len(df) >= min_rows:
+            price_data[ticker] = df
+
+    return price_data
+
+
+def save_report(report_dict: dict, path: Path = REPORT_FILE):
+    """검증 리포트 저장"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    report_dict = {**report_dict, 'generated_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+    with open(path, 'w') as f:
+        json.dump(report_dict, f, indent=2, ensure_ascii=False, default=str)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='워크포워드 가중치 검증')
+    parser.add_argument('--years', type=int, default=3, help='검증 데이터 기간 (년)')
+    parser.add_argument('--tickers', type=int, default=50, help='KOSPI200 상위 종목 수')
+    parser.add_argument('--train-days', type=int, default=120, help='학습 구간 (거래일)')
+    parser.add_argument('--test-days', type=int, default=60, help='검증 구간 (거래일)')
+    parser.add_argument('--workers', type=int, default=None, help='프로세스 수 (기본: CPU 수)')
+    args = parser.parse_args()
+
+    print("\n" + "=" * 60)
+    print("     워크포워드 가중치 검증")
+    print("=" * 60)
+
+    end_date = datetime.now() - timedelta(days=2)
+    start_date = end_date - timedelta(days=365 * args.years)
+    print(f"\n기간: {start_date:%Y-%m-%d} ~ {end_date:%Y-%m-%d}")
+
+    print("\n[1/3] 데이터 로드 중 (캐시 우선)...")
+    tickers = get_kospi200_tickers(end_date, args.tickers)
+    price_data = load_price_history(tickers, start_date, end_date)
+    print(f"  → {len(price_data)}개 종목")
+
+    print("\n[2/3] 폴드별 그리드 서치 중...")
+    config = WalkForwardConfig(
+        train_days=args.train_days,
+        test_days=args.test_days,
+        max_workers=args.workers
+    )
+    report = WalkForwardOptimizer(price_data, config).run(verbose=True)
+
+    print("\n[3/3] 검증 결과")
+    print("-" * 90)
+    print(f"{'폴드':^4} {'검증구간':^23} {'모멘텀':^6} {'단기':^6} {'변동성':^6} {'거래량':^6} "
+          f"{'종목':^4} {'IS샤프':^7} {'OOS샤프':^7} {'수익률':^8}")
+    print("-" * 90)
+    for f in report.folds:
+        p = f.params
+        print(f"{f.fold.index:^4} {f.fold.test_start:%Y-%m-%d} ~ {f.fold.test_end:%Y-%m-%d} "
+              f"{p['momentum_weight']:^6.2f} {p['short_mom_weight']:^6.2f} "
+              f"{p['volatility_weight']:^6.2f} {p['volume_weight']:^6.2f} "
+              f"{int(p['target_count']):^4} {f.train_sharpe:^7.2f} {f.test_sharpe:^7.2f} "
+              f"{f.test_return:^+8.2f}%")
+    print("-" * 90)
+
+    stds = report.weight_std
+    print(f"""
+  평균 OOS 샤프:   {report.oos_sharpe:.2f} (IS {report.is_sharpe:.2f}, 효율 {report.efficiency:.2f})
+  OOS 누적 수익률: {report.oos_return:+.2f}%
+  월평균 턴오버:   {report.avg_turnover:.1f}%
+  가중치 표준편차: {', '.join(f'{k.replace("_weight", "")}={v:.2f}' for k, v in stds.items())}
+  조합 유지율:     {report.persistence * 100:.0f}%
+  소요 시간:       {report.elapsed_sec:.1f}초
+
+  검증 결과:       {'✅ 통과' if report.passed else '❌ 미통과'}
+""")
+
+    save_report(report.to_dict())
+    print(f"리포트 저장: {REPORT_FILE}")
+
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -6,12 +6,12 @@
 
 import time
 import logging
-import requests
 from typing import Optional, Dict, Any
 from dataclasses import dataclass
 from requests.exceptions import Timeout, ConnectionError, RequestException
 
 from .kis_auth import KISAuth, get_auth
+from .kis_transport import get_transport
 
 logger = logging.getLogger(__name__)
 
@@ -127,6 +127,8 @@ class KISClient:
         """
         self.auth = get_auth(is_virtual)
         self.is_virtual = is_virtual
+        # 세션 풀 + 공통 Rate Limiter (계좌 유형별 프로세스 공유)
+        self.transport = get_transport(is_virtual)
         self._last_response_headers = {}  # 페이지네이션용 응답 헤더 저장
 
     def _request(
@@ -171,19 +173,16 @@ class KISClient:
 
         for attempt in range(retries):
             try:
-                if method.upper() == "GET":
-                    response = requests.get(
-                        url, headers=headers, params=params, timeout=timeout
-                    )
-                else:
-                    response = requests.post(
-                        url, headers=headers, json=body, timeout=timeout
-                    )
-
-                # HTTP 상태 코드 체크
-                if response.status_code == 429:
+                response = self.transport.request(
+                    method, url, tr_id, headers,
+                    params=params, body=body, timeout=timeout
+                )
+
+                # 요청 제한 (HTTP 429 / EGW00201 초당 거래건수 초과)
+                if self.transport.is_rate_limited(response):
+                    last_error = KISRateLimitError(f"API 요청 제한 초과: {endpoint}", code="EGW00201")
                     wait_time = 2 ** attempt
-                    logger.warning(f"API 요청 제한 초과. {wait_time}초 후 재시도...")
+                    logger.warning(f"API 요청 제한 초과 ({tr_id}). {wait_time}초 후 재시도...")
                     time.sleep(wait_time)
                     continue
 
@@ -263,6 +262,10 @@ class KISClient:
 
         raise KISAPIError(f"API 호출 실패: {endpoint}")
 
+    def get_api_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """TR별 API 호출 지표 (호출 수, 지연, 요청 제한 횟수)"""
+        return self.transport.get_metrics()
+
     # ========== 시세 조회 ==========
 
     def get_stock_price(self, stock_code: str) -> StockPrice:
@@ -788,7 +791,6 @@ class KISClient:
                 ctx_nk = data.get("ctx_area_nk100", "")
                 if not ctx_fk and not ctx_nk:
                     break
-                time.sleep(0.5)  # API Rate Limit 방지
             else:
                 break
 
@@ -3,7 +3,6 @@
 - 재무비율, 순위 조회, 모멘텀 계산 등
 """
 
-import time
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
@@ -113,19 +112,6 @@ class DailyPrice:
 class KISQuantClient(KISClient):
     """퀀트 전략용 확장 API 클라이언트"""
 
-    def __init__(self, is_virtual: bool = True):
-        super().__init__(is_virtual)
-        # API 호출 제한 관리 (모의: 5건/초, 실전: 20건/초)
-        self._last_call_time: float = 0
-        self._min_interval: float = 0.5 if is_virtual else 0.1  # 여유있게 설정
-
-    def _rate_limit(self):
-        """API 호출 속도 제한"""
-        elapsed = time.time() - self._last_call_time
-        if elapsed < self._min_interval:
-            time.sleep(self._min_interval - elapsed)
-        self._last_call_time = time.time()
-
     # ========== 재무 데이터 API ==========
 
     def get_financial_ratio_ext(self, stock_code: str) -> FinancialRatioExt:
@@ -135,8 +121,6 @@ class KISQuantClient(KISClient):
         TR ID: FHKST66430300
         참고: 현재가 API에서 일부 재무비율 조회 가능
         """
-        self._rate_limit()
-
         # 현재가 API에서 기본 재무비율 조회
         tr_id = "FHKST01010100"
 
@@ -178,8 +162,6 @@ class KISQuantClient(KISClient):
         주의: 한국투자증권 API에서 상세 재무제표는
               별도 TR이 필요하며, 일부 데이터만 조회 가능
         """
-        self._rate_limit()
-
         # 기본 정보에서 가능한 데이터 추출
         ratio = self.get_financial_ratio_ext(stock_code)
 
@@ -208,8 +190,6 @@ class KISQuantClient(KISClient):
         max_per_page = 30   # API 제한
 
         while len(result) < count:
-            self._rate_limit()
-
             params = {
                 "FID_COND_MRKT_DIV_CODE": "J",
                 "FID_COND_SCR_DIV_CODE": "20174",
@@ -274,8 +254,6 @@ class KISQuantClient(KISClient):
 
         TR ID: FHPST01710000
         """
-        self._rate_limit()
-
         tr_id = "FHPST01710000"
 
         params = {
@@ -332,8 +310,6 @@ class KISQuantClient(KISClient):
             count: 조회 개수
             is_rise: True=상승률, False=하락률
         """
-        self._rate_limit()
-
         tr_id = "FHPST01720000"
 
         params = {
@@ -384,8 +360,6 @@ class KISQuantClient(KISClient):
 
         TR ID: FHPST01730000
         """
-        self._rate_limit()
-
         tr_id = "FHPST01730000"
 
         params = {
@@ -439,8 +413,6 @@ class KISQuantClient(KISClient):
         """
         52주 신저가 종목 조회
         """
-        self._rate_limit()
-
         tr_id = "FHPST01730000"
 
         params = {
@@ -508,8 +480,6 @@ class KISQuantClient(KISClient):
             period: D(일), W(주), M(월)
             count: 조회 개수
         """
-        self._rate_limit()
-
         tr_id = "FHKST03010100"
 
         # 종료일자 (오늘)
@@ -0,0 +1,167 @@
+"""
+한국투자증권 API 전송 계층
+- Keep-Alive 세션 풀 (연결 재사용)
+- 프로세스 공통 토큰 버킷 (실전/모의 계좌 TPS 한도)
+- TR별 지표 (호출 수, 지연, 429/EGW00201 횟수)
+
+스크리닝/모니터링/주문이 동시에 실행되어도 같은 Rate Limiter를 공유하므로
+증권사 초당 거래건수 제한(EGW00201)에 걸리지 않음
+"""
+
+import time
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Optional, Dict, Any
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from ..utils.rate_limiter import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+# 계좌 유형별 TPS 예산 (증권사 한도: 실전 20건/초, 모의 5건/초 - 여유 확보)
+TPS_REAL = 15.0
+TPS_VIRTUAL = 2.0
+BURST_REAL = 3
+BURST_VIRTUAL = 1
+
+# 세션 연결 풀 크기 (동시 조회 스레드 수 이상)
+POOL_SIZE = 10
+
+# 초당 거래건수 초과 응답
+RATE_LIMIT_CODES = ("EGW00201", "초당 거래건수")
+
+
+@dataclass
+class TRMetrics:
+    """TR별 호출 지표"""
+    calls: int = 0
+    errors: int = 0
+    rate_limited: int = 0       # HTTP 429 + EGW00201
+    total_latency: float = 0.0  # 초
+    max_latency: float = 0.0    # 초
+    throttle_wait: float = 0.0  # Rate Limiter 대기 누적 (초)
+
+    @property
+    def avg_latency_ms(self) -> float:
+        return self.total_latency / self.calls * 1000 if self.calls else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "rate_limited": self.rate_limited,
+            "avg_latency_ms": round(self.avg_latency_ms, 1),
+            "max_latency_ms": round(self.max_latency * 1000, 1),
+            "throttle_wait_sec": round(self.throttle_wait, 2),
+        }
+
+
+class KISTransport:
+    """KIS REST 전송 계층 (계좌 유형별 싱글톤)"""
+
+    def __init__(self, is_virtual: bool = True):
+        self.is_virtual = is_virtual
+        self.limiter = RateLimiter(
+            rate=TPS_VIRTUAL if is_virtual else TPS_REAL,
+            burst=BURST_VIRTUAL if is_virtual else BURST_REAL
+        )
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self._metrics: Dict[str, TRMetrics] = {}
+        self._metrics_lock = threading.Lock()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        tr_id: str,
+        headers: Dict[str, str],
+        params: Optional[Dict] = None,
+        body: Optional[Dict] = None,
+        timeout: float = 10
+    ) -> requests.Response:
+        """
+        HTTP 요청 (Rate Limiter 대기 후 세션으로 전송)
+
+        Raises:
+            requests.RequestException: 네트워크 오류 (호출자가 재시도 처리)
+        """
+        waited = self.limiter.acquire()
+        started = time.monotonic()
+        response = None
+        try:
+            if method.upper() == "GET":
+                response = self.session.get(url, headers=headers, params=params, timeout=timeout)
+            else:
+                response = self.session.post(url, headers=headers, json=body, timeout=timeout)
+            return response
+        finally:
+            self._record(tr_id, time.monotonic() - started, waited, response)
+
+    @staticmethod
+    def is_rate_limited(response: requests.Response) -> bool:
+        """초당 거래건수 초과 응답 여부"""
+        if response.status_code == 429:
+            return True
+        text = response.text or ""
+        return any(code in text for code in RATE_LIMIT_CODES)
+
+    def _record(self, tr_id: str, latency: float, waited: float, response):
+        with self._metrics_lock:
+            m = self._metrics.setdefault(tr_id, TRMetrics())
+            m.calls += 1
+            m.total_latency += latency
+            m.max_latency = max(m.max_latency, latency)
+            m.throttle_wait += waited
+            if response is None or response.status_code >= 400:
+                m.errors += 1
+            if response is not None and self.is_rate_limited(response):
+                m.rate_limited += 1
+
+    def get_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """TR별 지표 스냅샷"""
+        with self._metrics_lock:
+            return {tr_id: m.to_dict() for tr_id, m in self._metrics.items()}
+
+    def reset_metrics(self):
+        with self._metrics_lock:
+            self._metrics.clear()
+
+    def log_metrics(self):
+        """TR별 지표 로그 (호출 수 상위)"""
+        metrics = self.get_metrics()
+        if not metrics:
+            return
+        for tr_id, m in sorted(metrics.items(), key=lambda x: -x[1]["calls"]):
+            logger.info(
+                f"[KIS] {tr_id}: {m['calls']}건, 평균 {m['avg_latency_ms']}ms, "
+                f"최대 {m['max_latency_ms']}ms, 제한 {m['rate_limited']}건, "
+                f"대기 {m['throttle_wait_sec']}초"
+            )
+
+
+# 계좌 유형별 싱글톤
+_transports: Dict[bool, KISTransport] = {}
+_transports_lock = threading.Lock()
+
+
+def get_transport(is_virtual: bool = True) -> KISTransport:
+    """
+    전송 계층 인스턴스 반환 (계좌 유형별 싱글톤)
+
+    Args:
+        is_virtual: True=모의투자, False=실전투자
+    """
+    with _transports_lock:
+        transport = _transports.get(is_virtual)
+        if transport is None:
+            transport = KISTransport(is_virtual=is_virtual)
+            _transports[is_virtual] = transport
+        return transport
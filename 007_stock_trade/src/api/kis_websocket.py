@@ -254,6 +254,9 @@ class KISWebSocket:
     def _on_close(self, ws, close_status_code, close_msg):
         """WebSocket 연결 종료"""
         self.is_connected = False
+        # 재연결 시 서버 측 등록이 초기화되므로 구독 목록도 비움
+        self._subscribed_prices.clear()
+        self._subscribed_orderbooks.clear()
         print(f"[KISWebSocket] 연결 종료 (code={close_status_code})")
 
     def _on_ws_error(self, ws, error):
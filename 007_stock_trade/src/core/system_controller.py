@@ -34,6 +34,7 @@ class SystemConfig:
     stop_loss_pct: float = 7.0
     take_profit_pct: float = 10.0
     max_daily_trades: int = 10
+    realtime_monitoring: bool = False  # WebSocket 실시간 손절/익절 감시
 
     # 신호 가중치 (모니터링/최적화용, system_config.json에 저장)
     # 주의: 엔진 스크리너의 V/M/Q 팩터 가중치는 optimal_weights.json에서 관리
@@ -43,14 +43,11 @@ from .strategy.quant import (
 from .telegram import TelegramNotifier, get_notifier
 from .utils import is_trading_day, get_trading_hours, get_market_open_time
 from .utils.balance_helpers import parse_balance
-from .quant_modules import EngineState, SchedulePhase, PendingOrder, EngineStateManager, OrderExecutor, MonthlyTracker, DailyTracker, DailySnapshot, ReportGenerator, PositionMonitor, ScheduleHandler
+from .quant_modules import EngineState, SchedulePhase, PendingOrder, EngineStateManager, OrderExecutor, MonthlyTracker, DailyTracker, DailySnapshot, ReportGenerator, PositionMonitor, RealtimePositionMonitor, ScheduleHandler
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
-# API Rate Limit 설정 (order_executor 정의를 공유)
-from .quant_modules.order_executor import API_DELAY_VIRTUAL, API_DELAY_REAL
-
 
 @dataclass
 class QuantEngineConfig:
@@ -74,6 +71,7 @@ class QuantEngineConfig:
     market_open_time: str = "09:00"   # 장 시작
     market_close_time: str = "15:20"  # 장 종료
     monitoring_interval: int = 5       # 모니터링 간격 (분)
+    realtime_monitoring: bool = False  # WebSocket 실시간 손절/익절 (끊김 시 폴링 폴백)
 
     # 리밸런싱
     rebalance_day: int = 1            # 리밸런싱 일 (매월 N일)
@@ -246,6 +244,15 @@ class QuantTradingEngine:
             order_executor=self.order_executor,
         )
 
+        # 실시간 포지션 모니터 (WebSocket)
+        self.realtime_monitor: Optional[RealtimePositionMonitor] = None
+        if self.config.realtime_monitoring:
+            self.realtime_monitor = RealtimePositionMonitor(
+                position_monitor=self.position_monitor,
+                portfolio=self.portfolio,
+                is_virtual=is_virtual,
+            )
+
         # 스케줄 핸들러
         self.schedule_handler = ScheduleHandler(engine=self)
 
@@ -700,10 +707,35 @@ class QuantTradingEngine:
             save_state_callback=self._save_state
         )
 
+        # 신규 체결 종목 실시간 구독
+        if self.realtime_monitor:
+            self.realtime_monitor.sync_subscriptions()
+
     # ========== 장중 모니터링 (position_monitor 위임) ==========
 
+    def start_realtime_monitoring(self):
+        """실시간 포지션 모니터링 시작 (장 시작 시)"""
+        if not self.realtime_monitor:
+            return
+        self.realtime_monitor.start(
+            position_lock=self._position_lock,
+            get_daily_trades=lambda: self.daily_trades,
+            save_state_fn=self._save_state,
+        )
+
+    def stop_realtime_monitoring(self):
+        """실시간 포지션 모니터링 정지 (장 마감 시)"""
+        if self.realtime_monitor:
+            self.realtime_monitor.stop()
+
     def monitor_positions(self):
         """포지션 모니터링 (position_monitor 위임)"""
+        if self.realtime_monitor and self.realtime_monitor.is_streaming:
+            # 실시간 스트림 정상: 손절/익절은 틱 단위로 처리됨 → 리스크 점검만
+            self.realtime_monitor.sync_subscriptions()
+            self.position_monitor.check_risks(self._position_lock)
+            return
+
         self.position_monitor.monitor(
             position_lock=self._position_lock,
             daily_trades=self.daily_trades,
@@ -850,6 +882,8 @@ class QuantTradingEngine:
         self.state = EngineState.STOPPED
         schedule.clear()
 
+        self.stop_realtime_monitoring()
+
         # 상태 저장
         self._save_state()
 
@@ -6,7 +6,9 @@ QuantEngine의 핵심 컴포넌트를 분리하여 관리
 - order_executor: 주문 실행 (생성, 재시도, 실행)
 - monthly_tracker: 월간 포트폴리오 트래킹 및 리포트
 - daily_tracker: 일별 자산 추적 및 거래 일지
+- tracker_store: 일별 트래커 SQLite 저장소
 - position_monitor: 포지션 모니터링 (손절/익절)
+- realtime_monitor: WebSocket 실시간 포지션 모니터링
 - schedule_handler: 스케줄 이벤트 핸들러
 - report_generator: 리포트 생성
 """
@@ -20,8 +22,10 @@ from .state_manager import (
 from .order_executor import OrderExecutor
 from .monthly_tracker import MonthlySnapshot, MonthlyTracker
 from .daily_tracker import DailySnapshot, TransactionRecord, DailyTracker
+from .tracker_store import TrackerStore
 from .report_generator import ReportGenerator
 from .position_monitor import PositionMonitor
+from .realtime_monitor import RealtimePositionMonitor
 from .schedule_handler import ScheduleHandler
 
 __all__ = [
@@ -35,7 +39,9 @@ __all__ = [
     'DailySnapshot',
     'TransactionRecord',
     'DailyTracker',
+    'TrackerStore',
     'ReportGenerator',
     'PositionMonitor',
+    'RealtimePositionMonitor',
     'ScheduleHandler',
 ]
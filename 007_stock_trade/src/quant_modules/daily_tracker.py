@@ -2,6 +2,7 @@
 일별 자산 추적 및 거래 일지
 
 일별 스냅샷 저장, 거래 즉시 기록, 조회 기능 담당
+저장은 TrackerStore(SQLite)에 날짜 키로 upsert
 """
 
 import logging
@@ -11,6 +12,7 @@ from dataclasses import dataclass, field, asdict
 from typing import Optional, List, Dict, Any
 
 from .tracker_base import TrackerBase
+from .tracker_store import TrackerStore, DB_FILENAME
 
 logger = logging.getLogger(__name__)
 
@@ -102,78 +104,95 @@ class DailyTracker(TrackerBase):
     일별 자산 추적기
 
     일별 스냅샷 저장/로드, 거래 즉시 기록 담당
+    저장소: data_dir/daily_tracker.db (SQLite, 날짜 키 upsert/범위 조회)
+    기존 JSON 파일은 최초 실행 시 DB로 이관 후 *.migrated.json으로 보관
     """
 
     def __init__(self, data_dir: Path):
         super().__init__(data_dir)
+        self.db_file = self.data_dir / DB_FILENAME
+        # 레거시 JSON (이관 대상)
         self.history_file = self.data_dir / "daily_history.json"
         self.transaction_file = self.data_dir / "transaction_journal.json"
 
-        self.snapshots: List[DailySnapshot] = []
-        self.transactions: List[TransactionRecord] = []
+        self.store = TrackerStore(self.db_file)
         self.initial_capital: float = 0
+        # 전체 목록 캐시: (저장소 쓰기 세대, 목록) - 쓰기 시 세대가 바뀌면 재조회
+        self._snapshots_cache: Optional[tuple] = None
+        self._transactions_cache: Optional[tuple] = None
 
+        self._migrate_legacy_json()
         self._load_history()
-        self._load_transactions()
+
+    @property
+    def snapshots(self) -> List[DailySnapshot]:
+        """전체 스냅샷 (날짜순, 쓰기 전까지 캐시 - 최신/기간 조회는 get_* 사용)"""
+        version = self.store.snapshots_version
+        if self._snapshots_cache is None or self._snapshots_cache[0] != version:
+            rows = [DailySnapshot.from_dict(s) for s in self.store.get_snapshots()]
+            self._snapshots_cache = (version, rows)
+        return list(self._snapshots_cache[1])
+
+    @property
+    def transactions(self) -> List[TransactionRecord]:
+        """전체 거래 (시간순, 쓰기 전까지 캐시 - 기간 조회는 get_* 사용)"""
+        version = self.store.transactions_version
+        if self._transactions_cache is None or self._transactions_cache[0] != version:
+            rows = [TransactionRecord.from_dict(t) for t in self.store.get_transactions()]
+            self._transactions_cache = (version, rows)
+        return list(self._transactions_cache[1])
 
     # ========== 히스토리 (일별 스냅샷) ==========
 
     def _load_history(self):
-        data = self._load_json(self.history_file, "일별 히스토리")
-        if data is None:
-            self.snapshots = []
-            return
-
-        self.initial_capital = data.get("initial_capital", 0)
-        self.snapshots = [
-            DailySnapshot.from_dict(s) for s in data.get("snapshots", [])
-        ]
-        logger.info(f"일별 히스토리 로드: {len(self.snapshots)}일, 초기자본: {self.initial_capital:,.0f}원")
+        self.initial_capital = self.store.get_meta("initial_capital", 0)
+        logger.info(
+            f"일별 히스토리 로드: {self.store.count_snapshots()}일, "
+            f"거래 {self.store.count_transactions()}건, 초기자본: {self.initial_capital:,.0f}원"
+        )
 
     def _save_history(self):
-        data = {
-            "initial_capital": self.initial_capital,
-            "snapshots": [s.to_dict() for s in self.snapshots],
-            "updated_at": datetime.now().isoformat()
-        }
-        if self._save_json(self.history_file, data, "일별 히스토리"):
-            logger.debug(f"일별 히스토리 저장: {len(self.snapshots)}일")
-
-    # ========== 거래 일지 ==========
-
-    def _load_transactions(self):
-        data = self._load_json(self.transaction_file, "거래 일지")
-        if data is None:
-            self.transactions = []
-            return
-
-        self.transactions = [
-            TransactionRecord.from_dict(t) for t in data.get("transactions", [])
-        ]
-        logger.info(f"거래 일지 로드: {len(self.transactions)}건")
-
-    def _save_transactions(self):
-        data = {
-            "transactions": [t.to_dict() for t in self.transactions],
-            "updated_at": datetime.now().isoformat()
-        }
-        if self._save_json(self.transaction_file, data, "거래 일지"):
-            logger.debug(f"거래 일지 저장: {len(self.transactions)}건")
+        """초기 투자금 등 메타 저장 (스냅샷은 save_daily_snapshot에서 개별 upsert)"""
+        try:
+            self.store.set_meta("initial_capital", self.initial_capital)
+            self.store.set_meta("updated_at", datetime.now().isoformat())
+        except Exception as e:
+            logger.error(f"일별 히스토리 저장 실패: {e}", exc_info=True)
+
+    def _migrate_legacy_json(self):
+        """레거시 JSON → DB 이관 (DB가 비어 있을 때 1회)"""
+        if self.store.count_snapshots() == 0 and self.history_file.exists():
+            data = self._load_json(self.history_file, "일별 히스토리")
+            if data is not None:
+                snapshots = [DailySnapshot.from_dict(s).to_dict() for s in data.get("snapshots", [])]
+                self.store.upsert_snapshots(snapshots)
+                self.store.set_meta("initial_capital", data.get("initial_capital", 0))
+                self._retire_legacy_file(self.history_file)
+                logger.info(f"일별 히스토리 DB 이관: {len(snapshots)}일")
+
+        if self.store.count_transactions() == 0 and self.transaction_file.exists():
+            data = self._load_json(self.transaction_file, "거래 일지")
+            if data is not None:
+                records = [TransactionRecord.from_dict(t).to_dict() for t in data.get("transactions", [])]
+                self.store.add_transactions(records)
+                self._retire_legacy_file(self.transaction_file)
+                logger.info(f"거래 일지 DB 이관: {len(records)}건")
+
+    @staticmethod
+    def _retire_legacy_file(filepath: Path):
+        filepath.replace(filepath.with_name(f"{filepath.stem}.migrated.json"))
 
     # ========== 공개 API ==========
 
     def save_daily_snapshot(self, snapshot: DailySnapshot):
         """일별 스냅샷 저장 (같은 날짜면 업데이트)"""
-        for i, s in enumerate(self.snapshots):
-            if s.date == snapshot.date:
-                self.snapshots[i] = snapshot
-                logger.info(f"일별 스냅샷 업데이트: {snapshot.date}")
-                self._cleanup_old_snapshots()
-                self._save_history()
-                return
-
-        self.snapshots.append(snapshot)
-        logger.info(f"새 일별 스냅샷 저장: {snapshot.date}")
+        try:
+            self.store.upsert_snapshot(snapshot.date, snapshot.to_dict())
+            logger.info(f"일별 스냅샷 저장: {snapshot.date}")
+        except Exception as e:
+            logger.error(f"일별 스냅샷 저장 실패: {e}", exc_info=True)
+            return
+
         self._cleanup_old_snapshots()
         self._save_history()
 
@@ -202,9 +221,8 @@ class DailyTracker(TrackerBase):
                 pnl_pct=trade_dict.get("pnl_pct", 0)
             )
 
-            self.transactions.append(record)
+            self.store.add_transaction(record.to_dict())
             self._cleanup_old_transactions()
-            self._save_transactions()
             logger.info(f"거래 기록: {record.type} {record.name} {record.quantity}주 @ {record.price:,.0f}원")
 
         except Exception as e:
@@ -212,41 +230,35 @@ class DailyTracker(TrackerBase):
 
     def get_previous_snapshot(self) -> Optional[DailySnapshot]:
         """직전 일 스냅샷 조회"""
-        sorted_snapshots = sorted(self.snapshots, key=lambda s: s.date)
-        if len(sorted_snapshots) >= 2:
-            return sorted_snapshots[-2]
+        rows = self.store.get_snapshots(desc=True, limit=2)
+        if len(rows) >= 2:
+            return DailySnapshot.from_dict(rows[1])
         return None
 
     def get_latest_snapshot(self) -> Optional[DailySnapshot]:
         """최신 스냅샷 조회"""
-        if not self.snapshots:
-            return None
-        return sorted(self.snapshots, key=lambda s: s.date)[-1]
+        rows = self.store.get_snapshots(desc=True, limit=1)
+        return DailySnapshot.from_dict(rows[0]) if rows else None
 
     def get_previous_day_snapshot(self, today: str) -> Optional[DailySnapshot]:
         """오늘 이전 날짜의 가장 최근 스냅샷 조회 (daily_pnl 계산용)"""
-        candidates = [s for s in self.snapshots if s.date < today]
-        if not candidates:
-            return None
-        return sorted(candidates, key=lambda s: s.date)[-1]
+        rows = self.store.get_snapshots(before=today, desc=True, limit=1)
+        return DailySnapshot.from_dict(rows[0]) if rows else None
 
     def get_recent_snapshots(self, days: int = 7) -> List[DailySnapshot]:
         """최근 N일 스냅샷 (최신순)"""
         cutoff = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
-        recent = [s for s in self.snapshots if s.date >= cutoff]
-        return sorted(recent, key=lambda s: s.date, reverse=True)
+        return [DailySnapshot.from_dict(s) for s in self.store.get_snapshots(since=cutoff, desc=True)]
 
     def get_recent_transactions(self, days: int = 7) -> List[TransactionRecord]:
         """최근 N일 거래 (최신순)"""
         cutoff = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
-        recent = [t for t in self.transactions if t.date >= cutoff]
-        return sorted(recent, key=lambda t: t.timestamp, reverse=True)
+        return [TransactionRecord.from_dict(t) for t in self.store.get_transactions(since=cutoff, desc=True)]
 
     def get_first_snapshot_date(self) -> Optional[str]:
         """최초 스냅샷 날짜"""
-        if not self.snapshots:
-            return None
-        return sorted(self.snapshots, key=lambda s: s.date)[0].date
+        rows = self.store.get_snapshots(limit=1)
+        return rows[0]["date"] if rows else None
 
     # ========== 장부 점검 (Reconciliation) ==========
 
@@ -310,7 +322,7 @@ class DailyTracker(TrackerBase):
             latest.daily_pnl = kis_total - prev.total_assets
             latest.daily_pnl_pct = (latest.daily_pnl / prev.total_assets * 100) if prev.total_assets > 0 else 0
 
-        self._save_history()
+        self.store.upsert_snapshot(latest.date, latest.to_dict())
 
         result["corrected"] = True
         result["details"] = f"보정 완료: {old_total:,.0f} → {kis_total:,.0f} (편차 {old_total - kis_total:+,.0f}원)"
@@ -320,25 +332,21 @@ class DailyTracker(TrackerBase):
     # ========== 내부 유틸 ==========
 
     def _cleanup_old_snapshots(self):
-        """365일 초과 스냅샷 정리"""
-        if len(self.snapshots) <= MAX_HISTORY_DAYS:
+        """365일 초과 스냅샷 정리 (기준일 이전 행 삭제)"""
+        if self.store.count_snapshots() <= MAX_HISTORY_DAYS:
             return
 
         cutoff = (datetime.now() - timedelta(days=MAX_HISTORY_DAYS)).strftime("%Y-%m-%d")
-        before = len(self.snapshots)
-        self.snapshots = [s for s in self.snapshots if s.date >= cutoff]
-        removed = before - len(self.snapshots)
+        removed = self.store.delete_snapshots_before(cutoff)
         if removed > 0:
             logger.info(f"오래된 스냅샷 {removed}개 정리")
 
     def _cleanup_old_transactions(self):
-        """365일 초과 거래 정리"""
-        if len(self.transactions) <= MAX_HISTORY_DAYS * 10:
+        """365일 초과 거래 정리 (기준일 이전 행 삭제)"""
+        if self.store.count_transactions() <= MAX_HISTORY_DAYS * 10:
             return
 
         cutoff = (datetime.now() - timedelta(days=MAX_HISTORY_DAYS)).strftime("%Y-%m-%d")
-        before = len(self.transactions)
-        self.transactions = [t for t in self.transactions if t.date >= cutoff]
-        removed = before - len(self.transactions)
+        removed = self.store.delete_transactions_before(cutoff)
         if removed > 0:
             logger.info(f"오래된 거래 기록 {removed}개 정리")
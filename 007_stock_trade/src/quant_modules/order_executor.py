@@ -2,13 +2,18 @@
 퀀트 엔진 주문 실행 모듈
 
 주문 생성, 실행, 재시도 등 주문 처리 전담
+- 현재가 일괄 조회 / 주문 배치 전송은 동시 실행 (TPS 한도는 KIS 전송 계층 Rate Limiter가 보장)
+- 매도 → 체결 확인(주문내역 일괄 조회) → 매수 순 파이프라인
 """
 
+import math
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import List, Dict, Any, Optional, TYPE_CHECKING
+from typing import List, Dict, Any, Optional, Tuple, TYPE_CHECKING
 
+from ..api.kis_transport import get_transport
 from .state_manager import PendingOrder
 
 if TYPE_CHECKING:
@@ -23,9 +28,10 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
-# API Rate Limit 설정 (주문 1건당 get_price + buy/sell = 2회 API 호출)
-API_DELAY_VIRTUAL = 1.0    # 모의투자: 1000ms (초당 1건 제한 대응)
-API_DELAY_REAL = 0.15      # 실전투자: 150ms
+# 주문 파이프라인
+ORDER_WORKERS = 4          # 동시 조회/주문 스레드 수
+FILL_POLL_INTERVAL = 1.0   # 체결 확인 주기 (초)
+FILL_WAIT_TIMEOUT = 10.0   # 체결 대기 상한 (초)
 
 # P2-6: 재진입 쿨다운 (반복 손절 루프 차단)
 COOLDOWN_DAYS = 20         # 손절 후 N영업일 재매수 금지
@@ -65,8 +71,13 @@ class OrderExecutor:
         self.notifier = notifier
         self.config = config
         self.is_virtual = is_virtual
-        self.api_delay = API_DELAY_VIRTUAL if is_virtual else API_DELAY_REAL
         self.daily_tracker = daily_tracker
+        # 전송 계층과 같은 Rate Limiter 공유 (별도 인스턴스를 두면 TPS 한도가 이중 계산됨)
+        self.rate_limiter = get_transport(is_virtual).limiter
+
+    def _workers(self, jobs: int) -> int:
+        """동시 실행 스레드 수 (공유 Rate Limiter의 초당 허용 건수를 넘지 않음)"""
+        return max(1, min(ORDER_WORKERS, jobs, math.ceil(self.rate_limiter.rate)))
 
     def generate_rebalance_orders(
         self,
@@ -196,17 +207,18 @@ class OrderExecutor:
         min_weight = 0.03  # 최소 3%
         max_weight = self.config.max_single_weight  # 최대 10%
 
-        for idx, stock in enumerate(buy_stocks):
+        # 매수 대상 현재가 일괄 조회
+        prices, price_errors = self.fetch_prices([s.code for s in buy_stocks])
+
+        for stock in buy_stocks:
             code = stock.code
-            if idx > 0:
-                time.sleep(self.api_delay)
 
-            # 포지션 사이징 (API 재시도 로직 포함)
+            # 포지션 사이징
             try:
-                current_price = self._get_price_with_retry(code)
+                current_price = prices.get(code)
 
                 if current_price is None:
-                    error_msg = "가격 조회 재시도 모두 실패"
+                    error_msg = price_errors.get(code, "가격 조회 재시도 모두 실패")[:200]
                     logger.error(f"가격 조회 최종 실패 ({code}): {error_msg}")
                     failed_orders.append(PendingOrder(
                         code=code,
@@ -461,15 +473,18 @@ class OrderExecutor:
         # 매수 주문 생성
         available_capital = self.portfolio.cash * 0.95  # 5% 여유
 
-        for idx, stock in enumerate(to_buy):
-            if idx > 0:
-                time.sleep(self.api_delay)
+        # 매수 대상 현재가 일괄 조회
+        prices, price_errors = self.fetch_prices([s.code for s in to_buy])
 
+        for stock in to_buy:
             try:
-                current_price = self._get_price_with_retry(stock.code)
+                current_price = prices.get(stock.code)
 
                 if current_price is None:
-                    logger.error(f"가격 조회 최종 실패 ({stock.code})")
+                    logger.error(
+                        f"가격 조회 최종 실패 ({stock.code}): "
+                        f"{price_errors.get(stock.code, '')}"
+                    )
                     continue
 
                 # 목표 비중 계산
@@ -521,6 +536,38 @@ class OrderExecutor:
         logger.info(f"부분 리밸런싱 주문 생성 완료: {len(orders)}건")
         return orders
 
+    def fetch_prices(self, codes: List[str]) -> Tuple[Dict[str, float], Dict[str, str]]:
+        """
+        현재가 일괄 조회 (동시 조회)
+
+        Args:
+            codes: 종목코드 리스트
+
+        Returns:
+            (종목별 현재가, 종목별 조회 실패 사유) - 실패 종목은 가격 dict에서 제외
+        """
+        prices: Dict[str, float] = {}
+        errors: Dict[str, str] = {}
+        codes = list(dict.fromkeys(codes))
+        if not codes:
+            return prices, errors
+
+        with ThreadPoolExecutor(max_workers=self._workers(len(codes))) as pool:
+            futures = {pool.submit(self._get_price_with_retry, code): code for code in codes}
+            for future in as_completed(futures):
+                code = futures[future]
+                try:
+                    price = future.result()
+                except Exception as e:
+                    errors[code] = str(e)
+                    continue
+                if price is None:
+                    errors[code] = "가격 조회 재시도 모두 실패"
+                else:
+                    prices[code] = price
+
+        return prices, errors
+
     def _get_price_with_retry(self, code: str, max_retries: int = 3) -> Optional[float]:
         """가격 조회 (재시도 포함)"""
         retry_delay = 1.0
@@ -601,10 +648,7 @@ class OrderExecutor:
         permanently_failed = []
         max_total_retries = 3
 
-        for i, order in enumerate(failed_orders):
-            if i > 0:
-                time.sleep(self.api_delay)
-
+        for order in failed_orders:
             # 이미 보유 중인 종목은 스킵
             if order.code in self.portfolio.positions:
                 logger.info(f"이미 보유 중 - 재시도 스킵: {order.name}")
@@ -737,6 +781,9 @@ class OrderExecutor:
         """
         대기 중인 주문 실행
 
+        매도 배치 전송 → 매도 체결 확인 → 매수 배치 전송 순으로 실행.
+        배치 내 현재가 조회/주문 전송은 동시 처리 (TPS 한도는 전송 계층에서 보장).
+
         Args:
             pending_orders: 대기 주문 리스트
             failed_orders: 실패 주문 리스트
@@ -757,8 +804,6 @@ class OrderExecutor:
                 take_profit_manager,
                 save_state_callback
             )
-            # 재시도 → 신규 주문 사이 Rate Limit 방지
-            time.sleep(self.api_delay * 2)
 
         # 2. 대기 주문 스냅샷 (Lock 보호)
         with order_lock:
@@ -768,33 +813,34 @@ class OrderExecutor:
             orders_to_execute = list(pending_orders)
 
         logger.info(f"대기 주문 실행: {len(orders_to_execute)}건")
+        started = time.time()
 
         # 매도 먼저 실행 (자금 확보)
         sell_orders = [o for o in orders_to_execute if o.order_type == "SELL"]
         buy_orders = [o for o in orders_to_execute if o.order_type == "BUY"]
 
-        executed = []
-        exec_failed = []  # 실행 단계에서 실패한 주문
+        executed, exec_failed, sell_nos = self._execute_batch(
+            sell_orders, daily_trades, position_class, stop_loss_manager
+        )
 
-        for i, order in enumerate(sell_orders):
-            if i > 0:
-                time.sleep(self.api_delay)
-            if self._execute_order(order, daily_trades, position_class, stop_loss_manager):
-                executed.append(order)
-            else:
-                exec_failed.append(order)
+        # 매도 체결 확인 후 매수 (고정 대기 대신 주문내역 일괄 조회)
+        if sell_nos:
+            unfilled = self._wait_for_fills(sell_nos)
+            if unfilled:
+                logger.warning(
+                    f"매도 미체결 {len(unfilled)}건 ({FILL_WAIT_TIMEOUT:.0f}초 대기 초과) - 매수 진행"
+                )
 
-        # 잠시 대기 (주문 체결 시간)
-        if sell_orders:
-            time.sleep(3)
+        buy_executed, buy_failed, buy_nos = self._execute_batch(
+            buy_orders, daily_trades, position_class, stop_loss_manager
+        )
+        executed += buy_executed
+        exec_failed += buy_failed
 
-        for i, order in enumerate(buy_orders):
-            if i > 0:
-                time.sleep(self.api_delay)
-            if self._execute_order(order, daily_trades, position_class, stop_loss_manager):
-                executed.append(order)
-            else:
-                exec_failed.append(order)
+        logger.info(
+            f"주문 전송 완료: 성공 {len(executed)}건, 실패 {len(exec_failed)}건 "
+            f"({time.time() - started:.1f}초)"
+        )
 
         # 실행 실패 주문을 failed_orders로 이관 (다음 장 재시도 대상)
         for order in exec_failed:
@@ -816,6 +862,13 @@ class OrderExecutor:
         # 상태 저장
         save_state_callback()
 
+        # 매수 체결 확인 (기록 이후 - 미체결은 로그로만 남김)
+        if buy_nos:
+            unfilled = self._wait_for_fills(buy_nos)
+            for no in unfilled:
+                o = buy_nos[no]
+                logger.warning(f"매수 미체결: {o.name} ({o.code}) 주문번호 {no}")
+
         # 리밸런싱 결과 알림
         if executed:
             self._notify_rebalance_result(executed)
@@ -823,6 +876,153 @@ class OrderExecutor:
         # 최종 보유 종목 미달 알림
         self._check_position_shortage(failed_orders, exec_failed)
 
+    def _execute_batch(
+        self,
+        orders: List[PendingOrder],
+        daily_trades: List[Dict],
+        position_class,
+        stop_loss_manager
+    ) -> Tuple[List[PendingOrder], List[PendingOrder], Dict[str, PendingOrder]]:
+        """
+        주문 배치 실행
+
+        현재가 일괄 조회 → 주문 동시 전송 → 포지션/거래 기록 (기록은 원래 순서대로 단일 스레드)
+
+        Returns:
+            (성공 주문, 실패 주문, 주문번호별 주문 - 실주문만)
+        """
+        executed: List[PendingOrder] = []
+        failed: List[PendingOrder] = []
+        order_nos: Dict[str, PendingOrder] = {}
+        if not orders:
+            return executed, failed, order_nos
+
+        # 미보유 종목 매도는 실패 처리
+        candidates = []
+        for order in orders:
+            if order.order_type == "SELL" and order.code not in self.portfolio.positions:
+                failed.append(order)
+            else:
+                candidates.append(order)
+
+        prices, price_errors = self.fetch_prices([o.code for o in candidates])
+        ready = []
+        for order in candidates:
+            if order.code in prices:
+                ready.append(order)
+            else:
+                logger.error(
+                    f"주문 가격 조회 실패 ({order.name}/{order.code}): "
+                    f"{price_errors.get(order.code, '')}"
+                )
+                failed.append(order)
+
+        # 주문 전송 (동시 전송)
+        submitted: Dict[int, Optional[str]] = {}
+        if ready:
+            with ThreadPoolExecutor(max_workers=self._workers(len(ready))) as pool:
+                futures = {
+                    pool.submit(self._submit_order, order, prices[order.code]): order
+                    for order in ready
+                }
+                for future in as_completed(futures):
+                    order = futures[future]
+                    try:
+                        submitted[id(order)] = future.result()
+                    except Exception as e:
+                        logger.error(f"주문 전송 오류 ({order.name}/{order.code}): {e}", exc_info=True)
+                        submitted[id(order)] = None
+
+        for order in ready:
+            order_no = submitted.get(id(order))
+            if not order_no:
+                failed.append(order)
+                continue
+
+            current_price = prices[order.code]
+            if order.order_type == "SELL":
+                ok = self._record_sell(order, current_price, order_no, daily_trades)
+            else:
+                ok = self._record_buy(
+                    order, current_price, order_no, daily_trades, position_class, stop_loss_manager
+                )
+
+            if ok:
+                executed.append(order)
+                if not self.config.dry_run:
+                    order_nos[order_no] = order
+            else:
+                failed.append(order)
+
+        return executed, failed, order_nos
+
+    def _submit_order(self, order: PendingOrder, current_price: float) -> Optional[str]:
+        """
+        주문 전송 (시장가)
+
+        Returns:
+            주문번호 (dry_run이면 가상 번호), 실패 시 None
+        """
+        side = "매수" if order.order_type == "BUY" else "매도"
+
+        if self.config.dry_run:
+            logger.info(f"[DRY RUN] {side}: {order.name} {order.quantity}주 @ {current_price:,}원")
+            return f"DRY_{datetime.now().strftime('%H%M%S')}"
+
+        if order.order_type == "BUY":
+            result = self.client.buy_stock(order.code, order.quantity, price=0, order_type="01")
+        else:
+            result = self.client.sell_stock(order.code, order.quantity, price=0, order_type="01")
+
+        if not result.success:
+            logger.error(f"{side} 실패: {result.message}")
+            return None
+        return result.order_no
+
+    @staticmethod
+    def _normalize_order_no(order_no) -> str:
+        return str(order_no or "").lstrip("0")
+
+    def _wait_for_fills(
+        self,
+        order_nos: Dict[str, PendingOrder],
+        timeout: float = FILL_WAIT_TIMEOUT
+    ) -> set:
+        """
+        체결 대기 (당일 주문내역 일괄 조회로 확인)
+
+        Args:
+            order_nos: 주문번호별 주문
+            timeout: 최대 대기 시간 (초)
+
+        Returns:
+            시간 내 전량 체결되지 않은 주문번호 집합
+        """
+        if not order_nos or self.config.dry_run:
+            return set()
+
+        pending = {self._normalize_order_no(no): no for no in order_nos}
+        deadline = time.time() + timeout
+
+        while pending:
+            try:
+                history = self.client.get_order_history()
+            except Exception as e:
+                logger.warning(f"체결 조회 실패: {e}")
+                history = []
+
+            for item in history:
+                key = self._normalize_order_no(item.get("order_no"))
+                original = pending.get(key)
+                if original and item.get("filled_qty", 0) >= order_nos[original].quantity:
+                    del pending[key]
+
+            if not pending or time.time() >= deadline:
+                break
+            time.sleep(FILL_POLL_INTERVAL)
+
+        return set(pending.values())
+
     def _execute_order(
         self,
         order: PendingOrder,
@@ -849,19 +1049,33 @@ class OrderExecutor:
     ) -> bool:
         """매수 주문 실행"""
         try:
-            price_info = self.client.get_stock_price(order.code)
-            current_price = price_info.price
+            current_price = self._get_price_with_retry(order.code)
+            if current_price is None:
+                return False
 
-            if self.config.dry_run:
-                logger.info(f"[DRY RUN] 매수: {order.name} {order.quantity}주 @ {current_price:,}원")
-                order_no = f"DRY_{datetime.now().strftime('%H%M%S')}"
-            else:
-                result = self.client.buy_stock(order.code, order.quantity, price=0, order_type="01")
-                if not result.success:
-                    logger.error(f"매수 실패: {result.message}")
-                    return False
-                order_no = result.order_no
+            order_no = self._submit_order(order, current_price)
+            if not order_no:
+                return False
+
+            return self._record_buy(
+                order, current_price, order_no, daily_trades, position_class, stop_loss_manager
+            )
 
+        except Exception as e:
+            logger.error(f"매수 실행 오류 ({order.name}/{order.code}): {e}", exc_info=True)
+            return False
+
+    def _record_buy(
+        self,
+        order: PendingOrder,
+        current_price: float,
+        order_no: str,
+        daily_trades: List[Dict],
+        position_class,
+        stop_loss_manager
+    ) -> bool:
+        """매수 체결 반영 (포지션 추가, 거래 기록, 알림)"""
+        try:
             # 포지션 추가
             position = position_class(
                 code=order.code,
@@ -915,19 +1129,30 @@ class OrderExecutor:
             return False
 
         try:
-            position = self.portfolio.positions[order.code]
-            price_info = self.client.get_stock_price(order.code)
-            current_price = price_info.price
+            current_price = self._get_price_with_retry(order.code)
+            if current_price is None:
+                return False
 
-            if self.config.dry_run:
-                logger.info(f"[DRY RUN] 매도: {order.name} {order.quantity}주 @ {current_price:,}원")
-                order_no = f"DRY_{datetime.now().strftime('%H%M%S')}"
-            else:
-                result = self.client.sell_stock(order.code, order.quantity, price=0, order_type="01")
-                if not result.success:
-                    logger.error(f"매도 실패: {result.message}")
-                    return False
-                order_no = result.order_no
+            order_no = self._submit_order(order, current_price)
+            if not order_no:
+                return False
+
+            return self._record_sell(order, current_price, order_no, daily_trades)
+
+        except Exception as e:
+            logger.error(f"매도 실행 오류: {e}", exc_info=True)
+            return False
+
+    def _record_sell(
+        self,
+        order: PendingOrder,
+        current_price: float,
+        order_no: str,
+        daily_trades: List[Dict]
+    ) -> bool:
+        """매도 체결 반영 (손익 계산, 포지션 제거, 거래 기록, 알림)"""
+        try:
+            position = self.portfolio.positions[order.code]
 
             # 손익 계산
             pnl = (current_price - position.entry_price) * order.quantity
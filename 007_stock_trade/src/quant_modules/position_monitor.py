@@ -6,9 +6,9 @@
 
 import time
 import logging
+import threading
 
 from .state_manager import PendingOrder
-from .order_executor import API_DELAY_VIRTUAL, API_DELAY_REAL
 from ..strategy.quant import (
     Position,
     StopLossManager,
@@ -18,6 +18,9 @@ from ..strategy.quant import (
 
 logger = logging.getLogger(__name__)
 
+# 매도 재시도 간격 (초, 시도마다 선형 증가)
+SELL_RETRY_DELAY = 1.0
+
 # 디버그 전용 로거 (별도 파일에 상세 로그 기록)
 debug_logger = logging.getLogger("quant_debug")
 debug_logger.setLevel(logging.DEBUG)
@@ -39,6 +42,11 @@ class PositionMonitor:
         self.config = config
         self.is_virtual = is_virtual
         self.order_executor = order_executor
+        # 매도 진행 중 종목 (실시간 소비자 스레드 / 폴링 폴백 동시 매도 방지)
+        self._selling = set()
+        self._selling_lock = threading.Lock()
+        # 종목별 마지막 매도 트리거 시각 (성공/실패 무관)
+        self.last_sell_trigger = {}
 
     def monitor(self, position_lock, daily_trades, save_state_fn):
         """
@@ -58,14 +66,10 @@ class PositionMonitor:
         debug_logger.info(f"{'='*60}")
         debug_logger.info(f"모니터링 시작: {len(positions_snapshot)}개 포지션")
 
-        api_delay = API_DELAY_VIRTUAL if self.is_virtual else API_DELAY_REAL
-
-        for i, (code, position) in enumerate(positions_snapshot):
-            if i > 0:
-                time.sleep(api_delay)
-
+        # 호출 간격은 KIS 전송 계층 Rate Limiter가 조절
+        for code, position in positions_snapshot:
             try:
-                # 현재가 업데이트 (Rate Limit 시 재시도)
+                # 현재가 업데이트 (서버 오류 시 재시도)
                 price_info = None
                 for retry in range(3):
                     try:
@@ -87,44 +91,7 @@ class PositionMonitor:
                     debug_logger.error(f"[{code}] 3회 재시도 실패")
                     continue
 
-                with position_lock:
-                    if code not in self.portfolio.positions:
-                        continue
-                    position.current_price = price_info.price
-
-                # 디버그 로그
-                pnl_pct = ((position.current_price - position.entry_price) / position.entry_price) * 100
-                to_stop = ((position.current_price - position.stop_loss) / position.current_price) * 100
-                to_tp1 = ((position.take_profit_1 - position.current_price) / position.current_price) * 100
-                debug_logger.debug(
-                    f"[{position.name}({code})] "
-                    f"현재가: {position.current_price:,}원 | "
-                    f"진입가: {position.entry_price:,}원 | "
-                    f"수익률: {pnl_pct:+.2f}% | "
-                    f"손절까지: {to_stop:.2f}% | "
-                    f"익절1까지: {to_tp1:.2f}%"
-                )
-
-                # 손절 체크
-                if position.current_price <= position.stop_loss:
-                    self._trigger_stop_loss(position, daily_trades)
-                    continue
-
-                # 익절 체크
-                if not position.tp1_executed and position.current_price >= position.take_profit_1:
-                    self._trigger_take_profit(position, stage=1, daily_trades=daily_trades)
-                elif not position.tp2_executed and position.current_price >= position.take_profit_2:
-                    self._trigger_take_profit(position, stage=2, daily_trades=daily_trades)
-
-                # 트레일링 스탑 업데이트
-                if self.config.trailing_stop:
-                    new_stop = StopLossManager.update_trailing_stop(
-                        position, self.config.stop_loss_pct
-                    )
-                    with position_lock:
-                        if new_stop > position.stop_loss:
-                            position.stop_loss = new_stop
-                            logger.info(f"{position.name}: 손절가 상향 → {new_stop:,.0f}원")
+                self.evaluate_price(code, price_info.price, position_lock, daily_trades)
 
             except Exception as e:
                 logger.error(f"모니터링 오류 ({code}): {e}", exc_info=True)
@@ -136,6 +103,73 @@ class PositionMonitor:
         save_state_fn()
 
         # 리스크 체크
+        self.check_risks(position_lock)
+
+    def evaluate_price(self, code, price, position_lock, daily_trades) -> bool:
+        """
+        현재가 기준 손절/익절/트레일링 스탑 평가 (폴링/실시간 공통)
+
+        Args:
+            code: 종목코드
+            price: 현재가
+            position_lock: threading.Lock for position access
+            daily_trades: mutable list of daily trades
+
+        Returns:
+            포지션 상태 변경 여부 (매도 실행 또는 손절가 상향)
+        """
+        if self.is_selling(code):
+            return False
+
+        with position_lock:
+            position = self.portfolio.positions.get(code)
+            if position is None:
+                return False
+            position.current_price = price
+
+        # 디버그 로그
+        pnl_pct = ((position.current_price - position.entry_price) / position.entry_price) * 100
+        to_stop = ((position.current_price - position.stop_loss) / position.current_price) * 100
+        to_tp1 = ((position.take_profit_1 - position.current_price) / position.current_price) * 100
+        debug_logger.debug(
+            f"[{position.name}({code})] "
+            f"현재가: {position.current_price:,}원 | "
+            f"진입가: {position.entry_price:,}원 | "
+            f"수익률: {pnl_pct:+.2f}% | "
+            f"손절까지: {to_stop:.2f}% | "
+            f"익절1까지: {to_tp1:.2f}%"
+        )
+
+        # 손절 체크
+        if position.current_price <= position.stop_loss:
+            self._trigger_stop_loss(position, daily_trades)
+            return True
+
+        changed = False
+
+        # 익절 체크
+        if not position.tp1_executed and position.current_price >= position.take_profit_1:
+            self._trigger_take_profit(position, stage=1, daily_trades=daily_trades)
+            changed = True
+        elif not position.tp2_executed and position.current_price >= position.take_profit_2:
+            self._trigger_take_profit(position, stage=2, daily_trades=daily_trades)
+            changed = True
+
+        # 트레일링 스탑 업데이트
+        if self.config.trailing_stop:
+            new_stop = StopLossManager.update_trailing_stop(
+                position, self.config.stop_loss_pct
+            )
+            with position_lock:
+                if new_stop > position.stop_loss:
+                    position.stop_loss = new_stop
+                    changed = True
+                    logger.info(f"{position.name}: 손절가 상향 → {new_stop:,.0f}원")
+
+        return changed
+
+    def check_risks(self, position_lock):
+        """포트폴리오 리스크 체크 및 경고 알림"""
         with position_lock:
             alerts = self.portfolio.check_risks()
         for alert in alerts:
@@ -147,14 +181,36 @@ class PositionMonitor:
                     f"조치: {alert.action_required}"
                 )
 
+    def is_selling(self, code) -> bool:
+        """해당 종목 매도 주문 진행 중 여부"""
+        with self._selling_lock:
+            return code in self._selling
+
     def _trigger_sell_with_retry(self, order, success_msg, failure_msg,
                                   daily_trades, on_success=None):
-        """매도 주문 실행 (재시도 포함). 손절/익절 공통."""
+        """매도 주문 실행 (재시도 포함). 손절/익절 공통.
+
+        같은 종목 매도가 다른 스레드에서 진행 중이면 건너뛴다.
+        """
+        with self._selling_lock:
+            if order.code in self._selling:
+                logger.info(f"매도 진행 중 - 중복 트리거 무시: {order.name}")
+                return
+            self._selling.add(order.code)
+            self.last_sell_trigger[order.code] = time.time()
+
+        try:
+            self._sell_with_retry(order, success_msg, failure_msg, daily_trades, on_success)
+        finally:
+            with self._selling_lock:
+                self._selling.discard(order.code)
+
+    def _sell_with_retry(self, order, success_msg, failure_msg, daily_trades, on_success):
         max_retries = 3
-        api_delay = API_DELAY_VIRTUAL if self.is_virtual else API_DELAY_REAL
 
         for attempt in range(max_retries):
-            time.sleep(api_delay * (attempt + 1))
+            if attempt > 0:
+                time.sleep(SELL_RETRY_DELAY * attempt)
 
             if self.order_executor._execute_order(order, daily_trades, Position, StopLossManager):
                 if on_success:
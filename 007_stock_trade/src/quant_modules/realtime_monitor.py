@@ -0,0 +1,335 @@
+"""
+실시간 포지션 모니터링 모듈
+
+KIS WebSocket 체결가(H0STCNT0) 구독으로 틱마다 손절/익절/트레일링 스탑 평가
+- 보유 종목 자동 구독/해제 (포지션 변경 시 재구독)
+- 전용 소비자 스레드에서 규칙 평가 (WebSocket 수신 스레드는 큐 적재만)
+- 연결 끊김 시 재연결 시도, 그동안은 5분 폴링(PositionMonitor.monitor)으로 폴백
+"""
+
+import time
+import queue
+import logging
+import threading
+from typing import Callable, Dict, Optional, Set
+
+from ..api.kis_websocket import KISWebSocket, RealtimePrice
+
+logger = logging.getLogger(__name__)
+
+# KIS WebSocket 세션당 실시간 등록 한도
+MAX_SUBSCRIPTIONS = 40
+
+# 구독 목록 재동기화 주기 (초)
+RESYNC_INTERVAL_SEC = 10
+
+# 동일 종목 매도 트리거 최소 간격 (초) - 매도 실패 시 틱마다 재주문 방지
+TRIGGER_COOLDOWN_SEC = 30
+
+# 상태 저장 최소 간격 (초)
+SAVE_INTERVAL_SEC = 5
+
+# 재연결 대기 (초, 지수 백오프 상한)
+RECONNECT_BASE_SEC = 5
+RECONNECT_MAX_SEC = 120
+
+# 수신 틱 없음 허용 시간 (초) - 초과 시 스트림 비정상으로 간주하고 폴링 병행
+STALE_TICK_SEC = 180
+
+
+class RealtimePositionMonitor:
+    """WebSocket 기반 실시간 포지션 모니터"""
+
+    def __init__(
+        self,
+        position_monitor,
+        portfolio,
+        is_virtual: bool,
+        ws_factory: Optional[Callable[[], KISWebSocket]] = None
+    ):
+        """
+        Args:
+            position_monitor: PositionMonitor (손절/익절 규칙 평가 위임)
+            portfolio: PortfolioManager
+            is_virtual: 모의투자 여부
+            ws_factory: WebSocket 생성 함수 (테스트용 주입)
+        """
+        self.position_monitor = position_monitor
+        self.portfolio = portfolio
+        self.is_virtual = is_virtual
+        self._ws_factory = ws_factory or (lambda: KISWebSocket(is_virtual=is_virtual))
+
+        self.ws: Optional[KISWebSocket] = None
+        # (수신 시각, RealtimePrice)
+        self._ticks: queue.Queue = queue.Queue()
+        self._consumer: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+
+        self._position_lock = None
+        self._get_daily_trades: Optional[Callable[[], list]] = None
+        self._save_state_fn = None
+
+        self._subscribed: Set[str] = set()
+        self._sub_lock = threading.Lock()  # 엔진 스레드/소비자 스레드 동시 동기화 방지
+        self._last_trigger: Dict[str, float] = {}
+        self._last_resync = 0.0
+        self._last_save = 0.0
+        self._dirty = False
+        self._reconnect_delay = RECONNECT_BASE_SEC
+        self._next_reconnect = 0.0
+
+        # 지표
+        self.tick_count = 0
+        self.last_tick_at = 0.0
+        self.subscribed_at = 0.0  # 마지막 신규 구독 시각 (틱 미수신 시 staleness 기준)
+        self.max_queue_latency_ms = 0.0
+
+    # ========== 시작/정지 ==========
+
+    def start(self, position_lock, get_daily_trades: Callable[[], list], save_state_fn):
+        """
+        실시간 모니터링 시작 (장 시작 시)
+
+        Args:
+            position_lock: threading.Lock for position access
+            get_daily_trades: 현재 일일 거래 리스트 반환 함수 (리포트 후 리스트 교체 대응)
+            save_state_fn: callback to save engine state
+        """
+        if self._consumer and self._consumer.is_alive():
+            return
+
+        self._position_lock = position_lock
+        self._get_daily_trades = get_daily_trades
+        self._save_state_fn = save_state_fn
+        self._stop_event.clear()
+
+        self._connect()
+
+        self._consumer = threading.Thread(
+            target=self._consume_loop, name="RealtimeMonitor", daemon=True
+        )
+        self._consumer.start()
+        logger.info("실시간 포지션 모니터링 시작")
+
+    def stop(self):
+        """실시간 모니터링 정지 (장 마감 시)"""
+        self._stop_event.set()
+        if self._consumer:
+            self._consumer.join(timeout=5)
+            self._consumer = None
+
+        self._disconnect()
+        self._flush_state(force=True)
+        logger.info(
+            f"실시간 포지션 모니터링 정지 (수신 틱 {self.tick_count}건, "
+            f"최대 처리 지연 {self.max_queue_latency_ms:.0f}ms)"
+        )
+
+    @property
+    def is_streaming(self) -> bool:
+        """스트리밍 정상 여부 (False면 폴링 모니터링 필요)"""
+        if self._consumer is None or not self._consumer.is_alive():
+            return False
+        if self.ws is None or not self.ws.is_connected:
+            return False
+        # 보유 종목을 구독 중인데 장시간 틱이 없으면 스트림 이상으로 판단
+        # (구독 후 틱이 한 번도 안 오면 구독 시각부터 계산)
+        if self._subscribed:
+            since = max(self.last_tick_at, self.subscribed_at)
+            return time.time() - since < STALE_TICK_SEC
+        return True
+
+    def get_status(self) -> dict:
+        """모니터 상태"""
+        return {
+            "streaming": self.is_streaming,
+            "subscribed": sorted(self._subscribed),
+            "tick_count": self.tick_count,
+            "last_tick_at": self.last_tick_at,
+            "subscribed_at": self.subscribed_at,
+            "queue_size": self._ticks.qsize(),
+            "max_queue_latency_ms": self.max_queue_latency_ms,
+        }
+
+    # ========== 연결 관리 ==========
+
+    def _connect(self):
+        """WebSocket 연결 (실패 시 다음 재연결 시각 예약)"""
+        try:
+            self.ws = self._ws_factory()
+            self.ws.connect(on_price=self._on_price, on_error=self._on_error)
+            self._subscribed.clear()
+            self._last_resync = 0.0
+        except Exception as e:
+            logger.warning(f"실시간 시세 연결 실패 (폴링 유지): {e}")
+            self.ws = None
+            self._schedule_reconnect()
+
+    def _disconnect(self):
+        if self.ws:
+            try:
+                self.ws.disconnect()
+            except Exception as e:
+                logger.debug(f"WebSocket 종료 오류: {e}")
+        self.ws = None
+        self._subscribed.clear()
+
+    def _schedule_reconnect(self):
+        self._next_reconnect = time.time() + self._reconnect_delay
+        self._reconnect_delay = min(self._reconnect_delay * 2, RECONNECT_MAX_SEC)
+
+    def _ensure_connected(self):
+        """연결 끊김 감지 및 재연결 (백오프)"""
+        if self.ws is not None and self.ws.is_connected:
+            self._reconnect_delay = RECONNECT_BASE_SEC
+            return True
+
+        if self.ws is not None and self.ws.ws_thread and self.ws.ws_thread.is_alive():
+            # 연결 수립 대기 중
+            return False
+
+        if time.time() < self._next_reconnect:
+            return False
+
+        logger.info("실시간 시세 재연결 시도")
+        self._disconnect()
+        self._connect()
+        if self.ws is not None:
+            self._schedule_reconnect()
+        return False
+
+    # ========== 구독 관리 ==========
+
+    def sync_subscriptions(self):
+        """보유 종목 기준 구독 목록 동기화 (신규 구독 / 청산 종목 해제)"""
+        if self.ws is None or not self.ws.is_connected:
+            return
+
+        with self._position_lock:
+            held = list(self.portfolio.positions.keys())
+
+        with self._sub_lock:
+            self._sync_subscriptions(held)
+
+    def _sync_subscriptions(self, held: list):
+        if len(held) > MAX_SUBSCRIPTIONS:
+            logger.warning(
+                f"보유 {len(held)}종목 > 실시간 등록 한도 {MAX_SUBSCRIPTIONS} "
+                f"→ 초과분은 폴링으로만 감시"
+            )
+        wanted = set(held[:MAX_SUBSCRIPTIONS])
+
+        for code in self._subscribed - wanted:
+            try:
+                self.ws.unsubscribe_price(code)
+            except Exception as e:
+                logger.debug(f"[{code}] 구독 해제 실패: {e}")
+            self._subscribed.discard(code)
+            self._last_trigger.pop(code, None)
+
+        for code in wanted - self._subscribed:
+            try:
+                self.ws.subscribe_price(code)
+                self._subscribed.add(code)
+                self.subscribed_at = time.time()
+            except Exception as e:
+                logger.warning(f"[{code}] 실시간 체결가 구독 실패: {e}")
+
+        self._last_resync = time.time()
+
+    # ========== 틱 처리 ==========
+
+    def _on_price(self, tick: RealtimePrice):
+        """WebSocket 수신 스레드 콜백 - 큐 적재만 수행"""
+        self._ticks.put((time.time(), tick))
+
+    def _on_error(self, error: Exception):
+        logger.warning(f"실시간 시세 오류: {error}")
+
+    def _drain_latest(self, first) -> Dict[str, tuple]:
+        """큐에 쌓인 틱을 종목별 최신 1건으로 병합"""
+        latest = {first[1].code: first}
+        while True:
+            try:
+                item = self._ticks.get_nowait()
+            except queue.Empty:
+                break
+            latest[item[1].code] = item
+        return latest
+
+    def _consume_loop(self):
+        """소비자 스레드: 틱 → 규칙 평가"""
+        while not self._stop_event.is_set():
+            if self._ensure_connected() and time.time() - self._last_resync >= RESYNC_INTERVAL_SEC:
+                self.sync_subscriptions()
+
+            try:
+                first = self._ticks.get(timeout=1.0)
+            except queue.Empty:
+                self._flush_state()
+                continue
+
+            for code, (received_at, tick) in self._drain_latest(first).items():
+                self._handle_tick(code, received_at, tick)
+
+            self._flush_state()
+
+    def _handle_tick(self, code: str, received_at: float, tick: RealtimePrice):
+        self.tick_count += 1
+        self.last_tick_at = received_at
+        latency_ms = (time.time() - received_at) * 1000
+        if latency_ms > self.max_queue_latency_ms:
+            self.max_queue_latency_ms = latency_ms
+
+        if code not in self._subscribed or tick.price <= 0:
+            return
+
+        # 직전 매도 트리거 후 쿨다운 - 매도 실패 시 틱마다 재주문/실패 알림 방지
+        # (재시도는 PositionMonitor 내부에서 처리)
+        last = self._last_trigger.get(code, 0.0)
+        if time.time() - last < TRIGGER_COOLDOWN_SEC:
+            return
+
+        try:
+            with self._position_lock:
+                position = self.portfolio.positions.get(code)
+                quantity_before = position.quantity if position else 0
+            if position is None:
+                return
+
+            evaluated_at = time.time()
+            changed = self.position_monitor.evaluate_price(
+                code, tick.price, self._position_lock, self._get_daily_trades()
+            )
+            if self.position_monitor.last_sell_trigger.get(code, 0.0) >= evaluated_at:
+                # 매도 트리거 발생 (성공/실패 무관) → 쿨다운 시작
+                self._last_trigger[code] = time.time()
+            if not changed:
+                return
+
+            self._dirty = True
+            with self._position_lock:
+                position = self.portfolio.positions.get(code)
+                sold = position is None or position.quantity != quantity_before
+            if sold:
+                logger.info(
+                    f"[{code}] 실시간 청산 처리 (틱 수신→처리 {latency_ms:.0f}ms)"
+                )
+                # 포지션 변경 → 다음 루프에서 즉시 재구독
+                self._last_resync = 0.0
+
+        except Exception as e:
+            logger.error(f"실시간 모니터링 오류 ({code}): {e}", exc_info=True)
+
+    def _flush_state(self, force: bool = False):
+        """변경된 상태를 주기적으로 저장 (틱마다 저장 방지)"""
+        if not self._dirty or self._save_state_fn is None:
+            return
+        if not force and time.time() - self._last_save < SAVE_INTERVAL_SEC:
+            return
+        try:
+            self._save_state_fn()
+        except Exception as e:
+            logger.error(f"상태 저장 실패: {e}")
+        self._dirty = False
+        self._last_save = time.time()
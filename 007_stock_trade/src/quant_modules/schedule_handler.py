@@ -321,6 +321,9 @@ class ScheduleHandler:
         # 대기 주문 실행
         e.execute_pending_orders()
 
+        # 실시간 손절/익절 감시 시작 (설정 시)
+        e.start_realtime_monitoring()
+
         e.current_phase = SchedulePhase.MARKET_HOURS
 
     def on_monitoring(self):
@@ -332,6 +335,9 @@ class ScheduleHandler:
         if not e._is_trading_time():
             return
 
+        # 장중 재시작 등으로 스트림이 없으면 시작 (이미 실행 중이면 무시)
+        e.start_realtime_monitoring()
+
         e.monitor_positions()
 
     def on_market_close(self):
@@ -344,6 +350,10 @@ class ScheduleHandler:
             return
 
         e.current_phase = SchedulePhase.MARKET_CLOSE
+
+        # 실시간 감시 종료 (일일 거래 리스트 교체 전)
+        e.stop_realtime_monitoring()
+
         logger.info("=" * 60)
         logger.info("장 마감 - 일일 리포트 생성")
         e.notifier.send_message(
@@ -367,6 +377,10 @@ class ScheduleHandler:
         # 상태 저장
         e._save_state()
 
+        # 당일 KIS API 호출 지표 (TR별) 기록 후 초기화
+        e.client.transport.log_metrics()
+        e.client.transport.reset_metrics()
+
         e.current_phase = SchedulePhase.AFTER_MARKET
 
     def _check_missed_rebalance(self):
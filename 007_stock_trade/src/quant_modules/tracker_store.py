@@ -0,0 +1,203 @@
+"""
+일별 트래커 저장소 (SQLite)
+
+일별 스냅샷/거래 일지를 날짜 키로 저장
+- 스냅샷: date PRIMARY KEY → 같은 날짜 upsert (전체 파일 재작성 없음)
+- 거래: append-only INSERT
+- 기간 조회: date 인덱스 범위 검색
+- 보관 기간 정리: 기준일 이전 행 DELETE (리스트 재구성 없음)
+
+WAL 모드로 엔진(쓰기)과 텔레그램/대시보드(읽기)가 동시에 접근 가능
+"""
+
+import json
+import sqlite3
+import logging
+import threading
+from pathlib import Path
+from typing import Optional, List, Dict, Any
+
+logger = logging.getLogger(__name__)
+
+DB_FILENAME = "daily_tracker.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS snapshots (
+    date TEXT PRIMARY KEY,
+    payload TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS transactions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    date TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_transactions_date ON transactions(date);
+"""
+
+
+class TrackerStore:
+    """일별 스냅샷/거래 일지 SQLite 저장소 (Thread-safe)"""
+
+    def __init__(self, db_path: Path, readonly: bool = False):
+        """
+        Args:
+            db_path: DB 파일 경로
+            readonly: True면 읽기 전용 (텔레그램/대시보드 조회용, 스키마 생성 안 함)
+        """
+        self.db_path = Path(db_path)
+        self.readonly = readonly
+        self._lock = threading.RLock()
+        # 쓰기 세대 번호 (호출자 캐시 무효화용, 이 인스턴스를 통한 쓰기만 반영)
+        self.snapshots_version = 0
+        self.transactions_version = 0
+
+        if readonly:
+            uri = f"file:{self.db_path}?mode=ro"
+            self._conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        else:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    # ========== 메타 ==========
+
+    def get_meta(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else default
+
+    def set_meta(self, key: str, value: Any):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO meta (key, value) VALUES (?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+                (key, json.dumps(value))
+            )
+
+    # ========== 스냅샷 ==========
+
+    def upsert_snapshot(self, date: str, data: Dict[str, Any]):
+        """날짜 키 upsert"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO snapshots (date, payload) VALUES (?, ?) "
+                "ON CONFLICT(date) DO UPDATE SET payload = excluded.payload",
+                (date, json.dumps(data, ensure_ascii=False))
+            )
+            self.snapshots_version += 1
+
+    def upsert_snapshots(self, items: List[Dict[str, Any]]):
+        """여러 스냅샷 일괄 upsert (레거시 JSON 이관용)"""
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT INTO snapshots (date, payload) VALUES (?, ?) "
+                "ON CONFLICT(date) DO UPDATE SET payload = excluded.payload",
+                [(d["date"], json.dumps(d, ensure_ascii=False)) for d in items]
+            )
+            self.snapshots_version += 1
+
+    def get_snapshots(
+        self,
+        since: Optional[str] = None,
+        before: Optional[str] = None,
+        desc: bool = False,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        기간 스냅샷 조회
+
+        Args:
+            since: 시작일 (포함, "YYYY-MM-DD")
+            before: 종료일 (미포함)
+            desc: True면 최신순
+            limit: 최대 건수
+        """
+        sql, params = self._range_query("snapshots", "date", since, before, desc, limit)
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [json.loads(r[0]) for r in rows]
+
+    def count_snapshots(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM snapshots").fetchone()[0]
+
+    def delete_snapshots_before(self, cutoff: str) -> int:
+        """기준일 이전 스냅샷 삭제, 삭제 건수 반환"""
+        with self._lock, self._conn:
+            removed = self._conn.execute("DELETE FROM snapshots WHERE date < ?", (cutoff,)).rowcount
+            self.snapshots_version += 1
+            return removed
+
+    # ========== 거래 ==========
+
+    def add_transaction(self, data: Dict[str, Any]):
+        self.add_transactions([data])
+
+    def add_transactions(self, items: List[Dict[str, Any]]):
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT INTO transactions (date, timestamp, payload) VALUES (?, ?, ?)",
+                [(d["date"], d["timestamp"], json.dumps(d, ensure_ascii=False)) for d in items]
+            )
+            self.transactions_version += 1
+
+    def get_transactions(
+        self,
+        since: Optional[str] = None,
+        before: Optional[str] = None,
+        desc: bool = False,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """기간 거래 조회 (timestamp 순, 인자는 get_snapshots와 동일)"""
+        sql, params = self._range_query("transactions", "timestamp", since, before, desc, limit)
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [json.loads(r[0]) for r in rows]
+
+    def count_transactions(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM transactions").fetchone()[0]
+
+    def delete_transactions_before(self, cutoff: str) -> int:
+        """기준일 이전 거래 삭제, 삭제 건수 반환"""
+        with self._lock, self._conn:
+            removed = self._conn.execute("DELETE FROM transactions WHERE date < ?", (cutoff,)).rowcount
+            self.transactions_version += 1
+            return removed
+
+    # ========== 내부 유틸 ==========
+
+    @staticmethod
+    def _range_query(table, order_col, since, before, desc, limit):
+        clauses, params = [], []
+        if since:
+            clauses.append("date >= ?")
+            params.append(since)
+        if before:
+            clauses.append("date < ?")
+            params.append(before)
+
+        sql = f"SELECT payload FROM {table}"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        direction = "DESC" if desc else "ASC"
+        sql += f" ORDER BY {order_col} {direction}"
+        if table == "transactions":
+            # 동일 timestamp는 입력 순서(id) 유지
+            sql += f", id {direction}"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return sql, params
@@ -40,6 +40,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 워크포워드 검증 데이터 기간 (년)
+WALK_FORWARD_YEARS = 3
+
 
 class WeightConfig:
     """가중치 설정 관리 (Single Source of Truth)
@@ -127,8 +130,8 @@ class WeightConfig:
         logger.info(f"가중치 설정 저장됨: {config_path}")
 
     @classmethod
-    def update_from_optimization(cls, optimization_result: dict) -> dict:
-        """최적화 결과로 가중치 업데이트"""
+    def update_from_optimization(cls, optimization_result: dict, validation: dict = None) -> dict:
+        """최적화 결과로 가중치 업데이트 (validation: 워크포워드 검증 요약)"""
         current = cls.load()
 
         # 최적화 결과가 더 좋으면 업데이트
@@ -149,6 +152,8 @@ class WeightConfig:
                 "auto_update": True,
                 "previous_weights": current,
             }
+            if validation:
+                new_weights["validation"] = validation
             cls.save(new_weights)
             return new_weights
 
@@ -238,6 +243,32 @@ class TelegramReporter:
 • 수익률: {result.get('total_return', 0):+.2f}%
 • MDD: {result.get('max_drawdown', 0):.2f}%
 
+⏰ {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+"""
+        self.notifier.send_message(message.strip())
+
+    def send_walk_forward_report(self, validation: dict):
+        """워크포워드 검증 결과 전송"""
+        status = "✅ 통과" if validation.get('passed') else "❌ 미통과 (가중치 유지)"
+        stds = validation.get('weight_std', {})
+        std_text = ", ".join(f"{k.replace('_weight', '')} {v:.2f}" for k, v in stds.items())
+
+        message = f"""
+🧪 <b>워크포워드 검증</b>
+━━━━━━━━━━━━━━━━━━━━
+
+{status}
+
+<b>📊 표본외 성과</b>
+• 폴드: {validation.get('folds', 0)}개
+• OOS 샤프: {validation.get('oos_sharpe', 0):.2f} (IS {validation.get('is_sharpe', 0):.2f})
+• OOS 누적 수익률: {validation.get('oos_return', 0):+.2f}%
+• 월평균 턴오버: {validation.get('avg_turnover', 0):.1f}%
+
+<b>🔁 가중치 안정성</b>
+• 표준편차: {std_text or 'N/A'}
+• 조합 유지율: {validation.get('persistence', 0) * 100:.0f}%
+
 ⏰ {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 """
         self.notifier.send_message(message.strip())
@@ -333,38 +364,26 @@ class AutoStrategyManager:
         logger.info(f"최적화 시작 ({trigger_reason})...")
 
         try:
-            from scripts.optimize_weights import WeightOptimizer, get_price_data
-            from pykrx import stock
-            from datetime import datetime, timedelta
+            from scripts.optimize_weights import WeightOptimizer
+            from scripts.walk_forward import get_kospi200_tickers, load_price_history, save_report
+            from src.strategy.quant.walk_forward import FactorPanel, WalkForwardOptimizer
 
-            # 데이터 수집
+            # 데이터 수집 (워크포워드용 수년치, 로컬 캐시 사용)
             end_date = datetime.now() - timedelta(days=2)
             start_date = end_date - timedelta(days=180)
+            history_start = end_date - timedelta(days=365 * WALK_FORWARD_YEARS)
 
-            start_str = start_date.strftime("%Y%m%d")
-            end_str = end_date.strftime("%Y%m%d")
-
-            # KOSPI200 종목 조회
-            for i in range(7):
-                check_date = (end_date - timedelta(days=i)).strftime("%Y%m%d")
-                tickers = stock.get_index_portfolio_deposit_file("1028", check_date)
-                if tickers is not None and len(tickers) > 0:
-                    break
-
-            tickers = list(tickers)[:50]
-
-            # 가격 데이터 수집
-            price_data = {}
-            for ticker in tickers:
-                df = get_price_data(ticker, start_str, end_str)
-                if df is not None and len(df) >= 60:
-                    price_data[ticker] = df
+            tickers = get_kospi200_tickers(end_date, limit=50)
+            price_data = load_price_history(tickers, history_start, end_date)
 
             if len(price_data) < 10:
                 raise ValueError("데이터 부족")
 
-            # 최적화 실행
-            optimizer = WeightOptimizer(price_data, start_date, end_date)
+            # 팩터 패널 1회 계산 → 표본내 최적화와 워크포워드 검증이 공유
+            panel = FactorPanel(price_data)
+
+            # 최적화 실행 (최근 180일 표본내)
+            optimizer = WeightOptimizer(price_data, start_date, end_date, panel=panel)
             results_df = optimizer.grid_search(verbose=False)
 
             if results_df.empty:
@@ -373,13 +392,25 @@ class AutoStrategyManager:
             # 최적 결과
             best = results_df.iloc[0].to_dict()
 
-            # 가중치 자동 업데이트
+            # 워크포워드 검증 (가중치 파일 반영 전)
+            report = WalkForwardOptimizer(price_data, panel=panel).run()
+            validation = report.to_dict()
+            save_report(validation)
+            self.reporter.send_walk_forward_report(validation)
+
+            # 가중치 자동 업데이트 (검증 통과 시에만)
             updated = False
-            if self.weights.get('auto_update', True):
-                new_weights = WeightConfig.update_from_optimization(best)
+            if self.weights.get('auto_update', True) and report.passed:
+                validation_summary = {k: v for k, v in validation.items() if k != 'fold_results'}
+                new_weights = WeightConfig.update_from_optimization(best, validation_summary)
                 if new_weights != self.weights:
                     self.weights = new_weights
                     updated = True
+            elif not report.passed:
+                logger.warning(
+                    f"워크포워드 검증 미통과 → 가중치 유지 "
+                    f"(OOS 샤프 {report.oos_sharpe:.2f}, 폴드 {len(report.folds)}개)"
+                )
 
             # 텔레그램 리포트 전송
             self.reporter.send_optimization_report(best, updated)
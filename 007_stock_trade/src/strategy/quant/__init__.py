@@ -49,6 +49,15 @@ from .backtest import (
     Backtester,
     run_simple_backtest
 )
+from .walk_forward import (
+    DEFAULT_PARAM_GRID,
+    FactorPanel,
+    WalkForwardConfig,
+    WalkForwardFold,
+    FoldResult,
+    WalkForwardReport,
+    WalkForwardOptimizer
+)
 from .analytics import (
     PerformanceMetrics,
     BenchmarkComparison,
@@ -109,6 +118,14 @@ __all__ = [
     "DailySnapshot",
     "Backtester",
     "run_simple_backtest",
+    # Walk-Forward
+    "DEFAULT_PARAM_GRID",
+    "FactorPanel",
+    "WalkForwardConfig",
+    "WalkForwardFold",
+    "FoldResult",
+    "WalkForwardReport",
+    "WalkForwardOptimizer",
     # Analytics
     "PerformanceMetrics",
     "BenchmarkComparison",
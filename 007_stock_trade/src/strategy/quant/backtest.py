@@ -149,6 +149,8 @@ class Backtester:
         self.trades: List[Trade] = []
         self.daily_snapshots: List[DailySnapshot] = []
         self.peak_value = self.config.initial_capital
+        # 종목별 {date: (high, low, close)} 조회 테이블 (run()에서 1회 구축)
+        self._bars: Dict[str, Dict[datetime, Tuple[float, float, float]]] = {}
 
     def reset(self):
         """상태 초기화"""
@@ -157,13 +159,34 @@ class Backtester:
         self.trades = []
         self.daily_snapshots = []
         self.peak_value = self.config.initial_capital
+        self._bars = {}
+
+    @staticmethod
+    def index_bars(price_data: Dict[str, pd.DataFrame]) -> Dict[str, Dict[datetime, Tuple[float, float, float]]]:
+        """일자별 가격 조회를 O(1)로 만들기 위한 인덱스 구축
+
+        동일 가격 데이터로 run()을 반복 호출할 때는 한 번 만들어 bar_index로 재사용.
+        """
+        return {
+            code: dict(zip(df['date'], zip(df['high'], df['low'], df['close'])))
+            for code, df in price_data.items()
+            if df is not None and not df.empty
+        }
+
+    def _bar(self, code: str, date: datetime) -> Optional[Tuple[float, float, float]]:
+        """(high, low, close) 조회 - 해당일 데이터 없으면 None"""
+        bars = self._bars.get(code)
+        if bars is None:
+            return None
+        return bars.get(date)
 
     def run(
         self,
         price_data: Dict[str, pd.DataFrame],
         signals: pd.DataFrame,
         start_date: datetime = None,
-        end_date: datetime = None
+        end_date: datetime = None,
+        bar_index: Dict[str, Dict[datetime, Tuple[float, float, float]]] = None
     ) -> BacktestResult:
         """
         백테스트 실행
@@ -175,16 +198,18 @@ class Backtester:
                     columns: date, code, name, signal, score, weight
             start_date: 시작일
             end_date: 종료일
+            bar_index: index_bars()로 미리 만든 가격 인덱스 (선택)
 
         Returns:
             BacktestResult
         """
         self.reset()
+        self._bars = bar_index if bar_index is not None else self.index_bars(price_data)
 
         # 날짜 범위 설정
         all_dates = set()
-        for code, df in price_data.items():
-            all_dates.update(df['date'].tolist())
+        for bars in self._bars.values():
+            all_dates.update(bars.keys())
 
         all_dates = sorted(all_dates)
 
@@ -198,9 +223,19 @@ class Backtester:
 
         logger.info(f"백테스트 시작: {all_dates[0]} ~ {all_dates[-1]}")
 
+        # 리밸런싱일 신호를 날짜별로 미리 분리 (일별 전체 필터링 방지)
+        if 'date' in signals.columns:
+            signals_by_date = {date: group for date, group in signals.groupby('date')}
+        else:
+            signals_by_date = None
+
         # 일별 시뮬레이션
         for date in all_dates:
-            self._process_day(date, price_data, signals)
+            if signals_by_date is None:
+                day_signals = signals
+            else:
+                day_signals = signals_by_date.get(date, signals.iloc[0:0])
+            self._process_day(date, price_data, day_signals)
 
         # 결과 계산
         result = self._calculate_result(all_dates[0], all_dates[-1])
@@ -213,9 +248,9 @@ class Backtester:
         self,
         date: datetime,
         price_data: Dict[str, pd.DataFrame],
-        signals: pd.DataFrame
+        day_signals: pd.DataFrame
     ):
-        """일별 처리"""
+        """일별 처리 (day_signals: 해당일 신호)"""
         # 1. 포지션 가격 업데이트
         self._update_prices(date, price_data)
 
@@ -224,7 +259,6 @@ class Backtester:
 
         # 3. 리밸런싱 체크
         if self._should_rebalance(date):
-            day_signals = signals[signals['date'] == date] if 'date' in signals.columns else signals
             if not day_signals.empty:
                 self._rebalance(date, day_signals, price_data)
 
@@ -234,27 +268,20 @@ class Backtester:
     def _update_prices(self, date: datetime, price_data: Dict[str, pd.DataFrame]):
         """포지션 가격 업데이트"""
         for code, pos in list(self.positions.items()):
-            if code in price_data:
-                df = price_data[code]
-                day_data = df[df['date'] == date]
-                if not day_data.empty:
-                    pos.current_price = day_data.iloc[0]['close']
-                    if pos.current_price > pos.highest_price:
-                        pos.highest_price = pos.current_price
+            bar = self._bar(code, date)
+            if bar is not None:
+                pos.current_price = bar[2]
+                if pos.current_price > pos.highest_price:
+                    pos.highest_price = pos.current_price
 
     def _check_stop_orders(self, date: datetime, price_data: Dict[str, pd.DataFrame]):
         """손절/익절 체크"""
         for code, pos in list(self.positions.items()):
-            if code not in price_data:
-                continue
-
-            df = price_data[code]
-            day_data = df[df['date'] == date]
-            if day_data.empty:
+            bar = self._bar(code, date)
+            if bar is None:
                 continue
 
-            low = day_data.iloc[0]['low']
-            high = day_data.iloc[0]['high']
+            high, low, _ = bar
 
             # 손절 체크
             if pos.stop_loss > 0 and low <= pos.stop_loss:
@@ -294,12 +321,9 @@ class Backtester:
         # 매도: 목표에 없는 종목
         to_sell = current_holdings - target_holdings
         for code in to_sell:
-            if code in price_data:
-                df = price_data[code]
-                day_data = df[df['date'] == date]
-                if not day_data.empty:
-                    price = day_data.iloc[0]['close']
-                    self._close_position(date, code, price, "리밸런싱 매도")
+            bar = self._bar(code, date)
+            if bar is not None:
+                self._close_position(date, code, bar[2], "리밸런싱 매도")
 
         # 매수: 새로 진입할 종목
         to_buy = target_holdings - current_holdings
@@ -310,15 +334,11 @@ class Backtester:
             name = row.get('name', code)
             weight = row.get('weight', 1.0 / self.config.target_position_count)
 
-            if code not in price_data:
-                continue
-
-            df = price_data[code]
-            day_data = df[df['date'] == date]
-            if day_data.empty:
+            bar = self._bar(code, date)
+            if bar is None:
                 continue
 
-            price = day_data.iloc[0]['close']
+            price = bar[2]
 
             # 투자금액 계산
             target_amount = self._total_value * min(weight, self.config.max_position_size)
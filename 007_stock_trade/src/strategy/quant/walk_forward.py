@@ -0,0 +1,487 @@
+"""
+워크포워드(Walk-Forward) 검증 엔진
+- 학습/검증 구간을 롤링하며 폴드별 가중치 그리드 서치
+- 표본외(OOS) 샤프비율, 턴오버, 선택 가중치 안정성 리포트
+- 팩터 패널 1회 사전 계산 + 프로세스 풀 병렬 실행
+"""
+
+import os
+import time
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from itertools import product
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .backtest import Backtester, BacktestConfig
+
+logger = logging.getLogger(__name__)
+
+
+# 그리드 서치 가중치 범위 (scripts/optimize_weights.py와 공유)
+DEFAULT_PARAM_GRID: Dict[str, List[float]] = {
+    "momentum_weight": [0.2, 0.3, 0.4, 0.5, 0.6],
+    "short_mom_weight": [0.1, 0.2, 0.3, 0.4],
+    "volatility_weight": [0.1, 0.2, 0.3, 0.4, 0.5],
+    "volume_weight": [0.0, 0.1, 0.2],
+    "target_count": [10, 15, 20],
+}
+
+# 안정성 평가 대상 신호 가중치
+SIGNAL_WEIGHT_KEYS = ("momentum_weight", "short_mom_weight", "volatility_weight", "volume_weight")
+
+
+def optimizer_backtest_config(target_count: int) -> BacktestConfig:
+    """가중치 최적화용 백테스트 설정"""
+    return BacktestConfig(
+        initial_capital=100_000_000,
+        commission_rate=0.00015,
+        slippage_rate=0.001,
+        target_position_count=target_count,
+        max_position_size=0.10,
+        rebalance_frequency="M",
+        stop_loss_pct=0.07,
+        take_profit_pct=0.15
+    )
+
+
+def iter_param_grid(param_grid: Dict[str, List[float]] = None) -> List[Dict[str, float]]:
+    """파라미터 그리드 → 조합 리스트"""
+    grid = param_grid or DEFAULT_PARAM_GRID
+    keys = list(grid.keys())
+    return [dict(zip(keys, values)) for values in product(*(grid[k] for k in keys))]
+
+
+class FactorPanel:
+    """일자×종목 팩터 패널
+
+    가중치와 무관한 팩터(모멘텀, 변동성, 거래량 변화, 52주 고점 대비)를
+    전체 기간에 대해 1회만 계산해두고, 가중치 조합마다 점수만 선형 결합한다.
+    WeightOptimizer.generate_signals와 동일한 산식을 사용한다.
+    """
+
+    MIN_HISTORY = 60  # 신호 생성 최소 거래일 수
+
+    def __init__(self, price_data: Dict[str, pd.DataFrame]):
+        factor_frames = {}
+        for code, df in price_data.items():
+            if df is None or df.empty:
+                continue
+            factor_frames[code] = self._compute_factors(df)
+
+        self.codes: List[str] = list(factor_frames.keys())
+
+        all_dates = set()
+        for frame in factor_frames.values():
+            all_dates.update(frame.index)
+        self.dates = pd.DatetimeIndex(sorted(all_dates))
+
+        def _stack(column: str) -> np.ndarray:
+            if not self.codes:
+                return np.empty((len(self.dates), 0))
+            wide = pd.DataFrame({
+                code: frame[column] for code, frame in factor_frames.items()
+            }).reindex(self.dates).ffill()
+            return wide[self.codes].to_numpy(dtype=float)
+
+        self.momentum = _stack("momentum")
+        self.short_momentum = _stack("short_momentum")
+        self.volatility = _stack("volatility")
+        self.volume_change = _stack("volume_change")
+        self.from_high = _stack("from_high")
+        self.valid = _stack("valid") > 0
+
+        # 백테스트 반복 실행용 가격 인덱스
+        self.bar_index = Backtester.index_bars(price_data)
+
+    @classmethod
+    def _compute_factors(cls, df: pd.DataFrame) -> pd.DataFrame:
+        """단일 종목 팩터 시계열 (각 시점은 해당일까지의 데이터만 사용)"""
+        df = df.sort_values('date')
+        close = df['close'].astype(float).reset_index(drop=True)
+        volume = df['volume'].astype(float).reset_index(drop=True)
+
+        momentum = (close / close.shift(59) - 1) * 100
+        short_momentum = (close / close.shift(19) - 1) * 100
+        volatility = close.pct_change().rolling(20).std() * np.sqrt(252) * 100
+
+        recent_volume = volume.rolling(20).mean()
+        prev_volume = recent_volume.shift(20)
+        volume_change = ((recent_volume / prev_volume - 1) * 100).where(prev_volume > 0, 0.0)
+
+        high_52w = close.rolling(252, min_periods=1).max()
+        from_high = (close / high_52w).where(high_52w > 0, 0.0)
+
+        valid = (np.arange(len(close)) + 1 >= cls.MIN_HISTORY).astype(float)
+
+        return pd.DataFrame({
+            "momentum": momentum.values,
+            "short_momentum": short_momentum.values,
+            "volatility": volatility.values,
+            "volume_change": volume_change.values,
+            "from_high": from_high.values,
+            "valid": valid,
+        }, index=pd.DatetimeIndex(df['date']))
+
+    def scores(self, params: Dict[str, float]) -> np.ndarray:
+        """가중치 조합별 종합 점수 (일자×종목, 무효 구간은 NaN)"""
+        score = (
+            self.momentum * params["momentum_weight"] +
+            self.short_momentum * params["short_mom_weight"] -
+            self.volatility * params["volatility_weight"] +
+            self.volume_change * params.get("volume_weight", 0.0) +
+            self.from_high * 10  # 고점 근접 보너스
+        )
+        return np.where(self.valid, score, np.nan)
+
+    def rebalance_dates(self, start_date: datetime, end_date: datetime) -> List[pd.Timestamp]:
+        """구간 내 월초(1~3일) 리밸런싱 후보일"""
+        mask = (self.dates >= start_date) & (self.dates <= end_date) & (self.dates.day <= 3)
+        return list(self.dates[mask])
+
+    def generate_signals(
+        self,
+        params: Dict[str, float],
+        start_date: datetime,
+        end_date: datetime
+    ) -> pd.DataFrame:
+        """구간 내 리밸런싱일 신호 (Backtester.run 입력 형식)"""
+        dates = self.rebalance_dates(start_date, end_date)
+        if not dates or not self.codes:
+            return pd.DataFrame()
+
+        top_n = int(params.get("target_count", 15))
+        rows = self.dates.get_indexer(dates)
+        score = self.scores(params)[rows]
+
+        records = []
+        for date, row, day_scores in zip(dates, rows, score):
+            available = np.flatnonzero(~np.isnan(day_scores))
+            if available.size == 0:
+                continue
+            # 동점 시 종목 입력 순서 유지 (DataFrame.nlargest와 동일)
+            order = available[np.argsort(-day_scores[available], kind="stable")][:top_n]
+            weight = 1.0 / len(order)
+            for col in order:
+                records.append({
+                    'code': self.codes[col],
+                    'name': self.codes[col],
+                    'score': day_scores[col],
+                    'momentum': self.momentum[row, col],
+                    'short_momentum': self.short_momentum[row, col],
+                    'volatility': self.volatility[row, col],
+                    'date': date,
+                    'signal': 'BUY',
+                    'weight': weight,
+                })
+
+        return pd.DataFrame(records)
+
+
+def evaluate_weights(
+    panel: FactorPanel,
+    price_data: Dict[str, pd.DataFrame],
+    params: Dict[str, float],
+    start_date: datetime,
+    end_date: datetime
+) -> Optional[dict]:
+    """단일 가중치 조합 백테스트 (신호 없으면 None)"""
+    signals = panel.generate_signals(params, start_date, end_date)
+    if signals.empty:
+        return None
+
+    backtester = Backtester(optimizer_backtest_config(int(params.get("target_count", 15))))
+    result = backtester.run(price_data, signals, start_date, end_date, bar_index=panel.bar_index)
+
+    return {
+        **params,
+        'total_return': result.total_return,
+        'sharpe_ratio': result.sharpe_ratio,
+        'sortino_ratio': result.sortino_ratio,
+        'max_drawdown': result.max_drawdown,
+        'win_rate': result.win_rate,
+        'profit_factor': result.profit_factor,
+        'calmar_ratio': result.calmar_ratio,
+        'volatility': result.volatility,
+        'avg_monthly_turnover': result.avg_monthly_turnover,
+        'total_trades': result.total_trades,
+    }
+
+
+# ========== 프로세스 풀 워커 ==========
+# 패널/가격 데이터는 워커 초기화 시 1회만 전달 (작업마다 직렬화하지 않음)
+_WORKER_STATE: Dict[str, object] = {}
+
+
+def _init_worker(panel: FactorPanel, price_data: Dict[str, pd.DataFrame]):
+    _WORKER_STATE["panel"] = panel
+    _WORKER_STATE["price_data"] = price_data
+
+
+def _evaluate_task(task: Tuple[int, Dict[str, float], datetime, datetime]) -> Tuple[int, Optional[dict]]:
+    fold_index, params, start_date, end_date = task
+    try:
+        result = evaluate_weights(
+            _WORKER_STATE["panel"], _WORKER_STATE["price_data"],
+            params, start_date, end_date
+        )
+    except Exception as e:
+        logger.debug(f"폴드 {fold_index} 평가 실패 {params}: {e}")
+        result = None
+    return fold_index, result
+
+
+@dataclass
+class WalkForwardConfig:
+    """워크포워드 설정 (구간 길이는 거래일 기준)"""
+    train_days: int = 120                 # 학습 구간 (~6개월)
+    test_days: int = 60                   # 검증 구간 (~3개월)
+    step_days: Optional[int] = None       # 폴드 이동 간격 (기본: test_days)
+    max_workers: Optional[int] = None     # 프로세스 수 (None: CPU 수, 1: 단일 프로세스)
+    min_oos_sharpe: float = 0.5           # 통과 기준: 평균 OOS 샤프비율
+    max_weight_std: float = 0.15          # 통과 기준: 선택 가중치 평균 표준편차
+
+
+@dataclass
+class WalkForwardFold:
+    """학습/검증 구간"""
+    index: int
+    train_start: datetime
+    train_end: datetime
+    test_start: datetime
+    test_end: datetime
+
+
+@dataclass
+class FoldResult:
+    """폴드별 결과"""
+    fold: WalkForwardFold
+    params: Dict[str, float]
+    train_sharpe: float
+    test_sharpe: float
+    test_return: float
+    test_mdd: float
+    test_turnover: float
+
+    def to_dict(self) -> dict:
+        return {
+            'fold': self.fold.index,
+            'train_start': self.fold.train_start.strftime("%Y-%m-%d"),
+            'train_end': self.fold.train_end.strftime("%Y-%m-%d"),
+            'test_start': self.fold.test_start.strftime("%Y-%m-%d"),
+            'test_end': self.fold.test_end.strftime("%Y-%m-%d"),
+            'params': self.params,
+            'train_sharpe': self.train_sharpe,
+            'test_sharpe': self.test_sharpe,
+            'test_return': self.test_return,
+            'test_mdd': self.test_mdd,
+            'test_turnover': self.test_turnover,
+        }
+
+
+@dataclass
+class WalkForwardReport:
+    """워크포워드 검증 리포트"""
+    config: WalkForwardConfig
+    folds: List[FoldResult] = field(default_factory=list)
+    combos_tested: int = 0
+    elapsed_sec: float = 0.0
+
+    @property
+    def oos_sharpe(self) -> float:
+        """평균 표본외 샤프비율"""
+        if not self.folds:
+            return 0.0
+        return float(np.mean([f.test_sharpe for f in self.folds]))
+
+    @property
+    def is_sharpe(self) -> float:
+        """평균 표본내 샤프비율"""
+        if not self.folds:
+            return 0.0
+        return float(np.mean([f.train_sharpe for f in self.folds]))
+
+    @property
+    def efficiency(self) -> float:
+        """OOS/IS 샤프 비율 (과최적화 지표, 1에 가까울수록 양호)"""
+        if self.is_sharpe <= 0:
+            return 0.0
+        return self.oos_sharpe / self.is_sharpe
+
+    @property
+    def oos_return(self) -> float:
+        """검증 구간 연결 수익률 (%)"""
+        if not self.folds:
+            return 0.0
+        growth = np.prod([1 + f.test_return / 100 for f in self.folds])
+        return float((growth - 1) * 100)
+
+    @property
+    def avg_turnover(self) -> float:
+        """검증 구간 월평균 턴오버 (%)"""
+        if not self.folds:
+            return 0.0
+        return float(np.mean([f.test_turnover for f in self.folds]))
+
+    @property
+    def weight_std(self) -> Dict[str, float]:
+        """폴드 간 선택 가중치 표준편차"""
+        if not self.folds:
+            return {}
+        return {
+            key: float(np.std([f.params.get(key, 0.0) for f in self.folds]))
+            for key in SIGNAL_WEIGHT_KEYS
+        }
+
+    @property
+    def persistence(self) -> float:
+        """연속 폴드에서 동일 조합이 선택된 비율"""
+        if len(self.folds) < 2:
+            return 1.0 if self.folds else 0.0
+        same = sum(
+            1 for prev, cur in zip(self.folds, self.folds[1:])
+            if prev.params == cur.params
+        )
+        return same / (len(self.folds) - 1)
+
+    @property
+    def passed(self) -> bool:
+        """가중치 파일 반영 가능 여부"""
+        if not self.folds:
+            return False
+        stds = self.weight_std
+        avg_std = float(np.mean(list(stds.values()))) if stds else 0.0
+        return (self.oos_sharpe >= self.config.min_oos_sharpe and
+                avg_std <= self.config.max_weight_std)
+
+    def to_dict(self) -> dict:
+        return {
+            'passed': self.passed,
+            'folds': len(self.folds),
+            'combos_tested': self.combos_tested,
+            'elapsed_sec': round(self.elapsed_sec, 1),
+            'oos_sharpe': self.oos_sharpe,
+            'is_sharpe': self.is_sharpe,
+            'efficiency': self.efficiency,
+            'oos_return': self.oos_return,
+            'avg_turnover': self.avg_turnover,
+            'weight_std': self.weight_std,
+            'persistence': self.persistence,
+            'fold_results': [f.to_dict() for f in self.folds],
+        }
+
+
+class WalkForwardOptimizer:
+    """워크포워드 가중치 검증기
+
+    각 폴드의 학습 구간에서 그리드 서치로 최적(샤프) 조합을 고르고,
+    바로 뒤 검증 구간에서 해당 조합의 표본외 성과를 측정한다.
+    """
+
+    def __init__(
+        self,
+        price_data: Dict[str, pd.DataFrame],
+        config: WalkForwardConfig = None,
+        param_grid: Dict[str, List[float]] = None,
+        panel: FactorPanel = None
+    ):
+        self.price_data = {
+            code: df for code, df in price_data.items()
+            if df is not None and not df.empty
+        }
+        self.config = config or WalkForwardConfig()
+        self.combos = iter_param_grid(param_grid)
+        self.panel = panel or FactorPanel(self.price_data)
+
+    def build_folds(self) -> List[WalkForwardFold]:
+        """거래일 기준 롤링 폴드 생성 (첫 학습 구간은 팩터 워밍업 이후 시작)"""
+        dates = self.panel.dates
+        train, test = self.config.train_days, self.config.test_days
+        step = self.config.step_days or test
+
+        folds = []
+        start = FactorPanel.MIN_HISTORY
+        while start + train + test <= len(dates):
+            folds.append(WalkForwardFold(
+                index=len(folds),
+                train_start=dates[start].to_pydatetime(),
+                train_end=dates[start + train - 1].to_pydatetime(),
+                test_start=dates[start + train].to_pydatetime(),
+                test_end=dates[start + train + test - 1].to_pydatetime(),
+            ))
+            start += step
+        return folds
+
+    def _map(self, tasks: List[tuple]) -> List[Tuple[int, Optional[dict]]]:
+        """작업 실행 (max_workers=1이면 현재 프로세스에서 순차 실행)"""
+        workers = self.config.max_workers or os.cpu_count() or 1
+        if workers <= 1 or len(tasks) <= 1:
+            _init_worker(self.panel, self.price_data)
+            return [_evaluate_task(task) for task in tasks]
+
+        chunksize = max(1, len(tasks) // (workers * 4))
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(self.panel, self.price_data)
+        ) as executor:
+            return list(executor.map(_evaluate_task, tasks, chunksize=chunksize))
+
+    def run(self, verbose: bool = False) -> WalkForwardReport:
+        """워크포워드 검증 실행"""
+        started = time.time()
+        report = WalkForwardReport(config=self.config, combos_tested=len(self.combos))
+
+        folds = self.build_folds()
+        if not folds:
+            logger.warning("워크포워드 폴드 생성 불가: 가격 데이터 기간 부족")
+            return report
+
+        if verbose:
+            print(f"\n워크포워드: {len(folds)}개 폴드 × {len(self.combos)}개 조합")
+
+        # 1. 폴드별 학습 구간 그리드 서치 (전체 폴드를 한 번에 병렬 실행)
+        train_tasks = [
+            (fold.index, params, fold.train_start, fold.train_end)
+            for fold in folds for params in self.combos
+        ]
+        best: Dict[int, dict] = {}
+        for fold_index, result in self._map(train_tasks):
+            if result is None:
+                continue
+            if fold_index not in best or result['sharpe_ratio'] > best[fold_index]['sharpe_ratio']:
+                best[fold_index] = result
+
+        # 2. 폴드별 최적 조합의 검증 구간 성과
+        test_tasks = [
+            (fold.index, {k: best[fold.index][k] for k in self.combos[0]}, fold.test_start, fold.test_end)
+            for fold in folds if fold.index in best
+        ]
+        for fold_index, result in self._map(test_tasks):
+            if result is None:
+                continue
+            fold = folds[fold_index]
+            train = best[fold_index]
+            report.folds.append(FoldResult(
+                fold=fold,
+                params={k: train[k] for k in self.combos[0]},
+                train_sharpe=train['sharpe_ratio'],
+                test_sharpe=result['sharpe_ratio'],
+                test_return=result['total_return'],
+                test_mdd=result['max_drawdown'],
+                test_turnover=result['avg_monthly_turnover'],
+            ))
+
+        report.folds.sort(key=lambda f: f.fold.index)
+        report.elapsed_sec = time.time() - started
+
+        logger.info(
+            f"워크포워드 완료: {len(report.folds)}개 폴드, "
+            f"OOS 샤프 {report.oos_sharpe:.2f} (IS {report.is_sharpe:.2f}), "
+            f"통과={report.passed}, {report.elapsed_sec:.1f}초"
+        )
+        return report
@@ -14,11 +14,21 @@ from pathlib import Path
 from telegram import Update
 from telegram.ext import ContextTypes
 
+from src.quant_modules.tracker_store import TrackerStore, DB_FILENAME
+
 from ._base import DATA_DIR, parse_days_arg, with_error_handling
 
 logger = logging.getLogger(__name__)
 
 
+def _open_tracker_store():
+    """일별 트래커 DB 읽기 전용 열기 (없으면 None)"""
+    db_file = DATA_DIR / DB_FILENAME
+    if not db_file.exists():
+        return None
+    return TrackerStore(db_file, readonly=True)
+
+
 class QueryCommandsMixin:
     """조회 명령어 모음"""
 
@@ -120,31 +130,26 @@ class QueryCommandsMixin:
     @with_error_handling("히스토리 조회")
     async def cmd_history(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """일별 자산 변동 조회"""
-        history_file = DATA_DIR / "daily_history.json"
+        store = _open_tracker_store()
 
-        if not history_file.exists():
+        if store is None:
             await update.message.reply_text("❌ 일별 히스토리 데이터가 없습니다.\n15:20 일일 리포트 후 생성됩니다.")
             return
 
-        with open(history_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        days = parse_days_arg(context)
+        cutoff = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
 
-        initial_capital = data.get("initial_capital", 0)
-        snapshots = data.get("snapshots", [])
+        try:
+            initial_capital = store.get_meta("initial_capital", 0)
+            has_snapshots = store.count_snapshots() > 0
+            recent = store.get_snapshots(since=cutoff, desc=True)
+        finally:
+            store.close()
 
-        if not snapshots:
+        if not has_snapshots:
             await update.message.reply_text("❌ 저장된 스냅샷이 없습니다.")
             return
 
-        days = parse_days_arg(context)
-
-        cutoff = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
-        recent = sorted(
-            [s for s in snapshots if s["date"] >= cutoff],
-            key=lambda s: s["date"],
-            reverse=True
-        )
-
         if not recent:
             await update.message.reply_text(f"❌ 최근 {days}일 내 데이터가 없습니다.")
             return
@@ -187,30 +192,25 @@ class QueryCommandsMixin:
     @with_error_handling("거래 내역 조회")
     async def cmd_trades(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """거래 내역 조회"""
-        tx_file = DATA_DIR / "transaction_journal.json"
+        store = _open_tracker_store()
 
-        if not tx_file.exists():
+        if store is None:
             await update.message.reply_text("❌ 거래 일지 데이터가 없습니다.\n거래 발생 시 자동 기록됩니다.")
             return
 
-        with open(tx_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        days = parse_days_arg(context)
+        cutoff = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
 
-        transactions = data.get("transactions", [])
+        try:
+            has_transactions = store.count_transactions() > 0
+            recent = store.get_transactions(since=cutoff, desc=True)
+        finally:
+            store.close()
 
-        if not transactions:
+        if not has_transactions:
             await update.message.reply_text("❌ 기록된 거래가 없습니다.")
             return
 
-        days = parse_days_arg(context)
-
-        cutoff = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
-        recent = sorted(
-            [t for t in transactions if t["date"] >= cutoff],
-            key=lambda t: t["timestamp"],
-            reverse=True
-        )
-
         if not recent:
             await update.message.reply_text(f"❌ 최근 {days}일 내 거래가 없습니다.")
             return
@@ -263,17 +263,18 @@ class QueryCommandsMixin:
     @with_error_handling("투자 현황 조회")
     async def cmd_capital(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """초기 투자금 대비 현황"""
-        history_file = DATA_DIR / "daily_history.json"
+        store = _open_tracker_store()
 
-        if not history_file.exists():
+        if store is None:
             await update.message.reply_text("❌ 일별 히스토리 데이터가 없습니다.\n15:20 일일 리포트 후 생성됩니다.")
             return
 
-        with open(history_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        initial_capital = data.get("initial_capital", 0)
-        snapshots = data.get("snapshots", [])
+        try:
+            initial_capital = store.get_meta("initial_capital", 0)
+            first = store.get_snapshots(limit=1)
+            last = store.get_snapshots(desc=True, limit=1)
+        finally:
+            store.close()
 
         if not initial_capital:
             await update.message.reply_text("❌ 초기 투자금 정보가 없습니다.")
@@ -300,8 +301,8 @@ class QueryCommandsMixin:
                 logger.warning(f"실시간 잔고 조회 실패: {e}")
 
         # API 실패 시 최신 스냅샷 사용
-        if total_assets == 0 and snapshots:
-            latest = sorted(snapshots, key=lambda s: s["date"])[-1]
+        if total_assets == 0 and last:
+            latest = last[0]
             total_assets = latest["total_assets"]
             cash = latest["cash"]
             invested = latest["invested"]
@@ -318,8 +319,8 @@ class QueryCommandsMixin:
 
         # 운용 기간 계산
         days_str = ""
-        if snapshots:
-            first_date = sorted(snapshots, key=lambda s: s["date"])[0]["date"]
+        if first:
+            first_date = first[0]["date"]
             try:
                 start = datetime.strptime(first_date, "%Y-%m-%d")
                 days_count = (datetime.now() - start).days
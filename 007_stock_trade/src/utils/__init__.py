@@ -26,6 +26,7 @@ from .retry import (
     RetryExecutor,
 )
 
+from .rate_limiter import RateLimiter
 from .error_formatter import format_user_error
 from .balance_helpers import parse_balance, BalanceSummary
 
@@ -50,6 +51,8 @@ __all__ = [
     "ORDER_RETRY_CONFIG",
     "with_retry",
     "RetryExecutor",
+    # rate_limiter
+    "RateLimiter",
     # error_formatter
     "format_user_error",
     # balance_helpers
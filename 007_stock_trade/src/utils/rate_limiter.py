@@ -0,0 +1,63 @@
+"""
+API 호출 속도 제한 유틸리티
+
+여러 스레드가 공유하는 토큰 버킷 방식 Rate Limiter
+- 초당 허용 건수(rate)만큼 토큰 보충, 최대 burst개까지 적립
+- acquire()는 토큰이 생길 때까지 대기 (스레드 안전)
+"""
+
+import time
+import threading
+
+
+class RateLimiter:
+    """토큰 버킷 Rate Limiter (Thread-safe)"""
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Args:
+            rate: 초당 허용 호출 수
+            burst: 최대 연속 호출 수 (버킷 크기)
+        """
+        if rate <= 0:
+            raise ValueError(f"rate는 0보다 커야 합니다: {rate}")
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        토큰 획득 (부족하면 대기)
+
+        Args:
+            tokens: 소모할 토큰 수
+
+        Returns:
+            대기한 시간 (초)
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                wait = (tokens - self._tokens) / self.rate
+            time.sleep(wait)
+            waited += wait
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """토큰 즉시 획득 시도 (대기 없음)"""
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return True
+            return False
@@ -17,6 +17,7 @@ import shutil
 from pathlib import Path
 from datetime import datetime, timedelta
 import unittest
+from unittest.mock import patch
 
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -210,6 +211,30 @@ class TestDailyTracker(unittest.TestCase):
         self.assertEqual(len(tracker.snapshots), 1)  # 여전히 1개
         self.assertEqual(tracker.snapshots[0].total_assets, 18_500_000)  # 업데이트됨
 
+    def test_full_list_cached_until_write(self):
+        """전체 목록은 쓰기 전까지 재조회하지 않고, 쓰기 후 갱신"""
+        tracker = self._make_tracker()
+        tracker.log_transaction({"type": "BUY", "code": "005930", "name": "삼성전자",
+                                 "quantity": 1, "price": 70_000,
+                                 "timestamp": "2026-02-09T09:00:00"})
+        self.assertEqual(len(tracker.transactions), 1)
+
+        with patch.object(tracker.store, "get_transactions",
+                          wraps=tracker.store.get_transactions) as spy:
+            tracker.transactions
+            tracker.transactions
+            self.assertEqual(spy.call_count, 0)
+
+            tracker.log_transaction({"type": "SELL", "code": "005930", "name": "삼성전자",
+                                     "quantity": 1, "price": 71_000,
+                                     "timestamp": "2026-02-10T09:00:00"})
+            self.assertEqual([t.type for t in tracker.transactions], ["BUY", "SELL"])
+            self.assertEqual(spy.call_count, 1)
+
+        # 반환 목록을 수정해도 캐시는 영향 없음
+        tracker.snapshots.append(None)
+        self.assertEqual(len(tracker.snapshots), 0)
+
     def test_log_transaction(self):
         """거래 즉시 기록"""
         tracker = self._make_tracker()
@@ -231,8 +256,8 @@ class TestDailyTracker(unittest.TestCase):
         self.assertEqual(tracker.transactions[0].amount, 750_000)
         self.assertEqual(tracker.transactions[0].date, "2026-02-09")
 
-        # 파일 존재 확인
-        self.assertTrue(tracker.transaction_file.exists())
+        # DB 파일 존재 확인
+        self.assertTrue(tracker.db_file.exists())
 
         # 재로드 후 확인
         tracker2 = DailyTracker(data_dir=self.temp_dir)
@@ -383,7 +408,8 @@ class TestDailyTracker(unittest.TestCase):
         """오래된 스냅샷 정리"""
         tracker = self._make_tracker()
 
-        # MAX_HISTORY_DAYS + 10 개 추가
+        # MAX_HISTORY_DAYS + 10 개 추가 (저장소 직접 기록, cleanup 미실행)
+        snaps = []
         for i in range(MAX_HISTORY_DAYS + 10):
             date = (datetime.now() - timedelta(days=i)).strftime("%Y-%m-%d")
             snap = DailySnapshot(
@@ -392,7 +418,9 @@ class TestDailyTracker(unittest.TestCase):
                 total_pnl=0, total_pnl_pct=0, daily_pnl=0,
                 daily_pnl_pct=0, trades_today=0
             )
-            tracker.snapshots.append(snap)
+            snaps.append(snap.to_dict())
+        tracker.store.upsert_snapshots(snaps)
+        self.assertEqual(len(tracker.snapshots), MAX_HISTORY_DAYS + 10)
 
         # cleanup 트리거 (save시 자동)
         new_snap = DailySnapshot(
@@ -430,8 +458,8 @@ class TestDailyTracker(unittest.TestCase):
         tracker2 = DailyTracker(data_dir=self.temp_dir)
         self.assertEqual(tracker2.initial_capital, 10_000_000)
 
-    def test_atomic_write_history(self):
-        """히스토리 파일 atomic write (tmp → replace)"""
+    def test_snapshot_persisted_in_db(self):
+        """스냅샷은 DB에 저장 (JSON 파일 재작성 없음)"""
         tracker = self._make_tracker()
         snap = DailySnapshot(
             date="2026-02-09", total_assets=18_000_000, cash=5_000_000,
@@ -441,31 +469,57 @@ class TestDailyTracker(unittest.TestCase):
         )
         tracker.save_daily_snapshot(snap)
 
-        # tmp 파일이 남아있지 않은지
-        tmp_files = list(self.temp_dir.glob("*.tmp"))
-        self.assertEqual(len(tmp_files), 0)
+        self.assertTrue(tracker.db_file.exists())
+        self.assertFalse(tracker.history_file.exists())
+        self.assertEqual(tracker.store.count_snapshots(), 1)
 
-        # 원본 파일이 유효한 JSON인지
-        with open(tracker.history_file, 'r') as f:
-            data = json.load(f)
-        self.assertIn("snapshots", data)
-        self.assertIn("initial_capital", data)
+    def test_snapshot_range_query(self):
+        """날짜 범위 조회 (since 포함, before 미포함)"""
+        tracker = self._make_tracker()
+        for day in ("2026-02-05", "2026-02-06", "2026-02-09", "2026-02-10"):
+            tracker.save_daily_snapshot(DailySnapshot(
+                date=day, total_assets=10_000_000, cash=5_000_000,
+                invested=5_000_000, buy_amount=5_000_000, position_count=5,
+                total_pnl=0, total_pnl_pct=0, daily_pnl=0,
+                daily_pnl_pct=0, trades_today=0
+            ))
+
+        rows = tracker.store.get_snapshots(since="2026-02-06", before="2026-02-10", desc=True)
+        self.assertEqual([r["date"] for r in rows], ["2026-02-09", "2026-02-06"])
+
+    def test_migrate_legacy_json(self):
+        """레거시 JSON → DB 1회 이관 후 원본은 *.migrated.json으로 보관"""
+        history = {
+            "initial_capital": 10_000_000,
+            "snapshots": [{
+                "date": "2026-02-09", "total_assets": 10_500_000, "cash": 2_000_000,
+                "invested": 8_500_000, "position_count": 3,
+                "total_pnl": 500_000, "total_pnl_pct": 5.0
+            }],
+        }
+        journal = {
+            "transactions": [{
+                "timestamp": "2026-02-09T09:00:00", "date": "2026-02-09", "type": "BUY",
+                "code": "005930", "name": "삼성전자", "quantity": 10, "price": 75_000
+            }],
+        }
+        with open(self.temp_dir / "daily_history.json", 'w') as f:
+            json.dump(history, f)
+        with open(self.temp_dir / "transaction_journal.json", 'w') as f:
+            json.dump(journal, f)
 
-    def test_atomic_write_transactions(self):
-        """거래 일지 파일 atomic write"""
         tracker = self._make_tracker()
-        tracker.log_transaction({
-            "type": "BUY", "code": "005930", "name": "삼성전자",
-            "quantity": 10, "price": 75_000, "order_no": "ORD001",
-            "reason": "테스트", "timestamp": "2026-02-09T09:00:00"
-        })
-
-        tmp_files = list(self.temp_dir.glob("*.tmp"))
-        self.assertEqual(len(tmp_files), 0)
-
-        with open(tracker.transaction_file, 'r') as f:
-            data = json.load(f)
-        self.assertIn("transactions", data)
+        self.assertEqual(tracker.initial_capital, 10_000_000)
+        self.assertEqual(tracker.get_latest_snapshot().total_assets, 10_500_000)
+        self.assertEqual(tracker.transactions[0].amount, 750_000)
+        self.assertFalse(tracker.history_file.exists())
+        self.assertTrue((self.temp_dir / "daily_history.migrated.json").exists())
+        self.assertTrue((self.temp_dir / "transaction_journal.migrated.json").exists())
+
+        # 재시작 시 중복 이관 없음
+        tracker2 = self._make_tracker()
+        self.assertEqual(len(tracker2.snapshots), 1)
+        self.assertEqual(len(tracker2.transactions), 1)
 
 
 class TestDailyPnlCalculation(unittest.TestCase):
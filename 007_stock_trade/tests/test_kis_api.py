@@ -14,7 +14,8 @@ from datetime import datetime, timedelta
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.api.kis_auth import KISAuth, get_auth
-from src.api.kis_client import KISClient, StockPrice, OrderResult, StockBalance
+from src.api.kis_client import KISClient, StockPrice, OrderResult, StockBalance, KISRateLimitError
+from src.api.kis_transport import KISTransport
 
 
 class TestKISAuth:
@@ -99,6 +100,9 @@ class TestKISClient:
             # Mock token to avoid API call
             client.auth.access_token = "test_token"
             client.auth.token_expires_at = datetime.now() + timedelta(hours=23)
+            # 전송 계층 세션 대체 (싱글톤 세션을 건드리지 않도록 전용 인스턴스)
+            client.transport = KISTransport(is_virtual=True)
+            client.transport.session = Mock()
             return client
 
     def test_client_init(self, mock_client):
@@ -106,11 +110,9 @@ class TestKISClient:
         assert mock_client.is_virtual is True
         assert mock_client.auth is not None
 
-    @pytest.mark.skip(reason="kis_client._request 재시도 로직 추가로 mock 패턴 구형 (response.text Mock 이슈)")
-    @patch('src.api.kis_client.requests.get')
-    def test_get_stock_price(self, mock_get, mock_client):
+    def test_get_stock_price(self, mock_client):
         """현재가 조회 테스트"""
-        mock_response = Mock()
+        mock_response = Mock(status_code=200, text='{"rt_cd": "0"}', headers={})
         mock_response.json.return_value = {
             "output": {
                 "hts_kor_isnm": "삼성전자",
@@ -124,7 +126,7 @@ class TestKISClient:
             }
         }
         mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
+        mock_client.transport.session.get.return_value = mock_response
 
         result = mock_client.get_stock_price("005930")
 
@@ -133,11 +135,9 @@ class TestKISClient:
         assert result.name == "삼성전자"
         assert result.price == 71000
 
-    @pytest.mark.skip(reason="kis_client._request 재시도 로직 추가로 mock 패턴 구형")
-    @patch('src.api.kis_client.requests.post')
-    def test_buy_stock(self, mock_post, mock_client):
+    def test_buy_stock(self, mock_client):
         """매수 주문 테스트"""
-        mock_response = Mock()
+        mock_response = Mock(status_code=200, text='{"rt_cd": "0"}', headers={})
         mock_response.json.return_value = {
             "rt_cd": "0",
             "msg1": "정상처리",
@@ -146,7 +146,7 @@ class TestKISClient:
             }
         }
         mock_response.raise_for_status = Mock()
-        mock_post.return_value = mock_response
+        mock_client.transport.session.post.return_value = mock_response
 
         result = mock_client.buy_stock("005930", qty=10, price=70000)
 
@@ -154,11 +154,9 @@ class TestKISClient:
         assert result.success is True
         assert result.order_no == "0000123456"
 
-    @pytest.mark.skip(reason="kis_client._request 재시도 로직 추가로 mock 패턴 구형")
-    @patch('src.api.kis_client.requests.post')
-    def test_sell_stock(self, mock_post, mock_client):
+    def test_sell_stock(self, mock_client):
         """매도 주문 테스트"""
-        mock_response = Mock()
+        mock_response = Mock(status_code=200, text='{"rt_cd": "0"}', headers={})
         mock_response.json.return_value = {
             "rt_cd": "0",
             "msg1": "정상처리",
@@ -167,18 +165,16 @@ class TestKISClient:
             }
         }
         mock_response.raise_for_status = Mock()
-        mock_post.return_value = mock_response
+        mock_client.transport.session.post.return_value = mock_response
 
         result = mock_client.sell_stock("005930", qty=10, price=72000)
 
         assert isinstance(result, OrderResult)
         assert result.success is True
 
-    @pytest.mark.skip(reason="kis_client._request 재시도 로직 추가로 mock 패턴 구형. parse_balance 자체는 CHECKLIST #7에서 검증")
-    @patch('src.api.kis_client.requests.get')
-    def test_get_balance(self, mock_get, mock_client):
+    def test_get_balance(self, mock_client):
         """잔고 조회 테스트"""
-        mock_response = Mock()
+        mock_response = Mock(status_code=200, text='{"rt_cd": "0"}', headers={})
         mock_response.json.return_value = {
             "output1": [
                 {
@@ -201,7 +197,7 @@ class TestKISClient:
             ]
         }
         mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
+        mock_client.transport.session.get.return_value = mock_response
 
         result = mock_client.get_balance()
 
@@ -211,6 +207,71 @@ class TestKISClient:
         assert result["total_eval"] == 7100000
 
 
+class TestKISTransport:
+    """전송 계층 (세션 풀 / Rate Limiter / 지표) 테스트"""
+
+    @staticmethod
+    def _response(status_code=200, text='{"rt_cd": "0"}', data=None):
+        response = Mock()
+        response.status_code = status_code
+        response.text = text
+        response.headers = {}
+        response.json.return_value = data if data is not None else {"rt_cd": "0"}
+        return response
+
+    def test_metrics_per_tr(self):
+        """TR별 호출 수 / 요청 제한 횟수 집계"""
+        transport = KISTransport(is_virtual=False)
+        transport.session = Mock()
+        transport.session.get.side_effect = [
+            self._response(),
+            self._response(500, '{"rt_cd": "1", "msg_cd": "EGW00201", "msg1": "초당 거래건수를 초과하였습니다."}'),
+        ]
+        transport.session.post.return_value = self._response(429, "")
+
+        transport.request("GET", "https://x", "FHKST01010100", {})
+        transport.request("GET", "https://x", "FHKST01010100", {})
+        transport.request("POST", "https://x", "TTTC0802U", {}, body={})
+
+        metrics = transport.get_metrics()
+        assert metrics["FHKST01010100"]["calls"] == 2
+        assert metrics["FHKST01010100"]["rate_limited"] == 1
+        assert metrics["TTTC0802U"]["rate_limited"] == 1
+        assert metrics["TTTC0802U"]["errors"] == 1
+
+    @patch('src.api.kis_client.time.sleep')
+    def test_request_retries_rate_limit(self, mock_sleep):
+        """EGW00201 응답은 대기 후 재시도"""
+        client = KISClient.__new__(KISClient)
+        client.auth = Mock(base_url="https://x")
+        client.auth.get_headers.return_value = {}
+        client._last_response_headers = {}
+        client.transport = Mock(wraps=KISTransport(is_virtual=False))
+        client.transport.request = Mock(side_effect=[
+            self._response(500, '{"msg_cd": "EGW00201"}'),
+            self._response(data={"rt_cd": "0", "output": {"ok": 1}}),
+        ])
+
+        data = client._request("GET", "/uapi/test", "FHKST01010100")
+
+        assert data["output"] == {"ok": 1}
+        assert client.transport.request.call_count == 2
+        mock_sleep.assert_called_once()
+
+    @patch('src.api.kis_client.time.sleep')
+    def test_request_rate_limit_exhausted(self, mock_sleep):
+        """재시도 소진 시 KISRateLimitError"""
+        client = KISClient.__new__(KISClient)
+        client.auth = Mock(base_url="https://x")
+        client.auth.get_headers.return_value = {}
+        client._last_response_headers = {}
+        client.transport = Mock(wraps=KISTransport(is_virtual=False))
+        client.transport.request = Mock(return_value=self._response(429, ""))
+
+        with pytest.raises(KISRateLimitError):
+            client._request("GET", "/uapi/test", "FHKST01010100", retries=2)
+
+
 class TestDataClasses:
     """데이터 클래스 테스트"""
 
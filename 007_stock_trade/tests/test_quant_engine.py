@@ -19,6 +19,16 @@ from src.quant_engine import (
     PendingOrder
 )
 from src.strategy.quant import Position
+from src.quant_modules.daily_tracker import DailyTracker
+
+
+@pytest.fixture(autouse=True)
+def isolated_daily_tracker(tmp_path, monkeypatch):
+    """엔진의 DailyTracker DB를 tmp_path로 격리 (실제 data/quant에 db/wal 생성·JSON 이관 방지)"""
+    monkeypatch.setattr(
+        'src.quant_engine.DailyTracker',
+        lambda data_dir: DailyTracker(data_dir=tmp_path / "daily_tracker")
+    )
 
 
 class TestQuantEngineConfig:
@@ -0,0 +1,48 @@
+"""
+Rate Limiter 테스트
+"""
+
+import sys
+import time
+import threading
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils.rate_limiter import RateLimiter
+
+
+class TestRateLimiter:
+    """토큰 버킷 테스트"""
+
+    def test_burst_immediate(self):
+        """버킷 크기만큼은 대기 없이 획득"""
+        limiter = RateLimiter(rate=1.0, burst=3)
+
+        assert all(limiter.try_acquire() for _ in range(3))
+        assert limiter.try_acquire() is False
+
+    def test_rate_enforced_across_threads(self):
+        """여러 스레드가 공유해도 초당 한도 유지"""
+        limiter = RateLimiter(rate=50.0, burst=1)
+        started = time.monotonic()
+
+        threads = [threading.Thread(target=limiter.acquire) for _ in range(11)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        # 첫 1건은 즉시, 나머지 10건은 1/50초 간격
+        assert time.monotonic() - started >= 10 / 50 * 0.9
+
+    def test_invalid_rate(self):
+        with pytest.raises(ValueError):
+            RateLimiter(rate=0)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,228 @@
+"""
+실시간 포지션 모니터 테스트 (WebSocket mock)
+"""
+
+import sys
+import time
+import logging
+import threading
+from pathlib import Path
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.api.kis_websocket import RealtimePrice
+from src.quant_engine import QuantTradingEngine
+from src.quant_modules import position_monitor as position_monitor_module
+from src.quant_modules import realtime_monitor as realtime_module
+from src.quant_modules.position_monitor import PositionMonitor
+from src.quant_modules.realtime_monitor import RealtimePositionMonitor
+from src.strategy.quant import Position
+
+
+class FakeWebSocket:
+    """KISWebSocket 대체 (네트워크 없음)"""
+
+    def __init__(self):
+        self.is_connected = False
+        self.ws_thread = None
+        self.on_price = None
+        self.subscribed = set()
+
+    def connect(self, on_price=None, on_error=None, **kwargs):
+        self.on_price = on_price
+        self.is_connected = True
+
+    def disconnect(self):
+        self.is_connected = False
+
+    def subscribe_price(self, code):
+        self.subscribed.add(code)
+
+    def unsubscribe_price(self, code):
+        self.subscribed.discard(code)
+
+
+def _position(code="005930", quantity=10):
+    return Position(
+        code=code, name=f"종목{code}", entry_price=50000, current_price=50000,
+        quantity=quantity, entry_date=datetime.now(), stop_loss=46500,
+        take_profit_1=62250, take_profit_2=71000, highest_price=50000,
+    )
+
+
+def _tick(code, price):
+    return RealtimePrice(
+        code=code, time="100000", price=price, change=0, change_rate=0.0,
+        volume=1, cum_volume=1
+    )
+
+
+@pytest.fixture(autouse=True)
+def _no_debug_log(monkeypatch):
+    """quant_debug 로거가 저장소의 logs/quant_debug.log에 기록하지 않도록 핸들러 교체"""
+    monkeypatch.setattr(position_monitor_module.debug_logger, "handlers", [logging.NullHandler()])
+
+
+@pytest.fixture
+def setup(monkeypatch):
+    """소비자 스레드 없이 _handle_tick을 직접 호출하는 모니터"""
+    monkeypatch.setattr(position_monitor_module, "SELL_RETRY_DELAY", 0)
+
+    portfolio = MagicMock()
+    portfolio.positions = {"005930": _position()}
+    executor = MagicMock()
+    notifier = MagicMock()
+    cfg = SimpleNamespace(trailing_stop=False, stop_loss_pct=0.07)
+    pm = PositionMonitor(MagicMock(), portfolio, notifier, cfg, is_virtual=True,
+                         order_executor=executor)
+
+    fake_ws = FakeWebSocket()
+    rt = RealtimePositionMonitor(pm, portfolio, is_virtual=True, ws_factory=lambda: fake_ws)
+    rt._position_lock = threading.Lock()
+    rt._get_daily_trades = lambda: []
+    rt._connect()
+    rt.sync_subscriptions()
+    rt._consumer = SimpleNamespace(is_alive=lambda: True)  # 스레드 기동 생략
+    return SimpleNamespace(rt=rt, pm=pm, portfolio=portfolio, executor=executor,
+                           notifier=notifier, ws=fake_ws)
+
+
+def _sell_ok(portfolio):
+    def execute(order, daily_trades, *args):
+        portfolio.positions.pop(order.code, None)
+        return True
+    return execute
+
+
+class TestTriggerCooldown:
+    def test_stop_loss_tick_sells_once(self, setup):
+        setup.executor._execute_order.side_effect = _sell_ok(setup.portfolio)
+
+        setup.rt._handle_tick("005930", time.time(), _tick("005930", 45000))
+
+        assert setup.executor._execute_order.call_count == 1
+        assert "005930" not in setup.portfolio.positions
+        assert setup.rt._last_resync == 0.0  # 즉시 재구독 예약
+
+    def test_failed_sell_starts_cooldown(self, setup):
+        setup.executor._execute_order.return_value = False
+
+        for _ in range(5):
+            setup.rt._handle_tick("005930", time.time(), _tick("005930", 45000))
+
+        # 첫 틱에서만 3회 시도 + 실패 알림 1회, 이후 틱은 쿨다운
+        assert setup.executor._execute_order.call_count == 3
+        failures = [c for c in setup.notifier.send_message.call_args_list if "손절 실패" in c.args[0]]
+        assert len(failures) == 1
+        assert "005930" in setup.rt._last_trigger
+
+    def test_cooldown_expires(self, setup, monkeypatch):
+        setup.executor._execute_order.return_value = False
+        setup.rt._handle_tick("005930", time.time(), _tick("005930", 45000))
+
+        monkeypatch.setattr(realtime_module, "TRIGGER_COOLDOWN_SEC", 0)
+        setup.rt._handle_tick("005930", time.time(), _tick("005930", 45000))
+
+        assert setup.executor._execute_order.call_count == 6
+
+    def test_price_update_without_trigger_has_no_cooldown(self, setup):
+        setup.rt._handle_tick("005930", time.time(), _tick("005930", 48000))
+
+        assert setup.executor._execute_order.call_count == 0
+        assert "005930" not in setup.rt._last_trigger
+        assert setup.portfolio.positions["005930"].current_price == 48000
+
+
+class TestSellInFlightGuard:
+    def test_concurrent_trigger_is_skipped(self, setup):
+        started, release = threading.Event(), threading.Event()
+
+        def slow_sell(order, daily_trades, *args):
+            started.set()
+            release.wait(5)
+            setup.portfolio.positions.pop(order.code, None)
+            return True
+        setup.executor._execute_order.side_effect = slow_sell
+
+        worker = threading.Thread(
+            target=setup.rt._handle_tick, args=("005930", time.time(), _tick("005930", 45000))
+        )
+        worker.start()
+        assert started.wait(5)
+
+        # 폴링 폴백 경로가 같은 종목을 평가해도 매도하지 않음
+        changed = setup.pm.evaluate_price("005930", 45000, setup.rt._position_lock, [])
+        release.set()
+        worker.join(5)
+
+        assert changed is False
+        assert setup.executor._execute_order.call_count == 1
+        assert not setup.pm.is_selling("005930")
+
+
+class TestStaleness:
+    def test_streaming_after_subscribe(self, setup):
+        assert setup.rt.is_streaming
+
+    def test_stale_without_any_tick(self, setup):
+        setup.rt.subscribed_at -= realtime_module.STALE_TICK_SEC + 1
+        assert setup.rt.last_tick_at == 0.0
+        assert not setup.rt.is_streaming
+
+    def test_tick_keeps_stream_fresh(self, setup):
+        setup.rt.subscribed_at -= realtime_module.STALE_TICK_SEC + 1
+        setup.rt._handle_tick("005930", time.time(), _tick("005930", 48000))
+        assert setup.rt.is_streaming
+
+    def test_stale_stream_falls_back_to_polling(self, setup):
+        setup.rt.subscribed_at -= realtime_module.STALE_TICK_SEC + 1
+        engine = SimpleNamespace(
+            realtime_monitor=setup.rt, position_monitor=MagicMock(),
+            _position_lock=setup.rt._position_lock, daily_trades=[], _save_state=lambda: None,
+        )
+
+        QuantTradingEngine.monitor_positions(engine)
+
+        engine.position_monitor.monitor.assert_called_once()
+        engine.position_monitor.check_risks.assert_not_called()
+
+    def test_healthy_stream_skips_polling(self, setup):
+        engine = SimpleNamespace(
+            realtime_monitor=setup.rt, position_monitor=MagicMock(),
+            _position_lock=setup.rt._position_lock, daily_trades=[], _save_state=lambda: None,
+        )
+
+        QuantTradingEngine.monitor_positions(engine)
+
+        engine.position_monitor.monitor.assert_not_called()
+        engine.position_monitor.check_risks.assert_called_once()
+
+
+class TestResubscribe:
+    def test_position_change_resubscribes(self, setup):
+        assert setup.ws.subscribed == {"005930"}
+
+        setup.portfolio.positions.pop("005930")
+        setup.portfolio.positions["000660"] = _position("000660")
+        setup.rt.sync_subscriptions()
+
+        assert setup.ws.subscribed == {"000660"}
+        assert setup.rt._subscribed == {"000660"}
+
+    def test_new_subscription_resets_staleness_clock(self, setup):
+        setup.rt.subscribed_at -= realtime_module.STALE_TICK_SEC + 1
+        setup.portfolio.positions["000660"] = _position("000660")
+        setup.rt.sync_subscriptions()
+        assert setup.rt.is_streaming
+
+    def test_subscription_limit(self, setup, monkeypatch):
+        monkeypatch.setattr(realtime_module, "MAX_SUBSCRIPTIONS", 2)
+        for code in ("000001", "000002", "000003"):
+            setup.portfolio.positions[code] = _position(code)
+        setup.rt.sync_subscriptions()
+        assert len(setup.ws.subscribed) == 2
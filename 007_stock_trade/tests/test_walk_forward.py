@@ -0,0 +1,162 @@
+"""
+워크포워드 검증 엔진 테스트
+"""
+
+import pytest
+import sys
+from pathlib import Path
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.strategy.quant import (
+    Backtester,
+    BacktestConfig,
+    FactorPanel,
+    WalkForwardConfig,
+    WalkForwardOptimizer,
+)
+
+
+def _make_price_data(n_stocks: int = 12, start: str = "2022-01-03", end: str = "2023-12-29") -> dict:
+    """랜덤워크 가격 데이터"""
+    rng = np.random.default_rng(42)
+    dates = pd.bdate_range(start, end)
+    data = {}
+    for i in range(n_stocks):
+        close = 10_000 * np.exp(np.cumsum(rng.normal(0.0005, 0.02, len(dates))))
+        data[f"{i:06d}"] = pd.DataFrame({
+            'date': dates,
+            'open': close,
+            'high': close * 1.01,
+            'low': close * 0.99,
+            'close': close,
+            'volume': rng.integers(10_000, 50_000, len(dates)).astype(float),
+        })
+    return data
+
+
+SMALL_GRID = {
+    "momentum_weight": [0.2, 0.5],
+    "short_mom_weight": [0.1],
+    "volatility_weight": [0.3],
+    "volume_weight": [0.0],
+    "target_count": [5],
+}
+
+
+class TestFactorPanel:
+    """팩터 패널 테스트"""
+
+    def test_matches_per_date_calculation(self):
+        """패널 점수가 해당일까지 데이터로 직접 계산한 값과 일치"""
+        price_data = _make_price_data()
+        panel = FactorPanel(price_data)
+        date = pd.Timestamp("2023-03-02")
+
+        df = price_data["000000"]
+        prices = df[df['date'] <= date]['close']
+        expected_mom = (prices.iloc[-1] / prices.iloc[-60] - 1) * 100
+        expected_vol = prices.pct_change().dropna().tail(20).std() * np.sqrt(252) * 100
+
+        row = panel.dates.get_loc(date)
+        assert panel.momentum[row, 0] == pytest.approx(expected_mom)
+        assert panel.volatility[row, 0] == pytest.approx(expected_vol)
+
+    def test_insufficient_history_excluded(self):
+        """60거래일 미만 구간은 신호 없음"""
+        panel = FactorPanel(_make_price_data())
+        params = {**{k: v[0] for k, v in SMALL_GRID.items()}}
+        signals = panel.generate_signals(params, datetime(2022, 1, 1), datetime(2022, 3, 4))
+
+        assert signals.empty
+
+    def test_signals_top_n(self):
+        """리밸런싱일마다 상위 N개 종목, 동일 비중"""
+        panel = FactorPanel(_make_price_data())
+        params = {**{k: v[0] for k, v in SMALL_GRID.items()}}
+        signals = panel.generate_signals(params, datetime(2023, 1, 1), datetime(2023, 6, 30))
+
+        assert not signals.empty
+        assert (signals['date'].dt.day <= 3).all()
+        for _, group in signals.groupby('date'):
+            assert len(group) == 5
+            assert group['weight'].sum() == pytest.approx(1.0)
+            assert group['score'].is_monotonic_decreasing
+
+
+class TestBacktesterBarIndex:
+    """백테스터 가격 인덱스 재사용 테스트"""
+
+    def test_prebuilt_index_same_result(self):
+        """미리 만든 인덱스로 실행해도 결과 동일"""
+        price_data = _make_price_data()
+        panel = FactorPanel(price_data)
+        params = {**{k: v[0] for k, v in SMALL_GRID.items()}}
+        start, end = datetime(2023, 1, 1), datetime(2023, 6, 30)
+        signals = panel.generate_signals(params, start, end)
+
+        config = BacktestConfig(target_position_count=5)
+        r1 = Backtester(config).run(price_data, signals, start, end)
+        r2 = Backtester(config).run(price_data, signals, start, end, bar_index=panel.bar_index)
+
+        assert r1.total_return == pytest.approx(r2.total_return)
+        assert r1.total_trades == r2.total_trades
+
+
+class TestWalkForwardOptimizer:
+    """워크포워드 검증기 테스트"""
+
+    def test_folds_do_not_overlap(self):
+        """검증 구간은 학습 구간 이후, 폴드끼리 검증 구간 중복 없음"""
+        wf = WalkForwardOptimizer(
+            _make_price_data(),
+            WalkForwardConfig(train_days=120, test_days=60),
+            SMALL_GRID
+        )
+        folds = wf.build_folds()
+
+        assert len(folds) >= 2
+        for fold in folds:
+            assert fold.train_end < fold.test_start
+        for prev, cur in zip(folds, folds[1:]):
+            assert prev.test_end < cur.test_start
+
+    def test_run_report(self):
+        """단일 프로세스 실행 리포트"""
+        wf = WalkForwardOptimizer(
+            _make_price_data(),
+            WalkForwardConfig(train_days=120, test_days=60, max_workers=1),
+            SMALL_GRID
+        )
+        report = wf.run()
+
+        assert report.combos_tested == 2
+        assert len(report.folds) == len(wf.build_folds())
+        for fold in report.folds:
+            assert fold.params['momentum_weight'] in SMALL_GRID['momentum_weight']
+        assert set(report.weight_std) == {
+            "momentum_weight", "short_mom_weight", "volatility_weight", "volume_weight"
+        }
+        assert 0.0 <= report.persistence <= 1.0
+        assert report.to_dict()['folds'] == len(report.folds)
+
+    def test_not_enough_history(self):
+        """데이터 기간 부족 시 미통과"""
+        wf = WalkForwardOptimizer(
+            _make_price_data(start="2023-01-02", end="2023-06-30"),
+            WalkForwardConfig(max_workers=1),
+            SMALL_GRID
+        )
+        report = wf.run()
+
+        assert report.folds == []
+        assert report.passed is False
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+미국 멀티팩터 전략 백테스트 실행 스크립트
+- 로컬 일봉 저장소(data/history/us) 기반 날짜 × 종목 패널
+- S&P 500 편입/편출 이력으로 시점별 구성종목 재현 (Wikipedia, 실패 시 현재 구성종목)
+- as-of 펀더멘털 CSV (선택), USD/KRW 환율 (Yahoo Finance)
+
+사용법:
+    python scripts/run_us_backtest.py                  # 저장소 데이터로 5년 월간 백테스트
+    python scripts/run_us_backtest.py --fetch          # 부족한 일봉을 KIS에서 먼저 수집
+    python scripts/run_us_backtest.py --fundamentals data/fundamentals_us.csv
+"""
+
+import sys
+import os
+import argparse
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+
+from src.strategy.us_backtest import (
+    USBacktestConfig, USPanelBacktester, USPricePanel, membership_from_changes
+)
+from src.strategy.us_history import USPriceHistoryStore
+from src.strategy.us_screener import PRICE_HISTORY_DAYS
+from src.strategy.us_universe import USUniverseBuilder, USDataCollector
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+logger = logging.getLogger(__name__)
+
+WIKI_SP500_URL = 'https://en.wikipedia.org/wiki/List_of_S%26P_500_companies'
+
+
+def load_membership(current: list) -> pd.DataFrame:
+    """Wikipedia 편입/편출 이력 → 편입 구간 (실패 시 None)"""
+    try:
+        changes = pd.read_html(WIKI_SP500_URL)[1]
+        changes.columns = ['_'.join(map(str, c)) if isinstance(c, tuple) else c for c in changes.columns]
+        date_col = next(c for c in changes.columns if c.startswith('Date') or c.startswith('Effective'))
+        added_col = next(c for c in changes.columns if c.startswith('Added') and c.endswith('Ticker'))
+        removed_col = next(c for c in changes.columns if c.startswith('Removed') and c.endswith('Ticker'))
+        normalized = pd.DataFrame({
+            'date': pd.to_datetime(changes[date_col], errors='coerce'),
+            'added': changes[added_col].fillna('').astype(str).str.replace('.', '-', regex=False),
+            'removed': changes[removed_col].fillna('').astype(str).str.replace('.', '-', regex=False),
+        }).dropna(subset=['date'])
+        print(f"  → 편입/편출 이력 {len(normalized)}건")
+        return membership_from_changes(current, normalized)
+    except Exception as e:
+        print(f"  → 편입/편출 이력 로드 실패 ({e}) - 현재 구성종목 사용 (생존 편향)")
+        return None
+
+
+def load_fx_rates(start: datetime, end: datetime) -> pd.Series:
+    """USD/KRW 일별 환율 (Yahoo Finance KRW=X)"""
+    try:
+        import yfinance as yf
+        raw = yf.download("KRW=X", start=start, end=end + timedelta(days=1), progress=False, auto_adjust=False)
+        close = raw['Close']
+        if isinstance(close, pd.DataFrame):
+            close = close.iloc[:, 0]
+        return close.dropna()
+    except Exception as e:
+        print(f"  → 환율 조회 실패 ({e}) - 고정 환율 사용")
+        return None
+
+
+def fetch_history(symbols: list, days: int, store: USPriceHistoryStore, builder: USUniverseBuilder):
+    """부족한 일봉 구간 KIS 수집 (Rate Limiter 적용, 로컬 저장소에 보관)"""
+    collector = USDataCollector(history_store=store, universe_builder=builder)
+    done = 0
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for _ in executor.map(lambda s: collector.get_price_data(s, days=days), symbols):
+            done += 1
+            if done % 50 == 0:
+                print(f"  진행: {done}/{len(symbols)}")
+
+
+def print_result(result):
+    """결과 출력"""
+    usd, krw = result.usd, result.krw
+    print("\n" + "=" * 60)
+    print("         미국 멀티팩터 전략 백테스트 결과")
+    print("=" * 60)
+    print(f"  기간: {usd.start_date:%Y-%m-%d} ~ {usd.end_date:%Y-%m-%d} (리밸런싱 {len(result.rebalance_dates)}회)")
+    print()
+    print(f"  {'':14}{'USD':>18}{'KRW':>20}")
+    print(f"  {'초기 자본':10}{usd.initial_capital:>18,.0f}{krw.initial_capital:>20,.0f}")
+    print(f"  {'최종 자산':10}{usd.final_value:>18,.0f}{krw.final_value:>20,.0f}")
+    print(f"  {'총 수익률':10}{usd.total_return:>+17.2f}%{krw.total_return:>+19.2f}%")
+    print(f"  {'CAGR':14}{usd.annualized_return:>+17.2f}%{krw.annualized_return:>+19.2f}%")
+    print(f"  {'변동성':11}{usd.volatility:>17.2f}%{krw.volatility:>19.2f}%")
+    print(f"  {'MDD':14}{usd.max_drawdown:>17.2f}%{krw.max_drawdown:>19.2f}%")
+    print(f"  {'샤프비율':10}{usd.sharpe_ratio:>18.2f}{krw.sharpe_ratio:>20.2f}")
+    print()
+    print(f"  환율: {result.fx_start:,.1f} → {result.fx_end:,.1f}원 ({result.fx_return:+.2f}%)")
+    print()
+    print("-" * 60)
+    print("  [거래 통계 (USD)]")
+    print(f"  총 거래 수: {usd.total_trades}회")
+    print(f"  승률: {usd.win_rate:.1f}%")
+    print(f"  평균 수익: ${usd.avg_win:,.0f}")
+    print(f"  평균 손실: ${usd.avg_loss:,.0f}")
+    print(f"  수익 팩터: {usd.profit_factor:.2f}")
+    print("=" * 60)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="미국 멀티팩터 백테스트")
+    parser.add_argument("--years", type=int, default=5, help="백테스트 기간 (년)")
+    parser.add_argument("--universe", default="sp500_full", help="유니버스 (sp500_full, sp500, nasdaq100)")
+    parser.add_argument("--capital", type=float, default=100_000, help="초기 자본 (USD)")
+    parser.add_argument("--target", type=int, default=15, help="목표 종목 수")
+    parser.add_argument("--freq", default="M", choices=["M", "W"], help="리밸런싱 주기")
+    parser.add_argument("--fundamentals", help="as-of 펀더멘털 CSV (symbol,date,per,pbr,market_cap,dividend_yield)")
+    parser.add_argument("--fetch", action="store_true", help="부족한 일봉을 KIS에서 수집 후 실행")
+    args = parser.parse_args()
+
+    end_date = datetime.now() - timedelta(days=1)
+    start_date = end_date - timedelta(days=365 * args.years)
+
+    print("\n" + "=" * 60)
+    print(f"     미국 멀티팩터 백테스트 ({args.years}년, {args.universe})")
+    print("=" * 60)
+
+    # 1. 유니버스 / 구성종목 이력
+    print("\n[1/4] 유니버스 구성 중...")
+    builder = USUniverseBuilder()
+    universe = builder.build_universe(universe_type=args.universe, size=1000)
+    symbols = [s.symbol for s in universe]
+    print(f"  → 현재 구성종목 {len(symbols)}개")
+    membership = load_membership(symbols) if args.universe.startswith("sp500") else None
+    if membership is not None:
+        symbols = sorted(set(membership['symbol']))
+
+    # 2. 가격 패널
+    print("\n[2/4] 가격 패널 구성 중...")
+    store = USPriceHistoryStore()
+    if args.fetch:
+        fetch_history(symbols, args.years * 252 + PRICE_HISTORY_DAYS, store, builder)
+    stored = set(store.symbols())
+    panel = USPricePanel.from_store(store, symbols=[s for s in symbols if s.upper() in stored])
+    print(f"  → {len(panel.dates)}거래일 × {len(panel.symbols)}종목")
+    if len(panel.symbols) < args.target:
+        print("데이터 부족으로 백테스트 불가 (--fetch로 일봉 수집)")
+        return
+
+    # 3. 펀더멘털 / 환율
+    print("\n[3/4] 펀더멘털 / 환율 로드 중...")
+    fundamentals = pd.read_csv(args.fundamentals) if args.fundamentals else None
+    if fundamentals is not None:
+        print(f"  → 펀더멘털 {len(fundamentals)}행")
+    fx_rates = load_fx_rates(start_date, end_date)
+
+    # 4. 백테스트
+    print("\n[4/4] 백테스트 실행 중...")
+    config = USBacktestConfig(
+        initial_capital=args.capital,
+        target_count=args.target,
+        rebalance_frequency=args.freq
+    )
+    started = datetime.now()
+    result = USPanelBacktester(config).run(
+        panel,
+        start_date,
+        end_date,
+        membership=membership,
+        fundamentals=fundamentals,
+        fx_rates=fx_rates,
+        sectors={s.symbol: s.sector for s in universe},
+        names={s.symbol: s.name for s in universe}
+    )
+    print(f"  → 소요 시간 {(datetime.now() - started).total_seconds():.1f}초")
+
+    print_result(result)
+    return result
+
+
+if __name__ == "__main__":
+    main()
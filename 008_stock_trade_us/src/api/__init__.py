@@ -15,7 +15,7 @@ from .kis_client import (
     KISRateLimitError,
     KISBusinessError,
 )
-from .kis_websocket import KISWebSocket, RealtimePrice, RealtimeOrderbook
+from .kis_websocket import KISWebSocket, RealtimePrice, RealtimeOrderbook, RealtimeOverseasPrice
 from .kis_quant import (
     KISQuantClient,
     FinancialStatement,
@@ -48,6 +48,7 @@ __all__ = [
     "KISWebSocket",
     "RealtimePrice",
     "RealtimeOrderbook",
+    "RealtimeOverseasPrice",
     # 퀀트 클라이언트
     "KISQuantClient",
     "FinancialStatement",
@@ -6,12 +6,14 @@
 
 import time
 import logging
+import threading
 import requests
 from typing import Optional, Dict, Any, List
 from dataclasses import dataclass
 from datetime import datetime
 from requests.exceptions import Timeout, ConnectionError, RequestException
 
+from src.utils.rate_limiter import RateLimiter
 from .kis_auth import KISAuth, get_auth
 from .kis_client import (
     KISAPIError, KISTimeoutError, KISConnectionError,
@@ -21,6 +23,10 @@ from .kis_client import (
 
 logger = logging.getLogger(__name__)
 
+# KIS 해외주식 초당 호출 한도 (계좌 유형별, 스크리너/주문 파이프라인이 공유)
+KIS_TPS_REAL = 15.0
+KIS_TPS_VIRTUAL = 2.0
+
 
 # ========== 미국 주식 데이터 클래스 ==========
 
@@ -120,6 +126,11 @@ class KISUSClient:
         self.auth = get_auth(is_virtual)
         self.is_virtual = is_virtual
 
+    @property
+    def limiter(self) -> RateLimiter:
+        """계좌 유형별 공유 Rate Limiter (병렬 호출 측에서 acquire)"""
+        return get_us_limiter(self.is_virtual)
+
     def _request(
         self,
         method: str,
@@ -669,12 +680,9 @@ class KISUSClient:
         Returns:
             환율 (원/달러)
         """
-        # 잔고 조회를 통해 환율 정보 획득
-        try:
-            balance = self.get_balance()
-            return balance.get("exchange_rate", 1300.0)
-        except Exception:
-            return 1300.0  # 기본값
+        # 잔고 조회 응답의 최초고시환율 (계좌 스냅샷 캐시 공유, 실패 시 기본값)
+        from .us_account_snapshot import get_account_snapshot
+        return get_account_snapshot(self.is_virtual, self.get_balance).get_exchange_rate()
 
     def is_market_open(self) -> bool:
         """
@@ -710,6 +718,28 @@ class KISUSClient:
 
 # ========== 편의 함수 ==========
 
+_limiters: Dict[bool, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_us_limiter(is_virtual: bool = True) -> RateLimiter:
+    """
+    KIS 해외주식 Rate Limiter 반환 (계좌 유형별 싱글톤)
+
+    Args:
+        is_virtual: True=모의투자, False=실전투자
+    """
+    with _limiters_lock:
+        limiter = _limiters.get(is_virtual)
+        if limiter is None:
+            limiter = RateLimiter(
+                rate=KIS_TPS_VIRTUAL if is_virtual else KIS_TPS_REAL,
+                burst=1 if is_virtual else 3
+            )
+            _limiters[is_virtual] = limiter
+        return limiter
+
+
 def get_us_client(is_virtual: bool = True) -> KISUSClient:
     """미국 주식 클라이언트 인스턴스 반환"""
     return KISUSClient(is_virtual)
@@ -2,10 +2,13 @@
 한국투자증권 실시간 시세 WebSocket 클라이언트
 - 주식 체결가 실시간 수신
 - 주식 호가 실시간 수신
+- 해외주식 체결가 실시간 수신 (HDFSCNT0)
 - 체결 통보 수신
 """
 
 import json
+import time
+import logging
 import websocket
 import threading
 from typing import Callable, Optional, Dict, List
@@ -14,6 +17,8 @@ from datetime import datetime
 
 from .kis_auth import get_auth
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class RealtimePrice:
@@ -27,6 +32,19 @@ class RealtimePrice:
     cum_volume: int     # 누적거래량
 
 
+@dataclass
+class RealtimeOverseasPrice:
+    """해외주식 실시간 체결가 정보"""
+    symbol: str         # 종목코드 (AAPL)
+    exchange: str       # 거래소 코드 (NAS, NYS, AMS)
+    time: str           # 현지 체결시간 (HHMMSS)
+    price: float        # 체결가 (USD)
+    change: float       # 전일대비
+    change_rate: float  # 등락률
+    volume: int         # 체결수량
+    cum_volume: int     # 누적거래량
+
+
 @dataclass
 class RealtimeOrderbook:
     """실시간 호가 정보"""
@@ -50,6 +68,13 @@ class KISWebSocket:
     TR_ORDERBOOK = "H0STASP0"  # 실시간 호가
     TR_NOTICE_REAL = "H0STCNI0"   # 체결통보 (실전)
     TR_NOTICE_VIRTUAL = "H0STCNI9"  # 체결통보 (모의)
+    TR_OVERSEAS_PRICE = "HDFSCNT0"  # 해외주식 실시간 체결가
+
+    # 해외주식 tr_key 접두어 (D + 거래소 3자리 + 종목코드, 예: DNASAAPL)
+    OVERSEAS_KEY_PREFIX = "D"
+
+    # 해외주식 체결가 레코드 필드 수 (다건 메시지 분할 기준, 미만이면 무시)
+    OVERSEAS_PRICE_FIELDS = 26
 
     def __init__(self, is_virtual: bool = True):
         """
@@ -68,12 +93,17 @@ class KISWebSocket:
         # 콜백 함수
         self._on_price: Optional[Callable[[RealtimePrice], None]] = None
         self._on_orderbook: Optional[Callable[[RealtimeOrderbook], None]] = None
+        self._on_overseas_price: Optional[Callable[[RealtimeOverseasPrice], None]] = None
         self._on_notice: Optional[Callable[[dict], None]] = None
         self._on_error: Optional[Callable[[Exception], None]] = None
 
         # 구독 중인 종목
         self._subscribed_prices: set = set()
         self._subscribed_orderbooks: set = set()
+        self._subscribed_overseas: set = set()
+
+        # 마지막 수신 시각 (PINGPONG 포함, 하트비트 감시용)
+        self.last_message_at: float = 0.0
 
         # 승인키 (WebSocket 인증용)
         self._approval_key: Optional[str] = None
@@ -105,7 +135,8 @@ class KISWebSocket:
         on_price: Optional[Callable[[RealtimePrice], None]] = None,
         on_orderbook: Optional[Callable[[RealtimeOrderbook], None]] = None,
         on_notice: Optional[Callable[[dict], None]] = None,
-        on_error: Optional[Callable[[Exception], None]] = None
+        on_error: Optional[Callable[[Exception], None]] = None,
+        on_overseas_price: Optional[Callable[[RealtimeOverseasPrice], None]] = None
     ):
         """
         WebSocket 연결 시작
@@ -115,9 +146,11 @@ class KISWebSocket:
             on_orderbook: 호가 수신 콜백
             on_notice: 체결통보 수신 콜백
             on_error: 에러 발생 콜백
+            on_overseas_price: 해외주식 체결가 수신 콜백
         """
         self._on_price = on_price
         self._on_orderbook = on_orderbook
+        self._on_overseas_price = on_overseas_price
         self._on_notice = on_notice
         self._on_error = on_error
 
@@ -172,6 +205,42 @@ class KISWebSocket:
         self._send_unsubscribe(self.TR_PRICE, stock_code)
         self._subscribed_prices.discard(stock_code)
 
+    def subscribe_overseas_price(self, symbol: str, exchange: str):
+        """
+        해외주식 실시간 체결가 구독
+
+        Args:
+            symbol: 종목코드 (AAPL)
+            exchange: 거래소 코드 (NAS, NYS, AMS)
+        """
+        if not self.is_connected:
+            raise ConnectionError("WebSocket이 연결되지 않았습니다.")
+
+        tr_key = self._overseas_key(symbol, exchange)
+        if tr_key in self._subscribed_overseas:
+            return
+
+        self._send_subscribe(self.TR_OVERSEAS_PRICE, tr_key)
+        self._subscribed_overseas.add(tr_key)
+
+    def unsubscribe_overseas_price(self, symbol: str, exchange: str):
+        """
+        해외주식 실시간 체결가 구독 해제
+
+        Args:
+            symbol: 종목코드
+            exchange: 거래소 코드
+        """
+        tr_key = self._overseas_key(symbol, exchange)
+        if tr_key not in self._subscribed_overseas:
+            return
+
+        self._send_unsubscribe(self.TR_OVERSEAS_PRICE, tr_key)
+        self._subscribed_overseas.discard(tr_key)
+
+    def _overseas_key(self, symbol: str, exchange: str) -> str:
+        return f"{self.OVERSEAS_KEY_PREFIX}{exchange}{symbol}"
+
     def subscribe_orderbook(self, stock_code: str):
         """
         실시간 호가 구독
@@ -249,22 +318,28 @@ class KISWebSocket:
     def _on_open(self, ws):
         """WebSocket 연결 완료"""
         self.is_connected = True
-        print(f"[KISWebSocket] 연결됨 ({datetime.now().strftime('%H:%M:%S')})")
+        self.last_message_at = time.time()
+        logger.info(f"[KISWebSocket] 연결됨 ({datetime.now().strftime('%H:%M:%S')})")
 
     def _on_close(self, ws, close_status_code, close_msg):
         """WebSocket 연결 종료"""
         self.is_connected = False
-        print(f"[KISWebSocket] 연결 종료 (code={close_status_code})")
+        # 재연결 시 서버 측 등록이 초기화되므로 구독 목록도 비움
+        self._subscribed_prices.clear()
+        self._subscribed_orderbooks.clear()
+        self._subscribed_overseas.clear()
+        logger.info(f"[KISWebSocket] 연결 종료 (code={close_status_code})")
 
     def _on_ws_error(self, ws, error):
         """WebSocket 에러 발생"""
         if self._on_error:
             self._on_error(error)
         else:
-            print(f"[KISWebSocket] 에러: {error}")
+            logger.error(f"[KISWebSocket] 에러: {error}")
 
     def _on_message(self, ws, message: str):
         """WebSocket 메시지 수신"""
+        self.last_message_at = time.time()
         try:
             # 구분자로 분리된 데이터인 경우
             if message.startswith("0|") or message.startswith("1|"):
@@ -293,6 +368,8 @@ class KISWebSocket:
 
         if tr_id == self.TR_PRICE:
             self._parse_price(data)
+        elif tr_id == self.TR_OVERSEAS_PRICE:
+            self._parse_overseas_price(data, data_cnt)
         elif tr_id == self.TR_ORDERBOOK:
             self._parse_orderbook(data)
         elif tr_id in (self.TR_NOTICE_REAL, self.TR_NOTICE_VIRTUAL):
@@ -322,6 +399,38 @@ class KISWebSocket:
             if self._on_error:
                 self._on_error(e)
 
+    def _parse_overseas_price(self, data: str, data_cnt: str):
+        """해외주식 체결가 데이터 파싱 (한 메시지에 여러 체결 포함 가능)"""
+        if not self._on_overseas_price:
+            return
+
+        fields = data.split("^")
+        try:
+            count = max(1, int(data_cnt))
+        except ValueError:
+            count = 1
+        size = len(fields) // count
+        if size < self.OVERSEAS_PRICE_FIELDS:
+            return
+
+        for i in range(count):
+            record = fields[i * size:(i + 1) * size]
+            try:
+                tick = RealtimeOverseasPrice(
+                    symbol=record[1],                  # 종목코드
+                    exchange=record[0][1:4],           # 실시간 키 (DNASAAPL) → NAS
+                    time=record[5],                    # 현지 체결시간
+                    price=float(record[11]),           # 현재가
+                    change=float(record[13]),          # 전일대비
+                    change_rate=float(record[14]),     # 등락률
+                    volume=int(record[19]),            # 체결량
+                    cum_volume=int(record[20])         # 누적거래량
+                )
+                self._on_overseas_price(tick)
+            except (ValueError, IndexError) as e:
+                if self._on_error:
+                    self._on_error(e)
+
     def _parse_orderbook(self, data: str):
         """호가 데이터 파싱"""
         if not self._on_orderbook:
@@ -0,0 +1,215 @@
+"""
+미국 주식 계좌 스냅샷 서비스
+
+잔고/보유종목/환율을 짧은 TTL 동안 메모리에서 공유
+- 잔고 조회(TTTS3012R) 1회로 보유종목·예수금·환율을 함께 갱신
+- 동시 요청은 1회 조회로 합침 (주문 몰림 시 Rate Limit 충돌 방지)
+- 체결 시 invalidate()로 다음 조회에서 강제 갱신 (환율은 유지)
+- 조회 실패 시 마지막 스냅샷을 stale 표시로 반환
+"""
+
+import time
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 잔고 스냅샷 유효 시간 (초)
+BALANCE_TTL_SEC = 30.0
+
+# 환율 유효 시간 (초) - 최초고시환율은 장중 변동이 작아 잔고보다 길게 유지
+FX_TTL_SEC = 600.0
+
+# 환율 조회 실패 시 기본값 (원/달러)
+DEFAULT_EXCHANGE_RATE = 1300.0
+
+
+@dataclass
+class USAccountSnapshot:
+    """계좌 스냅샷"""
+    stocks: List[Any] = field(default_factory=list)  # USStockBalance 리스트
+    cash_usd: float = 0.0
+    cash_krw: float = 0.0
+    total_eval: float = 0.0
+    total_profit: float = 0.0
+    exchange_rate: float = 0.0
+    fetched_at: float = 0.0          # time.time()
+    stale: bool = False              # 갱신 실패로 이전 스냅샷 반환 중
+    error: str = ""
+
+    @property
+    def age_sec(self) -> float:
+        return time.time() - self.fetched_at if self.fetched_at else float("inf")
+
+    def to_balance(self) -> Dict[str, Any]:
+        """KISUSClient.get_balance()와 같은 형식"""
+        return {
+            "stocks": list(self.stocks),
+            "total_eval": self.total_eval,
+            "total_profit": self.total_profit,
+            "cash_usd": self.cash_usd,
+            "cash_krw": self.cash_krw,
+            "exchange_rate": self.exchange_rate
+        }
+
+
+class USAccountSnapshotService:
+    """잔고/환율 TTL 캐시 (Thread-safe)"""
+
+    def __init__(
+        self,
+        fetch_balance: Callable[[], Dict[str, Any]],
+        ttl_sec: float = BALANCE_TTL_SEC,
+        fx_ttl_sec: float = FX_TTL_SEC
+    ):
+        """
+        Args:
+            fetch_balance: 잔고 조회 함수 (KISUSClient.get_balance 형식 반환)
+            ttl_sec: 잔고 스냅샷 유효 시간
+            fx_ttl_sec: 환율 유효 시간
+        """
+        self._fetch_balance = fetch_balance
+        self.ttl_sec = ttl_sec
+        self.fx_ttl_sec = fx_ttl_sec
+
+        self._snapshot: Optional[USAccountSnapshot] = None
+        self._invalidated = False
+        self._lock = threading.Lock()
+
+        # 지표
+        self.fetch_count = 0
+        self.hit_count = 0
+
+    def get(self, max_age: float = None) -> USAccountSnapshot:
+        """
+        계좌 스냅샷 반환 (유효하면 메모리, 아니면 1회 조회)
+
+        Args:
+            max_age: 허용 최대 경과 시간 (초, 기본 ttl_sec)
+
+        Raises:
+            조회 실패 + 이전 스냅샷 없음
+        """
+        max_age = self.ttl_sec if max_age is None else max_age
+
+        snapshot = self._fresh(max_age)
+        if snapshot:
+            self.hit_count += 1
+            return snapshot
+
+        with self._lock:
+            # 대기 중 다른 스레드가 갱신했으면 재사용
+            snapshot = self._fresh(max_age)
+            if snapshot:
+                self.hit_count += 1
+                return snapshot
+            return self._refresh()
+
+    def peek(self) -> Optional[USAccountSnapshot]:
+        """조회 없이 마지막 스냅샷 반환 (상태 표시용)"""
+        return self._snapshot
+
+    def get_balance(self, max_age: float = None) -> Dict[str, Any]:
+        """잔고 딕셔너리 (KISUSClient.get_balance() 대체)"""
+        return self.get(max_age).to_balance()
+
+    def get_exchange_rate(self) -> float:
+        """USD/KRW 환율 (FX_TTL 동안 체결 무효화와 무관하게 재사용)"""
+        snapshot = self._snapshot
+        if snapshot and snapshot.exchange_rate > 0 and snapshot.age_sec <= self.fx_ttl_sec:
+            self.hit_count += 1
+            return snapshot.exchange_rate
+        try:
+            rate = self.get(max_age=0).exchange_rate
+        except Exception as e:
+            logger.warning(f"환율 조회 실패: {e}")
+            rate = 0.0
+        return rate or DEFAULT_EXCHANGE_RATE
+
+    def invalidate(self):
+        """체결/주문 후 호출 - 다음 get()에서 잔고 재조회"""
+        self._invalidated = True
+
+    def status(self) -> Dict[str, Any]:
+        """캐시 상태 (경과 시간 / stale 여부 / 조회·재사용 횟수)"""
+        snapshot = self._snapshot
+        return {
+            "age_sec": round(snapshot.age_sec, 1) if snapshot else None,
+            "stale": self.is_stale,
+            "error": snapshot.error if snapshot else "",
+            "exchange_rate": snapshot.exchange_rate if snapshot else None,
+            "fetch_count": self.fetch_count,
+            "hit_count": self.hit_count
+        }
+
+    @property
+    def is_stale(self) -> bool:
+        """스냅샷이 없거나, 무효화/만료/갱신 실패 상태"""
+        snapshot = self._snapshot
+        if snapshot is None:
+            return True
+        return self._invalidated or snapshot.stale or snapshot.age_sec > self.ttl_sec
+
+    def _fresh(self, max_age: float) -> Optional[USAccountSnapshot]:
+        snapshot = self._snapshot
+        if snapshot is None or self._invalidated or snapshot.stale:
+            return None
+        if snapshot.age_sec > max_age:
+            return None
+        return snapshot
+
+    def _refresh(self) -> USAccountSnapshot:
+        self.fetch_count += 1
+        try:
+            balance = self._fetch_balance()
+        except Exception as e:
+            if self._snapshot is None:
+                raise
+            logger.warning(f"잔고 갱신 실패 - 이전 스냅샷 사용 ({self._snapshot.age_sec:.0f}초 경과): {e}")
+            self._snapshot.stale = True
+            self._snapshot.error = str(e)
+            return self._snapshot
+
+        previous_fx = self._snapshot.exchange_rate if self._snapshot else 0.0
+        self._snapshot = USAccountSnapshot(
+            stocks=list(balance.get("stocks", [])),
+            cash_usd=balance.get("cash_usd", 0.0),
+            cash_krw=balance.get("cash_krw", 0.0),
+            total_eval=balance.get("total_eval", 0.0),
+            total_profit=balance.get("total_profit", 0.0),
+            exchange_rate=balance.get("exchange_rate", 0.0) or previous_fx,
+            fetched_at=time.time()
+        )
+        self._invalidated = False
+        return self._snapshot
+
+
+# ========== 인스턴스 관리 ==========
+
+_snapshot_services: Dict[bool, USAccountSnapshotService] = {}
+_services_lock = threading.Lock()
+
+
+def get_account_snapshot(
+    is_virtual: bool = True,
+    fetch_balance: Callable[[], Dict[str, Any]] = None
+) -> USAccountSnapshotService:
+    """
+    계좌 스냅샷 서비스 반환 (계좌 유형별 싱글톤)
+
+    Args:
+        is_virtual: True=모의투자, False=실전투자
+        fetch_balance: 최초 생성 시 사용할 잔고 조회 함수 (예: 엔진 클라이언트의 get_balance).
+            미지정 시 클라이언트 1개를 만들어 계속 사용
+    """
+    with _services_lock:
+        service = _snapshot_services.get(is_virtual)
+        if service is None:
+            if fetch_balance is None:
+                from .kis_us_client import KISUSClient
+                fetch_balance = KISUSClient(is_virtual=is_virtual).get_balance
+            service = USAccountSnapshotService(fetch_balance)
+            _snapshot_services[is_virtual] = service
+        return service
@@ -44,6 +44,7 @@ from .backtest import (
     OrderSide,
     DailySnapshot,
     Backtester,
+    summarize_backtest,
     run_simple_backtest
 )
 from .analytics import (
@@ -102,6 +103,7 @@ __all__ = [
     "OrderSide",
     "DailySnapshot",
     "Backtester",
+    "summarize_backtest",
     "run_simple_backtest",
     # Analytics
     "PerformanceMetrics",
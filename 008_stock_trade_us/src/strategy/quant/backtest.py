@@ -141,6 +141,7 @@ class Backtester:
         self.trades: List[Trade] = []
         self.daily_snapshots: List[DailySnapshot] = []
         self.peak_value = self.config.initial_capital
+        self._bars: Dict[datetime, Dict[str, Dict[str, float]]] = {}
 
     def reset(self):
         """상태 초기화"""
@@ -173,12 +174,11 @@ class Backtester:
         """
         self.reset()
 
-        # 날짜 범위 설정
-        all_dates = set()
-        for code, df in price_data.items():
-            all_dates.update(df['date'].tolist())
+        # 종목별 일봉 → (날짜, 종목) 시세 조회 테이블 (일별 DataFrame 필터링 대신 1회 구성)
+        self._bars = self._build_bar_lookup(price_data)
 
-        all_dates = sorted(all_dates)
+        # 날짜 범위 설정
+        all_dates = sorted(self._bars)
 
         if start_date:
             all_dates = [d for d in all_dates if d >= start_date]
@@ -190,9 +190,19 @@ class Backtester:
 
         logger.info(f"백테스트 시작: {all_dates[0]} ~ {all_dates[-1]}")
 
+        # 리밸런싱 신호 날짜별 그룹 (1회)
+        if 'date' in signals.columns:
+            signals_by_date = {date: group for date, group in signals.groupby('date')}
+        else:
+            signals_by_date = None
+
         # 일별 시뮬레이션
         for date in all_dates:
-            self._process_day(date, price_data, signals)
+            if signals_by_date is None:
+                day_signals = signals
+            else:
+                day_signals = signals_by_date.get(date, signals.iloc[0:0])
+            self._process_day(date, price_data, day_signals)
 
         # 결과 계산
         result = self._calculate_result(all_dates[0], all_dates[-1])
@@ -201,13 +211,29 @@ class Backtester:
 
         return result
 
+    @staticmethod
+    def _build_bar_lookup(price_data: Dict[str, pd.DataFrame]) -> Dict[datetime, Dict[str, Dict[str, float]]]:
+        """{date: {code: {'open', 'high', 'low', 'close'}}} 조회 테이블"""
+        bars: Dict[datetime, Dict[str, Dict[str, float]]] = {}
+        for code, df in price_data.items():
+            if df is None or df.empty:
+                continue
+            cols = [c for c in ('open', 'high', 'low', 'close') if c in df.columns]
+            for row in df[['date', *cols]].to_dict('records'):
+                bars.setdefault(row.pop('date'), {})[code] = row
+        return bars
+
+    def _bar(self, date: datetime, code: str) -> Optional[Dict[str, float]]:
+        """해당 일자 종목 시세 (없으면 None)"""
+        return self._bars.get(date, {}).get(code)
+
     def _process_day(
         self,
         date: datetime,
         price_data: Dict[str, pd.DataFrame],
         signals: pd.DataFrame
     ):
-        """일별 처리"""
+        """일별 처리 (signals: 해당 일자 신호)"""
         # 1. 포지션 가격 업데이트
         self._update_prices(date, price_data)
 
@@ -216,9 +242,8 @@ class Backtester:
 
         # 3. 리밸런싱 체크
         if self._should_rebalance(date):
-            day_signals = signals[signals['date'] == date] if 'date' in signals.columns else signals
-            if not day_signals.empty:
-                self._rebalance(date, day_signals, price_data)
+            if not signals.empty:
+                self._rebalance(date, signals, price_data)
 
         # 4. 일별 스냅샷 저장
         self._save_snapshot(date)
@@ -226,27 +251,21 @@ class Backtester:
     def _update_prices(self, date: datetime, price_data: Dict[str, pd.DataFrame]):
         """포지션 가격 업데이트"""
         for code, pos in list(self.positions.items()):
-            if code in price_data:
-                df = price_data[code]
-                day_data = df[df['date'] == date]
-                if not day_data.empty:
-                    pos.current_price = day_data.iloc[0]['close']
-                    if pos.current_price > pos.highest_price:
-                        pos.highest_price = pos.current_price
+            bar = self._bar(date, code)
+            if bar is not None:
+                pos.current_price = bar['close']
+                if pos.current_price > pos.highest_price:
+                    pos.highest_price = pos.current_price
 
     def _check_stop_orders(self, date: datetime, price_data: Dict[str, pd.DataFrame]):
         """손절/익절 체크"""
         for code, pos in list(self.positions.items()):
-            if code not in price_data:
-                continue
-
-            df = price_data[code]
-            day_data = df[df['date'] == date]
-            if day_data.empty:
+            bar = self._bar(date, code)
+            if bar is None:
                 continue
 
-            low = day_data.iloc[0]['low']
-            high = day_data.iloc[0]['high']
+            low = bar['low']
+            high = bar['high']
 
             # 손절 체크
             if pos.stop_loss > 0 and low <= pos.stop_loss:
@@ -286,12 +305,9 @@ class Backtester:
         # 매도: 목표에 없는 종목
         to_sell = current_holdings - target_holdings
         for code in to_sell:
-            if code in price_data:
-                df = price_data[code]
-                day_data = df[df['date'] == date]
-                if not day_data.empty:
-                    price = day_data.iloc[0]['close']
-                    self._close_position(date, code, price, "리밸런싱 매도")
+            bar = self._bar(date, code)
+            if bar is not None:
+                self._close_position(date, code, bar['close'], "리밸런싱 매도")
 
         # 매수: 새로 진입할 종목
         to_buy = target_holdings - current_holdings
@@ -302,15 +318,11 @@ class Backtester:
             name = row.get('name', code)
             weight = row.get('weight', 1.0 / self.config.target_position_count)
 
-            if code not in price_data:
-                continue
-
-            df = price_data[code]
-            day_data = df[df['date'] == date]
-            if day_data.empty:
+            bar = self._bar(date, code)
+            if bar is None:
                 continue
 
-            price = day_data.iloc[0]['close']
+            price = bar['close']
 
             # 투자금액 계산
             target_amount = self._total_value * min(weight, self.config.max_position_size)
@@ -452,7 +464,7 @@ class Backtester:
 
     def _calculate_result(self, start_date: datetime, end_date: datetime) -> BacktestResult:
         """결과 계산"""
-        result = BacktestResult(
+        return summarize_backtest(
             config=self.config,
             start_date=start_date,
             end_date=end_date,
@@ -462,87 +474,122 @@ class Backtester:
             daily_snapshots=self.daily_snapshots
         )
 
-        if not self.daily_snapshots:
-            return result
-
-        # 수익률 지표
-        result.total_return = (self._total_value / self.config.initial_capital - 1) * 100
-
-        # 연환산 수익률
-        days = (end_date - start_date).days
-        if days > 0:
-            years = days / 365
-            result.annualized_return = ((1 + result.total_return / 100) ** (1 / years) - 1) * 100
-
-        # 일별 수익률
-        daily_returns = [s.daily_return / 100 for s in self.daily_snapshots]
-
-        if daily_returns:
-            # 변동성 (연환산)
-            result.volatility = np.std(daily_returns) * np.sqrt(252) * 100
-
-            # 샤프비율 (무위험이자율 3% 가정)
-            risk_free_rate = 0.03 / 252  # 일별
-            excess_returns = [r - risk_free_rate for r in daily_returns]
-            if np.std(excess_returns) > 0:
-                result.sharpe_ratio = np.mean(excess_returns) / np.std(excess_returns) * np.sqrt(252)
-
-            # 소르티노비율 (하방 변동성만 고려)
-            negative_returns = [r for r in excess_returns if r < 0]
-            if negative_returns:
-                downside_std = np.std(negative_returns) * np.sqrt(252)
-                if downside_std > 0:
-                    result.sortino_ratio = result.annualized_return / 100 / downside_std
-
-        # 최대 낙폭
-        result.max_drawdown = min(s.drawdown for s in self.daily_snapshots)
-
-        # 최대 낙폭 기간
-        max_dd_duration = 0
-        current_dd_duration = 0
-        for s in self.daily_snapshots:
-            if s.drawdown < 0:
-                current_dd_duration += 1
-                max_dd_duration = max(max_dd_duration, current_dd_duration)
-            else:
-                current_dd_duration = 0
-        result.max_drawdown_duration = max_dd_duration
-
-        # 칼마비율
-        if result.max_drawdown != 0:
-            result.calmar_ratio = result.annualized_return / abs(result.max_drawdown)
-
-        # 거래 통계
-        sell_trades = [t for t in self.trades if t.side == OrderSide.SELL]
-        result.total_trades = len(sell_trades)
-
-        if sell_trades:
-            winning = [t for t in sell_trades if t.pnl > 0]
-            losing = [t for t in sell_trades if t.pnl < 0]
-
-            result.winning_trades = len(winning)
-            result.losing_trades = len(losing)
-            result.win_rate = len(winning) / len(sell_trades) * 100
-
-            if winning:
-                result.avg_win = np.mean([t.pnl for t in winning])
-            if losing:
-                result.avg_loss = np.mean([t.pnl for t in losing])
-
-            total_wins = sum(t.pnl for t in winning)
-            total_losses = abs(sum(t.pnl for t in losing))
-            if total_losses > 0:
-                result.profit_factor = total_wins / total_losses
-
-        # 월별 수익률
-        for snapshot in self.daily_snapshots:
-            month_key = snapshot.date.strftime("%Y-%m")
-            if month_key not in result.monthly_returns:
-                result.monthly_returns[month_key] = 0
-            result.monthly_returns[month_key] = snapshot.cumulative_return
 
+def summarize_backtest(
+    config,
+    start_date: datetime,
+    end_date: datetime,
+    initial_capital: float,
+    final_value: float,
+    trades: List[Trade],
+    daily_snapshots: List[DailySnapshot]
+) -> BacktestResult:
+    """
+    거래 기록 + 일별 스냅샷 → 성과 지표 (Backtester, USPanelBacktester 공용)
+
+    Args:
+        config: 백테스트 설정
+        start_date: 시작일
+        end_date: 종료일
+        initial_capital: 초기 자본
+        final_value: 최종 평가금액
+        trades: 거래 기록
+        daily_snapshots: 일별 스냅샷 (daily_return, cumulative_return, drawdown 포함)
+
+    Returns:
+        BacktestResult
+    """
+    result = BacktestResult(
+        config=config,
+        start_date=start_date,
+        end_date=end_date,
+        initial_capital=initial_capital,
+        final_value=final_value,
+        trades=trades,
+        daily_snapshots=daily_snapshots
+    )
+
+    if not daily_snapshots:
         return result
 
+    # 수익률 지표
+    result.total_return = (final_value / initial_capital - 1) * 100
+
+    # 연환산 수익률
+    days = (end_date - start_date).days
+    if days > 0:
+        years = days / 365
+        result.annualized_return = ((1 + result.total_return / 100) ** (1 / years) - 1) * 100
+
+    # 일별 수익률
+    daily_returns = [s.daily_return / 100 for s in daily_snapshots]
+
+    if daily_returns:
+        # 변동성 (연환산)
+        result.volatility = np.std(daily_returns) * np.sqrt(252) * 100
+
+        # 샤프비율 (무위험이자율 3% 가정)
+        risk_free_rate = 0.03 / 252  # 일별
+        excess_returns = [r - risk_free_rate for r in daily_returns]
+        if np.std(excess_returns) > 0:
+            result.sharpe_ratio = np.mean(excess_returns) / np.std(excess_returns) * np.sqrt(252)
+
+        # 소르티노비율 (하방 변동성만 고려)
+        negative_returns = [r for r in excess_returns if r < 0]
+        if negative_returns:
+            downside_std = np.std(negative_returns) * np.sqrt(252)
+            if downside_std > 0:
+                result.sortino_ratio = result.annualized_return / 100 / downside_std
+
+    # 최대 낙폭
+    result.max_drawdown = min(s.drawdown for s in daily_snapshots)
+
+    # 최대 낙폭 기간
+    max_dd_duration = 0
+    current_dd_duration = 0
+    for s in daily_snapshots:
+        if s.drawdown < 0:
+            current_dd_duration += 1
+            max_dd_duration = max(max_dd_duration, current_dd_duration)
+        else:
+            current_dd_duration = 0
+    result.max_drawdown_duration = max_dd_duration
+
+    # 칼마비율
+    if result.max_drawdown != 0:
+        result.calmar_ratio = result.annualized_return / abs(result.max_drawdown)
+
+    # 거래 통계
+    sell_trades = [t for t in trades if t.side == OrderSide.SELL]
+    result.total_trades = len(sell_trades)
+
+    if sell_trades:
+        winning = [t for t in sell_trades if t.pnl > 0]
+        losing = [t for t in sell_trades if t.pnl < 0]
+
+        result.winning_trades = len(winning)
+        result.losing_trades = len(losing)
+        result.win_rate = len(winning) / len(sell_trades) * 100
+
+        if winning:
+            result.avg_win = np.mean([t.pnl for t in winning])
+        if losing:
+            result.avg_loss = np.mean([t.pnl for t in losing])
+
+        total_wins = sum(t.pnl for t in winning)
+        total_losses = abs(sum(t.pnl for t in losing))
+        if total_losses > 0:
+            result.profit_factor = total_wins / total_losses
+
+    # 월별 수익률
+    for snapshot in daily_snapshots:
+        month_key = snapshot.date.strftime("%Y-%m")
+        if month_key not in result.monthly_returns:
+            result.monthly_returns[month_key] = 0
+        result.monthly_returns[month_key] = snapshot.cumulative_return
+
+    return result
+
 
 def run_simple_backtest(
     screener,
@@ -0,0 +1,575 @@
+"""
+미국 주식 멀티팩터 백테스트 (날짜 × 종목 패널)
+- 로컬 일봉 저장소(USPriceHistoryStore)에서 종가/고가/저가/거래량 패널을 1회 구성
+- 리밸런싱일마다 해당 시점 구성종목 + 당일까지의 가격 + as-of 펀더멘털로 스크리너 재현
+  (팩터 테이블 → USCrossSectionalScorer → 필터/섹터 분산, 실전과 동일 경로)
+- 리밸런싱 사이 구간은 배열 연산으로 손절/익절 체결일과 평가금액 계산
+- USD 결과 + 환율 적용 KRW 결과 동시 산출
+"""
+
+import logging
+import warnings
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .us_history import USPriceHistoryStore
+from .us_scoring import FACTOR_COLUMNS
+from .us_screener import USMultiFactorScreener, USFactorWeights, PRICE_HISTORY_DAYS, MIN_PRICE_ROWS
+from .quant.backtest import Trade, OrderSide, DailySnapshot, BacktestResult, summarize_backtest
+
+logger = logging.getLogger(__name__)
+
+FIELDS = ('open', 'high', 'low', 'close', 'volume')
+
+
+@contextmanager
+def _ignore_empty_slice():
+    """전체 NaN 열 nanmean/nanstd 경고 억제"""
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        yield
+
+
+@dataclass
+class USBacktestConfig:
+    """미국 백테스트 설정 (금액 단위 USD)"""
+    initial_capital: float = 100_000.0
+    commission_rate: float = 0.0025       # 해외주식 온라인 수수료 0.25%
+    slippage_rate: float = 0.001          # 슬리피지 0.1%
+    target_count: int = 15                # 목표 보유 종목 수
+    max_position_size: float = 0.10       # 최대 단일 포지션 비중
+    rebalance_frequency: str = "M"        # M:월 첫 거래일, W:주 첫 거래일
+    stop_loss_pct: float = 0.07           # 손절 (USQuantEngineConfig 기본값과 동일)
+    take_profit_pct: float = 0.10         # 익절
+    cash_buffer: float = 0.02             # 매수 시 현금 여유분
+    default_fx_rate: float = 1350.0       # 환율 데이터 없을 때 USD/KRW
+
+
+@dataclass
+class USBacktestResult:
+    """미국 백테스트 결과"""
+    usd: BacktestResult                   # 달러 기준 (거래 통계 포함)
+    krw: BacktestResult                   # 원화 환산 기준 (평가금액 × 당일 환율)
+    fx_start: float = 0.0
+    fx_end: float = 0.0
+    rebalance_dates: List[datetime] = field(default_factory=list)
+    holdings: Dict[str, List[str]] = field(default_factory=dict)  # 리밸런싱일 → 보유 종목
+
+    @property
+    def fx_return(self) -> float:
+        """기간 환율 변동률 (%)"""
+        return (self.fx_end / self.fx_start - 1) * 100 if self.fx_start > 0 else 0.0
+
+
+class USPricePanel:
+    """날짜 × 종목 가격 패널 (행: 거래일, 열: 종목, 상장 전/거래 없음은 NaN)"""
+
+    def __init__(self, frames: Dict[str, pd.DataFrame]):
+        """
+        Args:
+            frames: {symbol: DataFrame(date, open, high, low, close, volume)}
+        """
+        frames = {s: df for s, df in frames.items() if df is not None and not df.empty}
+        self.symbols: List[str] = sorted(frames)
+
+        indexed = {s: frames[s].drop_duplicates('date').set_index('date') for s in self.symbols}
+        dates = sorted(set().union(*(df.index for df in indexed.values()))) if indexed else []
+        self.dates = pd.DatetimeIndex(dates)
+
+        for name in FIELDS:
+            if indexed:
+                panel = pd.concat({s: indexed[s][name] for s in self.symbols}, axis=1, sort=True)
+                values = panel.reindex(self.dates).to_numpy(dtype=np.float64)
+            else:
+                values = np.empty((0, 0))
+            setattr(self, name, values)
+
+        # 평가용 종가 (거래 정지/상장폐지 후에는 마지막 가격 유지)
+        self.close_ffill = pd.DataFrame(self.close).ffill().to_numpy()
+
+    @classmethod
+    def from_store(
+        cls,
+        store: USPriceHistoryStore,
+        symbols: List[str] = None,
+        end: datetime = None
+    ) -> "USPricePanel":
+        """로컬 저장소에서 패널 구성 (전체 기간 로드, 시작일 이전 구간은 팩터 계산에 사용)"""
+        frames = {}
+        for symbol in symbols or store.symbols():
+            cached = store.load(symbol)
+            if cached is None:
+                continue
+            df = cached["df"]
+            if end is not None:
+                df = df[df['date'] <= pd.Timestamp(end)]
+            frames[symbol] = df
+        panel = cls(frames)
+        logger.info(f"가격 패널 구성: {len(panel.dates)}일 × {len(panel.symbols)}종목")
+        return panel
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+
+def membership_from_changes(current: List[str], changes: pd.DataFrame) -> pd.DataFrame:
+    """
+    현재 구성종목 + 편입/편출 이력 → 종목별 편입 구간
+
+    Args:
+        current: 현재 구성종목
+        changes: columns (date, added, removed) - added/removed는 심볼 또는 빈 값
+
+    Returns:
+        DataFrame (symbol, start, end) - start 이상 end 미만 기간 구성종목, NaT는 무제한
+    """
+    active = {symbol: pd.NaT for symbol in current}  # symbol → 구간 종료일
+    rows = []
+
+    for change in changes.sort_values('date', ascending=False).to_dict('records'):
+        day = pd.Timestamp(change['date'])
+        added = change.get('added')
+        removed = change.get('removed')
+        # 이 날 편입된 종목은 이전에는 구성종목이 아님
+        if isinstance(added, str) and added and added in active:
+            rows.append((added, day, active.pop(added)))
+        # 이 날 편출된 종목은 이전까지 구성종목
+        if isinstance(removed, str) and removed and removed not in active:
+            active[removed] = day
+
+    rows.extend((symbol, pd.NaT, end) for symbol, end in active.items())
+    return pd.DataFrame(rows, columns=['symbol', 'start', 'end'])
+
+
+class USPanelBacktester:
+    """패널 기반 미국 멀티팩터 백테스터"""
+
+    def __init__(
+        self,
+        config: USBacktestConfig = None,
+        weights: USFactorWeights = None,
+        screener: USMultiFactorScreener = None
+    ):
+        """
+        Args:
+            config: 백테스트 설정
+            weights: 팩터 가중치 (screener 지정 시 무시)
+            screener: 선정 로직 (select, 섹터 분산) 재사용 대상
+        """
+        self.config = config or USBacktestConfig()
+        self.screener = screener or USMultiFactorScreener(weights=weights)
+
+    # ========== 실행 ==========
+
+    def run(
+        self,
+        panel: USPricePanel,
+        start_date: datetime,
+        end_date: datetime = None,
+        membership: pd.DataFrame = None,
+        fundamentals: pd.DataFrame = None,
+        fx_rates: pd.Series = None,
+        sectors: Dict[str, str] = None,
+        names: Dict[str, str] = None
+    ) -> USBacktestResult:
+        """
+        백테스트 실행
+
+        Args:
+            panel: 가격 패널 (start_date 이전 최소 PRICE_HISTORY_DAYS 포함 권장)
+            start_date: 시작일
+            end_date: 종료일 (기본: 패널 마지막 날)
+            membership: 편입 구간 (symbol, start, end) - 없으면 패널 전 종목 (생존 편향 주의)
+            fundamentals: as-of 펀더멘털 (symbol, date, per, pbr, market_cap, dividend_yield)
+                          date = 공시/이용 가능일, 리밸런싱일 이전 최신 행만 사용
+            fx_rates: USD/KRW 일별 환율 (DatetimeIndex), 없으면 default_fx_rate
+            sectors: symbol → 섹터 (섹터 분산용)
+            names: symbol → 종목명
+
+        Returns:
+            USBacktestResult
+        """
+        cfg = self.config
+        dates = panel.dates
+        first = int(dates.searchsorted(pd.Timestamp(start_date)))
+        last = len(dates) - 1 if end_date is None else int(dates.searchsorted(pd.Timestamp(end_date), side='right')) - 1
+        if first > last or first >= len(dates):
+            raise ValueError("유효한 거래일이 없습니다.")
+
+        sectors = sectors or {}
+        names = names or {}
+        member_mask = self._membership_mask(panel, membership)
+        if membership is None:
+            logger.warning("구성종목 이력 없음 → 패널 전 종목 사용 (생존 편향 가능)")
+        fundamentals = self._prepare_fundamentals(fundamentals)
+
+        rebalance_idx = self._rebalance_indices(dates, first, last)
+        logger.info(
+            f"미국 백테스트 시작: {dates[first].date()} ~ {dates[last].date()} "
+            f"({len(panel.symbols)}종목, 리밸런싱 {len(rebalance_idx)}회)"
+        )
+
+        n = len(panel.symbols)
+        qty = np.zeros(n)
+        entry = np.zeros(n)
+        cash = cfg.initial_capital
+        trades: List[Trade] = []
+        equity = np.empty(last - first + 1)
+        cash_path = np.empty(last - first + 1)
+        position_count = np.zeros(last - first + 1, dtype=int)
+        holdings: Dict[str, List[str]] = {}
+
+        bounds = list(rebalance_idx) + [last + 1]
+        for t, t_next in zip(bounds[:-1], bounds[1:]):
+            # 1. 리밸런싱 (당일 종가 체결)
+            targets = self._select(panel, t, member_mask, fundamentals, sectors, names)
+            cash = self._rebalance(panel, t, targets, qty, entry, cash, trades, names)
+            holdings[dates[t].strftime("%Y-%m-%d")] = [panel.symbols[i] for i in np.flatnonzero(qty)]
+
+            # 2. 리밸런싱일 평가
+            k = t - first
+            equity[k] = cash + np.nansum(qty * panel.close_ffill[t])
+            cash_path[k] = cash
+            position_count[k] = int(np.count_nonzero(qty))
+
+            # 3. 다음 리밸런싱 전까지 손절/익절 + 평가 (배열 연산)
+            if t_next - t > 1:
+                cash = self._simulate_segment(
+                    panel, t + 1, t_next, qty, entry, cash, trades, names,
+                    equity[k + 1:t_next - first], cash_path[k + 1:t_next - first],
+                    position_count[k + 1:t_next - first]
+                )
+
+        fx = self._fx_series(fx_rates, dates[first:last + 1])
+        usd = self._summarize(dates[first:last + 1], equity, cash_path, position_count, trades, cfg.initial_capital)
+        krw = self._summarize(
+            dates[first:last + 1], equity * fx, cash_path * fx, position_count, [],
+            cfg.initial_capital * fx[0]
+        )
+
+        logger.info(
+            f"미국 백테스트 완료: USD {usd.total_return:+.2f}%, KRW {krw.total_return:+.2f}% "
+            f"(거래 {len(trades)}건)"
+        )
+
+        return USBacktestResult(
+            usd=usd,
+            krw=krw,
+            fx_start=float(fx[0]),
+            fx_end=float(fx[-1]),
+            rebalance_dates=[dates[i].to_pydatetime() for i in rebalance_idx],
+            holdings=holdings
+        )
+
+    # ========== 종목 선정 ==========
+
+    def factor_table(
+        self,
+        panel: USPricePanel,
+        t: int,
+        eligible: np.ndarray,
+        fundamentals: Optional[pd.DataFrame] = None,
+        sectors: Dict[str, str] = None,
+        names: Dict[str, str] = None
+    ) -> pd.DataFrame:
+        """
+        t일 종가 기준 팩터 테이블 (USMultiFactorScreener._factor_row와 동일 정의, 종목 축 벡터 연산)
+
+        Args:
+            panel: 가격 패널
+            t: 기준일 행 인덱스 (t일까지의 데이터만 사용)
+            eligible: 대상 종목 bool 마스크
+            fundamentals: _prepare_fundamentals() 결과
+        """
+        sectors = sectors or {}
+        names = names or {}
+        lo = max(0, t - PRICE_HISTORY_DAYS + 1)
+        close = panel.close[lo:t + 1]
+        count = np.sum(~np.isnan(close), axis=0)
+        mask = eligible & (count >= MIN_PRICE_ROWS) & ~np.isnan(close[-1])
+        if not mask.any():
+            return pd.DataFrame(columns=FACTOR_COLUMNS)
+
+        close = close[:, mask]
+        count = count[mask]
+        current = close[-1]
+
+        def ret(k: int) -> np.ndarray:
+            if len(close) < k:
+                return np.zeros(len(current))
+            with np.errstate(divide='ignore', invalid='ignore'):
+                return np.where(count >= k, (current / close[-k] - 1) * 100, 0.0)
+
+        r1, r3 = ret(21), ret(63)
+        r6 = np.where(count >= 126, ret(126), r3 * 2)
+        r12 = np.where(count >= 252, ret(252), np.where(count >= 126, r6 * 2, r3 * 4))
+
+        # 60일 일간 수익률 연환산 변동성
+        window = close[-60:]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            daily = window[1:] / window[:-1] - 1
+        valid = np.sum(~np.isnan(daily), axis=0)
+        with np.errstate(invalid='ignore'), _ignore_empty_slice():
+            std = np.nanstd(daily, axis=0, ddof=1)
+        volatility = np.where(
+            (np.minimum(count, 60) < 5) | (valid < 2), 50.0, std * np.sqrt(252) * 100
+        )
+
+        volume = panel.volume[max(0, t - 19):t + 1, mask]
+        with _ignore_empty_slice():
+            avg_volume = np.nan_to_num(np.nanmean(volume, axis=0)).astype(np.int64)
+
+        symbols = [s for s, m in zip(panel.symbols, mask) if m]
+        table = pd.DataFrame({
+            'symbol': symbols,
+            'name': [names.get(s, s) for s in symbols],
+            'sector': [sectors.get(s, "") for s in symbols],
+            'exchange': "",
+            'return_1m': r1,
+            'return_3m': r3,
+            'return_6m': r6,
+            'return_12m': r12,
+            'volatility': volatility,
+            'avg_volume': avg_volume,
+        })
+
+        # as-of 펀더멘털 (t일 이전 최신 값)
+        for col in ('per', 'pbr', 'market_cap', 'dividend_yield'):
+            table[col] = 0.0
+        if fundamentals is not None and not fundamentals.empty:
+            known = fundamentals[fundamentals['date'] <= panel.dates[t]]
+            latest = known.groupby('symbol').last()
+            for col in ('per', 'pbr', 'market_cap', 'dividend_yield'):
+                if col in latest.columns:
+                    table[col] = table['symbol'].map(latest[col]).fillna(0.0).to_numpy()
+
+        return table[FACTOR_COLUMNS]
+
+    def _select(self, panel, t, member_mask, fundamentals, sectors, names) -> List[str]:
+        """t일 스크리너 재현 → 목표 종목"""
+        table = self.factor_table(panel, t, member_mask[t], fundamentals, sectors, names)
+        if table.empty:
+            return []
+        scored = self.screener.select(table, self.config.target_count)
+        return [s.symbol for s in scored]
+
+    # ========== 체결 ==========
+
+    def _rebalance(
+        self,
+        panel: USPricePanel,
+        t: int,
+        targets: List[str],
+        qty: np.ndarray,
+        entry: np.ndarray,
+        cash: float,
+        trades: List[Trade],
+        names: Dict[str, str]
+    ) -> float:
+        """목표 외 보유 종목 매도 → 신규 종목 동일 비중 매수 (t일 종가)"""
+        cfg = self.config
+        date = panel.dates[t].to_pydatetime()
+        prices = panel.close_ffill[t]
+        index = {s: i for i, s in enumerate(panel.symbols)}
+        target_idx = [index[s] for s in targets if s in index]
+        target_set = set(target_idx)
+
+        for i in np.flatnonzero(qty):
+            if i not in target_set:
+                cash += self._sell(date, panel.symbols[i], i, prices[i], qty, entry, trades, names, "리밸런싱 매도")
+
+        to_buy = [i for i in target_idx if qty[i] == 0 and prices[i] > 0]
+        if not to_buy:
+            return cash
+
+        total_value = cash + np.nansum(qty * prices)
+        weight = min(1.0 / max(cfg.target_count, 1), cfg.max_position_size)
+        available = cash * (1 - cfg.cash_buffer)
+        budget = min(total_value * weight, available / len(to_buy))
+
+        for i in to_buy:
+            price = prices[i] * (1 + cfg.slippage_rate)
+            shares = int(budget / (price * (1 + cfg.commission_rate)))
+            if shares <= 0:
+                continue
+            amount = price * shares
+            commission = amount * cfg.commission_rate
+            if cash < amount + commission:
+                continue
+            cash -= amount + commission
+            qty[i] = shares
+            entry[i] = price
+            trades.append(Trade(
+                date=date, code=panel.symbols[i], name=names.get(panel.symbols[i], panel.symbols[i]),
+                side=OrderSide.BUY, price=price, quantity=shares, amount=amount,
+                commission=commission, reason="매수"
+            ))
+
+        return cash
+
+    def _sell(self, date, symbol, i, price, qty, entry, trades, names, reason) -> float:
+        """포지션 청산 → 순 매도대금"""
+        cfg = self.config
+        fill = price * (1 - cfg.slippage_rate)
+        amount = fill * qty[i]
+        commission = amount * cfg.commission_rate
+        trades.append(Trade(
+            date=date, code=symbol, name=names.get(symbol, symbol),
+            side=OrderSide.SELL, price=fill, quantity=int(qty[i]), amount=amount,
+            commission=commission,
+            pnl=(fill - entry[i]) * qty[i] - commission,
+            pnl_pct=(fill / entry[i] - 1) * 100 if entry[i] > 0 else 0.0,
+            reason=reason
+        ))
+        qty[i] = 0
+        entry[i] = 0
+        return amount - commission
+
+    def _simulate_segment(
+        self,
+        panel: USPricePanel,
+        start: int,
+        stop: int,
+        qty: np.ndarray,
+        entry: np.ndarray,
+        cash: float,
+        trades: List[Trade],
+        names: Dict[str, str],
+        equity_out: np.ndarray,
+        cash_out: np.ndarray,
+        count_out: np.ndarray
+    ) -> float:
+        """
+        [start, stop) 구간 손절/익절 체결 + 일별 평가 (종목 축/날짜 축 배열 연산)
+
+        같은 날 손절/익절이 모두 닿으면 손절 우선, 시가가 기준가를 넘어 갭이 생기면 시가 체결
+        """
+        cfg = self.config
+        held = np.flatnonzero(qty)
+        days = stop - start
+
+        if len(held) == 0:
+            equity_out[:] = cash
+            cash_out[:] = cash
+            count_out[:] = 0
+            return cash
+
+        stop_px = entry[held] * (1 - cfg.stop_loss_pct)
+        take_px = entry[held] * (1 + cfg.take_profit_pct)
+        opens = panel.open[start:stop, held]
+        lows = panel.low[start:stop, held]
+        highs = panel.high[start:stop, held]
+
+        stop_hit = lows <= stop_px
+        take_hit = highs >= take_px
+        hit = stop_hit | take_hit
+        exit_row = np.where(hit.any(axis=0), hit.argmax(axis=0), days)
+
+        # 보유 수량 경로 (청산일부터 0)
+        rows = np.arange(days)[:, None]
+        qty_path = np.where(rows < exit_row[None, :], qty[held][None, :], 0.0)
+
+        proceeds = np.zeros(days)
+        for j in np.flatnonzero(exit_row < days):
+            r = exit_row[j]
+            i = held[j]
+            open_px = opens[r, j]
+            if stop_hit[r, j]:
+                price = min(open_px, stop_px[j]) if not np.isnan(open_px) else stop_px[j]
+                reason = "손절"
+            else:
+                price = max(open_px, take_px[j]) if not np.isnan(open_px) else take_px[j]
+                reason = "익절"
+            date = panel.dates[start + r].to_pydatetime()
+            proceeds[r] += self._sell(date, panel.symbols[i], i, price, qty, entry, trades, names, reason)
+
+        cash_series = cash + np.cumsum(proceeds)
+        positions_value = np.nansum(qty_path * panel.close_ffill[start:stop, held], axis=1)
+        equity_out[:] = cash_series + positions_value
+        cash_out[:] = cash_series
+        count_out[:] = np.count_nonzero(qty_path, axis=1)
+        return float(cash_series[-1])
+
+    # ========== 보조 ==========
+
+    def _rebalance_indices(self, dates: pd.DatetimeIndex, first: int, last: int) -> List[int]:
+        """리밸런싱 행 인덱스 (시작일 + 월/주 첫 거래일)"""
+        window = dates[first:last + 1]
+        if self.config.rebalance_frequency == "W":
+            keys = window.to_period("W").asi8
+        else:
+            keys = window.to_period("M").asi8
+        changed = np.flatnonzero(np.diff(keys) != 0) + 1
+        return [first] + [first + int(i) for i in changed]
+
+    @staticmethod
+    def _membership_mask(panel: USPricePanel, membership: Optional[pd.DataFrame]) -> np.ndarray:
+        """편입 구간 → (날짜 × 종목) bool 마스크"""
+        shape = (len(panel.dates), len(panel.symbols))
+        if membership is None:
+            return np.ones(shape, dtype=bool)
+
+        mask = np.zeros(shape, dtype=bool)
+        index = {s: i for i, s in enumerate(panel.symbols)}
+        for row in membership.to_dict('records'):
+            i = index.get(row['symbol'])
+            if i is None:
+                continue
+            lo = 0 if pd.isna(row['start']) else int(panel.dates.searchsorted(pd.Timestamp(row['start'])))
+            hi = shape[0] if pd.isna(row['end']) else int(panel.dates.searchsorted(pd.Timestamp(row['end'])))
+            mask[lo:hi, i] = True
+        return mask
+
+    @staticmethod
+    def _prepare_fundamentals(fundamentals: Optional[pd.DataFrame]) -> Optional[pd.DataFrame]:
+        if fundamentals is None or fundamentals.empty:
+            logger.warning("as-of 펀더멘털 없음 → 가치 점수/펀더멘털 필터 중립 처리")
+            return None
+        df = fundamentals.copy()
+        df['date'] = pd.to_datetime(df['date'])
+        return df.sort_values('date', kind='stable')
+
+    def _fx_series(self, fx_rates: Optional[pd.Series], dates: pd.DatetimeIndex) -> np.ndarray:
+        """거래일 기준 환율 (이전 값 유지, 시작 전 공백은 첫 값)"""
+        if fx_rates is None or len(fx_rates) == 0:
+            logger.warning(f"환율 데이터 없음 → 고정 환율 {self.config.default_fx_rate:,.0f}원 사용")
+            return np.full(len(dates), self.config.default_fx_rate)
+        fx = fx_rates.sort_index()
+        fx.index = pd.to_datetime(fx.index).tz_localize(None).normalize()
+        fx = fx[~fx.index.duplicated(keep='last')]
+        aligned = fx.reindex(fx.index.union(dates)).ffill().bfill().reindex(dates)
+        return aligned.fillna(self.config.default_fx_rate).to_numpy(dtype=np.float64)
+
+    def _summarize(self, dates, equity, cash, position_count, trades, initial_capital) -> BacktestResult:
+        """평가금액 경로 → BacktestResult (일별 스냅샷 벡터 계산)"""
+        prev = np.concatenate([[initial_capital], equity[:-1]])
+        daily_return = np.where(prev > 0, (equity / prev - 1) * 100, 0.0)
+        daily_return[0] = 0.0
+        cumulative = (equity / initial_capital - 1) * 100
+        peak = np.maximum.accumulate(np.maximum(equity, initial_capital))
+        drawdown = (equity / peak - 1) * 100
+
+        snapshots = [
+            DailySnapshot(
+                date=d.to_pydatetime(), cash=float(c), positions_value=float(e - c),
+                total_value=float(e), daily_return=float(r), cumulative_return=float(cr),
+                drawdown=float(dd), position_count=int(pc)
+            )
+            for d, c, e, r, cr, dd, pc in zip(
+                dates, cash, equity, daily_return, cumulative, drawdown, position_count
+            )
+        ]
+        return summarize_backtest(
+            config=self.config,
+            start_date=dates[0].to_pydatetime(),
+            end_date=dates[-1].to_pydatetime(),
+            initial_capital=float(initial_capital),
+            final_value=float(equity[-1]),
+            trades=trades,
+            daily_snapshots=snapshots
+        )
@@ -0,0 +1,261 @@
+"""
+미국 주식 일봉 히스토리 서비스
+- KIS 기간별 시세(1회 최대 100건)를 BYMD 역방향 페이지네이션으로 이어 붙여 장기 수정주가 구성
+- 종목별 로컬 저장소(.npz 컬럼 배열)에 보관, 이후에는 신규 거래일만 보충
+- 수정주가 변경(액면분할 등) 감지 시 전체 재수집
+"""
+
+import os
+import time
+import logging
+import threading
+from datetime import datetime, timedelta, date
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+COLUMNS = ('open', 'high', 'low', 'close', 'volume')
+
+# KIS 1회 조회 최대 건수 / 최대 페이지 (100 × 30 ≈ 12년)
+PAGE_SIZE = 100
+MAX_PAGES = 30
+
+# 마지막 수집 후 이 시간 안에는 보충 조회 생략 (초)
+TOPUP_INTERVAL = 6 * 3600
+
+# 겹치는 거래일 종가 차이가 이 비율을 넘으면 수정주가 변경으로 판단
+ADJUSTMENT_TOLERANCE = 0.005
+
+# 거래일 → 달력일 환산 (252 거래일 ≈ 365일) + 휴장일 여유
+CALENDAR_RATIO = 365 / 252
+CALENDAR_MARGIN_DAYS = 10
+
+# (symbol, exchange, BYMD) → 해당 일자 이전 최대 100건 일봉 (최신순, USDailyCandle 리스트)
+PageFetcher = Callable[[str, str, str], list]
+
+
+class USPriceHistoryStore:
+    """종목별 일봉 로컬 저장소 (종목당 .npz 1개, 컬럼 배열)"""
+
+    def __init__(self, data_dir: str = None):
+        """
+        Args:
+            data_dir: 저장 디렉토리 (기본: data/history/us)
+        """
+        self.data_dir = data_dir or os.path.join(
+            os.path.dirname(__file__), "..", "..", "data", "history", "us"
+        )
+        os.makedirs(self.data_dir, exist_ok=True)
+
+    def _path(self, symbol: str) -> str:
+        return os.path.join(self.data_dir, f"{symbol.upper()}.npz")
+
+    def load(self, symbol: str) -> Optional[Dict]:
+        """
+        저장된 히스토리 로드
+
+        Returns:
+            {"df": DataFrame(date, open, high, low, close, volume), "fetched_at": float,
+             "exhausted": bool} 또는 None
+        """
+        path = self._path(symbol)
+        if not os.path.exists(path):
+            return None
+
+        try:
+            with np.load(path) as data:
+                df = pd.DataFrame({'date': pd.to_datetime(data['date'])})
+                for col in COLUMNS:
+                    df[col] = data[col]
+                return {
+                    "df": df,
+                    "fetched_at": float(data['fetched_at']),
+                    "exhausted": bool(data['exhausted']),
+                }
+        except Exception as e:
+            logger.warning(f"히스토리 로드 실패 ({symbol}): {e}")
+            return None
+
+    def save(self, symbol: str, df: pd.DataFrame, exhausted: bool = False):
+        """
+        히스토리 저장 (임시 파일 → rename 원자적 교체)
+
+        Args:
+            symbol: 종목 심볼
+            df: 날짜순 일봉
+            exhausted: 상장일 이전까지 모두 수집했는지 여부 (추가 과거 조회 불필요)
+        """
+        path = self._path(symbol)
+        tmp_path = f"{path}.tmp.npz"
+        arrays = {col: df[col].to_numpy(dtype=np.float64) for col in COLUMNS}
+        try:
+            np.savez(
+                tmp_path,
+                date=df['date'].to_numpy(dtype='datetime64[D]'),
+                fetched_at=np.float64(time.time()),
+                exhausted=np.bool_(exhausted),
+                **arrays
+            )
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"히스토리 저장 실패 ({symbol}): {e}")
+
+    def symbols(self) -> List[str]:
+        """저장된 종목 목록"""
+        return sorted(
+            f[:-4] for f in os.listdir(self.data_dir)
+            if f.endswith(".npz") and ".tmp" not in f
+        )
+
+
+class USHistoryService:
+    """KIS 페이지네이션 + 로컬 저장소 기반 일봉 히스토리 서비스"""
+
+    def __init__(self, fetch_page: PageFetcher, store: USPriceHistoryStore = None):
+        """
+        Args:
+            fetch_page: 페이지 조회 함수 (Rate Limiter 적용은 호출자 책임)
+            store: 로컬 저장소
+        """
+        self.fetch_page = fetch_page
+        self.store = store or USPriceHistoryStore()
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+    def _lock_for(self, symbol: str) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault(symbol, threading.Lock())
+
+    def get_history(self, symbol: str, exchange: str, days: int) -> pd.DataFrame:
+        """
+        최근 N 거래일 일봉 (부족분만 네트워크 조회)
+
+        Args:
+            symbol: 종목 심볼
+            exchange: KIS 거래소 코드 (NAS, NYS, AMS)
+            days: 거래일 수
+
+        Returns:
+            DataFrame (date, open, high, low, close, volume) - 날짜순
+        """
+        symbol = symbol.upper()
+        with self._lock_for(symbol):
+            df = self._ensure_history(symbol, exchange, days)
+        return df.tail(days).reset_index(drop=True)
+
+    def _ensure_history(self, symbol: str, exchange: str, days: int) -> pd.DataFrame:
+        calendar_days = int(days * CALENDAR_RATIO) + CALENDAR_MARGIN_DAYS
+        start = (datetime.now() - timedelta(days=calendar_days)).date()
+
+        cached = self.store.load(symbol)
+        if cached is None or cached["df"].empty:
+            df, exhausted = self._fetch_range(symbol, exchange, start, datetime.now().date())
+            if not df.empty:
+                self.store.save(symbol, df, exhausted)
+            return df
+
+        df = cached["df"]
+        exhausted = cached["exhausted"]
+        changed = False
+
+        try:
+            # 1) 신규 거래일 보충
+            if time.time() - cached["fetched_at"] > TOPUP_INTERVAL:
+                last_day = df['date'].iloc[-1].date()
+                recent, _ = self._fetch_range(symbol, exchange, last_day, datetime.now().date())
+                if not recent.empty:
+                    if self._adjustment_changed(df, recent):
+                        logger.info(f"수정주가 변경 감지 ({symbol}) → 전체 재수집")
+                        df, exhausted = self._fetch_range(symbol, exchange, start, datetime.now().date())
+                        if not df.empty:
+                            self.store.save(symbol, df, exhausted)
+                        return df
+                    df = self._merge(df, recent)
+                changed = True
+
+            # 2) 과거 구간 부족 시 역방향 보충
+            first_day = df['date'].iloc[0].date()
+            if first_day > start and not exhausted:
+                older, exhausted = self._fetch_range(symbol, exchange, start, first_day - timedelta(days=1))
+                df = self._merge(older, df)
+                changed = True
+
+        except Exception as e:
+            # 보충 실패 시 저장된 데이터로 진행 (다음 호출에서 재시도)
+            logger.warning(f"히스토리 보충 실패 ({symbol}): {e}")
+            return df
+
+        if changed:
+            self.store.save(symbol, df, exhausted)
+        return df
+
+    def _fetch_range(self, symbol: str, exchange: str, start: date, end: date):
+        """
+        BYMD 역방향 페이지네이션으로 [start, end] 구간 수집
+
+        Returns:
+            (DataFrame 날짜순, exhausted: 상장 이전 구간까지 도달했는지)
+        """
+        rows = {}
+        bymd = end
+        exhausted = False
+
+        for _ in range(MAX_PAGES):
+            candles = self.fetch_page(symbol, exchange, bymd.strftime("%Y%m%d"))
+            page_dates = []
+            for c in candles:
+                if not c.date:
+                    continue
+                day = datetime.strptime(c.date, "%Y%m%d").date()
+                if day > end:
+                    continue
+                page_dates.append(day)
+                rows[day] = (c.open, c.high, c.low, c.close, c.volume)
+
+            if not page_dates:
+                exhausted = True
+                break
+
+            oldest = min(page_dates)
+            if oldest <= start:
+                break
+            if len(candles) < PAGE_SIZE:
+                # 마지막 페이지 (상장일 도달)
+                exhausted = True
+                break
+            bymd = oldest - timedelta(days=1)
+
+        if not rows:
+            return pd.DataFrame(columns=['date', *COLUMNS]), exhausted
+
+        # start 이전 행도 보관 (다음 호출에서 과거 구간 재조회 방지)
+        days_sorted = sorted(rows)
+        df = pd.DataFrame(
+            [rows[d] for d in days_sorted], columns=list(COLUMNS)
+        )
+        df.insert(0, 'date', pd.to_datetime(days_sorted))
+        return df, exhausted
+
+    @staticmethod
+    def _merge(older: pd.DataFrame, newer: pd.DataFrame) -> pd.DataFrame:
+        """두 구간 병합 (같은 날짜는 newer 우선)"""
+        if older.empty:
+            return newer.reset_index(drop=True)
+        merged = pd.concat([older, newer], ignore_index=True)
+        merged = merged.drop_duplicates(subset='date', keep='last')
+        return merged.sort_values('date').reset_index(drop=True)
+
+    @staticmethod
+    def _adjustment_changed(stored: pd.DataFrame, recent: pd.DataFrame) -> bool:
+        """겹치는 거래일 종가 비교로 수정주가 재계산 여부 판단"""
+        overlap = stored.merge(recent, on='date', suffixes=('_old', '_new'))
+        if overlap.empty:
+            return False
+        old = overlap['close_old'].to_numpy()
+        new = overlap['close_new'].to_numpy()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            diff = np.abs(new / old - 1)
+        return bool(np.nanmax(diff) > ADJUSTMENT_TOLERANCE)
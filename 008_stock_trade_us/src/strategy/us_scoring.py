@@ -0,0 +1,177 @@
+"""
+미국 주식 팩터 점수 - 횡단면 벡터 연산
+- 유니버스 전체 팩터 테이블(DataFrame)에서 하위 점수/필터/복합 점수/순위를 한 번에 계산
+- 데이터 수집과 분리되어 있어 가중치만 바꿔 재채점 가능 (재조회 불필요)
+- 구간 점수는 USMomentumCalculator 등 종목별 함수와 동일한 기준값 사용
+"""
+
+import logging
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# 팩터 테이블 입력 컬럼
+FACTOR_COLUMNS = [
+    'symbol', 'name', 'sector', 'exchange',
+    'return_1m', 'return_3m', 'return_6m', 'return_12m',
+    'volatility', 'avg_volume',
+    'per', 'pbr', 'market_cap', 'dividend_yield',
+]
+
+# 필터 실패 코드 (0 = 통과, _check_filters 순서와 동일)
+FILTER_PASS = 0
+FILTER_PER, FILTER_PBR, FILTER_MARKET_CAP, FILTER_VOLUME, FILTER_VOLATILITY, FILTER_RETURN = range(1, 7)
+
+
+def _piecewise(conditions: List[np.ndarray], values: List[float], default: float) -> np.ndarray:
+    return np.select(conditions, values, default=default).astype(float)
+
+
+class USCrossSectionalScorer:
+    """팩터 테이블 일괄 채점기"""
+
+    @staticmethod
+    def score_momentum(return_12m: np.ndarray, return_6m: np.ndarray) -> np.ndarray:
+        """12개월 모멘텀 점수 (USMomentumCalculator.score_momentum 벡터판)"""
+        r12, r6 = return_12m, return_6m
+        score = 50.0 + _piecewise(
+            [r12 > 100, r12 > 50, r12 > 30, r12 > 15, r12 > 0, r12 > -15, r12 > -30],
+            [35, 25, 20, 15, 10, 0, -15],
+            -30
+        )
+        score += _piecewise([(r6 > 0) & (r12 > 0), (r6 < 0) & (r12 > 0)], [5, -5], 0)
+        return np.clip(score, 0, 100)
+
+    @staticmethod
+    def score_short_momentum(return_1m: np.ndarray, return_3m: np.ndarray) -> np.ndarray:
+        """단기 모멘텀 점수 (USMomentumCalculator.score_short_momentum 벡터판)"""
+        r1, r3 = return_1m, return_3m
+        score = 50.0 + _piecewise(
+            [r3 > 30, r3 > 15, r3 > 5, r3 > 0, r3 > -10],
+            [20, 15, 10, 5, -5],
+            -15
+        )
+        score += _piecewise([r1 > 30, r1 > 20], [-10, -5], 0)
+        return np.clip(score, 0, 100)
+
+    @staticmethod
+    def score_volatility(volatility: np.ndarray) -> np.ndarray:
+        """저변동성 점수 (USVolatilityCalculator.score_volatility 벡터판)"""
+        v = volatility
+        return _piecewise(
+            [v <= 0, v < 15, v < 20, v < 25, v < 30, v < 35, v < 40, v < 50, v < 60],
+            [50, 95, 85, 75, 65, 55, 45, 35, 25],
+            10
+        )
+
+    @staticmethod
+    def score_value(per: np.ndarray, pbr: np.ndarray, dividend_yield: np.ndarray) -> np.ndarray:
+        """가치 점수 (USValueCalculator.score_value 벡터판)"""
+        score = 50.0 + _piecewise(
+            [(per > 0) & (per < 10), per < 15, per < 20, per < 25, per < 35, per < 50, per < 100],
+            [20, 15, 10, 5, 0, -5, -15],
+            -25
+        )
+        score += _piecewise(
+            [(pbr > 0) & (pbr < 1.5), pbr < 3, pbr < 5, pbr < 8, pbr < 12],
+            [15, 10, 5, 0, -5],
+            -15
+        )
+        score += _piecewise(
+            [dividend_yield > 3, dividend_yield > 2, dividend_yield > 1],
+            [10, 5, 2],
+            0
+        )
+        return np.clip(score, 0, 100)
+
+    @staticmethod
+    def filter_codes(table: pd.DataFrame, weights) -> np.ndarray:
+        """필터 실패 코드 (첫 번째로 걸린 필터, 0 = 통과)"""
+        w = weights
+        per = table['per'].to_numpy(float)
+        pbr = table['pbr'].to_numpy(float)
+        market_cap = table['market_cap'].to_numpy(float)
+        avg_volume = table['avg_volume'].to_numpy(float)
+        return np.select(
+            [
+                (per > 0) & (per > w.per_max),
+                pbr > w.pbr_max,
+                (market_cap > 0) & (market_cap < w.min_market_cap),
+                (avg_volume > 0) & (avg_volume < w.min_avg_volume),
+                table['volatility'].to_numpy(float) > w.max_volatility,
+                table['return_12m'].to_numpy(float) < w.min_return_12m,
+            ],
+            [FILTER_PER, FILTER_PBR, FILTER_MARKET_CAP, FILTER_VOLUME, FILTER_VOLATILITY, FILTER_RETURN],
+            default=FILTER_PASS
+        )
+
+    @staticmethod
+    def filter_reason(code: int, row: Dict, weights) -> str:
+        """필터 실패 사유 문자열 (_check_filters와 동일 형식)"""
+        w = weights
+        if code == FILTER_PER:
+            return f"PER({row['per']:.1f}) > {w.per_max}"
+        if code == FILTER_PBR:
+            return f"PBR({row['pbr']:.1f}) > {w.pbr_max}"
+        if code == FILTER_MARKET_CAP:
+            return f"시가총액(${row['market_cap']:.1f}B) < ${w.min_market_cap}B"
+        if code == FILTER_VOLUME:
+            return f"거래량({int(row['avg_volume']):,}) < {w.min_avg_volume:,}"
+        if code == FILTER_VOLATILITY:
+            return f"변동성({row['volatility']:.1f}%) > {w.max_volatility}%"
+        if code == FILTER_RETURN:
+            return f"12M수익률({row['return_12m']:.1f}%) < {w.min_return_12m}%"
+        return ""
+
+    @classmethod
+    def score(cls, table: pd.DataFrame, weights) -> pd.DataFrame:
+        """
+        팩터 테이블 일괄 채점
+
+        Args:
+            table: FACTOR_COLUMNS 컬럼을 가진 유니버스 테이블
+            weights: USFactorWeights
+
+        Returns:
+            점수 컬럼이 추가된 사본 (composite_score 내림차순)
+            - momentum_score, short_momentum_score, volatility_score, volume_score, value_score
+            - composite_score, filter_code, passed_filter, composite_rank (통과 종목 내 순위, 미통과 0)
+        """
+        scored = table.copy()
+        if scored.empty:
+            for col in ('momentum_score', 'short_momentum_score', 'volatility_score',
+                        'volume_score', 'value_score', 'composite_score'):
+                scored[col] = pd.Series(dtype=float)
+            scored['filter_code'] = pd.Series(dtype=int)
+            scored['passed_filter'] = pd.Series(dtype=bool)
+            scored['composite_rank'] = pd.Series(dtype=int)
+            return scored
+
+        col = lambda name: scored[name].to_numpy(float)
+
+        scored['momentum_score'] = cls.score_momentum(col('return_12m'), col('return_6m'))
+        scored['short_momentum_score'] = cls.score_short_momentum(col('return_1m'), col('return_3m'))
+        scored['volatility_score'] = cls.score_volatility(col('volatility'))
+        scored['value_score'] = cls.score_value(col('per'), col('pbr'), col('dividend_yield'))
+        # 거래량 점수 (현재 비활성화)
+        scored['volume_score'] = 50.0
+
+        w = weights
+        scored['composite_score'] = (
+            scored['momentum_score'] * w.momentum_weight +
+            scored['short_momentum_score'] * w.short_mom_weight +
+            scored['volatility_score'] * w.volatility_weight +
+            scored['volume_score'] * w.volume_weight +
+            scored['value_score'] * w.value_weight
+        )
+
+        scored['filter_code'] = cls.filter_codes(scored, w)
+        scored['passed_filter'] = scored['filter_code'] == FILTER_PASS
+
+        scored = scored.sort_values('composite_score', ascending=False, kind='stable')
+        ranks = scored['passed_filter'].cumsum()
+        scored['composite_rank'] = np.where(scored['passed_filter'], ranks, 0).astype(int)
+        return scored.reset_index(drop=True)
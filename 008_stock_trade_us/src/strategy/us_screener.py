@@ -2,19 +2,29 @@
 미국 주식 멀티팩터 스크리너
 - 모멘텀 + 저변동성 + 가치 팩터 기반 종목 선정
 - 미국 시장 특성에 맞게 조정된 기준값
+- 채점은 팩터 테이블 일괄 연산 (us_scoring), 종목별 calculator는 기준값 참조/단일 조회용
 """
 
+import time
 import logging
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Callable
 from datetime import datetime, timedelta
 import pandas as pd
 import numpy as np
 
 from .us_universe import USUniverseBuilder, USDataCollector, USStock
+from .us_scoring import USCrossSectionalScorer, FACTOR_COLUMNS
 
 logger = logging.getLogger(__name__)
 
+# 병렬 수집 설정 (호출 속도는 USDataCollector의 제공자별 Rate Limiter가 제한)
+SCREEN_WORKERS = 8
+STOCK_TIMEOUT = 45.0       # 종목당 최대 대기 (초) - 초과 시 해당 종목 제외
+PRICE_HISTORY_DAYS = 260
+MIN_PRICE_ROWS = 20
+
 
 # ========== 데이터 클래스 ==========
 
@@ -324,16 +334,25 @@ class USMultiFactorScreener:
     def __init__(
         self,
         weights: USFactorWeights = None,
-        kis_client=None
+        kis_client=None,
+        max_workers: int = SCREEN_WORKERS,
+        stock_timeout: float = STOCK_TIMEOUT
     ):
         """
         Args:
             weights: 팩터 가중치 설정
             kis_client: KIS US 클라이언트
+            max_workers: 병렬 수집 스레드 수
+            stock_timeout: 종목당 최대 대기 시간 (초)
         """
         self.weights = weights or USFactorWeights()
         self.universe_builder = USUniverseBuilder()
-        self.data_collector = USDataCollector(kis_client)
+        self.data_collector = USDataCollector(kis_client, universe_builder=self.universe_builder)
+        self.max_workers = max(1, max_workers)
+        self.stock_timeout = stock_timeout
+
+        # 마지막 screen()의 팩터 테이블 (rescore()로 재조회 없이 재채점)
+        self.last_factor_table: Optional[pd.DataFrame] = None
 
     def screen(
         self,
@@ -362,25 +381,65 @@ class USMultiFactorScreener:
 
         logger.info(f"유니버스 {len(universe)}개 종목 로드")
 
-        # 2. 각 종목 분석
-        scores = []
-        for stock in universe:
-            try:
-                score = self._analyze_stock(stock)
-                if score:
-                    scores.append(score)
-            except Exception as e:
-                logger.warning(f"종목 분석 실패 ({stock.symbol}): {e}")
-                continue
+        # 2. 데이터 수집 (가격 → Yahoo 일괄 폴백 → 펀더멘털, 병렬)
+        started = time.monotonic()
+        price_data = self._collect_price_data(universe)
+        fundamentals = self._collect_fundamentals(
+            [s for s in universe if s.symbol in price_data]
+        )
+        logger.info(
+            f"데이터 수집 완료: 가격 {len(price_data)}/{len(universe)}개, "
+            f"펀더멘털 {len(fundamentals)}개 ({time.monotonic() - started:.1f}초)"
+        )
 
-        logger.info(f"분석 완료: {len(scores)}개 종목")
+        # 3. 팩터 테이블 구성 (종목당 1행) → 일괄 채점/선정
+        self.last_factor_table = self.build_factor_table(universe, price_data, fundamentals)
+        logger.info(f"분석 완료: {len(self.last_factor_table)}개 종목")
 
-        # 3. 필터링
-        filtered = [s for s in scores if s.passed_filter]
-        logger.info(f"필터 통과: {len(filtered)}개 종목")
+        return self.select(self.last_factor_table, target_count)
 
-        # 4. 섹터 분산 적용
-        diversified = self._apply_sector_diversification(filtered, target_count)
+    def rescore(
+        self,
+        weights: USFactorWeights = None,
+        target_count: int = 15
+    ) -> List[USFactorScore]:
+        """
+        마지막 screen()의 팩터 테이블을 새 가중치로 재채점 (데이터 재조회 없음)
+
+        Args:
+            weights: 새 가중치 (None이면 현재 가중치, 지정 시 이후 기본값으로 교체)
+            target_count: 선정할 종목 수
+
+        Returns:
+            팩터 점수 리스트 (순위순), screen() 이전이면 빈 리스트
+        """
+        if weights is not None:
+            self.weights = weights
+        if self.last_factor_table is None:
+            logger.warning("재채점할 팩터 테이블 없음 (screen() 먼저 실행)")
+            return []
+        return self.select(self.last_factor_table, target_count)
+
+    def select(self, table: pd.DataFrame, target_count: int) -> List[USFactorScore]:
+        """
+        팩터 테이블 채점 → 필터 → 섹터 분산 → 순위
+
+        Args:
+            table: build_factor_table() 결과
+            target_count: 선정할 종목 수
+
+        Returns:
+            팩터 점수 리스트 (순위순)
+        """
+        scored = USCrossSectionalScorer.score(table, self.weights)
+        passed = scored[scored['passed_filter']]
+        logger.info(f"필터 통과: {len(passed)}개 종목")
+
+        # 4. 섹터 분산 적용 (composite_score 내림차순 정렬 상태)
+        diversified = self._apply_sector_diversification(
+            [self._to_factor_score(row) for row in passed.to_dict('records')],
+            target_count
+        )
 
         # 5. 순위 부여
         for i, score in enumerate(diversified, 1):
@@ -390,9 +449,101 @@ class USMultiFactorScreener:
 
         return diversified
 
+    # ========== 데이터 수집 (병렬) ==========
+
+    def _run_concurrent(
+        self,
+        fn: Callable[[USStock], Any],
+        stocks: List[USStock],
+        label: str
+    ) -> Dict[str, Any]:
+        """
+        종목별 작업 병렬 실행 (종목당 타임아웃)
+
+        실행 시작 후 stock_timeout을 넘긴 종목은 결과를 기다리지 않고 제외
+        (해당 스레드는 백그라운드에서 종료)
+
+        Returns:
+            {symbol: 결과} - 예외/타임아웃 종목 제외
+        """
+        results: Dict[str, Any] = {}
+        if not stocks:
+            return results
+
+        started: Dict[str, float] = {}
+
+        def task(stock: USStock):
+            started[stock.symbol] = time.monotonic()
+            return fn(stock)
+
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="us-screen")
+        futures = {executor.submit(task, stock): stock.symbol for stock in stocks}
+        pending = set(futures)
+        timed_out = []
+
+        try:
+            while pending:
+                done, pending = wait(pending, timeout=0.5, return_when=FIRST_COMPLETED)
+                for future in done:
+                    symbol = futures[future]
+                    try:
+                        results[symbol] = future.result()
+                    except Exception as e:
+                        logger.warning(f"{label} 조회 실패 ({symbol}): {e}")
+
+                now = time.monotonic()
+                expired = {
+                    f for f in pending
+                    if futures[f] in started and now - started[futures[f]] > self.stock_timeout
+                }
+                if expired:
+                    timed_out.extend(futures[f] for f in expired)
+                    pending -= expired
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        if timed_out:
+            logger.warning(f"{label} 조회 타임아웃 {len(timed_out)}개: {', '.join(timed_out[:10])}")
+
+        return results
+
+    def _collect_price_data(self, universe: List[USStock]) -> Dict[str, pd.DataFrame]:
+        """가격 데이터 수집 (KIS 병렬 → 실패 종목 Yahoo 일괄 조회)"""
+        kis_results = self._run_concurrent(
+            lambda s: self.data_collector.get_price_data(s.symbol, days=PRICE_HISTORY_DAYS),
+            universe,
+            "가격"
+        )
+        price_data = {
+            symbol: df for symbol, df in kis_results.items()
+            if not df.empty and len(df) >= MIN_PRICE_ROWS
+        }
+
+        missing = [s.symbol for s in universe if s.symbol not in price_data]
+        if missing:
+            logger.info(f"KIS 가격 데이터 부족 {len(missing)}개 → Yahoo Finance 일괄 조회")
+            yahoo = self.data_collector.get_price_data_yahoo_batch(missing, days=PRICE_HISTORY_DAYS)
+            for symbol, df in yahoo.items():
+                if len(df) >= MIN_PRICE_ROWS:
+                    price_data[symbol] = df
+
+        return price_data
+
+    def _collect_fundamentals(self, stocks: List[USStock]) -> Dict[str, Dict[str, Any]]:
+        """펀더멘털 수집 (KIS 병렬, 실패 시 종목별 Yahoo 폴백)"""
+        def fetch(stock: USStock) -> Dict[str, Any]:
+            fundamental = self.data_collector.get_fundamental_data(stock.symbol)
+            if not fundamental:
+                fundamental = self.data_collector.get_fundamental_data_yahoo(stock.symbol)
+            return fundamental or {}
+
+        return self._run_concurrent(fetch, stocks, "펀더멘털")
+
+    # ========== 종목 분석 ==========
+
     def _analyze_stock(self, stock: USStock) -> Optional[USFactorScore]:
         """
-        개별 종목 분석
+        개별 종목 분석 (단일 종목 조회용, screen()은 일괄 수집 후 _score_stock 사용)
 
         Args:
             stock: 종목 정보
@@ -401,13 +552,13 @@ class USMultiFactorScreener:
             팩터 점수
         """
         # 가격 데이터 조회
-        df = self.data_collector.get_price_data(stock.symbol, days=260)
+        df = self.data_collector.get_price_data(stock.symbol, days=PRICE_HISTORY_DAYS)
 
-        if df.empty or len(df) < 20:
+        if df.empty or len(df) < MIN_PRICE_ROWS:
             # Yahoo Finance 폴백
-            df = self.data_collector.get_price_data_yahoo(stock.symbol, days=260)
+            df = self.data_collector.get_price_data_yahoo(stock.symbol, days=PRICE_HISTORY_DAYS)
 
-        if df.empty or len(df) < 20:
+        if df.empty or len(df) < MIN_PRICE_ROWS:
             return None
 
         # 펀더멘털 데이터 조회
@@ -416,77 +567,111 @@ class USMultiFactorScreener:
         if not fundamental:
             fundamental = self.data_collector.get_fundamental_data_yahoo(stock.symbol)
 
-        # 수익률 계산
-        returns = USMomentumCalculator.calculate_returns(df)
+        return self._score_stock(stock, df, fundamental or {})
 
-        # 변동성 계산
-        volatility = USVolatilityCalculator.calculate_volatility(df)
+    def build_factor_table(
+        self,
+        universe: List[USStock],
+        price_data: Dict[str, pd.DataFrame],
+        fundamentals: Dict[str, Dict[str, Any]]
+    ) -> pd.DataFrame:
+        """
+        유니버스 팩터 테이블 구성 (종목당 1행, FACTOR_COLUMNS)
 
-        # 거래량
-        avg_volume = int(df['volume'].tail(20).mean()) if 'volume' in df.columns else 0
+        Args:
+            universe: 유니버스 종목
+            price_data: {symbol: 가격 데이터} - 없는 종목은 제외
+            fundamentals: {symbol: 펀더멘털 데이터}
 
-        # 펀더멘털 데이터 추출
-        per = fundamental.get("per", 0) or 0
-        pbr = fundamental.get("pbr", 0) or 0
-        market_cap = fundamental.get("market_cap", 0) or 0
-        dividend_yield = fundamental.get("dividend_yield", 0) or 0
-
-        # 필터 체크
-        passed, reason = self._check_filters(
-            per=per,
-            pbr=pbr,
-            market_cap=market_cap,
-            avg_volume=avg_volume,
-            volatility=volatility,
-            return_12m=returns["return_12m"]
-        )
+        Returns:
+            팩터 테이블 (유니버스 순서)
+        """
+        rows = []
+        for stock in universe:
+            df = price_data.get(stock.symbol)
+            if df is None:
+                continue
+            try:
+                rows.append(self._factor_row(stock, df, fundamentals.get(stock.symbol, {})))
+            except Exception as e:
+                logger.warning(f"종목 분석 실패 ({stock.symbol}): {e}")
+        return pd.DataFrame(rows, columns=FACTOR_COLUMNS)
 
-        # 팩터 점수 계산
-        momentum_score = USMomentumCalculator.score_momentum(
-            returns["return_12m"], returns["return_6m"]
-        )
-        short_mom_score = USMomentumCalculator.score_short_momentum(
-            returns["return_1m"], returns["return_3m"]
-        )
-        volatility_score = USVolatilityCalculator.score_volatility(volatility)
-        value_score = USValueCalculator.score_value(per, pbr, dividend_yield)
-
-        # 거래량 점수 (현재 비활성화)
-        volume_score = 50.0
-
-        # 복합 점수 계산
-        composite = (
-            momentum_score * self.weights.momentum_weight +
-            short_mom_score * self.weights.short_mom_weight +
-            volatility_score * self.weights.volatility_weight +
-            volume_score * self.weights.volume_weight +
-            value_score * self.weights.value_weight
-        )
+    def _factor_row(
+        self,
+        stock: USStock,
+        df: pd.DataFrame,
+        fundamental: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """가격/펀더멘털 데이터 → 팩터 테이블 1행"""
+        returns = USMomentumCalculator.calculate_returns(df)
+        volatility = USVolatilityCalculator.calculate_volatility(df)
+        avg_volume = int(df['volume'].tail(20).mean()) if 'volume' in df.columns else 0
 
+        return {
+            'symbol': stock.symbol,
+            'name': stock.name,
+            'sector': stock.sector,
+            'exchange': self.universe_builder.get_exchange_code(stock.symbol),
+            'return_1m': returns["return_1m"],
+            'return_3m': returns["return_3m"],
+            'return_6m': returns["return_6m"],
+            'return_12m': returns["return_12m"],
+            'volatility': volatility,
+            'avg_volume': avg_volume,
+            'per': fundamental.get("per", 0) or 0,
+            'pbr': fundamental.get("pbr", 0) or 0,
+            'market_cap': fundamental.get("market_cap", 0) or 0,
+            'dividend_yield': fundamental.get("dividend_yield", 0) or 0,
+        }
+
+    def _to_factor_score(self, row: Dict[str, Any]) -> USFactorScore:
+        """채점된 테이블 행 → USFactorScore"""
         return USFactorScore(
-            symbol=stock.symbol,
-            name=stock.name,
-            momentum_score=momentum_score,
-            short_momentum_score=short_mom_score,
-            volatility_score=volatility_score,
-            volume_score=volume_score,
-            value_score=value_score,
-            composite_score=composite,
-            return_12m=returns["return_12m"],
-            return_6m=returns["return_6m"],
-            return_3m=returns["return_3m"],
-            return_1m=returns["return_1m"],
-            volatility=volatility,
-            avg_volume=avg_volume,
-            per=per,
-            pbr=pbr,
-            market_cap=market_cap,
-            sector=stock.sector,
-            exchange=stock.exchange,
-            passed_filter=passed,
-            filter_reason=reason
+            symbol=row['symbol'],
+            name=row['name'],
+            momentum_score=float(row['momentum_score']),
+            short_momentum_score=float(row['short_momentum_score']),
+            volatility_score=float(row['volatility_score']),
+            volume_score=float(row['volume_score']),
+            value_score=float(row['value_score']),
+            composite_score=float(row['composite_score']),
+            return_12m=float(row['return_12m']),
+            return_6m=float(row['return_6m']),
+            return_3m=float(row['return_3m']),
+            return_1m=float(row['return_1m']),
+            volatility=float(row['volatility']),
+            avg_volume=int(row['avg_volume']),
+            per=float(row['per']),
+            pbr=float(row['pbr']),
+            market_cap=float(row['market_cap']),
+            sector=row['sector'],
+            exchange=row['exchange'],
+            passed_filter=bool(row['passed_filter']),
+            filter_reason=USCrossSectionalScorer.filter_reason(int(row['filter_code']), row, self.weights)
         )
 
+    def _score_stock(
+        self,
+        stock: USStock,
+        df: pd.DataFrame,
+        fundamental: Dict[str, Any]
+    ) -> USFactorScore:
+        """
+        단일 종목 팩터 점수 (1행 테이블로 일괄 채점기 사용)
+
+        Args:
+            stock: 종목 정보
+            df: 가격 데이터 (date, close, volume)
+            fundamental: 펀더멘털 데이터 (per, pbr, market_cap, dividend_yield)
+
+        Returns:
+            팩터 점수
+        """
+        table = pd.DataFrame([self._factor_row(stock, df, fundamental)], columns=FACTOR_COLUMNS)
+        scored = USCrossSectionalScorer.score(table, self.weights)
+        return self._to_factor_score(scored.to_dict('records')[0])
+
     def _check_filters(
         self,
         per: float,
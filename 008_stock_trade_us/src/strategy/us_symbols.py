@@ -0,0 +1,202 @@
+"""
+미국 주식 심볼 마스터 인덱스
+- symbol → 거래소(KIS 코드), 섹터, 종목명, 주식 클래스 dict 조회
+- 내장 목록 + 캐시된 유니버스 소스로 1회 구성 후 파일 저장, 주기적 재구성
+- KIS 응답 성공으로 확인된 거래소 코드를 별도 보관 (재구성 시에도 유지)
+"""
+
+import os
+import re
+import json
+import logging
+import threading
+from dataclasses import dataclass, asdict
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILENAME = "symbol_index.json"
+
+# 인덱스 재구성 주기 (일)
+INDEX_MAX_AGE_DAYS = 7
+
+# 거래소 미확인 종목 조회 순서 (기본값 NAS 우선)
+KIS_EXCHANGES = ("NAS", "NYS", "AMS")
+
+_EXCHANGE_CODES = {
+    "NASDAQ": "NAS", "NASD": "NAS", "NAS": "NAS",
+    "NYSE": "NYS", "NYS": "NYS",
+    "AMEX": "AMS", "NYSEAMERICAN": "AMS", "AMS": "AMS",
+}
+
+_CLASS_IN_NAME = re.compile(r"\bClass ([A-Z])\b")
+
+
+def normalize_symbol(symbol: str) -> str:
+    """심볼 키 정규화 (BRK-B / BRK/B → BRK.B)"""
+    return symbol.strip().upper().replace("-", ".").replace("/", ".")
+
+
+def to_kis_exchange(exchange: str) -> str:
+    """거래소명 → KIS 3자리 코드 (모르면 빈 문자열)"""
+    return _EXCHANGE_CODES.get((exchange or "").replace(" ", "").upper(), "")
+
+
+@dataclass
+class USSymbolInfo:
+    """심볼 메타데이터"""
+    symbol: str
+    name: str = ""
+    sector: str = ""
+    industry: str = ""
+    exchange: str = ""        # KIS 거래소 코드 (NAS, NYS, AMS), 미상이면 ""
+    share_class: str = ""     # 주식 클래스 (BRK.B → "B")
+
+
+class USSymbolIndex:
+    """심볼 마스터 인덱스 (Thread-safe)"""
+
+    def __init__(
+        self,
+        cache_dir: str,
+        source_loader: Callable[[], List],
+        max_age_days: int = INDEX_MAX_AGE_DAYS
+    ):
+        """
+        Args:
+            cache_dir: 인덱스 파일 디렉토리 (유니버스 캐시와 동일)
+            source_loader: USStock 리스트 반환 함수 (앞쪽 소스가 우선)
+            max_age_days: 재구성 주기
+        """
+        self.index_file = os.path.join(cache_dir, INDEX_FILENAME)
+        self.source_loader = source_loader
+        self.max_age_days = max_age_days
+
+        self._symbols: Dict[str, USSymbolInfo] = {}
+        self._verified: Dict[str, str] = {}
+        self._updated_at: Optional[datetime] = None
+        self._loaded = False
+        self._lock = threading.RLock()
+
+    # ========== 조회 ==========
+
+    def get(self, symbol: str) -> Optional[USSymbolInfo]:
+        """심볼 메타데이터 (없으면 None)"""
+        self._ensure_loaded()
+        return self._symbols.get(normalize_symbol(symbol))
+
+    def get_exchange_code(self, symbol: str, default: str = "NAS") -> str:
+        """KIS 거래소 코드 (확인된 코드 > 인덱스 > 기본값)"""
+        self._ensure_loaded()
+        key = normalize_symbol(symbol)
+        verified = self._verified.get(key)
+        if verified:
+            return verified
+        info = self._symbols.get(key)
+        if info and info.exchange:
+            return info.exchange
+        return default
+
+    def is_verified(self, symbol: str) -> bool:
+        self._ensure_loaded()
+        return normalize_symbol(symbol) in self._verified
+
+    def candidate_exchanges(self, symbol: str) -> List[str]:
+        """조회 시도 순서 (1순위 코드 + 나머지 거래소)"""
+        primary = self.get_exchange_code(symbol)
+        return [primary] + [e for e in KIS_EXCHANGES if e != primary]
+
+    # ========== 갱신 ==========
+
+    def mark_verified(self, symbol: str, exchange: str):
+        """KIS 응답으로 확인된 거래소 코드 기록 (변경 시에만 저장)"""
+        code = to_kis_exchange(exchange)
+        if not code:
+            return
+        self._ensure_loaded()
+        key = normalize_symbol(symbol)
+        with self._lock:
+            if self._verified.get(key) == code:
+                return
+            previous = self._verified.get(key) or (self._symbols.get(key).exchange if key in self._symbols else "")
+            self._verified[key] = code
+            if previous and previous != code:
+                logger.info(f"거래소 코드 정정: {key} {previous} → {code}")
+            self._save()
+
+    def refresh(self):
+        """소스 목록으로 인덱스 재구성 (확인된 거래소 코드 유지)"""
+        with self._lock:
+            symbols: Dict[str, USSymbolInfo] = {}
+            for stock in self.source_loader():
+                key = normalize_symbol(stock.symbol)
+                info = symbols.get(key)
+                if info is None:
+                    symbols[key] = self._to_info(key, stock)
+                elif not info.exchange:
+                    # 앞선 소스에 거래소 정보가 없으면 보충
+                    info.exchange = to_kis_exchange(stock.exchange)
+
+            self._symbols = symbols
+            self._updated_at = datetime.now()
+            self._loaded = True
+            self._save()
+            logger.info(f"심볼 인덱스 구성: {len(symbols)}개 (확인된 거래소 {len(self._verified)}개)")
+
+    # ========== 내부 ==========
+
+    @staticmethod
+    def _to_info(key: str, stock) -> USSymbolInfo:
+        share_class = key.split(".", 1)[1] if "." in key else ""
+        if not share_class:
+            match = _CLASS_IN_NAME.search(stock.name or "")
+            share_class = match.group(1) if match else ""
+        return USSymbolInfo(
+            symbol=key,
+            name=stock.name or "",
+            sector=stock.sector or "",
+            industry=stock.industry or "",
+            exchange=to_kis_exchange(stock.exchange),
+            share_class=share_class,
+        )
+
+    def _ensure_loaded(self):
+        if self._loaded and self._updated_at and \
+                datetime.now() - self._updated_at <= timedelta(days=self.max_age_days):
+            return
+
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            if self._updated_at is None or \
+                    datetime.now() - self._updated_at > timedelta(days=self.max_age_days):
+                self.refresh()
+
+    def _load(self):
+        self._loaded = True
+        if not os.path.exists(self.index_file):
+            return
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self._symbols = {k: USSymbolInfo(**v) for k, v in data.get("symbols", {}).items()}
+            self._verified = data.get("verified", {})
+            self._updated_at = datetime.fromisoformat(data["updated_at"])
+        except Exception as e:
+            logger.warning(f"심볼 인덱스 로드 실패: {e}")
+            self._symbols, self._updated_at = {}, None
+
+    def _save(self):
+        data = {
+            "updated_at": (self._updated_at or datetime.now()).isoformat(),
+            "symbols": {k: asdict(v) for k, v in self._symbols.items()},
+            "verified": self._verified,
+        }
+        tmp_file = f"{self.index_file}.tmp"
+        try:
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_file, self.index_file)
+        except Exception as e:
+            logger.warning(f"심볼 인덱스 저장 실패: {e}")
@@ -13,8 +13,18 @@ from datetime import datetime, timedelta
 import pandas as pd
 import requests
 
+from src.utils.rate_limiter import RateLimiter
+from .us_history import USHistoryService, USPriceHistoryStore, PAGE_SIZE
+from .us_symbols import USSymbolIndex, INDEX_FILENAME
+
 logger = logging.getLogger(__name__)
 
+# Yahoo 초당 호출 한도 (스크리너 병렬 수집 시 공유, KIS 한도는 kis_us_client)
+YAHOO_TPS = 5.0
+
+# yf.download 1회당 최대 심볼 수
+YAHOO_BATCH_SIZE = 100
+
 
 @dataclass
 class USStock:
@@ -174,6 +184,7 @@ class USUniverseBuilder:
             os.path.dirname(__file__), "..", "..", "data", "universe"
         )
         os.makedirs(self.cache_dir, exist_ok=True)
+        self.symbol_index = USSymbolIndex(self.cache_dir, self._symbol_sources)
 
     def get_sp500_symbols(self) -> List[USStock]:
         """
@@ -231,15 +242,18 @@ class USUniverseBuilder:
             tables = pd.read_html(url)
             df = tables[0]
 
+            # Wikipedia 표에는 거래소 정보가 없으므로 심볼 인덱스(내장 목록 + 확인된 코드)에서 보충
+            exchange_names = {"NAS": "NASDAQ", "NYS": "NYSE", "AMS": "AMEX"}
             stocks = []
             for _, row in df.iterrows():
                 symbol = str(row['Symbol']).replace('.', '-')  # BRK.B -> BRK-B
+                info = self.symbol_index.get(symbol)
                 stocks.append(USStock(
                     symbol=symbol,
                     name=row.get('Security', ''),
                     sector=row.get('GICS Sector', ''),
                     industry=row.get('GICS Sub-Industry', ''),
-                    exchange='NYSE' if 'NYSE' in str(row.get('CIK', '')) else 'NASDAQ',
+                    exchange=exchange_names.get(info.exchange, '') if info else '',
                     market_cap=0
                 ))
 
@@ -263,6 +277,9 @@ class USUniverseBuilder:
         with open(cache_file, 'w', encoding='utf-8') as f:
             json.dump(data, f, ensure_ascii=False, indent=2)
 
+        # 새 소스 반영
+        self.symbol_index.refresh()
+
     def _load_cache(self, name: str, max_age_days: int = 7) -> Optional[List[USStock]]:
         """캐시 로드"""
         cache_file = os.path.join(self.cache_dir, f"{name}.json")
@@ -321,6 +338,17 @@ class USUniverseBuilder:
 
         return stocks[:size]
 
+    def _symbol_sources(self) -> List[USStock]:
+        """심볼 인덱스 소스 (내장 목록 우선, 이후 캐시된 유니버스)"""
+        stocks = self.get_nasdaq100_symbols()
+        for filename in sorted(os.listdir(self.cache_dir)):
+            if not filename.endswith(".json") or filename == INDEX_FILENAME:
+                continue
+            cached = self._load_cache(filename[:-5], max_age_days=36500)
+            if cached:
+                stocks.extend(cached)
+        return stocks
+
     def get_exchange_code(self, symbol: str) -> str:
         """
         종목의 거래소 코드 반환
@@ -329,28 +357,30 @@ class USUniverseBuilder:
             symbol: 종목 심볼
 
         Returns:
-            거래소 코드 (NAS, NYS, AMS)
+            거래소 코드 (NAS, NYS, AMS) - 확인된 코드 > 인덱스 > 기본값 NAS
         """
-        # 내장 목록에서 확인
-        for item in self.SP500_TOP_100 + self.NASDAQ_100_EXTRA:
-            if item[0] == symbol:
-                exchange = item[4]
-                return "NAS" if exchange == "NASDAQ" else "NYS"
-
-        # 기본값: NASDAQ
-        return "NAS"
+        return self.symbol_index.get_exchange_code(symbol)
 
 
 class USDataCollector:
     """미국 주식 데이터 수집기 (KIS API + Yahoo Finance)"""
 
-    def __init__(self, kis_client=None):
+    def __init__(
+        self,
+        kis_client=None,
+        history_store: USPriceHistoryStore = None,
+        universe_builder: USUniverseBuilder = None
+    ):
         """
         Args:
             kis_client: KISUSClient 인스턴스 (없으면 생성)
+            history_store: 일봉 로컬 저장소 (기본: data/history/us)
+            universe_builder: 유니버스/심볼 인덱스 공유 (없으면 생성)
         """
         self.kis_client = kis_client
-        self.universe_builder = USUniverseBuilder()
+        self.universe_builder = universe_builder or USUniverseBuilder()
+        self.yahoo_limiter = RateLimiter(rate=YAHOO_TPS, burst=2)
+        self.history = USHistoryService(self._fetch_daily_page, history_store)
 
     def _get_client(self):
         """클라이언트 lazy 초기화"""
@@ -360,51 +390,56 @@ class USDataCollector:
             self.kis_client = get_us_client(is_virtual=is_virtual)
         return self.kis_client
 
+    @property
+    def kis_limiter(self) -> RateLimiter:
+        """KIS Rate Limiter (클라이언트 계좌 유형별 공유 한도 - 주문 파이프라인과 같은 버킷)"""
+        return self._get_client().limiter
+
     def get_price_data(
         self,
         symbol: str,
         days: int = 100
     ) -> pd.DataFrame:
         """
-        종목의 가격 데이터 조회 (일봉)
+        종목의 가격 데이터 조회 (일봉, 수정주가)
+
+        로컬 저장소 우선, 부족한 구간만 KIS 페이지네이션으로 보충
+        (100건 제한 없이 12개월 모멘텀용 260일 이상 조회 가능)
 
         Args:
             symbol: 종목 심볼
-            days: 조회 일수
+            days: 조회 거래일 수
 
         Returns:
             DataFrame (date, open, high, low, close, volume)
         """
+        index = self.universe_builder.symbol_index
+        # 거래소 미확인 종목은 다른 거래소도 시도 (성공한 코드는 인덱스에 기록)
+        exchanges = [index.get_exchange_code(symbol)] if index.is_verified(symbol) \
+            else index.candidate_exchanges(symbol)
+
+        for exchange in exchanges:
+            try:
+                df = self.history.get_history(symbol, exchange, days)
+            except Exception as e:
+                logger.warning(f"가격 데이터 조회 실패 ({symbol}@{exchange}): {e}")
+                continue
+            if not df.empty:
+                index.mark_verified(symbol, exchange)
+                return df
+
+        return pd.DataFrame()
+
+    def _fetch_daily_page(self, symbol: str, exchange: str, bymd: str) -> list:
+        """KIS 기간별 시세 1페이지 (BYMD 이전 최대 100건, Rate Limiter 적용)"""
         client = self._get_client()
-        exchange = self.universe_builder.get_exchange_code(symbol)
-
-        try:
-            candles = client.get_daily_price(
-                symbol=symbol,
-                exchange=exchange,
-                count=days
-            )
-
-            if not candles:
-                return pd.DataFrame()
-
-            df = pd.DataFrame([{
-                'date': c.date,
-                'open': c.open,
-                'high': c.high,
-                'low': c.low,
-                'close': c.close,
-                'volume': c.volume
-            } for c in candles])
-
-            df['date'] = pd.to_datetime(df['date'])
-            df = df.sort_values('date').reset_index(drop=True)
-
-            return df
-
-        except Exception as e:
-            logger.warning(f"가격 데이터 조회 실패 ({symbol}): {e}")
-            return pd.DataFrame()
+        self.kis_limiter.acquire()
+        return client.get_daily_price(
+            symbol=symbol,
+            exchange=exchange,
+            count=PAGE_SIZE,
+            end_date=bymd
+        )
 
     def get_price_data_yahoo(
         self,
@@ -424,6 +459,7 @@ class USDataCollector:
         try:
             import yfinance as yf
 
+            self.yahoo_limiter.acquire()
             ticker = yf.Ticker(symbol)
             df = ticker.history(period=f"{days}d")
 
@@ -443,6 +479,80 @@ class USDataCollector:
             logger.warning(f"Yahoo Finance 조회 실패 ({symbol}): {e}")
             return pd.DataFrame()
 
+    def get_price_data_yahoo_batch(
+        self,
+        symbols: List[str],
+        days: int = 100
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Yahoo Finance 일괄 가격 조회 (yf.download, KIS 실패 종목 폴백용)
+
+        Args:
+            symbols: 종목 심볼 리스트
+            days: 조회 일수
+
+        Returns:
+            {symbol: DataFrame(date, open, high, low, close, volume)} - 빈 데이터 종목 제외
+        """
+        if not symbols:
+            return {}
+
+        try:
+            import yfinance as yf
+        except ImportError:
+            logger.warning("yfinance 라이브러리가 설치되지 않았습니다. pip install yfinance")
+            return {}
+
+        result = {}
+        for i in range(0, len(symbols), YAHOO_BATCH_SIZE):
+            chunk = symbols[i:i + YAHOO_BATCH_SIZE]
+            try:
+                self.yahoo_limiter.acquire()
+                raw = yf.download(
+                    tickers=chunk,
+                    period=f"{days}d",
+                    group_by="ticker",
+                    auto_adjust=True,  # 분할/배당 조정 (Ticker.history, KIS 경로와 동일 기준)
+                    threads=True,
+                    progress=False
+                )
+            except Exception as e:
+                logger.warning(f"Yahoo Finance 일괄 조회 실패 ({len(chunk)}개): {e}")
+                continue
+
+            if raw is None or raw.empty:
+                continue
+
+            for symbol in chunk:
+                df = self._extract_yahoo_frame(raw, symbol)
+                if not df.empty:
+                    result[symbol] = df
+
+        logger.info(f"Yahoo Finance 일괄 조회: {len(result)}/{len(symbols)}개")
+        return result
+
+    @staticmethod
+    def _extract_yahoo_frame(raw: pd.DataFrame, symbol: str) -> pd.DataFrame:
+        """yf.download 결과(MultiIndex 컬럼)에서 단일 종목 추출"""
+        if isinstance(raw.columns, pd.MultiIndex):
+            if symbol not in raw.columns.get_level_values(0):
+                return pd.DataFrame()
+            df = raw[symbol]
+        else:
+            df = raw
+
+        df = df.dropna(how="all")
+        if df.empty:
+            return pd.DataFrame()
+
+        df = df.reset_index()
+        df.columns = [str(c).lower() for c in df.columns]
+        df = df.rename(columns={'index': 'date'})
+        if not {'date', 'open', 'high', 'low', 'close', 'volume'}.issubset(df.columns):
+            return pd.DataFrame()
+
+        return df[['date', 'open', 'high', 'low', 'close', 'volume']].reset_index(drop=True)
+
     def get_fundamental_data(self, symbol: str) -> Dict[str, Any]:
         """
         종목의 펀더멘털 데이터 조회
@@ -457,6 +567,7 @@ class USDataCollector:
         exchange = self.universe_builder.get_exchange_code(symbol)
 
         try:
+            self.kis_limiter.acquire()
             detail = client.get_stock_price_detail(symbol, exchange)
             return detail
         except Exception as e:
@@ -476,6 +587,7 @@ class USDataCollector:
         try:
             import yfinance as yf
 
+            self.yahoo_limiter.acquire()
             ticker = yf.Ticker(symbol)
             info = ticker.info
 
@@ -0,0 +1,201 @@
+"""
+미국 주식 주문 파이프라인
+
+리밸런싱 주문을 단계별로 병렬 처리
+- 시세: 후보 종목 현재가 병렬 조회 (완료 순으로 스트리밍)
+- 주문: Rate Limiter 적용 배치 제출 (호출 측에서 매도 → 매수 순으로 배치 구성)
+- 체결: 백그라운드 스레드에서 당일 주문내역 폴링으로 체결 확인 후 콜백
+"""
+
+import time
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from src.api.kis_client import OrderResult
+from src.utils.rate_limiter import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+# 체결 확인 폴링 간격 / 최대 대기 (초)
+FILL_POLL_SEC = 5.0
+FILL_TIMEOUT_SEC = 300.0
+
+
+@dataclass
+class FillReport:
+    """체결 확인 결과"""
+    filled: List[str] = field(default_factory=list)                    # 전량 체결 종목
+    partial: Dict[str, Tuple[int, int]] = field(default_factory=dict)  # 종목 → (체결, 주문)
+    unfilled: List[str] = field(default_factory=list)                  # 미체결 종목
+    elapsed_sec: float = 0.0                                           # 제출 → 확인 완료
+
+    @property
+    def complete(self) -> bool:
+        return not self.partial and not self.unfilled
+
+
+class USOrderPipeline:
+    """미국 주식 시세 조회 / 주문 제출 / 체결 확인 파이프라인"""
+
+    def __init__(self, client, max_workers: int = 8, limiter: RateLimiter = None):
+        """
+        Args:
+            client: KISUSClient
+            max_workers: 병렬 호출 스레드 수
+            limiter: KIS Rate Limiter (없으면 client.limiter - 계좌 유형별 공유 한도)
+        """
+        self.client = client
+        self.max_workers = max(1, max_workers)
+        self.limiter = limiter or client.limiter
+        self._fill_thread: Optional[threading.Thread] = None
+
+    # ========== 시세 ==========
+
+    def stream_quotes(self, symbols: Dict[str, str]) -> Iterator[Tuple[str, Optional[float]]]:
+        """
+        현재가 병렬 조회, 완료 순서대로 산출
+
+        Args:
+            symbols: 종목 → 거래소 코드
+
+        Yields:
+            (종목, 현재가) - 조회 실패 시 현재가 None
+        """
+        if not symbols:
+            return
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="us-quote") as executor:
+            futures = {
+                executor.submit(self._quote, symbol, exchange): symbol
+                for symbol, exchange in symbols.items()
+            }
+            for future in as_completed(futures):
+                symbol = futures[future]
+                try:
+                    price = future.result()
+                except Exception as e:
+                    logger.warning(f"시세 조회 실패 ({symbol}): {e}")
+                    price = None
+                yield symbol, price
+
+    def fetch_quotes(self, symbols: Dict[str, str]) -> Dict[str, float]:
+        """현재가 병렬 조회 (실패 종목 제외)"""
+        return {symbol: price for symbol, price in self.stream_quotes(symbols) if price}
+
+    def _quote(self, symbol: str, exchange: str) -> Optional[float]:
+        self.limiter.acquire()
+        price = self.client.get_stock_price(symbol, exchange).price
+        return price if price > 0 else None
+
+    # ========== 주문 ==========
+
+    def submit(self, orders: list) -> List[Tuple[object, OrderResult]]:
+        """
+        주문 배치 병렬 제출 (Rate Limiter 적용)
+
+        Args:
+            orders: USPendingOrder 리스트
+
+        Returns:
+            [(주문, 결과)] - 입력 순서 유지
+        """
+        if not orders:
+            return []
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="us-order") as executor:
+            results = list(executor.map(self._submit_one, orders))
+
+        return list(zip(orders, results))
+
+    def _submit_one(self, order) -> OrderResult:
+        self.limiter.acquire()
+        place = self.client.buy_stock if order.side == "BUY" else self.client.sell_stock
+        try:
+            return place(
+                symbol=order.symbol,
+                qty=order.qty,
+                price=order.price,
+                exchange=order.exchange
+            )
+        except Exception as e:
+            return OrderResult(success=False, order_no="", message=str(e))
+
+    # ========== 체결 확인 ==========
+
+    def confirm_fills(
+        self,
+        submitted: List[Tuple[object, OrderResult]],
+        on_complete: Callable[[FillReport], None],
+        timeout: float = FILL_TIMEOUT_SEC,
+        interval: float = FILL_POLL_SEC
+    ) -> Optional[threading.Thread]:
+        """
+        체결 확인 백그라운드 시작 (전량 체결 또는 타임아웃 시 on_complete 호출)
+
+        Args:
+            submitted: submit() 결과 중 접수 성공 건
+            on_complete: 체결 확인 결과 콜백 (백그라운드 스레드에서 호출)
+            timeout: 최대 대기 시간 (초)
+            interval: 주문내역 폴링 간격 (초)
+
+        Returns:
+            확인 스레드 (접수 건이 없으면 None)
+        """
+        orders = {
+            self._normalize_order_no(result.order_no): order
+            for order, result in submitted
+            if result.success and result.order_no
+        }
+        if not orders:
+            return None
+
+        self._fill_thread = threading.Thread(
+            target=self._confirm_loop,
+            args=(orders, on_complete, timeout, interval),
+            name="USFillConfirm",
+            daemon=True
+        )
+        self._fill_thread.start()
+        return self._fill_thread
+
+    def _confirm_loop(self, orders: dict, on_complete, timeout: float, interval: float):
+        started = time.monotonic()
+        filled_qty: Dict[str, int] = {}
+
+        while True:
+            try:
+                self.limiter.acquire()
+                for item in self.client.get_order_history():
+                    order_no = self._normalize_order_no(item.get("order_no", ""))
+                    if order_no in orders:
+                        filled_qty[order_no] = item.get("filled_qty", 0)
+            except Exception as e:
+                logger.warning(f"체결 확인 조회 실패: {e}")
+
+            done = all(filled_qty.get(no, 0) >= order.qty for no, order in orders.items())
+            if done or time.monotonic() - started >= timeout:
+                break
+            time.sleep(interval)
+
+        report = FillReport(elapsed_sec=time.monotonic() - started)
+        for order_no, order in orders.items():
+            qty = filled_qty.get(order_no, 0)
+            if qty >= order.qty:
+                report.filled.append(order.symbol)
+            elif qty > 0:
+                report.partial[order.symbol] = (qty, order.qty)
+            else:
+                report.unfilled.append(order.symbol)
+
+        try:
+            on_complete(report)
+        except Exception as e:
+            logger.error(f"체결 확인 콜백 오류: {e}", exc_info=True)
+
+    @staticmethod
+    def _normalize_order_no(order_no: str) -> str:
+        """주문번호 0 패딩 차이 제거 (주문 응답 / 주문내역 조회 간)"""
+        return str(order_no).lstrip("0")
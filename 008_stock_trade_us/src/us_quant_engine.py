@@ -9,6 +9,7 @@ import json
 import logging
 import schedule
 import time
+import threading
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field, asdict
 from typing import List, Dict, Any, Optional
@@ -121,6 +122,10 @@ class USMarketHours:
         return False
 
 
+# 실주문 청산 실패 시 재시도 최소 간격 (초) - 틱마다 재주문 방지
+EXIT_RETRY_SEC = 30
+
+
 # ========== 설정 ==========
 
 @dataclass
@@ -137,8 +142,13 @@ class USQuantEngineConfig:
     # 리스크 관리
     stop_loss_pct: float = 7.0
     take_profit_pct: float = 10.0
+    trailing_stop_pct: float = 0.0  # 최고가 대비 하락률 (0이면 미사용)
     max_position_pct: float = 10.0  # 종목당 최대 비중
 
+    # 주문
+    order_price_buffer_pct: float = 0.5  # 지정가 = 현재가 ± 버퍼 (즉시 체결용)
+    fill_confirm_timeout_sec: int = 300  # 체결 확인 최대 대기
+
     # 팩터 가중치
     momentum_weight: float = 0.20
     short_mom_weight: float = 0.10
@@ -159,6 +169,9 @@ class USQuantEngineConfig:
     screening_minutes_before: int = 30
     monitoring_interval_minutes: int = 10
 
+    # 실시간 체결가(WebSocket) 모니터링 - 스트림 비정상 시 REST 폴링 폴백
+    realtime_monitoring: bool = True
+
 
 @dataclass
 class USPosition:
@@ -171,6 +184,7 @@ class USPosition:
     profit_pct: float = 0.0
     exchange: str = "NAS"
     entry_date: str = ""
+    highest_price: float = 0.0  # 보유 중 최고가 (트레일링 스탑 기준)
 
 
 @dataclass
@@ -182,6 +196,7 @@ class USPendingOrder:
     price: float
     exchange: str = "NAS"
     reason: str = ""
+    amount: float = 0.0  # 매수 목표 금액 (USD, 주문 직전 현재가로 수량 재계산)
 
 
 # ========== 퀀트 엔진 ==========
@@ -207,6 +222,17 @@ class USQuantTradingEngine:
         self.pending_orders: List[USPendingOrder] = []
         self.last_screening_result: List[Dict] = []
         self.last_screening_time: Optional[datetime] = None
+        self.screener = None  # 마지막 스크리닝의 스크리너 (팩터 테이블 보관)
+
+        # 실시간 모니터 (소비자 스레드)와 포지션 공유
+        self._position_lock = threading.RLock()
+        self._exit_triggered: Dict[str, float] = {}  # symbol → 청산 발동 시각
+        self.realtime = None
+        self.client = None
+        self.order_pipeline = None
+
+        from src.us_realtime_monitor import LatencyStats
+        self.exit_latency = LatencyStats()  # 시세 수신 → 주문 제출
 
         # 데이터 디렉토리
         self.data_dir = os.path.join(
@@ -220,15 +246,35 @@ class USQuantTradingEngine:
         logger.info(f"미국 퀀트 엔진 초기화 완료 (모의투자: {is_virtual})")
 
     def _get_client(self):
-        """KIS US 클라이언트 반환"""
-        from src.api.kis_us_client import get_us_client
-        return get_us_client(self.is_virtual)
+        """KIS US 클라이언트 반환 (세션/토큰/Rate Limiter 공유를 위해 재사용)"""
+        if self.client is None:
+            from src.api.kis_us_client import get_us_client
+            self.client = get_us_client(self.is_virtual)
+        return self.client
+
+    def _get_account(self):
+        """계좌 스냅샷 서비스 반환 (잔고/환율 TTL 캐시, 엔진 클라이언트로 조회)"""
+        from src.api.us_account_snapshot import get_account_snapshot
+        return get_account_snapshot(self.is_virtual, self._get_client().get_balance)
+
+    def _get_order_pipeline(self):
+        """주문 파이프라인 반환 (Rate Limiter 공유를 위해 재사용)"""
+        if self.order_pipeline is None:
+            from src.us_order_pipeline import USOrderPipeline
+            self.order_pipeline = USOrderPipeline(self._get_client())
+        return self.order_pipeline
 
     def _get_screener(self):
         """스크리너 반환"""
-        from src.strategy.us_screener import USMultiFactorScreener, USFactorWeights
+        from src.strategy.us_screener import USMultiFactorScreener
+
+        return USMultiFactorScreener(weights=self._get_weights())
+
+    def _get_weights(self):
+        """설정의 팩터 가중치"""
+        from src.strategy.us_screener import USFactorWeights
 
-        weights = USFactorWeights(
+        return USFactorWeights(
             momentum_weight=self.config.momentum_weight,
             short_mom_weight=self.config.short_mom_weight,
             volatility_weight=self.config.volatility_weight,
@@ -236,8 +282,6 @@ class USQuantTradingEngine:
             value_weight=self.config.value_weight
         )
 
-        return USMultiFactorScreener(weights=weights)
-
     def _get_notifier(self):
         """텔레그램 알림 반환"""
         try:
@@ -279,10 +323,13 @@ class USQuantTradingEngine:
         if self._is_market_just_opened(kst_now):
             self.execute_pending_orders()
 
-        # 장 중 모니터링
+        # 장 중 모니터링 (실시간 스트림 정상이면 REST 폴링 생략)
         if USMarketHours.is_market_open(kst_now):
-            if self._should_monitor(kst_now):
+            self._start_realtime()
+            if self._should_monitor(kst_now) and not self._is_streaming():
                 self.monitor_positions()
+        else:
+            self._stop_realtime()
 
     def _should_run_screening(self, kst_now: datetime) -> bool:
         """스크리닝 실행 여부"""
@@ -310,6 +357,27 @@ class USQuantTradingEngine:
 
         return False
 
+    def _start_realtime(self):
+        """실시간 모니터링 시작 (설정 시, 이미 동작 중이면 무시)"""
+        if not self.config.realtime_monitoring:
+            return
+        try:
+            if self.realtime is None:
+                from src.us_realtime_monitor import USRealtimeMonitor
+                self.realtime = USRealtimeMonitor(self, self.is_virtual)
+            if not self.realtime.is_running:
+                self.realtime.start()
+        except Exception as e:
+            logger.warning(f"실시간 모니터링 시작 실패 (폴링 유지): {e}")
+
+    def _stop_realtime(self):
+        """실시간 모니터링 정지 (장 마감)"""
+        if self.realtime is not None and self.realtime.is_running:
+            self.realtime.stop()
+
+    def _is_streaming(self) -> bool:
+        return self.realtime is not None and self.realtime.is_streaming
+
     def _should_monitor(self, kst_now: datetime) -> bool:
         """모니터링 실행 여부"""
         return kst_now.minute % self.config.monitoring_interval_minutes == 0
@@ -328,22 +396,11 @@ class USQuantTradingEngine:
                 universe_size=self.config.universe_size,
                 target_count=self.config.target_stock_count
             )
+            # 팩터 테이블 보관 (rescore_screening()에서 재조회 없이 재채점)
+            self.screener = screener
 
             # 결과 저장
-            self.last_screening_result = [
-                {
-                    "symbol": r.symbol,
-                    "name": r.name,
-                    "score": r.composite_score,
-                    "momentum": r.momentum_score,
-                    "volatility": r.volatility_score,
-                    "value": r.value_score,
-                    "return_12m": r.return_12m,
-                    "sector": r.sector,
-                    "exchange": r.exchange
-                }
-                for r in results
-            ]
+            self.last_screening_result = self._to_result_dicts(results)
             self.last_screening_time = get_kst_now()
 
             # 주문 생성
@@ -370,6 +427,42 @@ class USQuantTradingEngine:
             self._notify(f"❌ 스크리닝 실패: {e}")
             return []
 
+    def rescore_screening(self) -> List[Dict]:
+        """
+        현재 설정 가중치/목표 종목 수로 마지막 스크리닝 재채점 (데이터 재조회/주문 생성 없음)
+
+        Returns:
+            재채점 결과 (스크리닝 이력이 없으면 빈 리스트)
+        """
+        if self.screener is None:
+            return []
+
+        results = self.screener.rescore(
+            weights=self._get_weights(),
+            target_count=self.config.target_stock_count
+        )
+        self.last_screening_result = self._to_result_dicts(results)
+        self._save_state()
+        return self.last_screening_result
+
+    @staticmethod
+    def _to_result_dicts(results: list) -> List[Dict]:
+        """팩터 점수 → 저장/표시용 딕셔너리"""
+        return [
+            {
+                "symbol": r.symbol,
+                "name": r.name,
+                "score": r.composite_score,
+                "momentum": r.momentum_score,
+                "volatility": r.volatility_score,
+                "value": r.value_score,
+                "return_12m": r.return_12m,
+                "sector": r.sector,
+                "exchange": r.exchange
+            }
+            for r in results
+        ]
+
     def _generate_orders(self, screening_results: list):
         """스크리닝 결과로 주문 생성"""
         self.pending_orders = []
@@ -392,29 +485,40 @@ class USQuantTradingEngine:
                     reason="리밸런싱 매도"
                 ))
 
-        # 매수 대상 (목표에 있지만 보유 안함)
+        # 매수 대상 (목표에 있지만 보유 안함) - 현재가 병렬 조회, 도착 순으로 수량 산정
         capital_per_stock = self.config.total_capital / self.config.target_stock_count
+        buy_targets = {
+            r.symbol: r.exchange for r in screening_results if r.symbol not in current_symbols
+        }
+
+        buys = {}
+        for symbol, price in self._get_order_pipeline().stream_quotes(buy_targets):
+            # 시세 조회 실패 시 수량 0 (장 시작 시 현재가로 재계산)
+            qty = int(capital_per_stock / price) if price else 0
+            if price and qty == 0:
+                logger.info(f"매수 제외 (1주 가격 ${price:,.2f} > 종목당 금액): {symbol}")
+                continue
+            buys[symbol] = USPendingOrder(
+                symbol=symbol,
+                side="BUY",
+                qty=qty,
+                price=0,  # 주문 직전 현재가로 지정
+                exchange=buy_targets[symbol],
+                reason="리밸런싱 매수",
+                amount=capital_per_stock
+            )
 
-        for result in screening_results:
-            if result.symbol not in current_symbols:
-                # 예상 가격으로 수량 계산 (실제 주문 시 갱신)
-                estimated_price = 100.0  # 임시값
-                qty = int(capital_per_stock / estimated_price)
-
-                if qty > 0:
-                    self.pending_orders.append(USPendingOrder(
-                        symbol=result.symbol,
-                        side="BUY",
-                        qty=qty,
-                        price=0,  # 시장가
-                        exchange=result.exchange,
-                        reason="리밸런싱 매수"
-                    ))
+        # 스크리닝 순위 순서 유지
+        self.pending_orders.extend(buys[s] for s in buy_targets if s in buys)
 
         logger.info(f"주문 생성: {len(self.pending_orders)}개")
 
     def execute_pending_orders(self):
-        """대기 주문 실행"""
+        """
+        대기 주문 실행 (장 시작 시)
+
+        현재가 병렬 조회 → 수량/지정가 산정 → 매도·매수 배치 제출 → 체결 확인(비동기)
+        """
         if not self.pending_orders:
             logger.info("실행할 대기 주문 없음")
             return
@@ -428,46 +532,85 @@ class USQuantTradingEngine:
             self.pending_orders = []
             return
 
-        client = self._get_client()
-        executed = []
+        started = time.monotonic()
+        pipeline = self._get_order_pipeline()
 
-        for order in self.pending_orders:
-            try:
-                if order.side == "BUY":
-                    result = client.buy_stock(
-                        symbol=order.symbol,
-                        qty=order.qty,
-                        price=order.price,
-                        exchange=order.exchange
-                    )
-                else:
-                    result = client.sell_stock(
-                        symbol=order.symbol,
-                        qty=order.qty,
-                        price=order.price,
-                        exchange=order.exchange
-                    )
-
-                if result.success:
-                    executed.append(order)
-                    logger.info(f"주문 성공: {order.side} {order.symbol} x{order.qty}")
-                else:
-                    logger.warning(f"주문 실패: {order.symbol} - {result.message}")
+        quotes = pipeline.fetch_quotes({o.symbol: o.exchange for o in self.pending_orders})
+        orders = self._price_orders(self.pending_orders, quotes)
 
-            except Exception as e:
-                logger.error(f"주문 실행 오류 ({order.symbol}): {e}")
+        # 매도 먼저 제출 (자금 확보), 체결 대기 없이 매수 제출
+        submitted = pipeline.submit([o for o in orders if o.side == "SELL"])
+        submitted += pipeline.submit([o for o in orders if o.side == "BUY"])
 
-        # 포지션 갱신
-        self._update_positions()
+        executed = []
+        for order, result in submitted:
+            if result.success:
+                executed.append(order)
+                logger.info(f"주문 접수: {order.side} {order.symbol} x{order.qty} @ ${order.price:,.2f}")
+            else:
+                logger.warning(f"주문 실패: {order.symbol} - {result.message}")
 
-        # 실행된 주문 제거
+        # 접수된 주문 제거 (시세 없음/실패 주문은 대기 유지)
         self.pending_orders = [o for o in self.pending_orders if o not in executed]
 
         self._save_state()
-        self._notify(f"✅ 주문 실행 완료: {len(executed)}개 성공")
+        elapsed = time.monotonic() - started
+        logger.info(f"주문 제출 완료: {len(executed)}/{len(submitted)}개 ({elapsed:.1f}초)")
+        self._notify(f"✅ 주문 접수 완료: {len(executed)}개 성공 ({elapsed:.1f}초)")
+
+        if pipeline.confirm_fills(
+            submitted,
+            on_complete=self._on_fills_confirmed,
+            timeout=self.config.fill_confirm_timeout_sec
+        ) is None:
+            self._get_account().invalidate()
+            self._update_positions()
+
+    def _price_orders(self, orders: List[USPendingOrder], quotes: Dict[str, float]) -> List[USPendingOrder]:
+        """
+        현재가로 지정가/매수 수량 산정
+
+        Returns:
+            주문 가능한 주문 리스트 (시세 없음/수량 0 제외)
+        """
+        buffer = self.config.order_price_buffer_pct / 100
+        priced = []
+
+        for order in orders:
+            price = quotes.get(order.symbol)
+            if not price:
+                logger.warning(f"시세 없음 → 주문 보류: {order.symbol}")
+                continue
+
+            if order.side == "BUY":
+                if order.amount > 0:
+                    order.qty = int(order.amount / price)
+                order.price = round(price * (1 + buffer), 2)
+            else:
+                order.price = round(price * (1 - buffer), 2)
+
+            if order.qty > 0:
+                priced.append(order)
+
+        return priced
+
+    def _on_fills_confirmed(self, report):
+        """체결 확인 완료 (백그라운드 스레드) → 포지션 갱신"""
+        self._get_account().invalidate()
+        self._update_positions()
+
+        msg = f"📬 체결 확인 ({report.elapsed_sec:.0f}초)\n"
+        msg += f"• 체결: {len(report.filled)}개\n"
+        if report.partial:
+            msg += "• 부분체결: " + ", ".join(
+                f"{s} {filled}/{qty}" for s, (filled, qty) in report.partial.items()
+            ) + "\n"
+        if report.unfilled:
+            msg += f"• 미체결: {', '.join(report.unfilled)}"
+        self._notify(msg.rstrip())
 
     def monitor_positions(self):
-        """포지션 모니터링"""
+        """포지션 모니터링 (REST 폴링)"""
         if not self.positions:
             return
 
@@ -475,64 +618,138 @@ class USQuantTradingEngine:
 
         client = self._get_client()
 
-        for pos in self.positions:
+        for symbol, exchange in self.get_position_exchanges().items():
             try:
-                price_info = client.get_stock_price(pos.symbol, pos.exchange)
-                pos.current_price = price_info.price
+                price_info = client.get_stock_price(symbol, exchange)
+                self.evaluate_price(symbol, price_info.price, received_at=time.time())
+            except Exception as e:
+                logger.warning(f"모니터링 실패 ({symbol}): {e}")
 
-                if pos.avg_price > 0:
-                    pos.profit_pct = (pos.current_price / pos.avg_price - 1) * 100
+    def get_position_exchanges(self) -> Dict[str, str]:
+        """보유 종목 → 거래소 코드"""
+        with self._position_lock:
+            return {p.symbol: p.exchange for p in self.positions}
 
-                # 손절/익절 체크
-                if pos.profit_pct <= -self.config.stop_loss_pct:
-                    self._execute_stop_loss(pos)
-                elif pos.profit_pct >= self.config.take_profit_pct:
-                    self._execute_take_profit(pos)
+    def evaluate_price(self, symbol: str, price: float, received_at: float = None) -> bool:
+        """
+        시세 1건으로 손절/익절/트레일링 스탑 평가 (실시간 틱 / REST 폴링 공용)
 
-            except Exception as e:
-                logger.warning(f"모니터링 실패 ({pos.symbol}): {e}")
+        Args:
+            symbol: 종목코드
+            price: 현재가 (USD)
+            received_at: 시세 수신 시각 (time.time(), 주문 제출 지연 측정용)
+
+        Returns:
+            상태 변경 여부 (최고가 갱신 또는 청산 발동)
+        """
+        with self._position_lock:
+            pos = next((p for p in self.positions if p.symbol == symbol), None)
+            if pos is None or price <= 0:
+                return False
+
+            pos.current_price = price
+            if pos.avg_price > 0:
+                pos.profit_pct = (price / pos.avg_price - 1) * 100
 
-    def _execute_stop_loss(self, pos: USPosition):
+            changed = price > pos.highest_price
+            if changed:
+                pos.highest_price = price
+
+            reason = self._exit_reason(pos)
+            if reason is None or not self._can_trigger_exit(symbol):
+                return changed
+            self._exit_triggered[symbol] = time.time()
+
+        if reason == "손절":
+            self._execute_stop_loss(pos, received_at)
+        elif reason == "익절":
+            self._execute_take_profit(pos, received_at)
+        else:
+            self._execute_trailing_stop(pos, received_at)
+        return True
+
+    def _exit_reason(self, pos: USPosition) -> Optional[str]:
+        """청산 사유 (해당 없으면 None)"""
+        if pos.profit_pct <= -self.config.stop_loss_pct:
+            return "손절"
+        if pos.profit_pct >= self.config.take_profit_pct:
+            return "익절"
+        trailing = self.config.trailing_stop_pct
+        if trailing > 0 and pos.highest_price > pos.avg_price > 0:
+            if pos.current_price <= pos.highest_price * (1 - trailing / 100):
+                return "트레일링"
+        return None
+
+    def _can_trigger_exit(self, symbol: str) -> bool:
+        """
+        청산 중복 발동 방지
+        - 모의 실행(dry_run): 포지션 갱신 전까지 1회만 알림
+        - 실주문: 주문 실패 시 EXIT_RETRY_SEC 후 재시도
+        """
+        last = self._exit_triggered.get(symbol)
+        if last is None:
+            return True
+        if self.config.dry_run:
+            return False
+        return time.time() - last >= EXIT_RETRY_SEC
+
+    def _execute_stop_loss(self, pos: USPosition, received_at: float = None):
         """손절 실행"""
         logger.warning(f"손절 발동: {pos.symbol} ({pos.profit_pct:.1f}%)")
+        self._submit_exit(pos, received_at)
         self._notify(f"🔴 손절: {pos.symbol} ({pos.profit_pct:.1f}%)")
 
-        if not self.config.dry_run:
-            client = self._get_client()
-            result = client.sell_stock(
-                symbol=pos.symbol,
-                qty=pos.qty,
-                price=0,
-                exchange=pos.exchange
-            )
-            if result.success:
-                self.positions.remove(pos)
-                self._save_state()
-
-    def _execute_take_profit(self, pos: USPosition):
+    def _execute_take_profit(self, pos: USPosition, received_at: float = None):
         """익절 실행"""
         logger.info(f"익절 발동: {pos.symbol} ({pos.profit_pct:.1f}%)")
+        self._submit_exit(pos, received_at)
         self._notify(f"🟢 익절: {pos.symbol} (+{pos.profit_pct:.1f}%)")
 
-        if not self.config.dry_run:
-            client = self._get_client()
-            result = client.sell_stock(
-                symbol=pos.symbol,
-                qty=pos.qty,
-                price=0,
-                exchange=pos.exchange
-            )
-            if result.success:
-                self.positions.remove(pos)
-                self._save_state()
+    def _execute_trailing_stop(self, pos: USPosition, received_at: float = None):
+        """트레일링 스탑 실행"""
+        drawdown = (pos.current_price / pos.highest_price - 1) * 100
+        logger.info(f"트레일링 스탑 발동: {pos.symbol} (고점 대비 {drawdown:.1f}%)")
+        self._submit_exit(pos, received_at)
+        self._notify(
+            f"🟡 트레일링 스탑: {pos.symbol} (고점 ${pos.highest_price:,.2f} 대비 {drawdown:.1f}%, "
+            f"수익 {pos.profit_pct:+.1f}%)"
+        )
+
+    def _submit_exit(self, pos: USPosition, received_at: float = None):
+        """시장가 전량 매도 (알림보다 먼저 제출), 제출 지연 기록"""
+        if self.config.dry_run:
+            self._record_exit_latency(received_at)
+            return
+
+        client = self._get_client()
+        result = client.sell_stock(
+            symbol=pos.symbol,
+            qty=pos.qty,
+            price=0,
+            exchange=pos.exchange
+        )
+        self._record_exit_latency(received_at)
+        if result.success:
+            self._get_account().invalidate()
+            with self._position_lock:
+                if pos in self.positions:
+                    self.positions.remove(pos)
+            self._save_state()
+
+    def _record_exit_latency(self, received_at: Optional[float]):
+        if received_at is not None:
+            self.exit_latency.record((time.time() - received_at) * 1000)
 
     def _update_positions(self):
         """포지션 갱신"""
         try:
-            client = self._get_client()
-            balance = client.get_balance()
+            snapshot = self._get_account().get()
+            if snapshot.stale:
+                # 갱신 실패 시 이전(체결 전) 스냅샷 → 방금 청산한 포지션이 되살아나지 않도록 유지
+                logger.warning(f"포지션 갱신 보류 - 잔고 스냅샷 stale: {snapshot.error}")
+                return
 
-            self.positions = [
+            positions = [
                 USPosition(
                     symbol=s.symbol,
                     name=s.name,
@@ -543,9 +760,18 @@ class USQuantTradingEngine:
                     exchange=s.exchange,
                     entry_date=datetime.now().strftime("%Y-%m-%d")
                 )
-                for s in balance.get("stocks", [])
+                for s in snapshot.stocks
             ]
 
+            with self._position_lock:
+                # 기존 최고가 유지, 청산된 종목의 발동 기록 정리
+                highest = {p.symbol: p.highest_price for p in self.positions}
+                for p in positions:
+                    p.highest_price = max(highest.get(p.symbol, 0.0), p.current_price)
+                self.positions = positions
+                held = {p.symbol for p in positions}
+                self._exit_triggered = {k: v for k, v in self._exit_triggered.items() if k in held}
+
             self._save_state()
 
         except Exception as e:
@@ -555,8 +781,10 @@ class USQuantTradingEngine:
 
     def _save_state(self):
         """상태 저장"""
+        with self._position_lock:
+            positions = [asdict(p) for p in self.positions]
         state = {
-            "positions": [asdict(p) for p in self.positions],
+            "positions": positions,
             "pending_orders": [asdict(o) for o in self.pending_orders],
             "last_screening_result": self.last_screening_result,
             "last_screening_time": self.last_screening_time.isoformat() if self.last_screening_time else None,
@@ -615,7 +843,10 @@ class USQuantTradingEngine:
             "pending_orders_count": len(self.pending_orders),
             "last_screening": self.last_screening_time.strftime("%Y-%m-%d %H:%M") if self.last_screening_time else "없음",
             "dry_run": self.config.dry_run,
-            "is_virtual": self.is_virtual
+            "is_virtual": self.is_virtual,
+            "realtime": self.realtime.get_status() if self.realtime else None,
+            "exit_latency": self.exit_latency.summary(),
+            "account": self._get_account().status()
         }
 
     def get_positions(self) -> List[Dict]:
@@ -0,0 +1,337 @@
+"""
+미국 주식 실시간 포지션 모니터링 모듈
+
+KIS WebSocket 해외주식 체결가(HDFSCNT0) 구독으로 틱마다 손절/익절/트레일링 스탑 평가
+- 보유 종목 자동 구독/해제 (포지션 변경 시 재구독)
+- 전용 소비자 스레드에서 규칙 평가 (WebSocket 수신 스레드는 큐 적재만)
+- 하트비트(PINGPONG 포함 마지막 수신 시각) 감시, 끊김 시 백오프 재연결
+- 스트림 비정상 동안은 엔진의 REST 폴링(monitor_positions)으로 폴백
+- 틱 수신 → 주문 제출 지연 지표
+"""
+
+import time
+import queue
+import logging
+import threading
+from collections import deque
+from typing import Callable, Dict, Optional, Set
+
+from src.api.kis_websocket import KISWebSocket, RealtimeOverseasPrice
+
+logger = logging.getLogger(__name__)
+
+# KIS WebSocket 세션당 실시간 등록 한도
+MAX_SUBSCRIPTIONS = 40
+
+# 구독 목록 재동기화 주기 (초)
+RESYNC_INTERVAL_SEC = 10
+
+# 상태 저장 최소 간격 (초)
+SAVE_INTERVAL_SEC = 5
+
+# 재연결 대기 (초, 지수 백오프 상한)
+RECONNECT_BASE_SEC = 5
+RECONNECT_MAX_SEC = 120
+
+# 수신 메시지 없음 허용 시간 (초) - 서버 PINGPONG도 끊기면 연결 이상으로 보고 재연결
+HEARTBEAT_TIMEOUT_SEC = 90
+
+# 수신 틱 없음 허용 시간 (초) - 초과 시 스트림 비정상으로 간주하고 폴링 병행
+STALE_TICK_SEC = 180
+
+
+class LatencyStats:
+    """지연 시간 통계 (최근 N건)"""
+
+    def __init__(self, maxlen: int = 1000):
+        self._samples: deque = deque(maxlen=maxlen)
+        self._lock = threading.Lock()
+        self.count = 0
+
+    def record(self, latency_ms: float):
+        with self._lock:
+            self._samples.append(latency_ms)
+            self.count += 1
+
+    def summary(self) -> dict:
+        """건수 / 평균 / p95 / 최대 (ms)"""
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return {"count": self.count, "avg_ms": 0.0, "p95_ms": 0.0, "max_ms": 0.0}
+        p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+        return {
+            "count": self.count,
+            "avg_ms": round(sum(samples) / len(samples), 1),
+            "p95_ms": round(p95, 1),
+            "max_ms": round(samples[-1], 1),
+        }
+
+
+class USRealtimeMonitor:
+    """WebSocket 기반 미국 주식 실시간 포지션 모니터"""
+
+    def __init__(
+        self,
+        engine,
+        is_virtual: bool,
+        ws_factory: Optional[Callable[[], KISWebSocket]] = None
+    ):
+        """
+        Args:
+            engine: USQuantTradingEngine (포지션 조회 / 청산 규칙 평가 위임)
+            is_virtual: 모의투자 여부
+            ws_factory: WebSocket 생성 함수 (테스트용 주입)
+        """
+        self.engine = engine
+        self.is_virtual = is_virtual
+        self._ws_factory = ws_factory or (lambda: KISWebSocket(is_virtual=is_virtual))
+
+        self.ws: Optional[KISWebSocket] = None
+        # (수신 시각, RealtimeOverseasPrice)
+        self._ticks: queue.Queue = queue.Queue()
+        self._consumer: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+
+        # symbol → exchange
+        self._subscribed: Dict[str, str] = {}
+        self._sub_lock = threading.Lock()  # 엔진 스레드/소비자 스레드 동시 동기화 방지
+        self._last_resync = 0.0
+        self._last_save = 0.0
+        self._dirty = False
+        self._reconnect_delay = RECONNECT_BASE_SEC
+        self._next_reconnect = 0.0
+
+        # 지표
+        self.tick_count = 0
+        self.last_tick_at = 0.0
+        self.subscribed_at = 0.0   # 마지막 신규 구독 시각 (틱 미수신 staleness 기준)
+        self.reconnect_count = 0
+        self.queue_latency = LatencyStats()
+
+    # ========== 시작/정지 ==========
+
+    def start(self):
+        """실시간 모니터링 시작 (장 시작 시)"""
+        if self._consumer and self._consumer.is_alive():
+            return
+
+        self._stop_event.clear()
+        self._connect()
+
+        self._consumer = threading.Thread(
+            target=self._consume_loop, name="USRealtimeMonitor", daemon=True
+        )
+        self._consumer.start()
+        logger.info("미국 실시간 포지션 모니터링 시작")
+
+    def stop(self):
+        """실시간 모니터링 정지 (장 마감 시)"""
+        self._stop_event.set()
+        if self._consumer:
+            self._consumer.join(timeout=5)
+            self._consumer = None
+
+        self._disconnect()
+        self._flush_state(force=True)
+        latency = self.queue_latency.summary()
+        logger.info(
+            f"미국 실시간 포지션 모니터링 정지 (수신 틱 {self.tick_count}건, "
+            f"처리 지연 p95 {latency['p95_ms']:.0f}ms)"
+        )
+
+    @property
+    def is_running(self) -> bool:
+        return self._consumer is not None and self._consumer.is_alive()
+
+    @property
+    def is_streaming(self) -> bool:
+        """스트리밍 정상 여부 (False면 REST 폴링 모니터링 필요)"""
+        if not self.is_running:
+            return False
+        if self.ws is None or not self.ws.is_connected:
+            return False
+        # 보유 종목을 구독 중인데 장시간 틱이 없으면 스트림 이상으로 판단
+        # (구독 후 틱을 한 번도 못 받은 경우 구독 시각부터 계산)
+        if self._subscribed:
+            since = max(self.last_tick_at, self.subscribed_at)
+            return time.time() - since < STALE_TICK_SEC
+        return True
+
+    def get_status(self) -> dict:
+        """모니터 상태"""
+        return {
+            "streaming": self.is_streaming,
+            "subscribed": sorted(self._subscribed),
+            "tick_count": self.tick_count,
+            "last_tick_at": self.last_tick_at,
+            "reconnect_count": self.reconnect_count,
+            "queue_size": self._ticks.qsize(),
+            "queue_latency": self.queue_latency.summary(),
+        }
+
+    # ========== 연결 관리 ==========
+
+    def _connect(self):
+        """WebSocket 연결 (실패 시 다음 재연결 시각 예약)"""
+        try:
+            self.ws = self._ws_factory()
+            self.ws.connect(on_overseas_price=self._on_price, on_error=self._on_error)
+            self._subscribed.clear()
+            self._last_resync = 0.0
+        except Exception as e:
+            logger.warning(f"미국 실시간 시세 연결 실패 (폴링 유지): {e}")
+            self.ws = None
+            self._schedule_reconnect()
+
+    def _disconnect(self):
+        if self.ws:
+            try:
+                self.ws.disconnect()
+            except Exception as e:
+                logger.debug(f"WebSocket 종료 오류: {e}")
+        self.ws = None
+        self._subscribed.clear()
+
+    def _schedule_reconnect(self):
+        self._next_reconnect = time.time() + self._reconnect_delay
+        self._reconnect_delay = min(self._reconnect_delay * 2, RECONNECT_MAX_SEC)
+
+    def _heartbeat_lost(self) -> bool:
+        last = getattr(self.ws, "last_message_at", 0.0)
+        return bool(last) and time.time() - last > HEARTBEAT_TIMEOUT_SEC
+
+    def _ensure_connected(self) -> bool:
+        """연결 끊김 / 하트비트 단절 감지 및 재연결 (백오프)"""
+        if self.ws is not None and self.ws.is_connected:
+            if not self._heartbeat_lost():
+                self._reconnect_delay = RECONNECT_BASE_SEC
+                return True
+            logger.warning(f"미국 실시간 시세 하트비트 {HEARTBEAT_TIMEOUT_SEC}초 단절 → 재연결")
+            self._disconnect()
+            self._next_reconnect = 0.0
+
+        if self.ws is not None and self.ws.ws_thread and self.ws.ws_thread.is_alive():
+            # 연결 수립 대기 중
+            return False
+
+        if time.time() < self._next_reconnect:
+            return False
+
+        logger.info("미국 실시간 시세 재연결 시도")
+        self.reconnect_count += 1
+        self._disconnect()
+        self._connect()
+        if self.ws is not None:
+            self._schedule_reconnect()
+        return False
+
+    # ========== 구독 관리 ==========
+
+    def sync_subscriptions(self):
+        """보유 종목 기준 구독 목록 동기화 (신규 구독 / 청산 종목 해제)"""
+        if self.ws is None or not self.ws.is_connected:
+            return
+
+        held = self.engine.get_position_exchanges()
+
+        with self._sub_lock:
+            self._sync_subscriptions(held)
+
+    def _sync_subscriptions(self, held: Dict[str, str]):
+        if len(held) > MAX_SUBSCRIPTIONS:
+            logger.warning(
+                f"보유 {len(held)}종목 > 실시간 등록 한도 {MAX_SUBSCRIPTIONS} "
+                f"→ 초과분은 폴링으로만 감시"
+            )
+        wanted = dict(list(held.items())[:MAX_SUBSCRIPTIONS])
+
+        for symbol, exchange in list(self._subscribed.items()):
+            if wanted.get(symbol) == exchange:
+                continue
+            try:
+                self.ws.unsubscribe_overseas_price(symbol, exchange)
+            except Exception as e:
+                logger.debug(f"[{symbol}] 구독 해제 실패: {e}")
+            self._subscribed.pop(symbol, None)
+
+        for symbol, exchange in wanted.items():
+            if symbol in self._subscribed:
+                continue
+            try:
+                self.ws.subscribe_overseas_price(symbol, exchange)
+                self._subscribed[symbol] = exchange
+                self.subscribed_at = time.time()
+            except Exception as e:
+                logger.warning(f"[{symbol}] 실시간 체결가 구독 실패: {e}")
+
+        self._last_resync = time.time()
+
+    # ========== 틱 처리 ==========
+
+    def _on_price(self, tick: RealtimeOverseasPrice):
+        """WebSocket 수신 스레드 콜백 - 큐 적재만 수행"""
+        self._ticks.put((time.time(), tick))
+
+    def _on_error(self, error: Exception):
+        logger.warning(f"미국 실시간 시세 오류: {error}")
+
+    def _drain_latest(self, first) -> Dict[str, tuple]:
+        """큐에 쌓인 틱을 종목별 최신 1건으로 병합"""
+        latest = {first[1].symbol: first}
+        while True:
+            try:
+                item = self._ticks.get_nowait()
+            except queue.Empty:
+                break
+            latest[item[1].symbol] = item
+        return latest
+
+    def _consume_loop(self):
+        """소비자 스레드: 틱 → 규칙 평가"""
+        while not self._stop_event.is_set():
+            if self._ensure_connected() and time.time() - self._last_resync >= RESYNC_INTERVAL_SEC:
+                self.sync_subscriptions()
+
+            try:
+                first = self._ticks.get(timeout=1.0)
+            except queue.Empty:
+                self._flush_state()
+                continue
+
+            for symbol, (received_at, tick) in self._drain_latest(first).items():
+                self._handle_tick(symbol, received_at, tick)
+
+            self._flush_state()
+
+    def _handle_tick(self, symbol: str, received_at: float, tick: RealtimeOverseasPrice):
+        self.tick_count += 1
+        self.last_tick_at = received_at
+        self.queue_latency.record((time.time() - received_at) * 1000)
+
+        if symbol not in self._subscribed or tick.price <= 0:
+            return
+
+        try:
+            changed = self.engine.evaluate_price(symbol, tick.price, received_at=received_at)
+        except Exception as e:
+            logger.error(f"실시간 모니터링 오류 ({symbol}): {e}", exc_info=True)
+            return
+
+        if changed:
+            self._dirty = True
+            # 포지션 변경 가능 → 다음 루프에서 즉시 재구독
+            self._last_resync = 0.0
+
+    def _flush_state(self, force: bool = False):
+        """변경된 상태를 주기적으로 저장 (틱마다 저장 방지)"""
+        if not self._dirty:
+            return
+        if not force and time.time() - self._last_save < SAVE_INTERVAL_SEC:
+            return
+        try:
+            self.engine._save_state()
+        except Exception as e:
+            logger.error(f"상태 저장 실패: {e}")
+        self._dirty = False
+        self._last_save = time.time()
@@ -1 +1,4 @@
 # Utils module - 유틸리티 함수
+from .rate_limiter import RateLimiter
+
+__all__ = ['RateLimiter']
@@ -0,0 +1,31 @@
+"""
+공용 테스트 픽스처
+"""
+
+import pytest
+import sys
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.us_quant_engine import USQuantTradingEngine, USQuantEngineConfig
+
+
+@pytest.fixture
+def make_engine(tmp_path):
+    """
+    엔진 생성 함수 (저장 상태 미로드, data_dir=tmp_path, 알림 Mock)
+
+    사용: make_engine(take_profit_pct=50.0) - 인자는 USQuantEngineConfig 덮어쓰기 (기본 dry_run=False)
+    클라이언트/계좌 주입은 각 테스트 모듈에서
+    """
+    def make(**config) -> USQuantTradingEngine:
+        with patch.object(USQuantTradingEngine, "_load_state"):
+            engine = USQuantTradingEngine(USQuantEngineConfig(**{"dry_run": False, **config}))
+        engine.data_dir = str(tmp_path)
+        engine._notify = Mock()
+        return engine
+
+    return make
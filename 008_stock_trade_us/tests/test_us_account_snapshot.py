@@ -0,0 +1,140 @@
+"""
+미국 계좌 스냅샷 서비스 테스트
+"""
+
+import pytest
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import Mock
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.api.kis_us_client import USStockBalance
+from src.api.us_account_snapshot import USAccountSnapshotService, DEFAULT_EXCHANGE_RATE
+
+
+def _balance(cash_usd=1_000.0, exchange_rate=1380.0, stocks=None):
+    return {
+        "stocks": stocks or [],
+        "total_eval": 0.0,
+        "total_profit": 0.0,
+        "cash_usd": cash_usd,
+        "cash_krw": cash_usd * exchange_rate,
+        "exchange_rate": exchange_rate
+    }
+
+
+class TestUSAccountSnapshotService:
+
+    def test_served_from_memory_within_ttl(self):
+        fetch = Mock(return_value=_balance())
+        service = USAccountSnapshotService(fetch, ttl_sec=60)
+
+        service.get_balance()
+        service.get_balance()
+        assert service.get_exchange_rate() == 1380.0
+
+        assert fetch.call_count == 1
+        assert service.hit_count == 2
+        assert not service.is_stale
+
+    def test_expired_refetches(self):
+        fetch = Mock(return_value=_balance())
+        service = USAccountSnapshotService(fetch, ttl_sec=60)
+
+        service.get()
+        service.get(max_age=0)
+
+        assert fetch.call_count == 2
+
+    def test_concurrent_readers_share_one_fetch(self):
+        def slow_fetch():
+            time.sleep(0.1)
+            return _balance()
+
+        fetch = Mock(side_effect=slow_fetch)
+        service = USAccountSnapshotService(fetch)
+        threads = [threading.Thread(target=service.get) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert fetch.call_count == 1
+
+    def test_invalidate_refreshes_balance_but_keeps_fx(self):
+        fetch = Mock(side_effect=[_balance(cash_usd=1_000.0), _balance(cash_usd=400.0)])
+        service = USAccountSnapshotService(fetch)
+        service.get()
+
+        service.invalidate()
+
+        assert service.is_stale
+        assert service.get_exchange_rate() == 1380.0
+        assert fetch.call_count == 1
+        assert service.get().cash_usd == 400.0
+        assert fetch.call_count == 2
+
+    def test_failed_refresh_serves_stale_snapshot(self):
+        fetch = Mock(side_effect=[_balance(), RuntimeError("rate limit")])
+        service = USAccountSnapshotService(fetch)
+        service.get()
+
+        snapshot = service.get(max_age=0)
+
+        assert snapshot.stale
+        assert snapshot.cash_usd == 1_000.0
+        assert service.status()["stale"] is True
+        assert service.status()["error"] == "rate limit"
+
+    def test_first_fetch_failure(self):
+        service = USAccountSnapshotService(Mock(side_effect=RuntimeError("down")))
+
+        with pytest.raises(RuntimeError):
+            service.get()
+        assert service.get_exchange_rate() == DEFAULT_EXCHANGE_RATE
+
+
+class TestEngineAccount:
+
+    @pytest.fixture
+    def engine(self, make_engine):
+        engine = make_engine()
+        stocks = [USStockBalance("AAPL", "Apple", 3, 180.0, 190.0, 30.0, 5.5, "NASD")]
+        self.fetch = Mock(return_value=_balance(stocks=stocks))
+        engine._get_account = Mock(return_value=USAccountSnapshotService(self.fetch))
+        return engine
+
+    def test_positions_and_status_share_snapshot(self, engine):
+        engine._update_positions()
+        status = engine.get_status()
+
+        assert [p.symbol for p in engine.positions] == ["AAPL"]
+        assert status["account"]["exchange_rate"] == 1380.0
+        assert self.fetch.call_count == 1
+
+    def test_fill_confirmation_invalidates(self, engine):
+        engine._update_positions()
+
+        engine._on_fills_confirmed(Mock(elapsed_sec=1, filled=["AAPL"], partial={}, unfilled=[]))
+
+        assert self.fetch.call_count == 2
+
+    def test_stale_snapshot_keeps_positions(self, engine):
+        """체결 후 잔고 갱신 실패 → 체결 전 스냅샷으로 포지션을 덮어쓰지 않음"""
+        engine._update_positions()
+        engine.positions = []  # AAPL 매도 완료
+        self.fetch.side_effect = RuntimeError("rate limit")
+
+        engine._get_account().invalidate()
+        engine._update_positions()
+
+        assert engine.positions == []
+        assert engine._get_account().is_stale
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
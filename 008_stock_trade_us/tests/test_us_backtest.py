@@ -0,0 +1,205 @@
+"""
+미국 패널 백테스트 테스트
+"""
+
+import pytest
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.strategy.us_backtest import (
+    USBacktestConfig, USPanelBacktester, USPricePanel, membership_from_changes
+)
+from src.strategy.us_history import USPriceHistoryStore
+from src.strategy.us_screener import USMultiFactorScreener, USFactorWeights
+from src.strategy.us_universe import USStock, USUniverseBuilder
+from src.strategy.quant.backtest import OrderSide
+
+
+def _frame(dates, closes, volume=2_000_000) -> pd.DataFrame:
+    closes = np.asarray(closes, dtype=float)
+    return pd.DataFrame({
+        'date': dates,
+        'open': closes,
+        'high': closes * 1.005,
+        'low': closes * 0.995,
+        'close': closes,
+        'volume': np.full(len(closes), volume),
+    })
+
+
+def _random_frames(n_symbols: int, days: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range(end="2026-01-30", periods=days)
+    frames = {}
+    for i in range(n_symbols):
+        drift = rng.uniform(-0.0005, 0.001)
+        vol = rng.uniform(0.005, 0.03)
+        closes = 50 * np.cumprod(1 + drift + rng.normal(0, vol, days))
+        frames[f"S{i:03d}"] = _frame(dates, closes)
+    return dates, frames
+
+
+@pytest.fixture
+def screener(tmp_path):
+    screener = USMultiFactorScreener()
+    screener.universe_builder = USUniverseBuilder(cache_dir=str(tmp_path))
+    return screener
+
+
+class TestFactorTable:
+    """패널 팩터 = 스크리너 종목별 팩터"""
+
+    def test_matches_screener_factor_row(self, screener):
+        dates, frames = _random_frames(8, 300)
+        # 짧은 상장 이력 종목 (수익률 대체 규칙 확인)
+        frames["NEW"] = _frame(dates[-100:], np.linspace(10, 12, 100))
+        panel = USPricePanel(frames)
+        backtester = USPanelBacktester(screener=screener)
+
+        t = len(panel.dates) - 1
+        table = backtester.factor_table(panel, t, np.ones(len(panel.symbols), dtype=bool)).set_index('symbol')
+
+        for symbol, df in frames.items():
+            expected = screener._factor_row(USStock(symbol, symbol, "", "", "NASDAQ", 0), df.tail(260), {})
+            row = table.loc[symbol]
+            for col in ('return_1m', 'return_3m', 'return_6m', 'return_12m', 'volatility'):
+                assert row[col] == pytest.approx(expected[col], rel=1e-9, abs=1e-9), (symbol, col)
+            assert int(row['avg_volume']) == expected['avg_volume']
+
+    def test_uses_only_past_data(self, screener):
+        dates, frames = _random_frames(5, 300)
+        panel = USPricePanel(frames)
+        backtester = USPanelBacktester(screener=screener)
+        t = 200
+        before = backtester.factor_table(panel, t, np.ones(5, dtype=bool))
+
+        panel.close[t + 1:] *= 3  # 미래 가격 변경
+        after = backtester.factor_table(panel, t, np.ones(5, dtype=bool))
+
+        pd.testing.assert_frame_equal(before, after)
+
+    def test_asof_fundamentals(self, screener):
+        dates, frames = _random_frames(2, 300)
+        panel = USPricePanel(frames)
+        fundamentals = pd.DataFrame([
+            {"symbol": "S000", "date": dates[100], "per": 10.0, "pbr": 1.0, "market_cap": 5.0, "dividend_yield": 1.0},
+            {"symbol": "S000", "date": dates[250], "per": 30.0, "pbr": 3.0, "market_cap": 6.0, "dividend_yield": 2.0},
+        ])
+        backtester = USPanelBacktester(screener=screener)
+        prepared = backtester._prepare_fundamentals(fundamentals)
+
+        table = backtester.factor_table(panel, 200, np.ones(2, dtype=bool), prepared).set_index('symbol')
+
+        assert table.loc["S000", 'per'] == 10.0
+        assert table.loc["S001", 'per'] == 0.0
+
+
+class TestMembership:
+
+    def test_from_changes(self):
+        changes = pd.DataFrame([
+            {"date": "2024-06-01", "added": "NEW", "removed": "OLD"},
+            {"date": "2023-01-01", "added": "MID", "removed": ""},
+        ])
+
+        result = membership_from_changes(["AAA", "NEW", "MID"], changes).set_index('symbol')
+
+        assert result.loc["NEW", 'start'] == pd.Timestamp("2024-06-01")
+        assert pd.isna(result.loc["NEW", 'end'])
+        assert pd.isna(result.loc["OLD", 'start'])
+        assert result.loc["OLD", 'end'] == pd.Timestamp("2024-06-01")
+        assert result.loc["MID", 'start'] == pd.Timestamp("2023-01-01")
+        assert pd.isna(result.loc["AAA", 'start'])
+
+    def test_non_member_never_selected(self, screener):
+        dates, frames = _random_frames(6, 400)
+        panel = USPricePanel(frames)
+        membership = pd.DataFrame([
+            {"symbol": s, "start": pd.NaT, "end": pd.NaT} for s in panel.symbols if s != "S000"
+        ])
+        backtester = USPanelBacktester(USBacktestConfig(target_count=3), screener=screener)
+
+        result = backtester.run(panel, dates[300], membership=membership)
+
+        assert all("S000" not in held for held in result.holdings.values())
+
+
+class TestSimulation:
+
+    def test_monthly_rebalance_and_equity(self, screener):
+        dates, frames = _random_frames(20, 500)
+        panel = USPricePanel(frames)
+        backtester = USPanelBacktester(USBacktestConfig(target_count=5), screener=screener)
+
+        result = backtester.run(panel, dates[300])
+
+        assert result.rebalance_dates[0] == dates[300].to_pydatetime()
+        assert all(
+            a.month != b.month for a, b in zip(result.rebalance_dates, result.rebalance_dates[1:])
+        )
+        snapshots = result.usd.daily_snapshots
+        assert len(snapshots) == 200
+        assert result.usd.final_value == pytest.approx(snapshots[-1].total_value)
+        assert all(s.cash >= 0 for s in snapshots)
+        assert any(t.side == OrderSide.BUY for t in result.usd.trades)
+
+    def test_stop_loss_fill(self, screener):
+        """손절가 하회 시 손절가(갭 하락은 시가)에 청산"""
+        dates = pd.bdate_range(end="2026-01-30", periods=320)
+        closes = np.concatenate([np.linspace(100, 110, 300), np.full(20, 90.0)])
+        frames = {"AAA": _frame(dates, closes)}
+        panel = USPricePanel(frames)
+        config = USBacktestConfig(target_count=1, max_position_size=1.0, slippage_rate=0, commission_rate=0)
+        backtester = USPanelBacktester(config, screener=screener)
+
+        result = backtester.run(panel, dates[299], dates[305])
+
+        sells = [t for t in result.usd.trades if t.side == OrderSide.SELL]
+        assert len(sells) == 1
+        assert sells[0].reason == "손절"
+        assert sells[0].date == dates[300].to_pydatetime()
+        # 시가 90 < 손절가 102.3 → 시가 체결
+        assert sells[0].price == pytest.approx(90.0)
+        assert result.usd.daily_snapshots[-1].position_count == 0
+
+    def test_krw_conversion(self, screener):
+        dates, frames = _random_frames(10, 400)
+        panel = USPricePanel(frames)
+        fx = pd.Series(np.linspace(1300, 1400, len(dates)), index=dates)
+        backtester = USPanelBacktester(USBacktestConfig(target_count=5), screener=screener)
+
+        result = backtester.run(panel, dates[300], fx_rates=fx)
+
+        assert result.fx_start == pytest.approx(fx.iloc[300])
+        assert result.krw.initial_capital == pytest.approx(100_000 * fx.iloc[300])
+        expected = (1 + result.usd.total_return / 100) * (1 + result.fx_return / 100) - 1
+        assert result.krw.total_return == pytest.approx(expected * 100)
+
+    def test_store_panel_speed(self, screener, tmp_path):
+        """5년 × 500종목 월간 리밸런싱"""
+        dates, frames = _random_frames(500, 1260 + 260, seed=1)
+        store = USPriceHistoryStore(str(tmp_path / "history"))
+        for symbol, df in frames.items():
+            store.save(symbol, df)
+
+        started = time.monotonic()
+        panel = USPricePanel.from_store(store)
+        sectors = {s: f"Sector{i % 11}" for i, s in enumerate(frames)}
+        result = USPanelBacktester(screener=screener).run(panel, dates[260], sectors=sectors)
+
+        assert len(panel.symbols) == 500
+        assert len(result.rebalance_dates) == dates[260:].to_period("M").nunique()
+        assert max(len(held) for held in result.holdings.values()) == 15
+        assert time.monotonic() - started < 60
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
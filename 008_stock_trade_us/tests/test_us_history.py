@@ -0,0 +1,123 @@
+"""
+미국 주식 일봉 히스토리 서비스 테스트
+"""
+
+import pytest
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pandas as pd
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.api.kis_us_client import USDailyCandle
+from src.strategy import us_history
+from src.strategy.us_history import USHistoryService, USPriceHistoryStore, PAGE_SIZE
+
+
+class FakeKIS:
+    """KIS 기간별 시세 대체 - BYMD 이전 최대 100건 (최신순)"""
+
+    def __init__(self, listed_days: int = 2000, scale: float = 1.0):
+        end = datetime.now().date()
+        self.days = list(pd.bdate_range(end=end, periods=listed_days).date)
+        self.scale = scale
+        self.calls = []
+
+    def fetch_page(self, symbol, exchange, bymd):
+        self.calls.append(bymd)
+        limit = datetime.strptime(bymd, "%Y%m%d").date()
+        eligible = [d for d in self.days if d <= limit][-PAGE_SIZE:]
+        return [
+            USDailyCandle(
+                date=d.strftime("%Y%m%d"),
+                open=100.0 + i, high=101.0 + i, low=99.0 + i,
+                close=(100.0 + self.days.index(d)) * self.scale, volume=1_000_000
+            )
+            for i, d in enumerate(reversed(eligible))
+        ]
+
+
+class TestUSHistoryService:
+    """페이지네이션 + 로컬 저장소"""
+
+    def test_paginates_beyond_single_page(self, tmp_path):
+        """100건 제한을 넘는 기간을 역방향 페이지로 수집"""
+        kis = FakeKIS()
+        service = USHistoryService(kis.fetch_page, USPriceHistoryStore(str(tmp_path)))
+
+        df = service.get_history("AAPL", "NAS", 260)
+
+        assert len(df) == 260
+        assert df['date'].is_monotonic_increasing
+        assert df['date'].is_unique
+        assert len(kis.calls) >= 3
+
+    def test_second_call_uses_store(self, tmp_path):
+        """저장 후 재조회는 네트워크 호출 없음"""
+        kis = FakeKIS()
+        store = USPriceHistoryStore(str(tmp_path))
+        USHistoryService(kis.fetch_page, store).get_history("AAPL", "NAS", 260)
+        calls = len(kis.calls)
+
+        df = USHistoryService(kis.fetch_page, store).get_history("AAPL", "NAS", 260)
+
+        assert len(kis.calls) == calls
+        assert len(df) == 260
+        assert store.symbols() == ["AAPL"]
+
+    def test_topup_fetches_single_page(self, tmp_path, monkeypatch):
+        """보충 주기 경과 시 최신 1페이지만 조회"""
+        kis = FakeKIS()
+        store = USPriceHistoryStore(str(tmp_path))
+        USHistoryService(kis.fetch_page, store).get_history("AAPL", "NAS", 260)
+        calls = len(kis.calls)
+
+        monkeypatch.setattr(us_history, "TOPUP_INTERVAL", -1)
+        USHistoryService(kis.fetch_page, store).get_history("AAPL", "NAS", 260)
+
+        assert len(kis.calls) == calls + 1
+
+    def test_backfills_older_range_only(self, tmp_path):
+        """더 긴 기간 요청 시 부족한 과거 구간만 추가 수집"""
+        kis = FakeKIS()
+        store = USPriceHistoryStore(str(tmp_path))
+        service = USHistoryService(kis.fetch_page, store)
+        service.get_history("AAPL", "NAS", 100)
+
+        df = service.get_history("AAPL", "NAS", 500)
+
+        assert len(df) == 500
+        assert df['date'].is_unique
+
+    def test_short_listing_marked_exhausted(self, tmp_path):
+        """상장 기간이 짧으면 과거 조회를 반복하지 않음"""
+        kis = FakeKIS(listed_days=150)
+        store = USPriceHistoryStore(str(tmp_path))
+        service = USHistoryService(kis.fetch_page, store)
+
+        assert len(service.get_history("NEW", "NYS", 260)) == 150
+        calls = len(kis.calls)
+        service.get_history("NEW", "NYS", 260)
+
+        assert len(kis.calls) == calls
+        assert store.load("NEW")["exhausted"] is True
+
+    def test_adjustment_change_triggers_refetch(self, tmp_path, monkeypatch):
+        """수정주가 변경(분할) 감지 시 전체 재수집"""
+        store = USPriceHistoryStore(str(tmp_path))
+        USHistoryService(FakeKIS().fetch_page, store).get_history("AAPL", "NAS", 260)
+
+        monkeypatch.setattr(us_history, "TOPUP_INTERVAL", -1)
+        split = FakeKIS(scale=0.25)
+        df = USHistoryService(split.fetch_page, store).get_history("AAPL", "NAS", 260)
+
+        assert len(split.calls) >= 3
+        assert df['close'].iloc[-1] == pytest.approx((100.0 + len(split.days) - 1) * 0.25)
+        assert df['close'].iloc[0] == pytest.approx((100.0 + len(split.days) - 260) * 0.25)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,190 @@
+"""
+미국 주식 주문 파이프라인 테스트
+"""
+
+import pytest
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import Mock
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.api.kis_client import OrderResult
+from src.strategy.us_screener import USFactorScore
+from src.us_order_pipeline import USOrderPipeline, FillReport
+from src.us_quant_engine import USPosition, USPendingOrder
+from src.utils.rate_limiter import RateLimiter
+
+
+class FakeUSClient:
+    """KISUSClient 대역 (호출 기록, 지연 주입)"""
+
+    is_virtual = True
+
+    def __init__(self, prices: dict, delay: float = 0.0):
+        self.prices = prices
+        self.delay = delay
+        self.calls = []
+        self.history = []
+        self._lock = threading.Lock()
+        self._order_no = 0
+
+    def get_stock_price(self, symbol, exchange="NAS"):
+        time.sleep(self.delay)
+        if symbol not in self.prices:
+            raise ValueError("no quote")
+        return Mock(price=self.prices[symbol])
+
+    def _place(self, side, symbol, qty, price, exchange):
+        time.sleep(self.delay)
+        with self._lock:
+            self.calls.append((side, symbol, qty, price))
+            self._order_no += 1
+            return OrderResult(success=True, order_no=f"{self._order_no:010d}", message="")
+
+    def buy_stock(self, symbol, qty, price=0, exchange="NAS"):
+        return self._place("BUY", symbol, qty, price, exchange)
+
+    def sell_stock(self, symbol, qty, price=0, exchange="NAS"):
+        return self._place("SELL", symbol, qty, price, exchange)
+
+    def get_order_history(self):
+        return self.history
+
+
+def _fast_pipeline(client) -> USOrderPipeline:
+    return USOrderPipeline(client, max_workers=8, limiter=RateLimiter(rate=1000, burst=100))
+
+
+def _score(symbol: str) -> USFactorScore:
+    return USFactorScore(symbol=symbol, name=symbol, sector="", exchange="NAS")
+
+
+class TestUSOrderPipeline:
+
+    def test_quotes_fetched_concurrently(self):
+        client = FakeUSClient({f"S{i}": 10.0 + i for i in range(8)}, delay=0.2)
+        pipeline = _fast_pipeline(client)
+
+        started = time.monotonic()
+        quotes = pipeline.fetch_quotes({f"S{i}": "NAS" for i in range(8)})
+
+        assert quotes == {f"S{i}": 10.0 + i for i in range(8)}
+        assert time.monotonic() - started < 0.2 * 8 / 2
+
+    def test_failed_quote_yields_none(self):
+        pipeline = _fast_pipeline(FakeUSClient({"AAPL": 190.0}))
+
+        result = dict(pipeline.stream_quotes({"AAPL": "NAS", "MISSING": "NYS"}))
+
+        assert result == {"AAPL": 190.0, "MISSING": None}
+
+    def test_submit_respects_rate_limit(self):
+        client = FakeUSClient({})
+        pipeline = USOrderPipeline(client, max_workers=8, limiter=RateLimiter(rate=20, burst=1))
+        orders = [USPendingOrder(f"S{i}", "BUY", 1, 10.0) for i in range(6)]
+
+        started = time.monotonic()
+        submitted = pipeline.submit(orders)
+
+        assert [o.symbol for o, _ in submitted] == [o.symbol for o in orders]
+        assert all(r.success for _, r in submitted)
+        # 최초 1건 후 초당 20건
+        assert time.monotonic() - started >= 5 / 20 * 0.9
+
+    def test_defaults_to_client_limiter(self):
+        """limiter 미지정 시 새 버킷을 만들지 않고 클라이언트 공유 한도 사용"""
+        client = FakeUSClient({})
+        client.limiter = RateLimiter(rate=2, burst=1)
+
+        assert USOrderPipeline(client).limiter is client.limiter
+
+    def test_confirm_fills_report(self):
+        client = FakeUSClient({})
+        pipeline = _fast_pipeline(client)
+        orders = [USPendingOrder(s, "BUY", 10, 10.0) for s in ("AAA", "BBB", "CCC")]
+        submitted = pipeline.submit(orders)
+        order_no = {o.symbol: r.order_no for o, r in submitted}
+        client.history = [
+            {"order_no": order_no["AAA"], "filled_qty": 10},
+            # 주문내역 조회는 0 패딩 없이 반환되는 경우
+            {"order_no": order_no["BBB"].lstrip("0"), "filled_qty": 4},
+        ]
+        reports = []
+
+        thread = pipeline.confirm_fills(submitted, reports.append, timeout=0.1, interval=0.02)
+        thread.join(timeout=2)
+
+        report = reports[0]
+        assert report.filled == ["AAA"]
+        assert report.partial == {"BBB": (4, 10)}
+        assert report.unfilled == ["CCC"]
+        assert not report.complete
+
+    def test_confirm_fills_stops_when_all_filled(self):
+        client = FakeUSClient({})
+        pipeline = _fast_pipeline(client)
+        submitted = pipeline.submit([USPendingOrder("AAA", "BUY", 5, 10.0)])
+        client.history = [{"order_no": "1", "filled_qty": 5}]
+        reports = []
+
+        pipeline.confirm_fills(submitted, reports.append, timeout=30, interval=0.01).join(timeout=2)
+
+        assert reports[0].complete
+        assert reports[0].elapsed_sec < 1
+
+
+class TestEnginePipeline:
+
+    @pytest.fixture
+    def engine(self, make_engine):
+        engine = make_engine(total_capital=10_000, target_stock_count=2)
+        engine._update_positions = Mock()
+        client = FakeUSClient({"AAPL": 200.0, "KO": 60.0, "OLD": 50.0})
+        engine._get_client = Mock(return_value=client)
+        engine.order_pipeline = _fast_pipeline(client)
+        return engine
+
+    def test_generate_orders_sizes_from_quotes(self, engine):
+        engine.positions = [USPosition("OLD", "Old", 7, 40.0)]
+
+        engine._generate_orders([_score("AAPL"), _score("KO")])
+
+        orders = {o.symbol: o for o in engine.pending_orders}
+        assert orders["OLD"].side == "SELL"
+        assert orders["AAPL"].qty == 25
+        assert orders["KO"].qty == 83
+        assert [o.symbol for o in engine.pending_orders] == ["OLD", "AAPL", "KO"]
+
+    def test_execute_prices_and_submits_sells_first(self, engine):
+        engine.pending_orders = [
+            USPendingOrder("AAPL", "BUY", 0, 0, amount=5_000),
+            USPendingOrder("OLD", "SELL", 7, 0),
+            USPendingOrder("NOQUOTE", "BUY", 0, 0, amount=5_000),
+        ]
+        engine.order_pipeline.client.prices["AAPL"] = 250.0
+        engine.config.fill_confirm_timeout_sec = 0
+        filled = threading.Event()
+        engine._on_fills_confirmed = lambda report: filled.set()
+
+        engine.execute_pending_orders()
+
+        assert engine.order_pipeline.client.calls == [
+            ("SELL", "OLD", 7, round(50.0 * 0.995, 2)),
+            ("BUY", "AAPL", 20, round(250.0 * 1.005, 2)),
+        ]
+        assert [o.symbol for o in engine.pending_orders] == ["NOQUOTE"]
+        assert filled.wait(timeout=2)
+
+    def test_fill_report_refreshes_positions(self, engine):
+        engine._on_fills_confirmed(FillReport(filled=["AAPL"], unfilled=["KO"], elapsed_sec=3))
+
+        engine._update_positions.assert_called_once()
+        assert "미체결: KO" in engine._notify.call_args[0][0]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,258 @@
+"""
+미국 실시간 포지션 모니터링 테스트
+"""
+
+import pytest
+import sys
+import time
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.api.kis_websocket import KISWebSocket, RealtimeOverseasPrice
+from src.us_quant_engine import USPosition
+from src.us_realtime_monitor import (
+    USRealtimeMonitor, LatencyStats, HEARTBEAT_TIMEOUT_SEC, STALE_TICK_SEC
+)
+
+
+def _overseas_record(symbol: str, price: float, exchange: str = "NAS") -> list:
+    fields = ["0"] * 26
+    fields[0] = f"D{exchange}{symbol}"
+    fields[1] = symbol
+    fields[5] = "093001"
+    fields[11] = str(price)
+    fields[13] = "1.25"
+    fields[14] = "0.65"
+    fields[19] = "10"
+    fields[20] = "123456"
+    return fields
+
+
+class FakeWebSocket:
+    """KISWebSocket 대역"""
+
+    def __init__(self):
+        self.is_connected = False
+        self.ws_thread = None
+        self.last_message_at = 0.0
+        self.subscribed = {}
+        self.on_overseas_price = None
+
+    def connect(self, on_overseas_price=None, on_error=None, **kwargs):
+        self.on_overseas_price = on_overseas_price
+        self.is_connected = True
+        self.last_message_at = time.time()
+
+    def disconnect(self):
+        self.is_connected = False
+
+    def subscribe_overseas_price(self, symbol, exchange):
+        self.subscribed[symbol] = exchange
+
+    def unsubscribe_overseas_price(self, symbol, exchange):
+        self.subscribed.pop(symbol, None)
+
+    def push(self, symbol, price):
+        self.last_message_at = time.time()
+        self.on_overseas_price(RealtimeOverseasPrice(symbol, "NAS", "093001", price, 0, 0, 1, 1))
+
+
+@pytest.fixture
+def engine(make_engine):
+    engine = make_engine(take_profit_pct=50.0)
+    engine.positions = [
+        USPosition("AAPL", "Apple", 10, 100.0, exchange="NAS"),
+        USPosition("KO", "Coca-Cola", 5, 60.0, exchange="NYS"),
+    ]
+    client = Mock()
+    client.sell_stock.return_value = Mock(success=True)
+    engine._get_client = Mock(return_value=client)
+    return engine
+
+
+def _wait_for(condition, timeout=3.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if condition():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+class TestOverseasWebSocket:
+
+    @pytest.fixture
+    def ws(self):
+        with patch("src.api.kis_websocket.get_auth"):
+            return KISWebSocket(is_virtual=True)
+
+    def test_parse_multi_record(self, ws):
+        ticks = []
+        ws._on_overseas_price = ticks.append
+        data = "^".join(_overseas_record("AAPL", 190.5) + _overseas_record("AAPL", 190.75))
+
+        ws._on_message(None, f"0|HDFSCNT0|002|{data}")
+
+        assert [t.price for t in ticks] == [190.5, 190.75]
+        assert ticks[0].symbol == "AAPL"
+        assert ticks[0].exchange == "NAS"
+        assert ticks[0].cum_volume == 123456
+        assert ws.last_message_at > 0
+
+    def test_subscribe_key_and_reset_on_close(self, ws):
+        ws.is_connected = True
+        ws._send_subscribe = Mock()
+
+        ws.subscribe_overseas_price("KO", "NYS")
+        ws.subscribe_overseas_price("KO", "NYS")
+
+        ws._send_subscribe.assert_called_once_with("HDFSCNT0", "DNYSKO")
+        ws._on_close(None, 1000, "")
+        assert not ws._subscribed_overseas
+
+
+class TestEvaluatePrice:
+
+    def test_stop_loss_sells_and_records_latency(self, engine):
+        changed = engine.evaluate_price("AAPL", 92.0, received_at=time.time())
+
+        assert changed
+        engine._get_client().sell_stock.assert_called_once_with(
+            symbol="AAPL", qty=10, price=0, exchange="NAS"
+        )
+        assert [p.symbol for p in engine.positions] == ["KO"]
+        assert engine.exit_latency.summary()["count"] == 1
+
+    def test_trailing_stop(self, engine):
+        engine.config.trailing_stop_pct = 5.0
+
+        assert engine.evaluate_price("AAPL", 120.0)
+        assert not engine.evaluate_price("AAPL", 115.0)
+        engine.evaluate_price("AAPL", 113.0)
+
+        engine._get_client().sell_stock.assert_called_once()
+        assert "트레일링" in engine._notify.call_args[0][0]
+
+    def test_dry_run_triggers_once(self, engine):
+        engine.config.dry_run = True
+
+        engine.evaluate_price("AAPL", 90.0)
+        engine.evaluate_price("AAPL", 89.0)
+
+        engine._get_client().sell_stock.assert_not_called()
+        assert engine._notify.call_count == 1
+        assert len(engine.positions) == 2
+
+    def test_failed_order_not_retried_every_tick(self, engine):
+        engine._get_client().sell_stock.return_value = Mock(success=False)
+
+        engine.evaluate_price("AAPL", 90.0)
+        engine.evaluate_price("AAPL", 89.0)
+
+        assert engine._get_client().sell_stock.call_count == 1
+        assert len(engine.positions) == 2
+
+
+class TestUSRealtimeMonitor:
+
+    def test_tick_triggers_stop_loss(self, engine):
+        fake = FakeWebSocket()
+        monitor = USRealtimeMonitor(engine, is_virtual=True, ws_factory=lambda: fake)
+        monitor.start()
+        try:
+            assert _wait_for(lambda: fake.subscribed == {"AAPL": "NAS", "KO": "NYS"})
+            assert monitor.is_streaming
+
+            fake.push("AAPL", 101.0)
+            fake.push("AAPL", 92.0)
+
+            assert _wait_for(lambda: len(engine.positions) == 1)
+            assert _wait_for(lambda: "AAPL" not in fake.subscribed, timeout=5.0)
+        finally:
+            monitor.stop()
+
+        assert monitor.tick_count >= 1
+        assert engine.exit_latency.summary()["count"] == 1
+        assert not monitor.is_streaming
+
+    def test_heartbeat_lost_reconnects(self, engine):
+        sockets = []
+
+        def factory():
+            sockets.append(FakeWebSocket())
+            return sockets[-1]
+
+        monitor = USRealtimeMonitor(engine, is_virtual=True, ws_factory=factory)
+        monitor._connect()
+        assert monitor._ensure_connected()
+
+        sockets[0].last_message_at = time.time() - HEARTBEAT_TIMEOUT_SEC - 1
+
+        assert not monitor._ensure_connected()
+        assert len(sockets) == 2
+        assert monitor.ws is sockets[1]
+        assert monitor.reconnect_count == 1
+
+    def _subscribed_monitor(self, engine):
+        monitor = USRealtimeMonitor(engine, is_virtual=True, ws_factory=FakeWebSocket)
+        monitor._connect()
+        monitor._sync_subscriptions({"AAPL": "NAS"})
+        monitor._consumer = Mock(is_alive=Mock(return_value=True))  # 소비자 스레드 기동 생략
+        return monitor
+
+    def test_stale_without_any_tick(self, engine):
+        monitor = self._subscribed_monitor(engine)
+        assert monitor.is_streaming
+
+        monitor.subscribed_at -= STALE_TICK_SEC + 1
+        assert monitor.last_tick_at == 0.0
+        assert not monitor.is_streaming
+
+    def test_tick_or_new_subscription_refreshes_staleness(self, engine):
+        monitor = self._subscribed_monitor(engine)
+        monitor.subscribed_at -= STALE_TICK_SEC + 1
+        monitor.last_tick_at = time.time()
+        assert monitor.is_streaming
+
+        monitor.last_tick_at -= STALE_TICK_SEC + 1
+        monitor._sync_subscriptions({"AAPL": "NAS", "KO": "NYS"})
+        assert monitor.is_streaming
+
+
+class TestPollingFallback:
+
+    def _run(self, engine, streaming: bool):
+        engine.realtime = Mock(is_running=True, is_streaming=streaming)
+        engine.monitor_positions = Mock()
+        with patch("src.us_quant_engine.USMarketHours.is_pre_market", return_value=False), \
+             patch("src.us_quant_engine.USMarketHours.is_market_open", return_value=True), \
+             patch.object(engine, "_is_market_just_opened", return_value=False), \
+             patch.object(engine, "_should_monitor", return_value=True):
+            engine._check_and_execute()
+        return engine.monitor_positions
+
+    def test_skip_polling_while_streaming(self, engine):
+        assert not self._run(engine, streaming=True).called
+
+    def test_poll_when_stream_down(self, engine):
+        assert self._run(engine, streaming=False).called
+
+
+def test_latency_stats():
+    stats = LatencyStats()
+    for ms in range(1, 101):
+        stats.record(float(ms))
+
+    summary = stats.summary()
+
+    assert summary["count"] == 100
+    assert summary["max_ms"] == 100.0
+    assert summary["p95_ms"] == 96.0
+    assert summary["avg_ms"] == 50.5
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
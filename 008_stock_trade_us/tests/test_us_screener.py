@@ -0,0 +1,241 @@
+"""
+미국 주식 스크리너 테스트
+"""
+
+import pytest
+import sys
+import time
+import threading
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.strategy.us_screener import (
+    USMultiFactorScreener, USFactorWeights,
+    USMomentumCalculator, USVolatilityCalculator, USValueCalculator,
+)
+from src.strategy.us_scoring import USCrossSectionalScorer, FACTOR_COLUMNS
+from src.strategy.us_universe import USStock, USDataCollector, USUniverseBuilder
+
+
+def _price_frame(days: int = 260, drift: float = 0.001) -> pd.DataFrame:
+    """테스트용 일봉 (완만한 상승 + 작은 변동)"""
+    rng = np.random.default_rng(0)
+    closes = 100 * np.cumprod(1 + drift + rng.normal(0, 0.01, days))
+    return pd.DataFrame({
+        'date': pd.bdate_range(end="2026-01-30", periods=days),
+        'open': closes,
+        'high': closes,
+        'low': closes,
+        'close': closes,
+        'volume': np.full(days, 2_000_000),
+    })
+
+
+def _stock(symbol: str, sector: str = "Technology") -> USStock:
+    return USStock(symbol=symbol, name=symbol, sector=sector, industry="", exchange="NASDAQ", market_cap=0)
+
+
+class FakeCollector:
+    """USDataCollector 대체 - 호출 기록 및 동시 실행 수 측정"""
+
+    def __init__(self, kis_missing=(), slow=(), delay: float = 0.05):
+        self.kis_missing = set(kis_missing)
+        self.slow = set(slow)
+        self.delay = delay
+        self.yahoo_batches = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def _enter(self):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+
+    def _exit(self):
+        with self._lock:
+            self.active -= 1
+
+    def get_price_data(self, symbol, days=100):
+        self._enter()
+        try:
+            time.sleep(5 if symbol in self.slow else self.delay)
+            if symbol in self.kis_missing:
+                return pd.DataFrame()
+            return _price_frame(days)
+        finally:
+            self._exit()
+
+    def get_price_data_yahoo_batch(self, symbols, days=100):
+        self.yahoo_batches.append(list(symbols))
+        return {s: _price_frame(days) for s in symbols}
+
+    def get_fundamental_data(self, symbol):
+        return {"per": 15.0, "pbr": 2.0, "market_cap": 100.0}
+
+    def get_fundamental_data_yahoo(self, symbol):
+        return {}
+
+
+class TestUSScreenerPipeline:
+    """병렬 수집 파이프라인 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def _cache_dir(self, tmp_path):
+        self.cache_dir = str(tmp_path)
+
+    def _screener(self, collector, universe, **kwargs):
+        screener = USMultiFactorScreener(**kwargs)
+        screener.data_collector = collector
+        screener.universe_builder = USUniverseBuilder(cache_dir=self.cache_dir)
+        screener.universe_builder.build_universe = lambda universe_type, size: universe[:size]
+        return screener
+
+    def test_concurrent_collection(self):
+        """종목 데이터를 병렬로 수집"""
+        universe = [_stock(f"S{i:02d}") for i in range(16)]
+        collector = FakeCollector()
+        screener = self._screener(collector, universe, max_workers=4)
+
+        results = screener.screen(universe_size=16, target_count=16)
+
+        assert collector.max_active > 1
+        assert collector.max_active <= 4
+        # 섹터 분산 (Technology 최대 3개)
+        assert len(results) == 3
+        assert [r.rank for r in results] == [1, 2, 3]
+
+    def test_yahoo_batch_fallback(self):
+        """KIS 데이터 부족 종목만 yf.download 일괄 조회"""
+        universe = [_stock("AAA", "Energy"), _stock("BBB", "Utilities"), _stock("CCC", "Materials")]
+        collector = FakeCollector(kis_missing={"BBB", "CCC"})
+        screener = self._screener(collector, universe)
+
+        results = screener.screen(universe_size=3, target_count=3)
+
+        assert collector.yahoo_batches == [["BBB", "CCC"]]
+        assert {r.symbol for r in results} == {"AAA", "BBB", "CCC"}
+
+    def test_stock_timeout_excludes_slow_symbol(self):
+        """종목당 타임아웃 초과 종목은 제외하고 진행"""
+        universe = [_stock("FAST", "Energy"), _stock("SLOW", "Utilities")]
+        collector = FakeCollector(slow={"SLOW"})
+        screener = self._screener(collector, universe, stock_timeout=0.3)
+
+        started = time.monotonic()
+        prices = screener._collect_price_data(universe)
+
+        assert time.monotonic() - started < 3
+        assert "FAST" in prices
+        # 타임아웃 종목은 Yahoo 일괄 조회로 재시도
+        assert collector.yahoo_batches == [["SLOW"]]
+
+
+    def test_rescore_without_refetch(self):
+        """가중치 변경 재채점은 데이터 재조회 없이 팩터 테이블만 사용"""
+        universe = [_stock(f"S{i:02d}", f"Sector{i}") for i in range(6)]
+        collector = FakeCollector()
+        screener = self._screener(collector, universe)
+        screener.screen(universe_size=6, target_count=6)
+
+        collector.get_price_data = None  # 호출되면 실패
+        collector.get_fundamental_data = None
+        results = screener.rescore(USFactorWeights(
+            momentum_weight=1.0, short_mom_weight=0, volatility_weight=0, value_weight=0
+        ), 4)
+
+        assert len(results) == 4
+        assert [r.rank for r in results] == [1, 2, 3, 4]
+        assert all(r.composite_score == pytest.approx(r.momentum_score) for r in results)
+
+
+class TestCrossSectionalScorer:
+    """일괄 채점 = 종목별 채점"""
+
+    def _table(self, n: int = 500) -> pd.DataFrame:
+        rng = np.random.default_rng(42)
+        table = pd.DataFrame({
+            'symbol': [f"S{i}" for i in range(n)],
+            'name': "", 'sector': "", 'exchange': "NAS",
+            'return_1m': rng.uniform(-40, 40, n),
+            'return_3m': rng.uniform(-40, 40, n),
+            'return_6m': rng.uniform(-60, 60, n),
+            'return_12m': rng.uniform(-80, 150, n),
+            'volatility': rng.uniform(-1, 100, n),
+            'avg_volume': rng.integers(0, 2_000_000, n),
+            'per': rng.uniform(-20, 150, n),
+            'pbr': rng.uniform(-1, 20, n),
+            'market_cap': rng.uniform(0, 5, n),
+            'dividend_yield': rng.uniform(0, 5, n),
+        }, columns=FACTOR_COLUMNS)
+        # 구간 경계값 포함
+        table.loc[0, ['return_12m', 'volatility', 'per', 'pbr']] = [100, 15, 10, 1.5]
+        table.loc[1, ['return_12m', 'volatility', 'per', 'pbr']] = [0, 0, 0, 0]
+        return table
+
+    def test_matches_scalar_functions(self):
+        table = self._table()
+        weights = USFactorWeights()
+        scored = USCrossSectionalScorer.score(table, weights).set_index('symbol')
+        screener = USMultiFactorScreener(weights=weights)
+
+        for row in table.to_dict('records'):
+            got = scored.loc[row['symbol']]
+            assert got['momentum_score'] == USMomentumCalculator.score_momentum(row['return_12m'], row['return_6m'])
+            assert got['short_momentum_score'] == USMomentumCalculator.score_short_momentum(
+                row['return_1m'], row['return_3m'])
+            assert got['volatility_score'] == USVolatilityCalculator.score_volatility(row['volatility'])
+            assert got['value_score'] == USValueCalculator.score_value(
+                row['per'], row['pbr'], row['dividend_yield'])
+
+            passed, reason = screener._check_filters(
+                per=row['per'], pbr=row['pbr'], market_cap=row['market_cap'],
+                avg_volume=int(row['avg_volume']), volatility=row['volatility'],
+                return_12m=row['return_12m']
+            )
+            assert bool(got['passed_filter']) == passed
+            assert USCrossSectionalScorer.filter_reason(int(got['filter_code']), row, weights) == reason
+
+    def test_ranked_by_composite(self):
+        scored = USCrossSectionalScorer.score(self._table(), USFactorWeights())
+
+        assert scored['composite_score'].is_monotonic_decreasing
+        passed = scored[scored['passed_filter']]
+        assert list(passed['composite_rank']) == list(range(1, len(passed) + 1))
+        assert (scored.loc[~scored['passed_filter'], 'composite_rank'] == 0).all()
+
+    def test_empty_table(self):
+        scored = USCrossSectionalScorer.score(pd.DataFrame(columns=FACTOR_COLUMNS), USFactorWeights())
+
+        assert scored.empty
+        assert 'composite_score' in scored.columns
+
+
+class TestYahooBatchFrame:
+    """yf.download 결과 파싱"""
+
+    def test_extract_multiindex(self):
+        frame = _price_frame(5).set_index('date')
+        frame.columns = [c.capitalize() for c in frame.columns]
+        raw = pd.concat({"AAPL": frame, "MSFT": frame * 2}, axis=1)
+
+        df = USDataCollector._extract_yahoo_frame(raw, "MSFT")
+
+        assert list(df.columns) == ['date', 'open', 'high', 'low', 'close', 'volume']
+        assert len(df) == 5
+        assert df['close'].iloc[0] == pytest.approx(frame['Close'].iloc[0] * 2)
+
+    def test_extract_missing_symbol(self):
+        frame = _price_frame(5).set_index('date')
+        raw = pd.concat({"AAPL": frame}, axis=1)
+
+        assert USDataCollector._extract_yahoo_frame(raw, "ZZZZ").empty
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
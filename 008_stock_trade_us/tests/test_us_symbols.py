@@ -0,0 +1,101 @@
+"""
+미국 주식 심볼 마스터 인덱스 테스트
+"""
+
+import pytest
+import sys
+import json
+from pathlib import Path
+
+import pandas as pd
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.strategy.us_symbols import USSymbolIndex, INDEX_FILENAME, normalize_symbol
+from src.strategy.us_universe import USUniverseBuilder, USDataCollector, USStock
+
+
+class TestUSSymbolIndex:
+    """심볼 인덱스 조회/갱신"""
+
+    def test_builtin_lookup(self, tmp_path):
+        """내장 목록 기반 거래소/섹터 조회"""
+        builder = USUniverseBuilder(cache_dir=str(tmp_path))
+
+        assert builder.get_exchange_code("AAPL") == "NAS"
+        assert builder.get_exchange_code("JPM") == "NYS"
+        info = builder.symbol_index.get("BRK-B")
+        assert info.sector == "Financials"
+        assert info.share_class == "B"
+        assert builder.symbol_index.get("GOOGL").share_class == "A"
+
+    def test_unknown_defaults_to_nas(self, tmp_path):
+        builder = USUniverseBuilder(cache_dir=str(tmp_path))
+
+        assert builder.get_exchange_code("ZZZZ") == "NAS"
+        assert builder.symbol_index.candidate_exchanges("ZZZZ") == ["NAS", "NYS", "AMS"]
+
+    def test_index_persisted_once(self, tmp_path):
+        """인덱스는 1회 구성 후 파일에서 로드"""
+        calls = {"n": 0}
+
+        def loader():
+            calls["n"] += 1
+            return [USStock("KO", "Coca-Cola", "Consumer Staples", "", "NYSE", 0)]
+
+        USSymbolIndex(str(tmp_path), loader).get("KO")
+        index = USSymbolIndex(str(tmp_path), loader)
+
+        assert index.get_exchange_code("KO") == "NYS"
+        assert calls["n"] == 1
+        assert (tmp_path / INDEX_FILENAME).exists()
+
+    def test_stale_index_rebuilt_keeps_verified(self, tmp_path):
+        """재구성 주기 경과 시 재구성, 확인된 거래소 코드는 유지"""
+        loader = lambda: [USStock("XYZ", "X", "", "", "", 0)]
+        index = USSymbolIndex(str(tmp_path), loader)
+        index.mark_verified("XYZ", "NYSE")
+
+        data = json.loads((tmp_path / INDEX_FILENAME).read_text())
+        data["updated_at"] = "2000-01-01T00:00:00"
+        (tmp_path / INDEX_FILENAME).write_text(json.dumps(data))
+
+        reloaded = USSymbolIndex(str(tmp_path), loader)
+        assert reloaded.get_exchange_code("XYZ") == "NYS"
+        assert reloaded.is_verified("XYZ")
+
+    def test_normalize_symbol(self):
+        assert normalize_symbol("brk-b") == "BRK.B"
+        assert normalize_symbol("BRK/B") == "BRK.B"
+
+
+class TestExchangeVerification:
+    """KIS 응답 기반 거래소 확인"""
+
+    def test_falls_back_and_learns_exchange(self, tmp_path):
+        """기본 거래소 조회 실패 시 다른 거래소 시도 후 기록"""
+        builder = USUniverseBuilder(cache_dir=str(tmp_path))
+        collector = USDataCollector(kis_client=object(), universe_builder=builder)
+        tried = []
+
+        def get_history(symbol, exchange, days):
+            tried.append(exchange)
+            if exchange != "NYS":
+                return pd.DataFrame()
+            return pd.DataFrame({'date': pd.bdate_range("2026-01-01", periods=3), 'close': [1.0, 2.0, 3.0]})
+
+        collector.history.get_history = get_history
+
+        assert not collector.get_price_data("NEWCO", days=3).empty
+        assert tried == ["NAS", "NYS"]
+        assert builder.get_exchange_code("NEWCO") == "NYS"
+
+        # 확인 후에는 해당 거래소만 조회
+        tried.clear()
+        collector.get_price_data("NEWCO", days=3)
+        assert tried == ["NYS"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
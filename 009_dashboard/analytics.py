@@ -0,0 +1,300 @@
+"""
+분석 지표 Materializer - 자산 곡선, 낙폭(drawdown), 종목/코인별 성과
+
+원본 파일이 바뀔 때 새로 추가된 스냅샷/거래만 반영해 누적 지표를 갱신한다.
+- 주식 자산 곡선: 일별 스냅샷 (tracker DB는 마지막 날짜 이후만 조회)
+- 주식 종목별 성과: SELL 거래 (tracker DB는 마지막 id 이후만 조회, JSON은 처리한 거래 키 기준)
+- 암호화폐 누적 손익 곡선 / 코인별 성과: 새로 청산(closed)된 거래만 반영
+"""
+import bisect
+import json
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+class RunningCurve:
+    """날짜순 누적 곡선 + 고점 대비 낙폭 (점마다 고점/최대 낙폭을 저장해 추가 O(1))"""
+
+    def __init__(self):
+        self.points: List[Dict[str, Any]] = []
+        self._dates: List[str] = []
+
+    def upsert(self, date: str, value: float, **extra):
+        """마지막 점 이후(또는 같은 날짜 갱신) 값 반영. 더 이전 날짜는 호출 측에서 재구성"""
+        while self._dates and self._dates[-1] >= date:
+            self._dates.pop()
+            self.points.pop()
+
+        prev = self.points[-1] if self.points else None
+        peak = max(value, prev['peak']) if prev else value
+        drawdown = value - peak
+        drawdown_pct = round(drawdown / peak * 100, 2) if peak > 0 else 0.0
+        self.points.append({
+            'date': date,
+            'value': value,
+            'peak': peak,
+            'drawdown': drawdown,
+            'drawdown_pct': drawdown_pct,
+            'max_drawdown': min(drawdown, prev['max_drawdown']) if prev else drawdown,
+            'max_drawdown_pct': min(drawdown_pct, prev['max_drawdown_pct']) if prev else drawdown_pct,
+            **extra,
+        })
+        self._dates.append(date)
+
+    @property
+    def last_date(self) -> Optional[str]:
+        return self._dates[-1] if self._dates else None
+
+    def page(self, start: Optional[str] = None, end: Optional[str] = None,
+             limit: Optional[int] = None, offset: int = 0) -> Dict[str, Any]:
+        """기간(start <= date <= end, 날짜 접두 비교) + 페이지 조회"""
+        lo = bisect.bisect_left(self._dates, start) if start else 0
+        hi = bisect.bisect_right(self._dates, end + '\uffff') if end else len(self._dates)
+        window = self.points[lo:hi]
+        page = window[offset:offset + limit] if limit else window[offset:]
+        last = self.points[-1] if self.points else {}
+        return {
+            'points': page,
+            'total': len(window),
+            'offset': offset,
+            'current_drawdown_pct': last.get('drawdown_pct', 0.0),
+            'max_drawdown': last.get('max_drawdown', 0),
+            'max_drawdown_pct': last.get('max_drawdown_pct', 0.0),
+        }
+
+
+def _new_stats(key_name: str, key: str) -> Dict[str, Any]:
+    return {
+        key_name: key, 'trades': 0, 'wins': 0,
+        'total_profit_pct': 0, 'total_profit_krw': 0, 'last_trade': '',
+    }
+
+
+def _add_trade(s: Dict[str, Any], profit_pct: float, profit_krw: float, when: str):
+    s['trades'] += 1
+    if profit_pct > 0:
+        s['wins'] += 1
+    s['total_profit_pct'] += profit_pct
+    s['total_profit_krw'] += profit_krw
+    if when > s['last_trade']:
+        s['last_trade'] = when
+
+
+def _with_rates(stats: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+    result = []
+    for s in stats.values():
+        trades = s['trades']
+        result.append({
+            **s,
+            'win_rate': (s['wins'] / trades * 100) if trades > 0 else 0,
+            'avg_profit_pct': s['total_profit_pct'] / trades if trades > 0 else 0,
+        })
+    result.sort(key=lambda x: x['trades'], reverse=True)
+    return result
+
+
+class AnalyticsMaterializer:
+    """TradingDataLoader 원본을 증분 반영하는 분석 지표 저장소 (Thread-safe)"""
+
+    STOCK_EQUITY_SOURCES = ('stock_tracker_db', 'stock_daily')
+    STOCK_TRADE_SOURCES = ('stock_tracker_db', 'stock_transactions')
+    CRYPTO_SOURCES = ('crypto_history',)
+
+    def __init__(self, loader):
+        self.loader = loader
+        self._lock = threading.Lock()
+        self._signatures: Dict[str, tuple] = {}
+        # 지표 -> (원본 파일 키, 증분 반영, 초기화)
+        self._sources: Dict[str, Tuple[Tuple[str, ...], Callable[[], None], Callable[[], None]]] = {
+            'stock_equity': (self.STOCK_EQUITY_SOURCES, self._apply_stock_equity, self._reset_stock_equity),
+            'stock_trades': (self.STOCK_TRADE_SOURCES, self._apply_stock_trades, self._reset_stock_trades),
+            'crypto': (self.CRYPTO_SOURCES, self._apply_crypto, self._reset_crypto),
+        }
+        self._reset_stock_equity()
+        self._reset_stock_trades()
+        self._reset_crypto()
+
+    # === 초기화 (원본이 줄어들거나 순서가 어긋나면 재구성) ===
+
+    def _reset_stock_equity(self):
+        self.stock_equity = RunningCurve()
+        self._stock_equity_source: Optional[str] = None   # 'db' | 'json'
+
+    def _reset_stock_trades(self):
+        self._stock_stats: Dict[str, Dict[str, Any]] = {}
+        self._stock_trade_source: Optional[str] = None
+        self._stock_trade_cursor = 0          # DB: 마지막 id
+        self._stock_trade_head = (None, 0)    # DB: 처리한 구간의 (최소 id, 건수)
+        self._stock_trade_seen: set = set()   # JSON: 처리한 거래 키
+
+    def _reset_crypto(self):
+        self.crypto_equity = RunningCurve()
+        self._coin_stats: Dict[str, Dict[str, Any]] = {}
+        self._crypto_seen: set = set()
+        self._crypto_cum_krw = 0.0
+
+    def _refresh(self, name: str):
+        """원본이 바뀌었으면 증분 반영. 시그니처는 성공 후에만 기록 (실패 시 초기화 → 다음 요청에서 재구성)"""
+        keys, apply, reset = self._sources[name]
+        sig = self.loader.signature(keys)
+        if self._signatures.get(name) == sig:
+            return
+        try:
+            apply()
+        except Exception:
+            reset()
+            self._signatures.pop(name, None)
+            raise
+        self._signatures[name] = sig
+
+    # === 주식 자산 곡선 ===
+
+    def _apply_stock_equity(self):
+        last = self.stock_equity.last_date
+        rows = self.loader._query_tracker_db(
+            "SELECT date, payload FROM snapshots WHERE date >= ? ORDER BY date", (last or '',))
+        if rows is not None:
+            if self._stock_equity_source != 'db':
+                self._reset_stock_equity()
+                self._stock_equity_source = 'db'
+                rows = self.loader._query_tracker_db(
+                    "SELECT date, payload FROM snapshots ORDER BY date")
+            snapshots = [json.loads(payload) for _, payload in rows]
+        else:
+            data = self.loader._load_json('stock_daily') or {}
+            snapshots = data.get('snapshots', [])
+            if self._stock_equity_source != 'json':
+                self._reset_stock_equity()
+                self._stock_equity_source = 'json'
+                last = None
+            # 뒤에서부터 마지막 날짜 이후 구간만
+            start = len(snapshots)
+            while last and start > 0 and snapshots[start - 1].get('date', '') >= last:
+                start -= 1
+            snapshots = snapshots[start:] if last else snapshots
+
+        for snap in snapshots:
+            self.stock_equity.upsert(
+                snap.get('date', ''), snap.get('total_assets', 0),
+                daily_pnl=snap.get('daily_pnl', 0),
+                total_pnl_pct=snap.get('total_pnl_pct', 0),
+            )
+
+    # === 주식 종목별 성과 ===
+
+    def _apply_stock_trades(self):
+        cursor = self._stock_trade_cursor if self._stock_trade_source == 'db' else 0
+        head = self._stock_trade_head
+        seen: set = set()
+        rows = self.loader._query_tracker_db(
+            "SELECT id, payload FROM transactions WHERE id > ? ORDER BY id", (cursor,))
+        if rows is not None:
+            # 처리한 구간(id <= cursor)의 (최소 id, 건수)가 달라졌으면(보관 기간 삭제/DB 재생성) 전체 재구성
+            processed = tuple(self.loader._query_tracker_db(
+                "SELECT MIN(id), COUNT(*) FROM transactions WHERE id <= ?", (cursor,))[0])
+            if self._stock_trade_source != 'db' or processed != head:
+                self._reset_stock_trades()
+                self._stock_trade_source = 'db'
+                cursor, head = 0, self._stock_trade_head
+                rows = self.loader._query_tracker_db(
+                    "SELECT id, payload FROM transactions ORDER BY id")
+            new = [json.loads(payload) for _, payload in rows]
+            if rows:
+                cursor = rows[-1][0]
+                head = (head[0] if head[1] else rows[0][0], head[1] + len(rows))
+        else:
+            txns = (self.loader._load_json('stock_transactions') or {}).get('transactions', [])
+            keys = [self._txn_key(t) for t in txns]
+            seen = set(keys)
+            # 처리했던 거래가 빠졌으면(보관 기간 정리/파일 교체) 전체 재구성 - 건수만으로는 감지 불가
+            if self._stock_trade_source != 'json' or not self._stock_trade_seen <= seen:
+                self._reset_stock_trades()
+                self._stock_trade_source = 'json'
+            new = [t for t, k in zip(txns, keys) if k not in self._stock_trade_seen]
+
+        for t in new:
+            if t.get('type') != 'SELL':
+                continue
+            code = t.get('code', 'UNKNOWN')
+            s = self._stock_stats.get(code)
+            if s is None:
+                s = self._stock_stats[code] = {**_new_stats('code', code), 'name': t.get('name', '')}
+            _add_trade(s, t.get('pnl_pct', 0), t.get('pnl', 0), t.get('timestamp', ''))
+
+        self._stock_trade_cursor = cursor
+        self._stock_trade_head = head
+        self._stock_trade_seen = seen
+
+    @staticmethod
+    def _txn_key(t: Dict[str, Any]) -> str:
+        return f"{t.get('timestamp')}|{t.get('order_no')}|{t.get('code')}|{t.get('type')}"
+
+    # === 암호화폐 ===
+
+    def _apply_crypto(self):
+        history = self.loader._load_json('crypto_history') or []
+        closed = [t for t in history if t.get('status') == 'closed']
+        # 처리했던 거래가 빠졌으면(최근 500건 보관 정리/파일 교체) 전체 재구성 - 건수만으로는 감지 불가
+        if not self._crypto_seen <= {self._trade_key(t) for t in closed}:
+            self._reset_crypto()
+
+        new = [t for t in closed if self._trade_key(t) not in self._crypto_seen]
+        new.sort(key=lambda t: t.get('exit_time', ''))
+        last = self.crypto_equity.last_date
+        if new and last and new[0].get('exit_time', '') < last:
+            # 과거 시점 청산 기록이 뒤늦게 추가됨 → 전체 재구성
+            self._reset_crypto()
+            new = sorted(closed, key=lambda t: t.get('exit_time', ''))
+
+        for t in new:
+            self._crypto_seen.add(self._trade_key(t))
+            coin = t.get('coin', 'UNKNOWN')
+            s = self._coin_stats.get(coin)
+            if s is None:
+                s = self._coin_stats[coin] = _new_stats('coin', coin)
+            exit_time = t.get('exit_time', '')
+            _add_trade(s, t.get('profit_pct', 0), t.get('profit_krw', 0), exit_time)
+            self._crypto_cum_krw += t.get('profit_krw', 0)
+            self.crypto_equity.upsert(exit_time, self._crypto_cum_krw, coin=coin,
+                                      profit_krw=t.get('profit_krw', 0))
+
+    @staticmethod
+    def _trade_key(t: Dict[str, Any]) -> str:
+        return t.get('trade_id') or f"{t.get('coin')}|{t.get('entry_time')}"
+
+    # === 조회 ===
+
+    def stock_equity_curve(self, **window) -> Dict[str, Any]:
+        with self._lock:
+            self._refresh('stock_equity')
+            return self.stock_equity.page(**window)
+
+    def crypto_equity_curve(self, **window) -> Dict[str, Any]:
+        with self._lock:
+            self._refresh('crypto')
+            return self.crypto_equity.page(**window)
+
+    def stock_symbol_stats(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            self._refresh('stock_trades')
+            return _with_rates(self._stock_stats)
+
+    def crypto_coin_stats(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            self._refresh('crypto')
+            return _with_rates(self._coin_stats)
+
+    def crypto_performance(self) -> Dict[str, Any]:
+        with self._lock:
+            self._refresh('crypto')
+            trades = sum(s['trades'] for s in self._coin_stats.values())
+            if not trades:
+                return {'total_trades': 0, 'win_rate': 0, 'total_profit_pct': 0}
+            wins = sum(s['wins'] for s in self._coin_stats.values())
+            total_profit_pct = sum(s['total_profit_pct'] for s in self._coin_stats.values())
+            return {
+                'total_trades': trades,
+                'win_rate': wins / trades * 100,
+                'total_profit_pct': total_profit_pct,
+                'avg_profit_pct': total_profit_pct / trades,
+            }
@@ -1,20 +1,32 @@
 """
 009_dashboard - Trading Dashboard Flask Application
 """
+import gzip
+import hashlib
+import json
 import os
 from datetime import datetime
-from flask import Flask, render_template, jsonify, request
+from flask import Flask, Response, render_template, jsonify, request
 from flask_cors import CORS
 from dotenv import load_dotenv
-from data_loader import TradingDataLoader
+from data_loader import TradingDataLoader, strip_volatile
+from push import ChangeFeed
 
 load_dotenv()
 
 app = Flask(__name__)
 CORS(app)  # Blogger iframe 임베드를 위한 CORS 허용
 
-# 데이터 로더 초기화
+# 데이터 로더 초기화 (보유 코인 차트는 백그라운드에서 미리 갱신)
 data_loader = TradingDataLoader()
+data_loader.start_background_refresh()
+
+# 상태 파일 변경 → SSE 푸시 (summary / positions / regime)
+change_feed = ChangeFeed(data_loader)
+change_feed.start()
+
+# 이 크기 미만의 응답은 압축하지 않음
+COMPRESS_MIN_BYTES = 1024
 
 # API Key 설정
 API_KEY = os.getenv('DASHBOARD_API_KEY', '')
@@ -33,13 +45,44 @@ def check_api_key():
             return jsonify({'status': 'error', 'error': 'Unauthorized'}), 401
 
 
+@app.after_request
+def compress_response(response):
+    """JSON 응답 gzip 압축 (Accept-Encoding: gzip 클라이언트)"""
+    if (response.direct_passthrough
+            or response.status_code != 200
+            or response.mimetype != 'application/json'
+            or 'Content-Encoding' in response.headers
+            or 'gzip' not in request.headers.get('Accept-Encoding', '').lower()):
+        return response
+    body = response.get_data()
+    if len(body) < COMPRESS_MIN_BYTES:
+        return response
+    response.set_data(gzip.compress(body, compresslevel=6))
+    response.headers['Content-Encoding'] = 'gzip'
+    response.vary.add('Accept-Encoding')
+    return response
+
+
+def _etag(data) -> str:
+    """응답 data 내용 해시 (매 요청 달라지는 generated_at 제외)"""
+    payload = json.dumps(strip_volatile(data), sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=12).hexdigest()
+
+
 def api_response(data):
-    """v2 API 통일 응답 형식"""
-    return jsonify({
-        'status': 'ok',
-        'data': data,
-        'timestamp': datetime.now().isoformat(),
-    })
+    """v2 API 통일 응답 형식 (ETag / If-None-Match → 304)"""
+    etag = _etag(data)
+    if request.if_none_match.contains(etag):
+        response = Response(status=304)
+    else:
+        response = jsonify({
+            'status': 'ok',
+            'data': data,
+            'timestamp': datetime.now().isoformat(),
+        })
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
 
 
 # === 페이지 라우트 ===
@@ -181,6 +224,28 @@ def api_v2_stock_daily():
     return api_response(data_loader.get_stock_daily_history(days=days))
 
 
+def _window_args():
+    """기간/페이지 파라미터 (?from=YYYY-MM-DD&to=YYYY-MM-DD&limit=&offset=)"""
+    return {
+        'start': request.args.get('from') or None,
+        'end': request.args.get('to') or None,
+        'limit': request.args.get('limit', type=int),
+        'offset': max(request.args.get('offset', 0, type=int), 0),
+    }
+
+
+@app.route('/api/v2/stock/equity')
+def api_v2_stock_equity():
+    """한국주식 자산 곡선 + 낙폭"""
+    return api_response(data_loader.get_stock_equity_curve(**_window_args()))
+
+
+@app.route('/api/v2/stock/symbols')
+def api_v2_stock_symbols():
+    """한국주식 종목별 성과 (승률, 손익)"""
+    return api_response(data_loader.get_stock_symbol_summary())
+
+
 @app.route('/api/v2/stock/transactions')
 def api_v2_stock_transactions():
     """한국주식 거래 내역"""
@@ -206,6 +271,12 @@ def api_v2_system_status():
     return api_response(data_loader.get_system_status())
 
 
+@app.route('/api/v2/crypto/equity')
+def api_v2_crypto_equity():
+    """암호화폐 누적 실현손익 곡선 + 낙폭"""
+    return api_response(data_loader.get_crypto_equity_curve(**_window_args()))
+
+
 @app.route('/api/v2/crypto/coins')
 def api_v2_crypto_coins():
     """코인별 성과 요약"""
@@ -225,6 +296,13 @@ def api_v2_crypto_price(coin):
     return api_response(data_loader.get_coin_price(coin))
 
 
+@app.route('/api/v2/crypto/prices')
+def api_v2_crypto_prices():
+    """여러 코인 시세 일괄 조회 (?coins=BTC,ETH, 미지정 시 보유 코인)"""
+    coins = [c for c in request.args.get('coins', '').split(',') if c.strip()]
+    return api_response(data_loader.get_coin_prices([c.strip() for c in coins] or None))
+
+
 @app.route('/api/v2/crypto/chart/<coin>')
 def api_v2_crypto_chart(coin):
     """코인 캔들스틱 차트 데이터"""
@@ -232,6 +310,25 @@ def api_v2_crypto_chart(coin):
     return api_response(data_loader.get_coin_chart(coin, interval=interval))
 
 
+@app.route('/api/v2/stream')
+def api_v2_stream():
+    """변경 푸시 (SSE). ?channels=summary,positions,regime
+
+    최초 `snapshot` 이벤트로 전체 값을 보내고, 이후 `patch` 이벤트로
+    JSON Merge Patch만 보낸다 (값이 null이 되면 `replace` 이벤트로 채널 전체).
+    재연결 시 Last-Event-ID로 놓친 이벤트를 재전송한다.
+    """
+    requested = request.args.get('channels', '')
+    channels = [c for c in requested.split(',') if c in change_feed.channels] \
+        or list(change_feed.channels)
+    last_id = request.headers.get('Last-Event-ID', type=int)
+    return Response(
+        change_feed.stream(channels, last_id),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'},
+    )
+
+
 # === Health Check ===
 
 @app.route('/health')
@@ -2,15 +2,82 @@
 Trading Data Loader - 007/005 데이터 통합 로더
 """
 import json
+import logging
 import os
+import sqlite3
+import threading
 import time
 from datetime import datetime, date
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, List, Any, Optional, Tuple
 from pathlib import Path
 
+from analytics import AnalyticsMaterializer
+
+logger = logging.getLogger(__name__)
+
+BITHUMB_API = 'https://api.bithumb.com/public'
+PRICE_TTL_SEC = 3           # ticker/ALL_KRW 1회로 전체 코인 시세 공유
+CHART_TTL_SEC = 60          # 캔들 데이터 공유 시간
+CHART_REFRESH_SEC = 30      # 보유 코인 차트 백그라운드 갱신 주기 (TTL보다 짧게 → 요청은 항상 캐시 적중)
+CHART_PREFETCH_INTERVALS = ('1h',)
+
+# 매 요청 달라지는 값 (ETag/SSE 차이 계산에서 제외).
+# age_minutes는 클라이언트(010 iOS)가 그대로 표시하므로 제외하지 않음 - 304로 고정되면 안 됨
+VOLATILE_KEYS = frozenset({'generated_at'})
+
+
+def strip_volatile(data: Any) -> Any:
+    """VOLATILE_KEYS를 중첩 dict/list까지 제거한 사본"""
+    if isinstance(data, dict):
+        return {k: strip_volatile(v) for k, v in data.items() if k not in VOLATILE_KEYS}
+    if isinstance(data, list):
+        return [strip_volatile(v) for v in data]
+    return data
+
+
+class SharedCache:
+    """짧은 TTL 공유 캐시 + 키별 single-flight (동시 요청은 외부 호출 1회로 합침)"""
+
+    def __init__(self):
+        self._entries: Dict[Any, Tuple[float, Any]] = {}  # key -> (만료 시각, 값)
+        self._locks: Dict[Any, threading.Lock] = {}
+        self._guard = threading.Lock()
+        self.stats = {'hits': 0, 'fetches': 0, 'errors': 0}
+
+    def get(self, key, ttl: float, fetch: Callable[[], Any], force: bool = False) -> Any:
+        """유효하면 캐시, 아니면 fetch() 1회. 실패 시 이전 값(있으면) 반환, 없으면 예외 전파"""
+        if not force:
+            entry = self._entries.get(key)
+            if entry and entry[0] > time.time():
+                self.stats['hits'] += 1
+                return entry[1]
+
+        with self._guard:
+            lock = self._locks.setdefault(key, threading.Lock())
+        with lock:
+            entry = self._entries.get(key)
+            if not force and entry and entry[0] > time.time():
+                self.stats['hits'] += 1  # 대기 중 다른 요청이 갱신
+                return entry[1]
+            self.stats['fetches'] += 1
+            try:
+                value = fetch()
+            except Exception:
+                self.stats['errors'] += 1
+                if entry:
+                    return entry[1]
+                raise
+            self._entries[key] = (time.time() + ttl, value)
+            return value
+
 
 class TradingDataLoader:
-    """007/005 트레이딩 데이터 통합 로더"""
+    """007/005 트레이딩 데이터 통합 로더
+
+    파일별 (mtime, size) 시그니처로 파싱 결과와 파생 뷰를 캐시한다.
+    파일이 바뀐 경우에만 다시 파싱하며, 캐시된 객체는 요청 간 공유되므로
+    반환값을 수정하지 말 것.
+    """
 
     def __init__(self, base_path: Optional[str] = None):
         if base_path is None:
@@ -24,31 +91,107 @@ class TradingDataLoader:
             'crypto_factors': self.base_path / '005_money/logs/dynamic_factors_v3.json',
             'crypto_history': self.base_path / '005_money/logs/performance_history_v3.json',
             'stock_system': self.base_path / '007_stock_trade/data/quant/system_state.json',
+            'stock_tracker_db': self.base_path / '007_stock_trade/data/quant/daily_tracker.db',
             'stock_daily': self.base_path / '007_stock_trade/data/quant/daily_history.json',
             'stock_transactions': self.base_path / '007_stock_trade/data/quant/transaction_journal.json',
             'stock_config': self.base_path / '007_stock_trade/config/system_config.json',
         }
 
-    def _load_json(self, key: str) -> Optional[Dict | List]:
-        """JSON 파일 로드"""
+        self._lock = threading.Lock()
+        self._json_cache: Dict[str, Tuple[tuple, Any]] = {}   # key -> (시그니처, 파싱 결과)
+        self._view_cache: Dict[str, Tuple[tuple, Any]] = {}   # 뷰 이름 -> (시그니처, 값)
+
+        # 자산 곡선 / 종목·코인별 성과 (증분 갱신)
+        self.analytics = AnalyticsMaterializer(self)
+
+        # Bithumb 공개 API 프록시 캐시
+        self.bithumb_cache = SharedCache()
+        self._http = None
+        self._refresher: Optional[threading.Thread] = None
+
+    def _file_signature(self, key: str) -> Optional[tuple]:
+        """파일 변경 감지용 (mtime_ns, size). SQLite는 -wal 파일 포함. 없으면 None"""
         path = self.data_paths.get(key)
-        if not path or not path.exists():
+        if not path:
+            return None
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        sig = (st.st_mtime_ns, st.st_size)
+        if path.suffix == '.db':
+            try:
+                wal = path.with_name(path.name + '-wal').stat()
+                sig += (wal.st_mtime_ns, wal.st_size)
+            except OSError:
+                pass
+        return sig
+
+    def _load_json(self, key: str) -> Optional[Dict | List]:
+        """JSON 파일 로드 (변경 시에만 재파싱, 결과는 공유 객체)"""
+        sig = self._file_signature(key)
+        if sig is None:
             return None
+        with self._lock:
+            cached = self._json_cache.get(key)
+        if cached and cached[0] == sig:
+            return cached[1]
+
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(self.data_paths[key], 'r', encoding='utf-8') as f:
+                data = json.load(f)
         except (json.JSONDecodeError, IOError):
+            # 봇이 쓰는 도중이면 직전 파싱 결과 유지 (다음 요청에서 재시도)
+            return cached[1] if cached else None
+
+        with self._lock:
+            self._json_cache[key] = (sig, data)
+        return data
+
+    def signature(self, keys: Tuple[str, ...]) -> tuple:
+        """여러 원본 파일의 변경 시그니처 (변경 감시용)"""
+        return tuple(self._file_signature(k) for k in keys)
+
+    def _view(self, name: str, keys: Tuple[str, ...], build: Callable[[], Any]) -> Any:
+        """파생 뷰 캐시 - 원본 파일(keys) 중 하나라도 바뀌면 build()로 재계산"""
+        sig = self.signature(keys)
+        with self._lock:
+            cached = self._view_cache.get(name)
+        if cached and cached[0] == sig:
+            return cached[1]
+
+        value = build()
+        with self._lock:
+            self._view_cache[name] = (sig, value)
+        return value
+
+    def _query_tracker_db(self, sql: str, params: tuple = ()) -> Optional[List[tuple]]:
+        """007 일별 트래커 DB 읽기 전용 조회 (DB 없으면 None → JSON 폴백)"""
+        path = self.data_paths['stock_tracker_db']
+        if not path.exists():
+            return None
+        try:
+            conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+            try:
+                return conn.execute(sql, params).fetchall()
+            finally:
+                conn.close()
+        except sqlite3.Error:
             return None
 
     # === 주식 데이터 ===
 
     def get_stock_positions(self) -> List[Dict[str, Any]]:
         """주식 포지션 조회"""
+        return self._view('stock_positions', ('stock_engine',), self._build_stock_positions)
+
+    def _build_stock_positions(self) -> List[Dict[str, Any]]:
         data = self._load_json('stock_engine')
         if not data:
             return []
 
-        positions = data.get('positions', [])
+        # 원본 캐시를 건드리지 않도록 복사 후 가공
+        positions = [dict(pos) for pos in data.get('positions', [])]
         for pos in positions:
             # 손익률 계산
             if pos.get('entry_price') and pos.get('current_price'):
@@ -79,6 +222,16 @@ class TradingDataLoader:
 
     def get_stock_daily_history(self, days: int = 30) -> Dict[str, Any]:
         """주식 일일 자산 히스토리"""
+        rows = self._query_tracker_db(
+            "SELECT payload FROM snapshots ORDER BY date DESC LIMIT ?", (days,))
+        if rows is not None:
+            meta = self._query_tracker_db(
+                "SELECT value FROM meta WHERE key = 'initial_capital'")
+            return {
+                'initial_capital': json.loads(meta[0][0]) if meta else 0,
+                'snapshots': [json.loads(r[0]) for r in reversed(rows)],
+            }
+
         data = self._load_json('stock_daily')
         if not data:
             return {'initial_capital': 0, 'snapshots': []}
@@ -90,12 +243,29 @@ class TradingDataLoader:
 
     def get_stock_transactions(self, limit: int = 20) -> List[Dict[str, Any]]:
         """주식 거래 내역"""
+        rows = self._query_tracker_db(
+            "SELECT payload FROM transactions ORDER BY timestamp DESC, id DESC LIMIT ?", (limit,))
+        if rows is not None:
+            return [json.loads(r[0]) for r in rows]
+
+        return self._view('stock_transactions_sorted', ('stock_transactions',),
+                          self._build_stock_transactions)[:limit]
+
+    def _build_stock_transactions(self) -> List[Dict[str, Any]]:
         data = self._load_json('stock_transactions')
         if not data:
             return []
         txns = data.get('transactions', [])
-        sorted_txns = sorted(txns, key=lambda x: x.get('timestamp', ''), reverse=True)
-        return sorted_txns[:limit]
+        return sorted(txns, key=lambda x: x.get('timestamp', ''), reverse=True)
+
+    def get_stock_equity_curve(self, start: Optional[str] = None, end: Optional[str] = None,
+                               limit: Optional[int] = None, offset: int = 0) -> Dict[str, Any]:
+        """주식 자산 곡선 + 낙폭 (일별 스냅샷 전체 기간)"""
+        return self.analytics.stock_equity_curve(start=start, end=end, limit=limit, offset=offset)
+
+    def get_stock_symbol_summary(self) -> List[Dict[str, Any]]:
+        """종목별 매도 성과 집계 (승률, 손익)"""
+        return self.analytics.stock_symbol_stats()
 
     def get_stock_trading_mode(self) -> Dict[str, Any]:
         """주식 트레이딩 모드 (모의/실전) 조회"""
@@ -111,7 +281,11 @@ class TradingDataLoader:
 
     def get_stock_account_summary(self) -> Dict[str, Any]:
         """주식 계좌 요약 (현금, 매입금, 평가금, 손익)"""
-        daily_data = self._load_json('stock_daily')
+        return self._view('stock_account', ('stock_tracker_db', 'stock_daily', 'stock_engine'),
+                          self._build_stock_account_summary)
+
+    def _build_stock_account_summary(self) -> Dict[str, Any]:
+        daily_data = self.get_stock_daily_history(days=1)
         engine_data = self._load_json('stock_engine')
 
         initial_capital = 0
@@ -179,137 +353,150 @@ class TradingDataLoader:
 
     def get_crypto_history(self, limit: int = 10) -> List[Dict[str, Any]]:
         """암호화폐 거래 내역 조회"""
-        data = self._load_json('crypto_history')
-        if not data:
-            return []
-        # 최신순 정렬
-        sorted_data = sorted(data, key=lambda x: x.get('exit_time', ''), reverse=True)
-        return sorted_data[:limit]
+        return self._crypto_history_sorted()[:limit]
+
+    def _crypto_history_sorted(self) -> List[Dict[str, Any]]:
+        """최신순 정렬된 거래 내역 (파일 변경 시에만 정렬)"""
+        def build():
+            data = self._load_json('crypto_history')
+            if not data:
+                return []
+            return sorted(data, key=lambda x: x.get('exit_time', ''), reverse=True)
+        return self._view('crypto_history_sorted', ('crypto_history',), build)
 
     def get_crypto_performance(self) -> Dict[str, Any]:
         """암호화폐 성과 통계"""
-        history = self._load_json('crypto_history')
-        if not history:
-            return {'total_trades': 0, 'win_rate': 0, 'total_profit_pct': 0}
+        return self.analytics.crypto_performance()
 
-        closed_trades = [t for t in history if t.get('status') == 'closed']
-        if not closed_trades:
-            return {'total_trades': 0, 'win_rate': 0, 'total_profit_pct': 0}
-
-        wins = sum(1 for t in closed_trades if t.get('profit_pct', 0) > 0)
-        total_profit_pct = sum(t.get('profit_pct', 0) for t in closed_trades)
-
-        return {
-            'total_trades': len(closed_trades),
-            'win_rate': wins / len(closed_trades) * 100 if closed_trades else 0,
-            'total_profit_pct': total_profit_pct,
-            'avg_profit_pct': total_profit_pct / len(closed_trades) if closed_trades else 0,
-        }
+    def get_crypto_equity_curve(self, start: Optional[str] = None, end: Optional[str] = None,
+                                limit: Optional[int] = None, offset: int = 0) -> Dict[str, Any]:
+        """암호화폐 누적 실현손익 곡선 + 낙폭 (청산 시각 기준)"""
+        return self.analytics.crypto_equity_curve(start=start, end=end, limit=limit, offset=offset)
 
     # === 암호화폐 코인별 데이터 ===
 
     def get_crypto_coin_summary(self) -> List[Dict[str, Any]]:
         """코인별 성과 집계"""
-        history = self._load_json('crypto_history')
-        if not history:
-            return []
-
-        coin_stats: Dict[str, Dict[str, Any]] = {}
-        for t in history:
-            if t.get('status') != 'closed':
-                continue
-            coin = t.get('coin', 'UNKNOWN')
-            if coin not in coin_stats:
-                coin_stats[coin] = {
-                    'coin': coin, 'trades': 0, 'wins': 0,
-                    'total_profit_pct': 0, 'total_profit_krw': 0,
-                    'last_trade': '',
-                }
-            s = coin_stats[coin]
-            s['trades'] += 1
-            if t.get('profit_pct', 0) > 0:
-                s['wins'] += 1
-            s['total_profit_pct'] += t.get('profit_pct', 0)
-            s['total_profit_krw'] += t.get('profit_krw', 0)
-            exit_time = t.get('exit_time', '')
-            if exit_time > s['last_trade']:
-                s['last_trade'] = exit_time
-
-        result = []
-        for coin, s in coin_stats.items():
-            s['win_rate'] = (s['wins'] / s['trades'] * 100) if s['trades'] > 0 else 0
-            s['avg_profit_pct'] = s['total_profit_pct'] / s['trades'] if s['trades'] > 0 else 0
-            result.append(s)
-
-        result.sort(key=lambda x: x['trades'], reverse=True)
-        return result
+        return self.analytics.crypto_coin_stats()
+
+    def _bithumb_get(self, path: str) -> Any:
+        """Bithumb 공개 API 호출 (세션 재사용). status != 0000이면 예외"""
+        if self._http is None:
+            import requests
+            self._http = requests.Session()
+        resp = self._http.get(f'{BITHUMB_API}/{path}', timeout=5)
+        data = resp.json()
+        if data.get('status') != '0000':
+            raise ValueError(f"Bithumb API error {data.get('status')}")
+        return data['data']
+
+    def _all_tickers(self) -> Dict[str, Any]:
+        """ticker/ALL_KRW (코인별 원본 + 'date')"""
+        return self.bithumb_cache.get('ticker_all', PRICE_TTL_SEC,
+                                      lambda: self._bithumb_get('ticker/ALL_KRW'))
+
+    @staticmethod
+    def _format_price(coin: str, d: Dict[str, Any], timestamp: Any) -> Dict[str, Any]:
+        closing = float(d.get('closing_price', 0))
+        prev_closing = float(d.get('prev_closing_price', 0))
+        change_pct = ((closing - prev_closing) / prev_closing * 100) if prev_closing else 0
+        return {
+            'coin': coin,
+            'closing_price': closing,
+            'opening_price': float(d.get('opening_price', 0)),
+            'high_price': float(d.get('max_price', 0)),
+            'low_price': float(d.get('min_price', 0)),
+            'volume': float(d.get('units_traded_24H', 0)),
+            'change_pct': round(change_pct, 2),
+            'timestamp': timestamp,
+        }
 
     def get_coin_price(self, coin: str) -> Dict[str, Any]:
-        """Bithumb 공개 API로 실시간 시세 조회"""
-        import requests
+        """Bithumb 공개 API로 실시간 시세 조회 (전체 시세 캐시에서 추출)"""
         try:
-            resp = requests.get(
-                f'https://api.bithumb.com/public/ticker/{coin.upper()}_KRW',
-                timeout=5,
-            )
-            data = resp.json()
-            if data.get('status') != '0000':
-                return {'error': 'API error', 'coin': coin}
-            d = data['data']
-            closing = float(d.get('closing_price', 0))
-            prev_closing = float(d.get('prev_closing_price', 0))
-            change_pct = ((closing - prev_closing) / prev_closing * 100) if prev_closing else 0
-            return {
-                'coin': coin.upper(),
-                'closing_price': closing,
-                'opening_price': float(d.get('opening_price', 0)),
-                'high_price': float(d.get('max_price', 0)),
-                'low_price': float(d.get('min_price', 0)),
-                'volume': float(d.get('units_traded_24H', 0)),
-                'change_pct': round(change_pct, 2),
-                'timestamp': d.get('date'),
-            }
+            tickers = self._all_tickers()
         except Exception as e:
             return {'error': str(e), 'coin': coin}
+        d = tickers.get(coin.upper())
+        if not isinstance(d, dict):
+            return {'error': 'API error', 'coin': coin}
+        return self._format_price(coin.upper(), d, tickers.get('date'))
+
+    def get_coin_prices(self, coins: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """여러 코인 시세 (외부 호출 최대 1회). coins 미지정 시 보유 코인"""
+        coins = [c.upper() for c in coins] if coins else self.get_held_coins()
+        try:
+            tickers = self._all_tickers()
+        except Exception:
+            return []
+        return [
+            self._format_price(c, tickers[c], tickers.get('date'))
+            for c in coins if isinstance(tickers.get(c), dict)
+        ]
 
     def get_coin_chart(self, coin: str, interval: str = '1h') -> List[Dict[str, Any]]:
-        """Bithumb 공개 API로 캔들스틱 차트 데이터 조회"""
-        import requests
+        """Bithumb 공개 API로 캔들스틱 차트 데이터 조회 (공유 캐시)"""
         interval_map = {
             '5m': '5m', '30m': '30m', '1h': '1h', '6h': '6h', '1d': '24h',
         }
         bithumb_interval = interval_map.get(interval, '1h')
         try:
-            resp = requests.get(
-                f'https://api.bithumb.com/public/candlestick/{coin.upper()}_KRW/{bithumb_interval}',
-                timeout=5,
-            )
-            data = resp.json()
-            if data.get('status') != '0000':
-                return []
-            candles = data.get('data', [])[-100:]
-            result = []
-            for c in candles:
-                result.append({
+            return self._fetch_chart(coin.upper(), bithumb_interval)
+        except Exception:
+            return []
+
+    def _fetch_chart(self, coin: str, bithumb_interval: str, force: bool = False) -> List[Dict[str, Any]]:
+        def fetch():
+            candles = self._bithumb_get(f'candlestick/{coin}_KRW/{bithumb_interval}')[-100:]
+            return [
+                {
                     'timestamp': c[0],
                     'open': float(c[1]),
                     'close': float(c[2]),
                     'high': float(c[3]),
                     'low': float(c[4]),
                     'volume': float(c[5]),
-                })
-            return result
-        except Exception:
-            return []
+                }
+                for c in candles
+            ]
+        return self.bithumb_cache.get(('chart', coin, bithumb_interval), CHART_TTL_SEC,
+                                      fetch, force=force)
+
+    def get_held_coins(self) -> List[str]:
+        """미청산(open) 거래가 있는 코인"""
+        def build():
+            history = self._load_json('crypto_history') or []
+            return sorted({t.get('coin', '').upper() for t in history
+                           if t.get('status') == 'open' and t.get('coin')})
+        return self._view('crypto_held_coins', ('crypto_history',), build)
+
+    def start_background_refresh(self, interval: float = CHART_REFRESH_SEC):
+        """보유 코인 차트를 TTL 만료 전에 미리 갱신하는 데몬 스레드 시작"""
+        if self._refresher and self._refresher.is_alive():
+            return
+
+        def loop():
+            while True:
+                for coin in self.get_held_coins():
+                    for iv in CHART_PREFETCH_INTERVALS:
+                        try:
+                            self._fetch_chart(coin, iv, force=True)
+                        except Exception as e:
+                            logger.warning("chart refresh failed (%s %s): %s", coin, iv, e)
+                time.sleep(interval)
+
+        self._refresher = threading.Thread(target=loop, name='bithumb-refresh', daemon=True)
+        self._refresher.start()
 
     def get_crypto_coin_trades(self, coin: str, limit: int = 20) -> List[Dict[str, Any]]:
         """특정 코인 거래 내역 필터"""
-        history = self._load_json('crypto_history')
-        if not history:
-            return []
-        filtered = [t for t in history if t.get('coin', '').upper() == coin.upper()]
-        sorted_data = sorted(filtered, key=lambda x: x.get('exit_time', ''), reverse=True)
-        return sorted_data[:limit]
+        def build():
+            by_coin: Dict[str, List[Dict[str, Any]]] = {}
+            for t in self._crypto_history_sorted():
+                by_coin.setdefault(t.get('coin', '').upper(), []).append(t)
+            return by_coin
+        by_coin = self._view('crypto_trades_by_coin', ('crypto_history',), build)
+        return by_coin.get(coin.upper(), [])[:limit]
 
     # === 시스템 상태 ===
 
@@ -411,12 +598,23 @@ class TradingDataLoader:
     # === 종합 ===
 
     def get_portfolio_summary(self) -> Dict[str, Any]:
-        """전체 포트폴리오 요약"""
+        """전체 포트폴리오 요약 (주식/암호화폐 섹션은 파일 변경 시에만 재계산)"""
+        sections = self._view(
+            'portfolio_sections',
+            ('stock_engine', 'stock_tracker_db', 'stock_daily', 'crypto_factors', 'crypto_history'),
+            self._build_portfolio_sections,
+        )
+        return {
+            **sections,
+            'system_status': self.get_system_status(),  # 파일 경과 시간/장 상태 - 매 요청 계산
+            'generated_at': datetime.now().isoformat(),
+        }
+
+    def _build_portfolio_sections(self) -> Dict[str, Any]:
         stock_positions = self.get_stock_positions()
         stock_state = self.get_stock_state()
         crypto_regime = self.get_crypto_regime()
         crypto_perf = self.get_crypto_performance()
-        system_status = self.get_system_status()
 
         # 주식 총 평가액 및 손익
         stock_total_value = sum(
@@ -451,8 +649,6 @@ class TradingDataLoader:
                 'avg_profit_pct': crypto_perf.get('avg_profit_pct'),
                 'updated_at': crypto_regime.get('last_update'),
             },
-            'system_status': system_status,
-            'generated_at': datetime.now().isoformat(),
         }
 
     def get_recent_trades(self, limit: int = 10) -> List[Dict[str, Any]]:
@@ -0,0 +1,181 @@
+"""
+상태 파일 변경 푸시 (Server-Sent Events)
+
+감시 스레드가 상태 파일 시그니처를 주기적으로 확인하고, 바뀐 채널만 페이로드를
+다시 만들어 이전 값과의 차이(JSON Merge Patch, RFC 7386)를 이벤트로 쌓는다.
+값이 null이 되는 변경은 Merge Patch로 표현할 수 없어(null = 키 삭제) 채널 값 전체를 보낸다.
+구독 클라이언트는 새 이벤트만 받는다.
+"""
+import json
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from data_loader import TradingDataLoader, strip_volatile
+
+logger = logging.getLogger(__name__)
+
+POLL_SEC = 1.0            # 파일 시그니처 확인 주기
+SUMMARY_REFRESH_SEC = 60.0  # 파일 변경 없어도 summary 재계산 (시간 경과로 바뀌는 running/age_minutes)
+KEEPALIVE_SEC = 15.0      # 이벤트 없을 때 주석 라인 전송 (프록시 타임아웃 방지)
+EVENT_BUFFER = 256        # Last-Event-ID 재전송용 최근 이벤트 수
+
+
+# merge_patch 결과: Merge Patch로 표현할 수 없는 변경 → 채널 값 전체 교체(replace 이벤트)
+REPLACE = object()
+
+
+def _has_null_member(value: Any) -> bool:
+    """dict(중첩 포함) 안에 null 값이 있는지. RFC 7386 적용 시 null 멤버는 삭제로 해석됨"""
+    return isinstance(value, dict) and any(
+        v is None or _has_null_member(v) for v in value.values())
+
+
+def merge_patch(old: Any, new: Any) -> Any:
+    """old → new JSON Merge Patch (RFC 7386, dict만 재귀, 나머지는 통째로 교체).
+
+    변경 없으면 None. 값이 null이 되는 변경은 Merge Patch에서 키 삭제와 구분되지 않으므로 REPLACE
+    """
+    if not isinstance(old, dict) or not isinstance(new, dict):
+        if old == new:
+            return None
+        return REPLACE if new is None or _has_null_member(new) else new
+    patch = {}
+    for key in old.keys() - new.keys():
+        patch[key] = None
+    for key, value in new.items():
+        if key in old and old[key] == value:
+            continue
+        if key in old and isinstance(value, dict) and isinstance(old[key], dict):
+            sub = merge_patch(old[key], value)
+            if sub is REPLACE:
+                return REPLACE
+            if sub is not None:
+                patch[key] = sub
+        elif value is None or _has_null_member(value):
+            return REPLACE
+        else:
+            patch[key] = value
+    return patch or None
+
+
+class ChangeFeed:
+    """채널별 페이로드 변경을 감지해 차이만 이벤트로 배포"""
+
+    def __init__(self, loader: TradingDataLoader, poll_sec: float = POLL_SEC):
+        self.loader = loader
+        self.poll_sec = poll_sec
+        # 채널 -> (원본 파일 키, 페이로드 생성 함수)
+        self.channels: Dict[str, Tuple[Tuple[str, ...], Callable[[], Any]]] = {
+            'summary': (
+                ('stock_engine', 'stock_tracker_db', 'stock_daily', 'stock_system',
+                 'crypto_factors', 'crypto_history'),
+                self._summary_payload,
+            ),
+            'positions': (
+                ('stock_engine',),
+                lambda: {p.get('code'): p for p in loader.get_stock_positions()},
+            ),
+            'regime': (('crypto_factors',), loader.get_crypto_regime),
+        }
+        # 채널 -> 강제 재계산 주기 (시그니처에 시간 구간을 섞음)
+        self.refresh_sec: Dict[str, float] = {'summary': SUMMARY_REFRESH_SEC}
+
+        self._signatures: Dict[str, tuple] = {}
+        self._payloads: Dict[str, Any] = {}
+        self._events: deque = deque(maxlen=EVENT_BUFFER)   # (version, channel, 'patch' | 'replace', data)
+        self.version = 0
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def _summary_payload(self) -> Dict[str, Any]:
+        # generated_at은 매번 달라지므로 제외. age_minutes/running은 SUMMARY_REFRESH_SEC마다 갱신
+        return strip_volatile(self.loader.get_portfolio_summary())
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self.poll()  # 첫 구독 전에 스냅샷 준비
+        self._thread = threading.Thread(target=self._loop, name='change-feed', daemon=True)
+        self._thread.start()
+
+    def _loop(self):
+        while True:
+            time.sleep(self.poll_sec)
+            try:
+                self.poll()
+            except Exception:
+                logger.exception("change feed poll failed")
+
+    def poll(self):
+        """시그니처가 바뀐 채널만 재계산 → 차이가 있으면 이벤트 추가.
+
+        시그니처는 build() 성공 후에만 기록 (실패 시 다음 poll에서 재시도)
+        """
+        for name, (keys, build) in self.channels.items():
+            sig = self.loader.signature(keys)
+            period = self.refresh_sec.get(name)
+            if period:
+                sig = (sig, int(time.time() // period))
+            if self._signatures.get(name) == sig:
+                continue
+            payload = build()
+            self._signatures[name] = sig
+            if name not in self._payloads:
+                self._payloads[name] = payload
+                continue
+            patch = merge_patch(self._payloads[name], payload)
+            self._payloads[name] = payload
+            if patch is not None:
+                event = ('replace', payload) if patch is REPLACE else ('patch', patch)
+                with self._cond:
+                    self.version += 1
+                    self._events.append((self.version, name, *event))
+                    self._cond.notify_all()
+
+    def snapshot(self, channels: List[str]) -> Tuple[int, Dict[str, Any]]:
+        with self._cond:
+            return self.version, {c: self._payloads.get(c) for c in channels}
+
+    def events_since(self, version: int, channels: List[str]) -> Optional[Tuple[int, List[tuple]]]:
+        """(현재 version, version 이후 구독 채널 이벤트).
+
+        버퍼에서 밀려났거나 알 수 없는 version(서버 재시작 등)이면 None → 스냅샷 재전송
+        """
+        with self._cond:
+            if version > self.version:
+                return None
+            if self._events and version < self._events[0][0] - 1:
+                return None
+            return self.version, [e for e in self._events if e[0] > version and e[1] in channels]
+
+    def wait(self, version: int, timeout: float) -> bool:
+        """version 이후 새 이벤트가 생길 때까지 대기"""
+        with self._cond:
+            return self._cond.wait_for(lambda: self.version > version, timeout=timeout)
+
+    def stream(self, channels: List[str], last_event_id: Optional[int] = None) -> Iterator[str]:
+        """SSE 메시지 스트림 (snapshot 1회 → patch/replace 이벤트 → keepalive)"""
+        version = last_event_id
+        first = True
+        while True:
+            if not first and not self.wait(version, KEEPALIVE_SEC):
+                yield ': keepalive\n\n'
+                continue
+            first = False
+            pending = self.events_since(version, channels) if version is not None else None
+            if pending is None:
+                version, payloads = self.snapshot(channels)
+                yield _sse('snapshot', payloads, version)
+                continue
+            version, events = pending
+            for v, channel, kind, data in events:
+                body = {'channel': channel, 'patch': data} if kind == 'patch' else {'channel': channel, 'data': data}
+                yield _sse(kind, body, v)
+
+
+def _sse(event: str, data: Any, event_id: int) -> str:
+    payload = json.dumps(data, ensure_ascii=False, separators=(',', ':'), default=str)
+    return f'id: {event_id}\nevent: {event}\ndata: {payload}\n\n'
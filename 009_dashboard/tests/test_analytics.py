@@ -0,0 +1,244 @@
+"""
+분석 지표 Materializer 테스트 (RunningCurve / 증분 반영 vs 전체 재구성)
+"""
+
+import json
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+# 대시보드 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from analytics import AnalyticsMaterializer, RunningCurve
+
+
+class FakeLoader:
+    """TradingDataLoader 대역 - 원본 변경마다 시그니처 버전 증가"""
+
+    def __init__(self, with_db: bool = False):
+        self.json = {}
+        self.versions = {}
+        self.db = None
+        if with_db:
+            self.recreate_db()
+
+    def recreate_db(self):
+        """트래커 DB 새로 생성 (id 1부터 다시 시작)"""
+        self.db = sqlite3.connect(':memory:')
+        self.db.executescript(
+            "CREATE TABLE snapshots (date TEXT PRIMARY KEY, payload TEXT NOT NULL);"
+            "CREATE TABLE transactions (id INTEGER PRIMARY KEY AUTOINCREMENT, payload TEXT NOT NULL);"
+        )
+        self._touch('stock_tracker_db')
+
+    def _touch(self, key):
+        self.versions[key] = self.versions.get(key, 0) + 1
+
+    def set_json(self, key, data):
+        self.json[key] = data
+        self._touch(key)
+
+    def add_snapshot(self, snap):
+        self.db.execute("INSERT OR REPLACE INTO snapshots VALUES (?, ?)", (snap['date'], json.dumps(snap)))
+        self._touch('stock_tracker_db')
+
+    def add_transaction(self, txn):
+        self.db.execute("INSERT INTO transactions (payload) VALUES (?)", (json.dumps(txn),))
+        self._touch('stock_tracker_db')
+
+    def delete_transactions(self, max_id):
+        """보관 기간 정리 (오래된 거래 삭제)"""
+        self.db.execute("DELETE FROM transactions WHERE id <= ?", (max_id,))
+        self._touch('stock_tracker_db')
+
+    # --- TradingDataLoader 인터페이스 ---
+
+    def signature(self, keys):
+        return tuple(self.versions.get(k) for k in keys)
+
+    def _load_json(self, key):
+        return self.json.get(key)
+
+    def _query_tracker_db(self, sql, params=()):
+        if self.db is None:
+            return None
+        return self.db.execute(sql, params).fetchall()
+
+
+def _snap(day, total):
+    return {'date': f"2026-03-{day:02d}", 'total_assets': total, 'daily_pnl': 0, 'total_pnl_pct': 0}
+
+
+def _sell(n, code, pnl_pct, pnl=1000):
+    return {'timestamp': f"2026-03-{n:02d}T10:00:00", 'type': 'SELL', 'code': code, 'name': code,
+            'order_no': f"{n:04d}", 'pnl_pct': pnl_pct, 'pnl': pnl}
+
+
+def _closed(n, coin, profit_krw):
+    return {'trade_id': f"t{n}", 'coin': coin, 'status': 'closed',
+            'exit_time': f"2026-03-{n:02d}T10:00:00", 'profit_pct': profit_krw / 1000,
+            'profit_krw': profit_krw}
+
+
+def _views(m):
+    """비교용 전체 지표"""
+    return {
+        'stock_equity': m.stock_equity_curve(),
+        'stock_symbols': m.stock_symbol_stats(),
+        'crypto_equity': m.crypto_equity_curve(),
+        'crypto_coins': m.crypto_coin_stats(),
+        'crypto_performance': m.crypto_performance(),
+    }
+
+
+class TestRunningCurve:
+
+    def test_peak_and_drawdown(self):
+        curve = RunningCurve()
+        for day, value in [(1, 100), (2, 120), (3, 90), (4, 110)]:
+            curve.upsert(f"2026-03-0{day}", value)
+
+        last = curve.points[-1]
+        assert [p['peak'] for p in curve.points] == [100, 120, 120, 120]
+        assert last['drawdown'] == -10
+        assert last['max_drawdown'] == -30
+        assert last['max_drawdown_pct'] == -25.0
+
+    def test_upsert_same_or_earlier_date_replaces_tail(self):
+        curve = RunningCurve()
+        for day, value in [(1, 100), (2, 50), (3, 80)]:
+            curve.upsert(f"2026-03-0{day}", value)
+
+        curve.upsert("2026-03-02", 120)   # 2일 갱신 → 3일 이후 점 제거
+        assert [p['date'] for p in curve.points] == ["2026-03-01", "2026-03-02"]
+        assert curve.points[-1]['max_drawdown'] == 0
+        assert curve.last_date == "2026-03-02"
+
+    def test_page_window_and_offset(self):
+        curve = RunningCurve()
+        for month, day in [(2, 27), (3, 1), (3, 2), (3, 31), (4, 1)]:
+            curve.upsert(f"2026-{month:02d}-{day:02d}", 100)
+
+        page = curve.page(start="2026-03", end="2026-03", limit=2, offset=1)
+
+        assert page['total'] == 3
+        assert [p['date'] for p in page['points']] == ["2026-03-02", "2026-03-31"]
+        assert curve.page(offset=4)['points'][0]['date'] == "2026-04-01"
+        assert RunningCurve().page()['points'] == []
+
+
+class TestIncrementalEquivalence:
+    """증분 반영 결과 == 같은 원본으로 새로 만든 Materializer 결과"""
+
+    def _rebuilt(self, loader):
+        return _views(AnalyticsMaterializer(loader))
+
+    def test_json_sources_append(self):
+        loader = FakeLoader()
+        m = AnalyticsMaterializer(loader)
+        snaps, txns, history = [], [], []
+
+        for n in range(1, 8):
+            snaps.append(_snap(n, 100 + (n % 3) * 10))
+            txns.append(_sell(n, 'A' if n % 2 else 'B', n - 4))
+            history.append(_closed(n, 'BTC' if n % 2 else 'ETH', (n - 3) * 1000))
+            loader.set_json('stock_daily', {'snapshots': list(snaps)})
+            loader.set_json('stock_transactions', {'transactions': list(txns)})
+            loader.set_json('crypto_history', list(history))
+
+            assert _views(m) == self._rebuilt(loader)
+
+    def test_db_sources_append(self):
+        loader = FakeLoader(with_db=True)
+        m = AnalyticsMaterializer(loader)
+
+        for n in range(1, 8):
+            loader.add_snapshot(_snap(n, 100 - n * 5 if n < 4 else 100 + n))
+            loader.add_transaction(_sell(n, 'A' if n % 3 else 'C', n - 2))
+            assert _views(m) == self._rebuilt(loader)
+
+        loader.add_snapshot(_snap(7, 50))  # 같은 날짜 재기록
+        assert _views(m) == self._rebuilt(loader)
+
+    def test_json_retention_with_same_count(self):
+        """앞부분 정리 + 신규 추가로 건수가 같아도 새 거래를 반영"""
+        loader = FakeLoader()
+        m = AnalyticsMaterializer(loader)
+        loader.set_json('stock_transactions', {'transactions': [_sell(n, 'A', 1) for n in (1, 2, 3)]})
+        assert m.stock_symbol_stats()[0]['trades'] == 3
+
+        loader.set_json('stock_transactions', {'transactions': [_sell(n, 'A', 1) for n in (2, 3, 4)]})
+
+        assert m.stock_symbol_stats() == self._rebuilt(loader)['stock_symbols']
+        assert m.stock_symbol_stats()[0]['last_trade'] == "2026-03-04T10:00:00"
+
+    def test_crypto_retention_with_same_count(self):
+        """가장 오래된 청산 정리 + 신규 청산이 한 번에 기록돼도 정리분을 누계에서 제외"""
+        loader = FakeLoader()
+        m = AnalyticsMaterializer(loader)
+        loader.set_json('crypto_history', [_closed(1, 'BTC', 1000), _closed(2, 'ETH', -2000),
+                                           _closed(3, 'BTC', 500)])
+        assert m.crypto_performance()['total_trades'] == 3
+
+        loader.set_json('crypto_history', [_closed(2, 'ETH', -2000), _closed(3, 'BTC', 500),
+                                           _closed(4, 'ETH', 700)])
+
+        assert _views(m) == self._rebuilt(loader)
+        assert m.crypto_performance()['total_trades'] == 3
+
+    def test_db_retention_delete_rebuilds(self):
+        """DB 보관 기간 정리로 처리했던 거래가 삭제되면 통계에서 제외"""
+        loader = FakeLoader(with_db=True)
+        m = AnalyticsMaterializer(loader)
+        for n in (1, 2, 3):
+            loader.add_transaction(_sell(n, 'A', n))
+        assert m.stock_symbol_stats()[0]['trades'] == 3
+
+        loader.delete_transactions(2)
+
+        assert m.stock_symbol_stats() == self._rebuilt(loader)['stock_symbols']
+        assert m.stock_symbol_stats()[0]['trades'] == 1
+
+    def test_db_recreated_rebuilds(self):
+        """DB 재생성으로 id가 1부터 다시 시작해도 새 거래를 누락하지 않음"""
+        loader = FakeLoader(with_db=True)
+        m = AnalyticsMaterializer(loader)
+        for n in (1, 2, 3):
+            loader.add_transaction(_sell(n, 'A', n))
+        m.stock_symbol_stats()
+
+        loader.recreate_db()
+        loader.add_transaction(_sell(4, 'B', 5))
+
+        assert m.stock_symbol_stats() == self._rebuilt(loader)['stock_symbols']
+        assert [s['code'] for s in m.stock_symbol_stats()] == ['B']
+
+    def test_late_crypto_exit_rebuilds(self):
+        loader = FakeLoader()
+        m = AnalyticsMaterializer(loader)
+        loader.set_json('crypto_history', [_closed(5, 'BTC', 1000)])
+        m.crypto_equity_curve()
+
+        loader.set_json('crypto_history', [_closed(5, 'BTC', 1000), _closed(2, 'ETH', -500)])
+
+        assert _views(m) == self._rebuilt(loader)
+
+
+class TestRefreshFailure:
+
+    def test_failed_refresh_is_retried(self):
+        loader = FakeLoader()
+        m = AnalyticsMaterializer(loader)
+        bad = _sell(2, 'A', None)  # pnl_pct 누락 → 비교 오류
+        loader.set_json('stock_transactions', {'transactions': [_sell(1, 'A', 1), bad]})
+
+        with pytest.raises(TypeError):
+            m.stock_symbol_stats()
+
+        # 같은 원본(시그니처 동일)이라도 다시 반영을 시도하고, 부분 반영분이 중복되지 않음
+        bad['pnl_pct'] = 2
+        assert m.stock_symbol_stats()[0]['trades'] == 2
+        assert m.stock_symbol_stats() == AnalyticsMaterializer(loader).stock_symbol_stats()
@@ -0,0 +1,92 @@
+"""
+변경 푸시 테스트 (merge_patch / ChangeFeed 이벤트)
+"""
+
+import json
+import sys
+from pathlib import Path
+
+# 대시보드 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from push import REPLACE, ChangeFeed, merge_patch
+
+
+def _apply(target, patch):
+    """RFC 7386 MergePatch (클라이언트 동작)"""
+    if not isinstance(patch, dict):
+        return patch
+    result = dict(target) if isinstance(target, dict) else {}
+    for key, value in patch.items():
+        if value is None:
+            result.pop(key, None)
+        else:
+            result[key] = _apply(result.get(key), value)
+    return result
+
+
+class FakeLoader:
+    """ChangeFeed용 TradingDataLoader 대역 - 원본 변경마다 시그니처 증가"""
+
+    def __init__(self):
+        self.version = 0
+        self.positions = []
+
+    def set_positions(self, positions):
+        self.positions = positions
+        self.version += 1
+
+    def signature(self, keys):
+        return (self.version,)
+
+    def get_portfolio_summary(self):
+        return {'generated_at': 'now'}
+
+    def get_stock_positions(self):
+        return self.positions
+
+    def get_crypto_regime(self):
+        return {}
+
+
+class TestMergePatch:
+
+    def test_patch_round_trips(self):
+        old = {'a': 1, 'b': {'c': 2, 'd': 3}, 'gone': 1, 'items': [1, None]}
+        new = {'a': 1, 'b': {'c': 5, 'd': 3}, 'added': {'x': 1}, 'items': [None]}
+
+        patch = merge_patch(old, new)
+
+        assert patch == {'b': {'c': 5}, 'gone': None, 'added': {'x': 1}, 'items': [None]}
+        assert _apply(old, patch) == new
+        assert merge_patch(new, new) is None
+
+    def test_value_to_null_requires_replace(self):
+        """null은 Merge Patch에서 키 삭제 → 값을 null로 바꾸는 변경은 전체 교체"""
+        old = {'005930': {'price': 70000, 'updated_at': '10:00'}}
+
+        assert merge_patch(old, {'005930': {'price': 70000, 'updated_at': None}}) is REPLACE
+        assert merge_patch(old, {'005930': {'price': 70000, 'updated_at': '10:00', 'x': None}}) is REPLACE
+        assert merge_patch(old, {'000660': {'price': None}}) is REPLACE
+        assert merge_patch({'a': 1}, None) is REPLACE
+
+
+class TestChangeFeed:
+
+    def test_null_value_sent_as_replace_event(self):
+        loader = FakeLoader()
+        loader.set_positions([{'code': 'A', 'price': 100}])
+        feed = ChangeFeed(loader)
+        feed.poll()
+
+        loader.set_positions([{'code': 'A', 'price': None}])
+        feed.poll()
+
+        version, events = feed.events_since(0, ['positions'])
+        assert events == [(version, 'positions', 'replace', {'A': {'code': 'A', 'price': None}})]
+
+        stream = feed.stream(['positions'], last_event_id=0)
+        message = next(stream)
+        assert 'event: replace' in message
+        body = json.loads(message.split('data: ', 1)[1])
+        assert body == {'channel': 'positions', 'data': {'A': {'code': 'A', 'price': None}}}
@@ -14,7 +14,9 @@ from starlette.requests import Request
 
 from config import DASHBOARD_PORT
 from tiles.tile_manager import DataStore
+from tiles.snapshot import SnapshotManager
 from data_sources.yfinance_adapter import YFinanceAdapter
+from data_sources.quote_scheduler import QuoteScheduler
 from workers.market_worker import MarketWorker
 from workers.sector_worker import SectorWorker
 from workers.sentiment_worker import SentimentWorker
@@ -47,21 +49,32 @@ logger = logging.getLogger(__name__)
 # Global state
 data_store = DataStore()
 workers: list = []
+quote_scheduler: QuoteScheduler | None = None
+snapshots: SnapshotManager | None = None
 worker_tasks: list[asyncio.Task] = []
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    global workers, worker_tasks
+    global workers, worker_tasks, quote_scheduler, snapshots
     logger.info("Starting dashboard workers...")
-
     shared_adapter = YFinanceAdapter()
+    # All quote loops share one scheduler → one batched download per tick
+    quote_scheduler = QuoteScheduler(shared_adapter)
+
+    # Warm start: tiles + caches from the last snapshot, before any worker runs
+    snapshots = SnapshotManager(data_store, shared_adapter, quote_scheduler)
+    snapshots.restore()
+    snapshots.start()
+
+    data_store.start()
+    quote_scheduler.start()
     workers = [
-        MarketWorker(data_store, adapter=shared_adapter),
-        SectorWorker(data_store, adapter=shared_adapter),
-        SentimentWorker(data_store, adapter=shared_adapter),
+        MarketWorker(data_store, adapter=shared_adapter, quotes=quote_scheduler),
+        SectorWorker(data_store, adapter=shared_adapter, quotes=quote_scheduler),
+        SentimentWorker(data_store, adapter=shared_adapter, quotes=quote_scheduler),
         NewsWorker(data_store),
-        AlertWorker(data_store, adapter=shared_adapter),
+        AlertWorker(data_store, adapter=shared_adapter, quotes=quote_scheduler),
     ]
 
     for w in workers:
@@ -76,6 +89,9 @@ async def lifespan(app: FastAPI):
         w.stop()
     for t in worker_tasks:
         t.cancel()
+    quote_scheduler.stop()
+    await snapshots.stop()
+    await data_store.stop()
     for ws in list(data_store._clients):
         try:
             await ws.close()
@@ -100,21 +116,22 @@ async def health():
         "status": "ok",
         "workers": len(workers),
         "clients": len(data_store._clients),
+        "broadcast": data_store.stats,
+        "quotes": quote_scheduler.stats if quote_scheduler else None,
+        "snapshot": snapshots.status() if snapshots else None,
     })
 
 
 @app.websocket("/ws")
 async def websocket_endpoint(ws: WebSocket):
     await ws.accept()
-    data_store.subscribe(ws)
 
-    # Send full state on connect
+    # Send full state on connect, then receive coalesced deltas
     try:
-        state = await data_store.get_full_state()
-        for tile_id, data in state.items():
-            await ws.send_json({"type": "tile_update", "tile_id": tile_id, "data": data})
+        await data_store.connect(ws)
     except Exception as e:
         logger.error(f"Error sending initial state: {e}")
+        data_store.subscribe(ws)
 
     try:
         while True:
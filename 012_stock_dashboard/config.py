@@ -17,6 +17,16 @@ TIER3_INTERVAL = 120   # Sector heatmap, Top movers
 TIER4_INTERVAL = 600   # News RSS + AI summary (10min, Gemini free tier 절약)
 TIER5_INTERVAL = 600   # Fear & Greed, Market Breadth
 OFF_HOURS_INTERVAL = 300  # All tickers during off-hours
+WS_FLUSH_INTERVAL = 0.25  # WebSocket broadcast coalescing window
+QUOTE_SCHEDULER_TICK = 0.5  # Quote demand collection window per batch download
+QUOTE_REFRESH_AHEAD = 0.5   # Refresh tickers already past this fraction of their max age
+INTRADAY_FULL_REFRESH = 600      # Re-download whole intraday series at most this often
+INTRADAY_INCREMENTAL_GAP = 7200  # Incremental fetch only if last cached bar is newer than this
+
+# --- Warm-start Snapshot ---
+SNAPSHOT_PATH = os.path.join(os.path.dirname(__file__), "data", "snapshot.json.gz")
+SNAPSHOT_INTERVAL = 60       # Persist tiles + quote caches every N seconds
+SNAPSHOT_STALE_AFTER = 300   # Restored tiles older than this are marked stale
 
 # --- yfinance Ticker Groups ---
 TIER1_TICKERS = ["^GSPC", "^IXIC", "^DJI", "BTC-USD"]
@@ -0,0 +1,130 @@
+"""Central quote scheduler: one batched yfinance download per scheduling tick.
+
+Workers call `fetch_quotes(tickers, ttl)` exactly as on YFinanceAdapter, with
+`ttl` read as the maximum acceptable quote age. Requests that can't be served
+from memory are queued; each tick merges all queued tickers, plus known
+tickers that active loops will need soon (refresh-ahead), into a single
+download and then wakes every waiter.
+"""
+
+import asyncio
+import logging
+import time
+
+from config import QUOTE_SCHEDULER_TICK, QUOTE_REFRESH_AHEAD
+
+logger = logging.getLogger(__name__)
+
+
+class QuoteScheduler:
+    def __init__(self, adapter, tick: float = QUOTE_SCHEDULER_TICK,
+                 refresh_ahead: float = QUOTE_REFRESH_AHEAD):
+        self.adapter = adapter
+        self._tick = tick
+        self._refresh_ahead = refresh_ahead
+        self._quotes: dict = {}   # ticker -> (quote, fetched_at)
+        self._demand: dict = {}   # ticker -> (max_age, last_requested)
+        self._waiters: list[tuple[set, asyncio.Future]] = []
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self.stats = {"requests": 0, "from_memory": 0, "batches": 0, "tickers": 0}
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def stop(self):
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+    async def fetch_quotes(self, tickers: list[str], ttl: float = 25) -> dict:
+        """Quotes no older than `ttl` seconds (LKG fallback for failed tickers)."""
+        now = time.time()
+        self.stats["requests"] += 1
+        for t in tickers:
+            self._note_demand(t, ttl, now)
+
+        stale = {t for t in tickers if not self._is_fresh(t, ttl, now)}
+        if not stale:
+            self.stats["from_memory"] += 1
+            return self._collect(tickers)
+
+        if self._task is None:
+            # Scheduler not running: fetch directly
+            await self._download(stale)
+        else:
+            future = asyncio.get_running_loop().create_future()
+            self._waiters.append((stale, future))
+            self._wakeup.set()
+            await future
+        return self._collect(tickers)
+
+    def export_state(self) -> dict:
+        return {t: [quote, fetched_at] for t, (quote, fetched_at) in self._quotes.items()}
+
+    def restore_state(self, state: dict):
+        """Seed quotes from a snapshot; those still within a loop's max age skip the fetch."""
+        for t, (quote, fetched_at) in state.items():
+            self._quotes[t] = (quote, fetched_at)
+
+    def _note_demand(self, ticker: str, max_age: float, now: float):
+        prev = self._demand.get(ticker)
+        # Tightest freshness requirement among loops still asking for it
+        if prev and now - prev[1] < 3 * prev[0]:
+            max_age = min(max_age, prev[0])
+        self._demand[ticker] = (max_age, now)
+
+    def _is_fresh(self, ticker: str, max_age: float, now: float) -> bool:
+        entry = self._quotes.get(ticker)
+        return entry is not None and now - entry[1] < max_age
+
+    def _collect(self, tickers: list[str]) -> dict:
+        results = {}
+        for t in tickers:
+            entry = self._quotes.get(t)
+            quote = entry[0] if entry else self.adapter.get_lkg(t)
+            if quote:
+                results[t] = quote
+        return results
+
+    def _due_soon(self, now: float) -> set:
+        """Actively requested tickers past `refresh_ahead` of their max age."""
+        due = set()
+        for t, (max_age, last) in list(self._demand.items()):
+            if now - last >= 3 * max_age:
+                del self._demand[t]  # no loop asks for it anymore
+                continue
+            entry = self._quotes.get(t)
+            if entry is None or now - entry[1] >= self._refresh_ahead * max_age:
+                due.add(t)
+        return due
+
+    async def _run(self):
+        while True:
+            await self._wakeup.wait()
+            await asyncio.sleep(self._tick)  # collect concurrent demand
+            self._wakeup.clear()
+            waiters, self._waiters = self._waiters, []
+            wanted = set().union(*(w[0] for w in waiters)) | self._due_soon(time.time())
+            try:
+                await self._download(wanted)
+            except Exception as e:
+                logger.error(f"Quote scheduler batch error: {e}")
+            finally:
+                for _, future in waiters:
+                    if not future.done():
+                        future.set_result(None)
+
+    async def _download(self, tickers: set):
+        if not tickers:
+            return
+        self.stats["batches"] += 1
+        self.stats["tickers"] += len(tickers)
+        fresh = await self.adapter.refresh_quotes(sorted(tickers), ttl=self._tick)
+        now = time.time()
+        for t, quote in fresh.items():
+            self._quotes[t] = (quote, now)
+        missing = len(tickers) - len(fresh)
+        if missing:
+            logger.warning(f"Quote batch missing {missing}/{len(tickers)} tickers")
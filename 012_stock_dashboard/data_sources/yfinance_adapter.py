@@ -1,10 +1,13 @@
 """yfinance async wrapper with caching."""
 
 import asyncio
+import bisect
 import logging
 import time
 import yfinance as yf
 
+from config import INTRADAY_FULL_REFRESH, INTRADAY_INCREMENTAL_GAP
+
 logger = logging.getLogger(__name__)
 
 
@@ -12,6 +15,7 @@ class YFinanceAdapter:
     def __init__(self):
         self._cache: dict = {}  # {ticker: {"data": ..., "expires_at": float}}
         self._lkg_cache: dict = {}  # Last-Known-Good: never expires, display fallback
+        self._intraday_full_at: dict = {}  # intraday cache key -> last full download
 
     def _is_cached(self, ticker: str) -> bool:
         entry = self._cache.get(ticker)
@@ -39,30 +43,53 @@ class YFinanceAdapter:
         if not uncached:
             return results
 
-        try:
-            data = await asyncio.to_thread(self._sync_fetch_quotes, uncached)
-            for ticker, quote in data.items():
-                self._set_cache(ticker, quote, ttl)
-                results[ticker] = quote
-
-            # Check for missing tickers and use LKG fallback
-            missing = [t for t in uncached if t not in results]
-            if missing:
-                logger.warning(f"yfinance batch missing {len(missing)} tickers: {missing}")
-                for t in missing:
-                    lkg = self._lkg_cache.get(t)
-                    if lkg:
-                        results[t] = lkg
-                        logger.info(f"Using LKG cache for {t}")
-        except Exception as e:
-            logger.error(f"yfinance fetch_quotes error: {e}")
-            for t in uncached:
+        fresh = await self.refresh_quotes(uncached, ttl)
+        results.update(fresh)
+
+        # Check for missing tickers and use LKG fallback
+        missing = [t for t in uncached if t not in fresh]
+        if missing:
+            logger.warning(f"yfinance batch missing {len(missing)} tickers: {missing}")
+            for t in missing:
                 cached = self._get_cached(t) or self._lkg_cache.get(t)
                 if cached:
                     results[t] = cached
+                    logger.info(f"Using LKG cache for {t}")
 
         return results
 
+    async def refresh_quotes(self, tickers: list[str], ttl: float = 25) -> dict:
+        """One batch download for the given tickers; returns freshly fetched quotes only."""
+        try:
+            data = await asyncio.to_thread(self._sync_fetch_quotes, tickers)
+        except Exception as e:
+            logger.error(f"yfinance fetch_quotes error: {e}")
+            return {}
+        for ticker, quote in data.items():
+            self._set_cache(ticker, quote, ttl)
+        return data
+
+    def get_lkg(self, ticker: str):
+        """Last-known-good value (display fallback), or None."""
+        return self._lkg_cache.get(ticker)
+
+    def export_state(self) -> dict:
+        """LKG values with their cache expiry, for warm-start snapshots."""
+        return {
+            "lkg": {
+                key: [data, self._cache.get(key, {}).get("expires_at", 0)]
+                for key, data in self._lkg_cache.items()
+            },
+            "intraday_full_at": dict(self._intraday_full_at),
+        }
+
+    def restore_state(self, state: dict):
+        """Inverse of export_state; unexpired entries are served without a fetch."""
+        for key, (data, expires_at) in state.get("lkg", {}).items():
+            self._cache[key] = {"data": data, "expires_at": expires_at}
+            self._lkg_cache[key] = data
+        self._intraday_full_at.update(state.get("intraday_full_at", {}))
+
     def _sync_fetch_quotes(self, tickers: list[str]) -> dict:
         results = {}
         ticker_str = " ".join(tickers)
@@ -132,31 +159,118 @@ class YFinanceAdapter:
 
     async def fetch_intraday(self, ticker: str, period: str = "1d", interval: str = "5m") -> list[dict]:
         """Fetch intraday OHLCV data for chart rendering."""
-        cache_key = f"{ticker}_intraday_{period}_{interval}"
-        if self._is_cached(cache_key):
-            return self._get_cached(cache_key)
+        series = await self.fetch_intraday_batch([ticker], period, interval)
+        return series.get(ticker, [])
+
+    async def fetch_intraday_batch(self, tickers: list[str], period: str = "1d",
+                                   interval: str = "5m", ttl: float = 25) -> dict:
+        """Intraday close points for many tickers: {ticker: [{"time", "value"}, ...]}.
+
+        Series fetched recently are extended with only the bars since their last
+        cached timestamp; the rest are re-downloaded over `period`. Each group is
+        one yf.download call.
+        """
+        keys = {t: f"{t}_intraday_{period}_{interval}" for t in tickers}
+        results = {t: self._get_cached(k) for t, k in keys.items() if self._is_cached(k)}
+        stale = [t for t in tickers if t not in results]
+        if not stale:
+            return results
+
+        now = time.time()
+        incremental, full = {}, []
+        for t in stale:
+            points = self._get_cached(keys[t])
+            if (points and now - self._intraday_full_at.get(keys[t], 0) < INTRADAY_FULL_REFRESH
+                    and now - points[-1]["time"] < INTRADAY_INCREMENTAL_GAP):
+                incremental[t] = points
+            else:
+                full.append(t)
 
         try:
-            data = await asyncio.to_thread(
-                self._sync_fetch_intraday, ticker, period, interval
+            fetched = await asyncio.to_thread(
+                self._sync_fetch_intraday_batch, full, incremental, period, interval
             )
-            self._set_cache(cache_key, data, ttl=25)
-            return data
         except Exception as e:
-            logger.error(f"yfinance fetch_intraday error for {ticker}: {e}")
-            return self._get_cached(cache_key) or []
+            logger.error(f"yfinance fetch_intraday_batch error: {e}")
+            fetched = {}
+
+        for t in stale:
+            key = keys[t]
+            if t in fetched:
+                self._set_cache(key, fetched[t], ttl)
+                if t not in incremental:
+                    self._intraday_full_at[key] = now
+                results[t] = fetched[t]
+            else:
+                cached = self._get_cached(key) or self._lkg_cache.get(key)
+                if cached:
+                    results[t] = cached
+        return results
+
+    def _sync_fetch_intraday_batch(self, full: list[str], incremental: dict,
+                                   period: str, interval: str) -> dict:
+        results = {}
+        if full:
+            data = self._download_intraday(full, interval, period=period)
+            results.update(_close_points(data, full))
+
+        if incremental:
+            tickers = list(incremental)
+            since = min(points[-1]["time"] for points in incremental.values())
+            data = self._download_intraday(tickers, interval, start=since)
+            for t, new in _close_points(data, tickers).items():
+                # Re-fetched bars (incl. the still-forming last one) replace cached ones
+                cached = incremental[t]
+                keep = bisect.bisect_left([p["time"] for p in cached], new[0]["time"])
+                results[t] = cached[:keep] + new
+
+        # Fallback: full history for tickers missing from a batch with no cached series
+        for t in full:
+            if t not in results:
+                try:
+                    points = self._sync_fetch_intraday(t, period, interval)
+                except Exception as e:
+                    logger.warning(f"Individual intraday fetch failed for {t}: {e}")
+                    continue
+                if points:
+                    results[t] = points
+        return results
+
+    def _download_intraday(self, tickers: list[str], interval: str, **window):
+        try:
+            return yf.download(" ".join(tickers), interval=interval, progress=False,
+                               threads=False, **window)
+        except Exception as e:
+            logger.error(f"yf.download intraday batch failed: {e}")
+            return None
 
     def _sync_fetch_intraday(self, ticker: str, period: str, interval: str) -> list[dict]:
         t = yf.Ticker(ticker)
         df = t.history(period=period, interval=interval)
         if df.empty:
             return []
+        return _to_points(df["Close"])
+
+
+def _close_points(data, tickers: list[str]) -> dict:
+    """Per-ticker point arrays from a (Price, Ticker) MultiIndex download."""
+    results = {}
+    if data is None or data.empty:
+        return results
+    for ticker in tickers:
+        close_col = ("Close", ticker)
+        if close_col not in data.columns:
+            continue
+        points = _to_points(data[close_col])
+        if points:
+            results[ticker] = points
+    return results
+
 
-        points = []
-        for idx, row in df.iterrows():
-            ts = int(idx.timestamp())
-            points.append({
-                "time": ts,
-                "value": round(float(row["Close"]), 2),
-            })
-        return points
+def _to_points(close) -> list[dict]:
+    close = close.dropna().round(2)
+    index = close.index
+    if hasattr(index, "as_unit"):  # pandas >= 2.0: index unit may not be ns
+        index = index.as_unit("ns")
+    times = (index.asi8 // 10**9).tolist()  # epoch seconds (UTC), pandas 1.x/2.x
+    return [{"time": ts, "value": v} for ts, v in zip(times, close.tolist())]
@@ -0,0 +1,100 @@
+"""Warm-start snapshots: tile store + quote caches persisted to a local file.
+
+The snapshot is a gzipped JSON document written every SNAPSHOT_INTERVAL and on
+shutdown. On startup it is restored before any worker runs, so the first
+WebSocket client gets a complete (possibly stale-marked) state, and quotes or
+intraday series that are still fresh are served from memory instead of being
+downloaded again.
+"""
+
+import asyncio
+import gzip
+import json
+import logging
+import os
+import time
+
+from config import SNAPSHOT_PATH, SNAPSHOT_INTERVAL, SNAPSHOT_STALE_AFTER
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 1
+
+
+class SnapshotManager:
+    def __init__(self, data_store, adapter, quotes=None, path: str = SNAPSHOT_PATH,
+                 interval: float = SNAPSHOT_INTERVAL):
+        self.data_store = data_store
+        self.adapter = adapter
+        self.quotes = quotes  # QuoteScheduler, if any
+        self.path = path
+        self._interval = interval
+        self._task: asyncio.Task | None = None
+        self.restored_from: float | None = None  # saved_at of the restored snapshot
+        self.saved_at: float | None = None
+
+    def restore(self) -> bool:
+        """Load the snapshot into the store and caches (call before workers start)."""
+        try:
+            with gzip.open(self.path, "rt", encoding="utf-8") as f:
+                snapshot = json.load(f)
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            logger.warning(f"Snapshot unreadable, starting cold: {e}")
+            return False
+
+        if snapshot.get("version") != SNAPSHOT_VERSION:
+            logger.info("Snapshot version mismatch, starting cold")
+            return False
+
+        self.data_store.restore(snapshot.get("tiles", {}), stale_after=SNAPSHOT_STALE_AFTER)
+        self.adapter.restore_state(snapshot.get("adapter", {}))
+        if self.quotes is not None:
+            self.quotes.restore_state(snapshot.get("quotes", {}))
+
+        self.restored_from = snapshot.get("saved_at")
+        age = time.time() - (self.restored_from or 0)
+        logger.info(f"Warm start: {len(snapshot.get('tiles', {}))} tiles restored "
+                    f"from snapshot {age:.0f}s old")
+        return True
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self):
+        """Stop the periodic task and write a final snapshot."""
+        if self._task:
+            self._task.cancel()
+            self._task = None
+        await self.save()
+
+    async def save(self):
+        snapshot = {
+            "version": SNAPSHOT_VERSION,
+            "saved_at": time.time(),
+            "tiles": await self.data_store.export_state(),
+            "adapter": self.adapter.export_state(),
+            "quotes": self.quotes.export_state() if self.quotes is not None else {},
+        }
+        try:
+            await asyncio.to_thread(self._write, snapshot)
+            self.saved_at = snapshot["saved_at"]
+        except Exception as e:
+            logger.error(f"Snapshot save error: {e}")
+
+    def _write(self, snapshot: dict):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp = self.path + ".tmp"
+        with gzip.open(tmp, "wt", encoding="utf-8") as f:
+            json.dump(snapshot, f, separators=(",", ":"), default=str)
+        os.replace(tmp, self.path)  # atomic: a crash never leaves a torn snapshot
+
+    async def _loop(self):
+        while True:
+            await asyncio.sleep(self._interval)
+            await self.save()
+
+    def status(self) -> dict:
+        return {"restored_from": self.restored_from, "saved_at": self.saved_at}
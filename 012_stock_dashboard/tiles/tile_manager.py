@@ -1,33 +1,197 @@
 """DataStore + WebSocket broadcast manager."""
 
 import asyncio
+import hashlib
 import json
 import logging
+import time
 from fastapi import WebSocket
 
+from config import WS_FLUSH_INTERVAL
+
 logger = logging.getLogger(__name__)
 
+# Array fields sent as splices (unchanged prefix skipped) instead of in full
+SERIES_KEYS = ("points", "sparkline")
+
+
+def _digest(data: dict) -> bytes:
+    payload = json.dumps(data, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.blake2b(payload.encode(), digest_size=16).digest()
+
+
+def _common_prefix(old: list, new: list) -> int:
+    n = min(len(old), len(new))
+    i = 0
+    while i < n and old[i] == new[i]:
+        i += 1
+    return i
+
+
+def _tile_delta(old: dict | None, new: dict) -> dict | None:
+    """Splice entry vs. the last broadcast value, or None when a full send is needed.
+
+    Delta format: {"patch": <all non-series fields>,
+                   "splice": {key: {"from": i, "items": new[key][i:]}}}
+    Clients rebuild each series as old[:from] + items.
+    """
+    if not old:
+        return None
+    splice = {}
+    for key in SERIES_KEYS:
+        old_s, new_s = old.get(key), new.get(key)
+        if new_s is None:
+            if old_s is not None:
+                return None  # series removed
+            continue
+        if not isinstance(old_s, list) or not isinstance(new_s, list):
+            return None
+        start = _common_prefix(old_s, new_s)
+        if start == 0 and new_s:
+            return None  # series replaced (e.g. new session / futures switch)
+        splice[key] = {"from": start, "items": new_s[start:]}
+    if not splice:
+        return None
+    patch = {k: v for k, v in new.items() if k not in SERIES_KEYS}
+    return {"patch": patch, "splice": splice}
+
 
 class DataStore:
-    """Thread-safe tile data store with WebSocket broadcasting."""
+    """Thread-safe tile data store with coalesced WebSocket broadcasting.
+
+    Updates are collected and flushed once per WS_FLUSH_INTERVAL as a single
+    "tile_batch" frame (serialized once for all clients). Unchanged tiles are
+    skipped by content hash; chart series are sent as append-style splices.
+    """
 
-    def __init__(self):
+    def __init__(self, flush_interval: float = WS_FLUSH_INTERVAL):
         self._data: dict = {}
+        self._digests: dict = {}   # tile_id -> digest of latest data
+        self._sent: dict = {}      # tile_id -> data as last broadcast
+        self._sent_digests: dict = {}
+        self._dirty: set = set()
+        self._updated_at: dict = {}  # tile_id -> time.time() of latest data
+        self._restored: dict = {}    # tile_id -> snapshot data not yet replaced
         self._lock = asyncio.Lock()
+        self._flush_lock = asyncio.Lock()  # frame order vs. new-client snapshot
         self._clients: set[WebSocket] = set()
+        self._flush_interval = flush_interval
+        self._flusher: asyncio.Task | None = None
+        self.stats = {"updates": 0, "skipped": 0, "frames": 0, "full": 0, "delta": 0}
 
     async def update(self, tile_id: str, data: dict):
-        """Update tile data and broadcast if changed."""
+        """Update tile data; broadcast on the next flush if content changed."""
+        digest = _digest(data)
         async with self._lock:
-            old = self._data.get(tile_id)
+            self.stats["updates"] += 1
+            if self._digests.get(tile_id) == digest:
+                self.stats["skipped"] += 1
+                return
             self._data[tile_id] = data
-        # Always broadcast (simplifies logic, small payload)
-        await self.broadcast(tile_id, data)
+            self._digests[tile_id] = digest
+            self._updated_at[tile_id] = time.time()
+            self._restored.pop(tile_id, None)
+            self._dirty.add(tile_id)
 
     async def get_full_state(self) -> dict:
         async with self._lock:
             return dict(self._data)
 
+    # --- Warm start ---
+
+    def restore(self, tiles: dict, stale_after: float):
+        """Seed tiles from a snapshot ({tile_id: [data, updated_at]}) before workers start.
+
+        Restored data carries "as_of" and a "stale" flag (older than `stale_after`)
+        until the producing worker publishes fresh data.
+        """
+        now = time.time()
+        for tile_id, (data, updated_at) in tiles.items():
+            marked = {**data, "as_of": int(updated_at), "stale": now - updated_at > stale_after}
+            digest = _digest(marked)
+            self._data[tile_id] = self._sent[tile_id] = marked
+            self._digests[tile_id] = self._sent_digests[tile_id] = digest
+            self._updated_at[tile_id] = updated_at
+            self._restored[tile_id] = data
+
+    def restored_age(self, tile_id: str) -> float | None:
+        """Age of snapshot data still standing in for a tile, or None."""
+        if tile_id not in self._restored:
+            return None
+        return time.time() - self._updated_at[tile_id]
+
+    async def export_state(self) -> dict:
+        """Tiles as {tile_id: [data, updated_at]} (restored tiles without markers)."""
+        async with self._lock:
+            return {
+                t: [self._restored.get(t, d), self._updated_at.get(t, 0)]
+                for t, d in self._data.items()
+            }
+
+    # --- Flush loop ---
+
+    def start(self):
+        """Start the periodic flush task (call inside the running event loop)."""
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.create_task(self._flush_loop())
+
+    async def stop(self):
+        if self._flusher:
+            self._flusher.cancel()
+            try:
+                await self._flusher
+            except asyncio.CancelledError:
+                pass
+            self._flusher = None
+        await self.flush()
+
+    async def _flush_loop(self):
+        while True:
+            await asyncio.sleep(self._flush_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Broadcast flush error: {e}")
+
+    async def flush(self):
+        """Send pending tile changes as one frame."""
+        async with self._flush_lock:
+            async with self._lock:
+                dirty, self._dirty = self._dirty, set()
+                changed = {t: (self._data[t], self._digests[t]) for t in dirty}
+
+            entries = []
+            for tile_id, (data, digest) in changed.items():
+                if self._sent_digests.get(tile_id) == digest:
+                    continue  # reverted within the flush window
+                delta = _tile_delta(self._sent.get(tile_id), data)
+                if delta is None:
+                    entries.append({"tile_id": tile_id, "data": data})
+                    self.stats["full"] += 1
+                else:
+                    entries.append({"tile_id": tile_id, **delta})
+                    self.stats["delta"] += 1
+                self._sent[tile_id] = data
+                self._sent_digests[tile_id] = digest
+
+            if entries and self._clients:
+                self.stats["frames"] += 1
+                await self._send_all(json.dumps({"type": "tile_batch", "updates": entries}))
+
+    # --- Clients ---
+
+    async def connect(self, ws: WebSocket):
+        """Send the broadcast-consistent full state, then subscribe.
+
+        Holding the flush lock guarantees later deltas apply on top of exactly
+        the snapshot this client received.
+        """
+        async with self._flush_lock:
+            entries = [{"tile_id": t, "data": d} for t, d in self._sent.items()]
+            if entries:
+                await ws.send_text(json.dumps({"type": "tile_batch", "updates": entries}))
+            self.subscribe(ws)
+
     def subscribe(self, ws: WebSocket):
         self._clients.add(ws)
         logger.info(f"Client subscribed. Total: {len(self._clients)}")
@@ -36,12 +200,10 @@ class DataStore:
         self._clients.discard(ws)
         logger.info(f"Client unsubscribed. Total: {len(self._clients)}")
 
-    async def broadcast(self, tile_id: str, data: dict):
-        """Send update to all connected WebSocket clients."""
+    async def _send_all(self, msg: str):
         clients = set(self._clients)  # snapshot to avoid set mutation during iteration
         if not clients:
             return
-        msg = json.dumps({"type": "tile_update", "tile_id": tile_id, "data": data})
 
         async def _send(ws: WebSocket):
             try:
@@ -53,15 +215,4 @@ class DataStore:
 
     async def broadcast_raw(self, message: dict):
         """Send arbitrary message to all clients."""
-        clients = set(self._clients)  # snapshot to avoid set mutation during iteration
-        if not clients:
-            return
-        msg = json.dumps(message)
-
-        async def _send(ws: WebSocket):
-            try:
-                await ws.send_text(msg)
-            except Exception:
-                self.unsubscribe(ws)
-
-        await asyncio.gather(*[_send(ws) for ws in clients])
+        await self._send_all(json.dumps(message))
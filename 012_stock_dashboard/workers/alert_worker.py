@@ -18,9 +18,10 @@ logger = logging.getLogger(__name__)
 
 
 class AlertWorker(BaseWorker):
-    def __init__(self, data_store, adapter=None):
+    def __init__(self, data_store, adapter=None, quotes=None):
         super().__init__(data_store, interval=ALERT_SCAN_INTERVAL)
         self.yf = adapter or YFinanceAdapter()
+        self.quotes = quotes or self.yf  # QuoteScheduler when shared
         self._alerts: deque = deque(maxlen=ALERT_MAX_ACTIVE)
         self._cooldowns: dict[str, float] = {}  # ticker -> expiry timestamp
         self._decay_task: asyncio.Task | None = None
@@ -63,17 +64,16 @@ class AlertWorker(BaseWorker):
         logger.info(f"Alert Phase 1: {len(candidates)} candidates from daily filter")
 
         # Phase 2: intraday check for candidates only
-        for ticker, daily_pct, market in candidates:
-            if self._is_cooled_down(ticker):
-                continue
-            await self._phase2_check(ticker, daily_pct, market)
+        candidates = [c for c in candidates if not self._is_cooled_down(c[0])]
+        if candidates:
+            await self._phase2_check(candidates)
 
         await self._broadcast_alerts()
 
     async def _phase1_filter(self, tickers: list[str], market: str) -> list[tuple]:
         """Batch fetch daily quotes, return tickers with |daily_pct| >= threshold."""
         try:
-            quotes = await self.yf.fetch_quotes(tickers, ttl=60)
+            quotes = await self.quotes.fetch_quotes(tickers, ttl=60)
         except Exception as e:
             logger.error(f"Alert Phase 1 ({market}) error: {e}")
             return []
@@ -89,14 +89,20 @@ class AlertWorker(BaseWorker):
 
         return candidates
 
-    async def _phase2_check(self, ticker: str, daily_pct: float, market: str):
-        """Fetch 5m intraday candles, compute 1h change, fire alert if threshold met."""
+    async def _phase2_check(self, candidates: list[tuple]):
+        """Batch fetch 5m intraday candles, compute 1h change, fire alerts."""
+        tickers = [ticker for ticker, _, _ in candidates]
         try:
-            candles = await self.yf.fetch_intraday(ticker, period="1d", interval="5m")
+            candles = await self.yf.fetch_intraday_batch(tickers, period="1d", interval="5m")
         except Exception as e:
-            logger.warning(f"Alert Phase 2 intraday error for {ticker}: {e}")
+            logger.warning(f"Alert Phase 2 intraday error: {e}")
             return
 
+        for ticker, daily_pct, market in candidates:
+            self._check_1h_change(ticker, candles.get(ticker), daily_pct, market)
+
+    def _check_1h_change(self, ticker: str, candles: list[dict] | None,
+                         daily_pct: float, market: str):
         if not candles or len(candles) < 2:
             return
 
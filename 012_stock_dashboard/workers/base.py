@@ -7,6 +7,10 @@ logger = logging.getLogger(__name__)
 
 
 class BaseWorker:
+    # Tiles produced by tick(); if all were restored from a snapshot younger
+    # than the interval, the first tick waits until they come due.
+    warm_tiles: tuple = ()
+
     def __init__(self, data_store, interval: int):
         self.data_store = data_store
         self.interval = interval
@@ -18,6 +22,10 @@ class BaseWorker:
         """Main loop: tick → sleep → repeat."""
         name = self.__class__.__name__
         logger.info(f"{name} started (interval={self.interval}s)")
+        delay = self._warm_start_delay()
+        if delay > 0:
+            logger.info(f"{name} warm start: first tick in {delay:.0f}s")
+            await asyncio.sleep(delay)
         while self._running:
             try:
                 await self.tick()
@@ -31,6 +39,12 @@ class BaseWorker:
                     logger.warning(f"{name} backing off to {self.interval}s")
             await asyncio.sleep(self.interval)
 
+    def _warm_start_delay(self) -> float:
+        ages = [self.data_store.restored_age(t) for t in self.warm_tiles]
+        if not ages or None in ages:
+            return 0
+        return self.interval - max(ages)
+
     async def tick(self):
         """Override in subclass."""
         raise NotImplementedError
@@ -19,9 +19,10 @@ logger = logging.getLogger(__name__)
 
 
 class MarketWorker(BaseWorker):
-    def __init__(self, data_store, adapter=None):
+    def __init__(self, data_store, adapter=None, quotes=None):
         super().__init__(data_store, TIER1_INTERVAL)
         self.adapter = adapter or YFinanceAdapter()
+        self.quotes = quotes or self.adapter  # QuoteScheduler when shared
         self._tasks: list[asyncio.Task] = []
         self._movers_quotes: dict = {}  # shared with watchlist for dynamic picks
 
@@ -56,9 +57,11 @@ class MarketWorker(BaseWorker):
                     source = "futures"
 
                 crypto_tickers = ["BTC-USD"]
-                idx_quotes, crypto_quotes = await asyncio.gather(
-                    self.adapter.fetch_quotes(idx_tickers, ttl=interval * 0.8),
-                    self.adapter.fetch_quotes(crypto_tickers, ttl=interval * 0.8),
+                idx_quotes, crypto_quotes, charts, sparklines = await asyncio.gather(
+                    self.quotes.fetch_quotes(idx_tickers, ttl=interval * 0.8),
+                    self.quotes.fetch_quotes(crypto_tickers, ttl=interval * 0.8),
+                    self.adapter.fetch_intraday_batch(idx_tickers, period="1d", interval="5m"),
+                    self.adapter.fetch_intraday_batch(crypto_tickers, period="1d", interval="15m"),
                 )
                 quotes = {**idx_quotes, **crypto_quotes}
 
@@ -72,7 +75,7 @@ class MarketWorker(BaseWorker):
 
                     tile_data = {**data, "source": source}
                     if ticker == "BTC-USD":
-                        sparkline = await self.adapter.fetch_intraday(ticker, period="1d", interval="15m")
+                        sparkline = sparklines.get(ticker)
                         if sparkline:
                             tile_data["sparkline"] = [p["value"] for p in sparkline]
                     await self.data_store.update(tile_id, tile_data)
@@ -84,7 +87,7 @@ class MarketWorker(BaseWorker):
                     else:
                         tile_id = TICKER_TO_TILE.get(ticker)
                     if tile_id:
-                        intraday = await self.adapter.fetch_intraday(ticker)
+                        intraday = charts.get(ticker)
                         if intraday:
                             await self.data_store.update(f"{tile_id}_chart", {
                                 "points": intraday,
@@ -101,16 +104,19 @@ class MarketWorker(BaseWorker):
         while self._running:
             try:
                 interval = TIER2_INTERVAL if is_us_market_hours() else OFF_HOURS_INTERVAL
-                quotes = await self.adapter.fetch_quotes(TIER2_TICKERS, ttl=interval * 0.8)
+                quotes = await self.quotes.fetch_quotes(TIER2_TICKERS, ttl=interval * 0.8)
 
                 # Fetch sparkline data for numeric tiles
                 # ^VIX excluded: yfinance intraday unreliable for VIX index
                 spark_tickers = ["^TNX", "DX-Y.NYB", "GC=F", "CL=F"]
+                sparklines = await self.adapter.fetch_intraday_batch(
+                    spark_tickers, period="1d", interval="15m"
+                )
                 for ticker in spark_tickers:
                     tile_id = TICKER_TO_TILE.get(ticker)
                     if not tile_id:
                         continue
-                    sparkline = await self.adapter.fetch_intraday(ticker, period="1d", interval="15m")
+                    sparkline = sparklines.get(ticker)
                     quote = quotes.get(ticker, {})
                     tile_data = {**quote}
                     if sparkline:
@@ -144,7 +150,7 @@ class MarketWorker(BaseWorker):
         while self._running:
             try:
                 all_global = EU_TICKERS + ASIA_TICKERS
-                quotes = await self.adapter.fetch_quotes(all_global, ttl=50)
+                quotes = await self.quotes.fetch_quotes(all_global, ttl=50)
 
                 eu_data = {}
                 eu_names = {"^FTSE": "FTSE 100", "^GDAXI": "DAX", "^FCHI": "CAC 40"}
@@ -171,7 +177,7 @@ class MarketWorker(BaseWorker):
         await asyncio.sleep(15)  # stagger start
         while self._running:
             try:
-                quotes = await self.adapter.fetch_quotes(TOP_MOVERS_TICKERS, ttl=100)
+                quotes = await self.quotes.fetch_quotes(TOP_MOVERS_TICKERS, ttl=100)
                 self._movers_quotes = quotes  # share with watchlist
                 if quotes:
                     sorted_by_change = sorted(
@@ -198,7 +204,7 @@ class MarketWorker(BaseWorker):
         while self._running:
             try:
                 # --- Yield Curve ---
-                yld_quotes = await self.adapter.fetch_quotes(YIELD_TICKERS, ttl=50)
+                yld_quotes = await self.quotes.fetch_quotes(YIELD_TICKERS, ttl=50)
                 yields = {}
                 for ticker in YIELD_TICKERS:
                     if ticker in yld_quotes:
@@ -219,7 +225,7 @@ class MarketWorker(BaseWorker):
                     })
 
                 # --- Commodities ---
-                cmd_quotes = await self.adapter.fetch_quotes(COMMODITY_TICKERS, ttl=50)
+                cmd_quotes = await self.quotes.fetch_quotes(COMMODITY_TICKERS, ttl=50)
                 cmd_data = {}
                 for ticker in COMMODITY_TICKERS:
                     if ticker in cmd_quotes:
@@ -249,7 +255,7 @@ class MarketWorker(BaseWorker):
                         logger.info(f"Watchlist dynamic picks: {dynamic_tickers}")
 
                 all_tickers = WATCHLIST_FIXED_TICKERS + dynamic_tickers
-                quotes = await self.adapter.fetch_quotes(all_tickers, ttl=50)
+                quotes = await self.quotes.fetch_quotes(all_tickers, ttl=50)
 
                 items = []
                 for ticker in all_tickers:
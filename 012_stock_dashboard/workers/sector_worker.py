@@ -10,14 +10,17 @@ logger = logging.getLogger(__name__)
 
 
 class SectorWorker(BaseWorker):
-    def __init__(self, data_store, adapter=None):
+    warm_tiles = ("sector",)
+
+    def __init__(self, data_store, adapter=None, quotes=None):
         super().__init__(data_store, TIER3_INTERVAL)
         self.adapter = adapter or YFinanceAdapter()
+        self.quotes = quotes or self.adapter  # QuoteScheduler when shared
 
     async def tick(self):
         tickers = list(SECTOR_ETFS.keys())
         expected = len(tickers)
-        quotes = await self.adapter.fetch_quotes(tickers, ttl=100)
+        quotes = await self.quotes.fetch_quotes(tickers, ttl=100)
 
         sectors = []
         for ticker, name in SECTOR_ETFS.items():
@@ -11,9 +11,12 @@ logger = logging.getLogger(__name__)
 
 
 class SentimentWorker(BaseWorker):
-    def __init__(self, data_store, adapter=None):
+    warm_tiles = ("feargreed", "breadth")
+
+    def __init__(self, data_store, adapter=None, quotes=None):
         super().__init__(data_store, TIER5_INTERVAL)
         self.adapter = adapter or YFinanceAdapter()
+        self.quotes = quotes or self.adapter  # QuoteScheduler when shared
 
     async def tick(self):
         # Fear & Greed
@@ -25,7 +28,7 @@ class SentimentWorker(BaseWorker):
         try:
             from config import SECTOR_ETFS
             tickers = list(SECTOR_ETFS.keys())
-            quotes = await self.adapter.fetch_quotes(tickers, ttl=300)
+            quotes = await self.quotes.fetch_quotes(tickers, ttl=300)
             advancing = sum(1 for q in quotes.values() if q.get("change_pct", 0) > 0)
             declining = sum(1 for q in quotes.values() if q.get("change_pct", 0) < 0)
             unchanged = len(quotes) - advancing - declining